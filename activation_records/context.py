@@ -0,0 +1,93 @@
+"""
+Per-compilation state.
+
+The compiler phases keep their state in class attributes: the counters of
+TempManager, the register maps of TempMap, the fragments of FragmentManager,
+the decisions of InliningReport and the instruction buffer of Codegen. Those
+attributes are ContextAttributes, which read and write the CompilationContext
+active in the current thread (or asyncio task) instead of the class itself.
+
+Code that never activates a context shares a single default context, so
+scripts and tests keep working as before. A compilation that runs inside its
+own context, as Compiler.compile does, never sees the temporaries, labels,
+fragments or instructions of any other compilation, and can therefore run
+in parallel with them in other threads.
+
+A context may also carry a profiler (see putting_it_all_together.
+phase_profiler). The phases report to it through profile_phase and
+record_statistics, which do nothing when no profiler is attached.
+"""
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class CompilationContext:
+    # TempManager
+    temp_count: int = 0
+    label_count: int = 0
+    # TempMap
+    register_to_temp: Dict[str, int] = field(default_factory=dict)
+    temp_to_register: Dict[int, str] = field(default_factory=dict)
+    # FragmentManager
+    fragment_list: List[Any] = field(default_factory=list)
+    string_labels: Dict[bytes, str] = field(default_factory=dict)
+    # InliningReport
+    inlining_decisions: List[Any] = field(default_factory=list)
+    # Codegen
+    instruction_list: List[Any] = field(default_factory=list)
+    # PhaseProfiler timing this compilation, if any
+    profiler: Optional[Any] = None
+
+    @contextmanager
+    def activate(self):
+        """Makes this the current context until the with block exits."""
+        token = _active_context.set(self)
+        try:
+            yield self
+        finally:
+            _active_context.reset(token)
+
+
+_default_context = CompilationContext()
+_active_context: ContextVar[CompilationContext] = ContextVar("compilation_context")
+
+
+def current_context() -> CompilationContext:
+    return _active_context.get(_default_context)
+
+
+def profile_phase(name: str, function: Optional[str] = None):
+    """Context manager timing a phase with the current profiler, if there is one."""
+    profiler = current_context().profiler
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name, function)
+
+
+def record_statistics(function: str, **statistics: int):
+    """Hands per-function counters (temporaries, spill rounds...) to the current profiler."""
+    profiler = current_context().profiler
+    if profiler is not None:
+        profiler.record_statistics(function, **statistics)
+
+
+class ContextAttribute:
+    """
+    Class attribute stored in the current CompilationContext.
+
+    Declared on the metaclass of the class that owns the attribute, so that
+    both reads and assignments through the class reach the context.
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        return getattr(current_context(), self.name)
+
+    def __set__(self, instance, value):
+        setattr(current_context(), self.name, value)
@@ -19,12 +19,14 @@ x86-64 Architecture Features:
 Author: Tiger Compiler Project
 """
 
+import re
 from typing import List, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from abc import ABC
 
 import intermediate_representation.tree as IRT
 import instruction_selection.assembly as Assembly
+from activation_records.context import ContextAttribute
 from activation_records.temp import Temp, TempLabel, TempManager
 
 # =====================================================================
@@ -34,6 +36,10 @@ from activation_records.temp import Temp, TempLabel, TempManager
 # Machine word size in bytes (64-bit architecture)
 word_size = 8
 
+# The static link is the first formal of every function and always escapes,
+# so it is kept in the first word below the saved %rbp.
+static_link_offset = -word_size
+
 # =====================================================================
 # REGISTER CLASSIFICATION (System V ABI)
 # =====================================================================
@@ -65,7 +71,15 @@ all_registers = (
 # REGISTER-TO-TEMPORARY MAPPING
 # =====================================================================
 
-class TempMap:
+class _TempMapState(type):
+    # Dictionary mapping register names to temporary objects
+    register_to_temp: Dict[str, Temp] = ContextAttribute()
+
+    # Dictionary mapping temporary objects to register names
+    temp_to_register: Dict[Temp, str] = ContextAttribute()
+
+
+class TempMap(metaclass=_TempMapState):
     """
     Bidirectional mapping between physical registers and abstract temporaries.
 
@@ -73,17 +87,11 @@ class TempMap:
     abstract temporary variables used during compilation. The mapping is
     essential for translating between IR temporaries and physical registers.
 
-    Class Attributes:
+    Class Attributes (kept in the current CompilationContext):
         register_to_temp (Dict[str, Temp]): Maps register names to temp objects
         temp_to_register (Dict[Temp, str]): Maps temp objects to register names
     """
 
-    # Dictionary mapping register names to temporary objects
-    register_to_temp: Dict[str, Temp] = {}
-
-    # Dictionary mapping temporary objects to register names
-    temp_to_register: Dict[Temp, str] = {}
-
     @classmethod
     def initialize(cls):
         """
@@ -114,6 +122,20 @@ class TempMap:
                 register_allocation[temporary]
             ]
 
+    @classmethod
+    def forget_temp_to_register(cls, register_allocation: Dict[Temp, Temp]):
+        """
+        Drop the registers of the temporaries of a function once it has been
+        emitted. The machine registers themselves stay mapped.
+
+        Args:
+            register_allocation (Dict[Temp, Temp]): The allocation passed to update_temp_to_register
+        """
+        machine_temps = set(cls.register_to_temp.values())
+        for temporary in register_allocation:
+            if temporary not in machine_temps:
+                cls.temp_to_register.pop(temporary, None)
+
 
 # =====================================================================
 # SPECIAL REGISTER ACCESSORS
@@ -132,6 +154,19 @@ def frame_pointer() -> Temp:
     return TempMap.register_to_temp["rbp"]
 
 
+def frame_base(frame: "Frame") -> Temp:
+    """
+    Get the register that the slots of frame are addressed from.
+
+    This is the frame pointer, or %rsp in a function that omits its frame
+    pointer (see omit_frame_pointer).
+
+    Returns:
+        Temp: Temporary representing the %rbp or the %rsp register
+    """
+    return TempMap.register_to_temp["rsp" if frame.omits_frame_pointer else "rbp"]
+
+
 def return_value() -> Temp:
     """
     Get the temporary representing the return value register (rax).
@@ -218,9 +253,14 @@ class Frame:
     def __init__(self, name: TempLabel, formal_escapes: List[bool]):
         self.name = name
         # The previous %rbp value is stored at 0(%rbp).
-        # Non-volatile registers are stored starting at -8(%rbp).
+        # Locals are stored starting at -8(%rbp).
         # (subtraction is performed before allocation)
         self.offset = 0
+        # The callee-save registers the function uses, pushed below the locals,
+        # and whether its frame is addressed from %rsp. Both are known once its
+        # registers are allocated.
+        self.saved_registers: List[str] = []
+        self.omits_frame_pointer = False
 
         # [Access] denoting the locations where the formal parameters will be
         # kept at run time, as seen from inside the callee.
@@ -276,6 +316,89 @@ def external_call(
     return IRT.Call(IRT.Name(TempManager.named_label(function_name)), arguments)
 
 
+# The runtime heap (see runtime.c) is made of zeroed pages, which the
+# garbage collector reclaims. The next free byte of the current page and its
+# end are kept in these globals.
+heap_pointer_label = "tiger_heap_pointer"
+heap_limit_label = "tiger_heap_limit"
+
+# Every record and array starts with a header word that tells the collector
+# its size and which of its words point to other records and arrays. A
+# record or array value is the address of the word after the header.
+# - record: bit 0 set, the number of fields from bit 3 and, from bit 32, a
+#   bit per field for the first 32 fields, set if the field is a pointer.
+#   The bits of further fields follow the fields, 64 to a word.
+# - array: bits 0 and 1 set, bit 3 set if the elements are pointers and
+#   the length from bit 4 (init_array writes it).
+# Bit 2 is the collector's. There is at least one word after the header, so
+# every value points into its own block.
+header_bitmap_fields = 32
+
+
+def record_layout(pointer_fields: List[bool]) -> List[int]:
+    """The words of a record's layout: its header, then the words of bits after its fields."""
+    bitmap = sum(1 << index for index, pointer in enumerate(pointer_fields) if pointer)
+    header = (bitmap & (1 << header_bitmap_fields) - 1) << 32 | len(pointer_fields) << 3 | 1
+    bitmap >>= header_bitmap_fields
+    trailing = -(-max(len(pointer_fields) - header_bitmap_fields, 0) // 64)
+    words = [header] + [bitmap >> 64 * index & (1 << 64) - 1 for index in range(trailing)]
+    # As the signed words the assembler is given
+    return [word - (1 << 64) if word >> 63 else word for word in words]
+
+
+# Allocates size bytes on the heap by moving the heap pointer, inline. Only
+# when the current page is full does it call refill_heap, which may collect.
+def heap_allocation(size: int) -> IRT.Expression:
+    block = IRT.Temporary(TempManager.new_temp())
+    end = IRT.Temporary(TempManager.new_temp())
+    heap_pointer = IRT.Memory(IRT.Name(TempManager.named_label(heap_pointer_label)))
+    heap_limit = IRT.Memory(IRT.Name(TempManager.named_label(heap_limit_label)))
+    fits, refill, done = (TempManager.new_label() for _ in range(3))
+    return IRT.EvaluateSequence(
+        IRT.Sequence(
+            [
+                IRT.Move(block, heap_pointer),
+                IRT.Move(end, IRT.BinaryOperation(IRT.BinaryOperator.plus, block, IRT.Constant(size))),
+                IRT.ConditionalJump(IRT.RelationalOperator.ule, end, heap_limit, fits, refill),
+                IRT.Label(fits),
+                IRT.Move(heap_pointer, end),
+                IRT.Jump(IRT.Name(done), [done]),
+                IRT.Label(refill),
+                IRT.Move(block, external_call("refill_heap", [IRT.Constant(size)])),
+                IRT.Label(done),
+            ]
+        ),
+        block,
+    )
+
+
+# Allocates a record, whose fields are pointers where pointer_fields is true,
+# and writes its layout before anything else can allocate. Its fields are
+# zero, which the collector reads as nil.
+def record_allocation(pointer_fields: List[bool]) -> IRT.Expression:
+    layout = record_layout(pointer_fields)
+    fields = max(len(pointer_fields), 1)
+    block = IRT.Temporary(TempManager.new_temp())
+
+    def word(index: int) -> IRT.Expression:
+        return IRT.Memory(
+            IRT.BinaryOperation(IRT.BinaryOperator.plus, block, IRT.Constant(index * word_size))
+        )
+
+    writes = [IRT.Move(block, heap_allocation((fields + len(layout)) * word_size))]
+    writes.append(IRT.Move(word(0), IRT.Constant(layout[0])))
+    writes += [
+        IRT.Move(word(1 + fields + index), IRT.Constant(bits))
+        for index, bits in enumerate(layout[1:])
+        # The page is zeroed
+        if bits
+    ]
+    return IRT.EvaluateSequence(
+        IRT.Sequence(writes),
+        IRT.BinaryOperation(IRT.BinaryOperator.plus, block, IRT.Constant(word_size)),
+    )
+
+
 # This applies the view shift of calling a function.
 # This means concatenating a sequence of IRT.Moves to the function
 # body, where each move changes a register parameter to the place
@@ -307,38 +430,47 @@ def shift_view(frame: Frame, function_body: IRT.Statement) -> IRT.Statement:
     return IRT.Sequence(shift_parameters + [function_body])
 
 
-# This preserves the callee_saved registers across a function call.
-# We need to make up new temporaries for each callee-save register. On entry, we move
-# all these registers to their new temporary locations, and on exit, we move them back.
-def preserve_callee_registers(
-        frame: Frame, function_body: IRT.Statement
-) -> IRT.Statement:
-    save_registers = []
-    restore_registers = []
-    for callee_register in callee_saved_registers:
-        temp = TempManager.new_temp()
-        save_registers.append(
-            IRT.Move(
-                IRT.Temporary(temp),
-                IRT.Temporary(TempMap.register_to_temp[callee_register]),
-            )
-        )
-        restore_registers.append(
-            IRT.Move(
-                IRT.Temporary(TempMap.register_to_temp[callee_register]),
-                IRT.Temporary(temp),
-            )
-        )
-    return IRT.Sequence(save_registers + [function_body] + restore_registers)
+# The registers live when the function is left, by returning or by a tail jump.
+# The callee-save registers other than %rbp are not live: the ones the
+# function uses are pushed and popped around its body (see assembly_procedure).
+def exit_live_temps() -> List[Temp]:
+    sink_registers = ["rbp", "rsp", "rip"]
+    return [TempMap.register_to_temp[register] for register in sink_registers]
+
+
+# A function can address its frame from %rsp instead of %rbp when %rbp is
+# only the base of memory operands (no function nested in it gets the frame
+# pointer as its static link) and %rsp does not move in its body (no call
+# passes arguments on the stack). %rbp is then an ordinary callee-save
+# register. The displacements stay relative to where %rbp would point, and
+# are shifted once the size of the frame is known (see assembly_procedure).
+def omit_frame_pointer(frame: Frame, function_body: List[Assembly.Instruction]):
+    fp = frame_pointer()
+    rsp = TempMap.register_to_temp["rsp"]
+    for instruction in function_body:
+        if isinstance(instruction, Assembly.Label):
+            continue
+        if fp in instruction.destination or rsp in instruction.destination:
+            return
+        for index, source in enumerate(instruction.source):
+            operand = re.compile(rf"%'s{index}(?!\d)")
+            base = re.compile(rf"\(%'s{index}(?!\d)")
+            if source == fp and (
+                    len(operand.findall(instruction.line)) != len(base.findall(instruction.line))
+            ):
+                return
+
+    frame.omits_frame_pointer = True
+    for instruction in function_body:
+        if not isinstance(instruction, Assembly.Label):
+            instruction.source = [rsp if source == fp else source for source in instruction.source]
 
 
 # This function appends a “sink” instruction to the function body to tell the
 # register allocator that certain registers are live at procedure exit.
 def sink(function_body: List[Assembly.Instruction]) -> List[Assembly.Instruction]:
-    sink_registers = callee_saved_registers + ["rsp", "rip"]
-    sink_temps = [TempMap.register_to_temp[register] for register in sink_registers]
     function_body.append(
-        Assembly.Operation(line="", source=sink_temps, destination=[], jump=None)
+        Assembly.Operation(line="", source=exit_live_temps(), destination=[], jump=None)
     )
     return function_body
 
@@ -368,10 +500,22 @@ def assembly_procedure(
     # *   previous rbp   *<- %rbp
     # *   local 1 (sl)   *<- %rbp - 8
     # *       ...        *<- %rbp - 16
-    # *     local n      *<- %rsp
-
-    prologue += "pushq %rbp\n"  # push rbp onto the stack
-    prologue += "movq %rsp, %rbp\n"  # rbp <- rsp, now rbp points to the old rbp
+    # *     local n      *
+    # *   ------------   *
+    # *  saved register  *
+    # *       ...        *<- %rsp
+
+    # Without a frame pointer, nothing is saved at %rbp: the frame is addressed
+    # from %rsp, as if %rbp pointed where it would be saved (see
+    # omit_frame_pointer). A frame that is never addressed, in a function
+    # that only keeps values in registers, needs no slots at all.
+    # The stack stays 16-byte aligned at the calls the function makes.
+    if not frame.omits_frame_pointer:
+        prologue += "pushq %rbp\n"  # push rbp onto the stack
+        prologue += "movq %rsp, %rbp\n"  # rbp <- rsp, now rbp points to the old rbp
+        pushed_size = word_size
+    else:
+        pushed_size = 0
 
     # Here stack space is reserved only for formal parameters and local variables.
     # Stack space for outgoing arguments is reserved in codegen (when munching
@@ -379,20 +523,157 @@ def assembly_procedure(
     # The amount of stack space necessary for formal parameters and local variables
     # is equal to word_size * amount of InFrames.
     # Each time an InFrame is created, frame.offset decreases by word_size.
-    # Align the stack_size to 16 bytes.
-    stack_size = -frame.offset - (frame.offset % -16)
-    prologue += f"subq ${stack_size}, %rsp\n"
+    # The callee-save registers the function uses are pushed below them.
+    rsp = TempMap.register_to_temp["rsp"]
+    saved_size = word_size * len(frame.saved_registers)
+    if not frame.omits_frame_pointer:
+        locals_size = -frame.offset
+    elif any(frame_operands(instruction, rsp) for instruction in body):
+        # The slot where %rbp would be saved, then the locals
+        locals_size = word_size - frame.offset
+    else:
+        locals_size = 0
+    # Below the return address
+    frame_size = pushed_size + locals_size + saved_size
+    if any(is_call(instruction) for instruction in body):
+        frame_size += (word_size - frame_size) % 16
+    stack_size = frame_size - pushed_size - saved_size
+    if stack_size:
+        prologue += f"subq ${stack_size}, %rsp\n"
+    for register in frame.saved_registers:
+        prologue += f"pushq %{register}\n"
     prologue += "\n\n"
+
+    if frame.omits_frame_pointer:
+        body = [
+            shift_frame_operands(instruction, rsp, frame_size - word_size)
+            for instruction in body
+        ]
+    # Tail jumps leave the function too
+    teardown = leave_frame(frame, stack_size)
+    body = [
+        replace(instruction, line=teardown + instruction.line)
+        if isinstance(instruction, Assembly.Operation) and instruction.jump == []
+        else instruction
+        for instruction in body
+    ]
+
     # Epilogue
     epilogue = "\n\n"
-    # Move rsp to where the old rbp value was stored.
-    epilogue += "movq %rbp, %rsp\n"
-    epilogue += "popq %rbp\n"  # Restore old rbp value.
+    epilogue += teardown
     epilogue += "ret\n"
     epilogue += f"# END {frame.name}\n"
 
     return Assembly.Procedure(prologue, body, epilogue)
 
 
+def leave_frame(frame: Frame, stack_size: int) -> str:
+    """The instructions that pop the frame, before returning or jumping to another function."""
+    code = ""
+    for register in reversed(frame.saved_registers):
+        code += f"popq %{register}\n"
+    if frame.omits_frame_pointer:
+        if stack_size:
+            code += f"addq ${stack_size}, %rsp\n"
+        return code
+    # Move rsp to where the old rbp value was stored.
+    code += "movq %rbp, %rsp\n"
+    code += "popq %rbp\n"  # Restore old rbp value.
+    return code
+
+
+def is_call(instruction: Assembly.Instruction) -> bool:
+    return isinstance(instruction, Assembly.Operation) and instruction.line.startswith("call ")
+
+
+def frame_operands(instruction: Assembly.Instruction, base: Temp) -> List[int]:
+    """The positions of the sources of instruction that are base, as the base of a memory operand."""
+    if isinstance(instruction, Assembly.Label):
+        return []
+    return [
+        index
+        for index, source in enumerate(instruction.source)
+        if source == base and re.search(rf"\(%'s{index}(?!\d)", instruction.line)
+    ]
+
+
+def shift_frame_operands(
+        instruction: Assembly.Instruction, base: Temp, shift: int
+) -> Assembly.Instruction:
+    """instruction, with shift added to the displacements of the memory operands based on base."""
+    line = instruction.line
+    for index in frame_operands(instruction, base):
+        line = re.sub(
+            rf"(-?\d+)?\(%'s{index}(?!\d)",
+            lambda match: f"{int(match.group(1) or 0) + shift}(%'s{index}",
+            line,
+        )
+    return instruction if line == instruction.line else replace(instruction, line=line)
+
+
+# A string is the address of its characters, which are followed by a zero
+# byte and preceded by three words: its depth as a rope, the hash of the
+# characters (string_hash) and their number. The runtime reads them in
+# constant time (see runtime.c). The literals, which FragmentManager pools,
+# are interned: their depth is interned_string, and the runtime puts them in
+# its interning table at startup from the table at string_table_label.
+interned_string = -1
+string_table_label = "tiger_strings"
+
+
+def string_characters(string: str) -> bytes:
+    """The characters of the Tiger string literal string, quotes included, with its escapes resolved."""
+    characters = bytearray()
+    index = 1
+    while index < len(string) - 1:
+        if string[index] != "\\":
+            characters += string[index].encode()
+            index += 1
+            continue
+        escape = string[index + 1]
+        if escape in "nt":
+            characters += b"\n" if escape == "n" else b"\t"
+            index += 2
+        elif escape == "^":
+            # Control character: \^@ is 0, \^A is 1, ... \^? is 127
+            characters.append((ord(string[index + 2].upper()) - ord("@")) & 0x7F)
+            index += 3
+        elif escape.isdigit():
+            characters.append(int(string[index + 1:index + 4]) & 0xFF)
+            index += 4
+        elif escape in "\"\\":
+            characters.append(ord(escape))
+            index += 2
+        else:
+            # \f___f\: the white space between the backslashes is ignored
+            index = string.index("\\", index + 1) + 1
+    return bytes(characters)
+
+
+def string_hash(characters: bytes) -> int:
+    """64-bit FNV-1a, as a signed word."""
+    hash_value = 0xCBF29CE484222325
+    for character in characters:
+        hash_value = (hash_value ^ character) * 0x100000001B3 & (1 << 64) - 1
+    return hash_value - (1 << 64) if hash_value >> 63 else hash_value
+
+
 def string_literal(label: TempLabel, string: str) -> str:
-    return f"{label}:\n\t.asciz {string}\n"
+    characters = string_characters(string)
+    text = "".join(
+        chr(character) if 32 <= character < 127 and chr(character) not in "\"\\" else f"\\{character:03o}"
+        for character in characters
+    )
+    return (
+        f"\t.balign 8\n\t.quad {interned_string}, {string_hash(characters)}, {len(characters)}\n"
+        f"{label}:\n\t.asciz \"{text}\"\n"
+    )
+
+
+def string_table(labels: List[TempLabel]) -> str:
+    """The number of literals and their addresses."""
+    addresses = "".join(f"\t.quad {label}\n" for label in labels)
+    return (
+        f"\t.balign 8\n\t.global {string_table_label}\n"
+        f"{string_table_label}:\n\t.quad {len(labels)}\n{addresses}"
+    )
@@ -0,0 +1,54 @@
+"""
+Calling convention of the runtime functions of runtime.c.
+
+The runtime is compiled with no_caller_saved_registers (see runtime.c), so a
+runtime function preserves every register except %rax, and it preserves %rax
+too when it returns nothing. A call to it only overwrites what it returns:
+values stay in the argument and caller-save registers across it, which keeps
+them out of the frame around the I/O in loops. A call to a Tiger function
+may overwrite every register the System V ABI lets a callee trash.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+from activation_records.frame import argument_registers, caller_saved_registers
+from activation_records.temp import TempLabel
+from semantic_analysis.environment import BaseEnvironmentManager
+from semantic_analysis.types import VoidType
+
+# The registers a System V callee may trash
+call_clobbered_registers = ["rax"] + argument_registers + caller_saved_registers
+
+
+@dataclass(frozen=True)
+class RuntimeSignature:
+    """
+    What a call to a runtime function reads and writes.
+
+    Attributes:
+        arguments: The number of arguments, all passed in registers
+        returns_value: Whether the result is left in %rax
+    """
+    arguments: int
+    returns_value: bool
+
+    def clobbered_registers(self) -> List[str]:
+        return ["rax"] if self.returns_value else []
+
+
+runtime_signatures: Dict[TempLabel, RuntimeSignature] = {
+    name: RuntimeSignature(len(argument_types), not isinstance(return_type, VoidType))
+    for name, (argument_types, return_type)
+    in BaseEnvironmentManager.standard_library_functions.items()
+}
+# Called by the translation of record and array creation
+runtime_signatures["refill_heap"] = RuntimeSignature(1, True)
+runtime_signatures["init_array"] = RuntimeSignature(3, True)
+
+
+def call_clobbers(function: TempLabel) -> List[str]:
+    """The registers a call to function may overwrite."""
+    if function in runtime_signatures:
+        return runtime_signatures[function].clobbered_registers()
+    return call_clobbered_registers
@@ -1,12 +1,18 @@
-from abc import ABC
+from abc import ABC, ABCMeta
+
+from activation_records.context import ContextAttribute
 
 Temp = int
 TempLabel = str
 
 
-class TempManager(ABC):
-    temp_count = 0
-    label_count = 0
+class _TempManagerState(ABCMeta):
+    # Last temporary and label numbers handed out in the current compilation
+    temp_count = ContextAttribute()
+    label_count = ContextAttribute()
+
+
+class TempManager(ABC, metaclass=_TempManagerState):
 
     @classmethod
     def new_temp(cls) -> Temp:
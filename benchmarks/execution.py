@@ -0,0 +1,188 @@
+"""
+Instructions executed by the compiled examples.
+
+Every program in examples/ is compiled, linked with the runtime and run, with
+each instruction of the generated functions preceded by an increment of a
+counter that preserves the flags and every register. The count is printed
+when the program exits. Only the code the compiler generates is counted, not
+the runtime or the C library, so the counts measure the generated code and
+nothing else. Programs that do not compile, crash or run for longer than
+--timeout seconds have no count.
+
+    python3 -m benchmarks.execution --output counts.json
+    python3 -m benchmarks.execution --compare counts.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, Optional
+
+from benchmarks.run import EXAMPLES_DIRECTORY, ROOT_DIRECTORY, _current_commit
+from parser.parser import SyntacticError
+from putting_it_all_together.compiler import Compiler
+from semantic_analysis.analyzers import SemanticError
+
+# Version of the JSON layout.
+COUNTS_VERSION = 1
+
+RUNTIME = os.path.join(ROOT_DIRECTORY, "putting_it_all_together", "runtime.c")
+
+# Input of the examples that read some.
+PROGRAM_INPUTS = {
+    "merge.tig": "1 3 5 6 7 10; 0 2 4 8 9;",
+    "test78.tig": "A very long string",
+    "test79.tig": "121",
+}
+
+COUNTER = "tiger_instructions"
+
+# Linked with the program: prints the counter when the program exits.
+REPORTER = f"""
+#include <stdio.h>
+long long {COUNTER};
+__attribute__((destructor)) static void report(void) {{
+  fprintf(stderr, "{COUNTER} %lld\\n", {COUNTER});
+}}
+"""
+
+
+def instrument(assembly: str) -> str:
+    """assembly, with the counter incremented before every instruction."""
+    lines = []
+    for line in assembly.splitlines():
+        if line[:1].isalpha() and not line.endswith(":"):
+            lines += ["pushfq", f"incq {COUNTER}(%rip)", "popfq"]
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def executed_instructions(
+        source: str, console_input: str = "", timeout: float = 10.0
+) -> Optional[int]:
+    """The number of generated instructions the program executes, None if it does not finish."""
+    try:
+        assembly = Compiler().compile(source)
+    except (SyntacticError, SemanticError):
+        return None
+
+    with tempfile.TemporaryDirectory() as directory:
+        assembly_file = os.path.join(directory, "output.s")
+        reporter_file = os.path.join(directory, "reporter.c")
+        program = os.path.join(directory, "a.out")
+        with open(assembly_file, "w") as file:
+            file.write(instrument(assembly))
+        with open(reporter_file, "w") as file:
+            file.write(REPORTER)
+        subprocess.run(
+            ["gcc", "-no-pie", "-o", program, assembly_file, reporter_file, RUNTIME],
+            check=True,
+            capture_output=True,
+        )
+        try:
+            result = subprocess.run(
+                [program],
+                input=console_input,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return None
+
+    for line in result.stderr.splitlines():
+        if line.startswith(COUNTER + " "):
+            return int(line.split()[1])
+    return None
+
+
+def count_corpus(timeout: float, directory: str = EXAMPLES_DIRECTORY) -> Dict[str, Any]:
+    """Counts every .tig program in directory, plus the sum over the ones that finished."""
+    programs = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.tig"))):
+        name = os.path.basename(path)
+        with open(path) as file:
+            programs[name] = executed_instructions(
+                file.read(), PROGRAM_INPUTS.get(name, ""), timeout
+            )
+    return {
+        "version": COUNTS_VERSION,
+        "commit": _current_commit(),
+        "programs": programs,
+        "total": sum(count for count in programs.values() if count is not None),
+    }
+
+
+def text_report(results: Dict[str, Any]) -> str:
+    lines = [f"{'':<24}{'instructions':>14}"]
+    for name, count in results["programs"].items():
+        if count is not None:
+            lines.append(f"{name:<24}{count:>14}")
+    lines.append(f"{'total':<24}{results['total']:>14}")
+    return "\n".join(lines) + "\n"
+
+
+def compare_report(baseline: Dict[str, Any], results: Dict[str, Any]) -> str:
+    """
+    The counts of both runs and their ratio (below 1 is fewer instructions),
+    for every program that both runs counted, and their sum.
+    """
+    lines = [
+        f"Compared with {baseline.get('commit') or 'an unknown commit'} "
+        f"(current / baseline)",
+        f"{'':<24}{'baseline':>14}{'current':>14}{'ratio':>10}",
+    ]
+    baseline_total = 0
+    total = 0
+    for name, count in results["programs"].items():
+        baseline_count = baseline["programs"].get(name)
+        if count is None or baseline_count is None:
+            continue
+        baseline_total += baseline_count
+        total += count
+        if count != baseline_count:
+            lines.append(f"{name:<24}{baseline_count:>14}{count:>14}{count / baseline_count:>10.3f}")
+    if baseline_total:
+        lines.append(f"{'total':<24}{baseline_total:>14}{total:>14}{total / baseline_total:>10.3f}")
+    return "\n".join(lines) + "\n"
+
+
+def setup_arguments(arguments=None):
+    parser = argparse.ArgumentParser(
+        description='Count the instructions the compiled examples execute'
+    )
+    parser.add_argument('--timeout', type=float, default=10.0, metavar='SECONDS',
+                        help='Give up on a program after SECONDS (default: 10)')
+    parser.add_argument('--output', default=None, metavar='FILE',
+                        help='Write the counts as JSON to FILE')
+    parser.add_argument('--compare', default=None, metavar='BASELINE',
+                        help='Compare the counts with earlier ones')
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    args = setup_arguments(arguments)
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("version") != COUNTS_VERSION:
+            sys.exit(f"{args.compare}: unsupported counts version {baseline.get('version')}")
+
+    results = count_corpus(args.timeout)
+    if baseline is None:
+        print(text_report(results))
+    else:
+        print(compare_report(baseline, results))
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+            output_file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Heap use of allocation-heavy programs.
+
+Every program in benchmarks/allocation/ is compiled, linked with the runtime
+and run with TIGER_HEAP_STATISTICS set, which makes the runtime report how
+many times it collected and the largest the heap grew (its high-water mark)
+when the program exits. The runs are also timed. Programs that do not
+compile, crash or run for longer than --timeout seconds have no results.
+
+    python3 -m benchmarks.heap --output heap.json
+    python3 -m benchmarks.heap --compare heap.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from benchmarks.execution import RUNTIME
+from benchmarks.run import ROOT_DIRECTORY, _current_commit
+from parser.parser import SyntacticError
+from putting_it_all_together.compiler import Compiler
+from semantic_analysis.analyzers import SemanticError
+
+# Version of the JSON layout.
+HEAP_VERSION = 1
+
+ALLOCATION_DIRECTORY = os.path.join(ROOT_DIRECTORY, "benchmarks", "allocation")
+
+STATISTICS = "tiger_heap"
+
+
+def heap_statistics(source: str, timeout: float = 60.0) -> Optional[Dict[str, Any]]:
+    """
+    The collections, the heap high-water mark in bytes and the seconds the
+    program ran, None if it does not finish.
+    """
+    try:
+        assembly = Compiler().compile(source)
+    except (SyntacticError, SemanticError):
+        return None
+
+    with tempfile.TemporaryDirectory() as directory:
+        assembly_file = os.path.join(directory, "output.s")
+        program = os.path.join(directory, "a.out")
+        with open(assembly_file, "w") as file:
+            file.write(assembly)
+        subprocess.run(
+            ["gcc", "-no-pie", "-O2", "-o", program, assembly_file, RUNTIME],
+            check=True,
+            capture_output=True,
+        )
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(
+                [program],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=dict(os.environ, TIGER_HEAP_STATISTICS="1"),
+            )
+        except subprocess.TimeoutExpired:
+            return None
+        seconds = time.perf_counter() - start
+
+    for line in result.stderr.splitlines():
+        words = line.split()
+        if words[:1] == [STATISTICS]:
+            statistics = dict(zip(words[1::2], map(int, words[2::2])))
+            return {
+                "collections": statistics["collections"],
+                "peak": statistics["peak"],
+                "seconds": seconds,
+            }
+    return None
+
+
+def measure_corpus(timeout: float, directory: str = ALLOCATION_DIRECTORY) -> Dict[str, Any]:
+    """Measures every .tig program in directory."""
+    programs = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.tig"))):
+        with open(path) as file:
+            programs[os.path.basename(path)] = heap_statistics(file.read(), timeout)
+    return {"version": HEAP_VERSION, "commit": _current_commit(), "programs": programs}
+
+
+def text_report(results: Dict[str, Any]) -> str:
+    lines = [f"{'':<24}{'collections':>12}{'peak KB':>12}{'seconds':>10}"]
+    for name, statistics in results["programs"].items():
+        if statistics is not None:
+            lines.append(
+                f"{name:<24}{statistics['collections']:>12}"
+                f"{statistics['peak'] // 1024:>12}{statistics['seconds']:>10.3f}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def compare_report(baseline: Dict[str, Any], results: Dict[str, Any]) -> str:
+    """
+    The peaks and times of both runs and their ratios (below 1 is less), for
+    every program that both runs measured.
+    """
+    lines = [
+        f"Compared with {baseline.get('commit') or 'an unknown commit'} "
+        f"(current / baseline)",
+        f"{'':<24}{'peak KB':>12}{'ratio':>8}{'seconds':>10}{'ratio':>8}",
+    ]
+    for name, statistics in results["programs"].items():
+        baseline_statistics = baseline["programs"].get(name)
+        if statistics is None or baseline_statistics is None:
+            continue
+        lines.append(
+            f"{name:<24}{statistics['peak'] // 1024:>12}"
+            f"{statistics['peak'] / baseline_statistics['peak']:>8.3f}"
+            f"{statistics['seconds']:>10.3f}"
+            f"{statistics['seconds'] / baseline_statistics['seconds']:>8.3f}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def setup_arguments(arguments=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the heap of the allocation-heavy programs'
+    )
+    parser.add_argument('--timeout', type=float, default=60.0, metavar='SECONDS',
+                        help='Give up on a program after SECONDS (default: 60)')
+    parser.add_argument('--output', default=None, metavar='FILE',
+                        help='Write the results as JSON to FILE')
+    parser.add_argument('--compare', default=None, metavar='BASELINE',
+                        help='Compare the results with earlier ones')
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    args = setup_arguments(arguments)
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("version") != HEAP_VERSION:
+            sys.exit(f"{args.compare}: unsupported heap version {baseline.get('version')}")
+
+    results = measure_corpus(args.timeout)
+    if baseline is None:
+        print(text_report(results))
+    else:
+        print(compare_report(baseline, results))
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+            output_file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
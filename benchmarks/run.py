@@ -0,0 +1,298 @@
+"""
+Benchmark harness for the compiler phases.
+
+Times lexing, parsing, semantic analysis (translate_program), canonization,
+instruction selection, register allocation and emission over two workloads:
+- every program in examples/ (the ones with errors stop at the failing phase);
+- synthetic programs (see benchmarks.synthetic) scaled along one axis at a
+  time: functions, nesting, expression depth, locals, loops and strings.
+
+Every program is compiled --repeat times and the fastest run of each phase
+is kept. The results can be written as a JSON baseline with --output and
+compared with an earlier baseline with --compare:
+
+    python3 -m benchmarks.run --output benchmarks/baseline.json
+    python3 -m benchmarks.run --compare benchmarks/baseline.json
+"""
+
+import argparse
+import gc
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks.synthetic import AXES, ProgramShape, generate_program
+from parser.parser import SyntacticError
+from putting_it_all_together.compiler import Compiler
+from putting_it_all_together.phase_profiler import PhaseProfiler
+from semantic_analysis.analyzers import SemanticError
+
+# Version of the JSON baseline layout.
+BASELINE_VERSION = 1
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLES_DIRECTORY = os.path.join(ROOT_DIRECTORY, "examples")
+
+# Top-level phases of Compiler.compile, in pipeline order.
+PHASES = (
+    "lex",
+    "parse",
+    "translate_program",
+    "simplify",
+    "canonize",
+    "optimize",
+    "codegen",
+    "register_allocation",
+    "emission",
+)
+
+# Values taken by each axis of the scaling series; the others keep the
+# defaults of ProgramShape.
+SCALING_VALUES: Dict[str, Sequence[int]] = {
+    "functions": (1, 2, 4, 8, 16, 32),
+    "nesting": (0, 1, 2, 4, 8),
+    "expression_depth": (1, 2, 3, 4, 5, 6),
+    "locals": (1, 4, 8, 16, 32, 64),
+    "loops": (0, 1, 4, 8, 16, 32),
+    "strings": (0, 1, 4, 16, 64),
+}
+
+# Smaller series for a quick check that the harness works.
+QUICK_SCALING_VALUES: Dict[str, Sequence[int]] = {
+    axis: values[:2] for axis, values in SCALING_VALUES.items()
+}
+
+
+def time_compilation(source: str, repeat: int) -> Dict[str, Any]:
+    """
+    Compiles source repeat times; returns the fastest wall time of every
+    top-level phase and of the whole compilation, in seconds.
+    """
+    phases: Dict[str, float] = {}
+    total = None
+    error = None
+    for _ in range(repeat):
+        profiler = PhaseProfiler()
+        gc.collect()
+        profiler.start()
+        try:
+            Compiler().compile(source, profiler)
+        except (SyntacticError, SemanticError) as err:
+            error = type(err).__name__
+        finally:
+            profiler.stop()
+
+        run_phases: Dict[str, float] = {}
+        for record in profiler.records:
+            if len(record.path) == 1:
+                run_phases[record.name] = run_phases.get(record.name, 0.0) + record.wall_time
+        for name, wall_time in run_phases.items():
+            phases[name] = min(phases.get(name, wall_time), wall_time)
+        total = profiler.wall_time if total is None else min(total, profiler.wall_time)
+
+    return {
+        "phases": {name: phases[name] for name in PHASES if name in phases},
+        "total": total,
+        "error": error,
+    }
+
+
+def benchmark_corpus(repeat: int, directory: str = EXAMPLES_DIRECTORY) -> Dict[str, Any]:
+    """Times every .tig program in directory, plus the sum over all of them."""
+    programs = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.tig"))):
+        with open(path) as file:
+            programs[os.path.basename(path)] = time_compilation(file.read(), repeat)
+
+    phases = {name: 0.0 for name in PHASES}
+    for timing in programs.values():
+        for name, wall_time in timing["phases"].items():
+            phases[name] += wall_time
+    return {
+        "programs": programs,
+        "phases": phases,
+        "total": sum(timing["total"] for timing in programs.values()),
+    }
+
+
+def benchmark_scaling(
+        repeat: int,
+        scaling_values: Dict[str, Sequence[int]] = SCALING_VALUES,
+        shape: ProgramShape = ProgramShape(),
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Times the synthetic programs of every axis, one point per value."""
+    series = {}
+    for axis in AXES:
+        if axis not in scaling_values:
+            continue
+        points = []
+        for value in scaling_values[axis]:
+            source = generate_program(shape.scaled(axis, value))
+            points.append({
+                "value": value,
+                "source_lines": source.count("\n"),
+                **time_compilation(source, repeat),
+            })
+        series[axis] = points
+    return series
+
+
+def run_benchmarks(
+        repeat: int,
+        scaling_values: Dict[str, Sequence[int]] = SCALING_VALUES,
+        corpus: bool = True,
+) -> Dict[str, Any]:
+    """The full baseline: environment, corpus timings and scaling series."""
+    shape = ProgramShape()
+    return {
+        "version": BASELINE_VERSION,
+        "commit": _current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "shape": {axis: getattr(shape, axis) for axis in AXES},
+        "corpus": benchmark_corpus(repeat) if corpus else None,
+        "scaling": benchmark_scaling(repeat, scaling_values, shape),
+    }
+
+
+def text_report(results: Dict[str, Any]) -> str:
+    lines = []
+    header = f"{'':<24}" + "".join(f"{_short(name):>10}" for name in PHASES) + f"{'total':>10}"
+    if results["corpus"] is not None:
+        corpus = results["corpus"]
+        lines.append(f"Corpus: {len(corpus['programs'])} programs (ms)")
+        lines.append(header)
+        lines.append(_row("examples/*.tig", corpus["phases"], corpus["total"]))
+        lines.append("")
+    for axis, points in results["scaling"].items():
+        lines.append(f"Scaling: {axis} (ms)")
+        lines.append(header)
+        for point in points:
+            lines.append(_row(f"{axis}={point['value']}", point["phases"], point["total"]))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def compare_report(baseline: Dict[str, Any], results: Dict[str, Any]) -> str:
+    """
+    Ratio of the current time to the baseline time of every phase (below 1
+    is faster), for the corpus and every scaling point both runs have.
+    """
+    lines = [
+        f"Compared with {baseline.get('commit') or 'an unknown commit'} "
+        f"(current / baseline)"
+    ]
+    header = f"{'':<24}" + "".join(f"{_short(name):>10}" for name in PHASES) + f"{'total':>10}"
+    if results["corpus"] is not None and baseline.get("corpus") is not None:
+        lines.append(header)
+        lines.append(_ratio_row("examples/*.tig", baseline["corpus"], results["corpus"]))
+    for axis, points in results["scaling"].items():
+        baseline_points = {
+            point["value"]: point for point in baseline.get("scaling", {}).get(axis, [])
+        }
+        rows = [
+            _ratio_row(f"{axis}={point['value']}", baseline_points[point["value"]], point)
+            for point in points
+            if point["value"] in baseline_points
+        ]
+        if rows:
+            lines.append("")
+            lines.append(header)
+            lines.extend(rows)
+    return "\n".join(lines) + "\n"
+
+
+def _row(label: str, phases: Dict[str, float], total: float) -> str:
+    return (
+        f"{label:<24}"
+        + "".join(_milliseconds(phases.get(name)) for name in PHASES)
+        + _milliseconds(total)
+    )
+
+
+def _ratio_row(label: str, baseline: Dict[str, Any], current: Dict[str, Any]) -> str:
+    ratios = [
+        _ratio(baseline["phases"].get(name), current["phases"].get(name))
+        for name in PHASES
+    ]
+    return f"{label:<24}" + "".join(ratios) + _ratio(baseline["total"], current["total"])
+
+
+def _milliseconds(seconds: Optional[float]) -> str:
+    return f"{'-':>10}" if seconds is None else f"{seconds * 1000:>10.2f}"
+
+
+def _ratio(baseline: Optional[float], current: Optional[float]) -> str:
+    if not baseline or current is None:
+        return f"{'-':>10}"
+    return f"{current / baseline:>10.2f}"
+
+
+def _short(phase: str) -> str:
+    return {"translate_program": "semantic", "register_allocation": "regalloc"}.get(phase, phase)
+
+
+def _current_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIRECTORY,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def setup_arguments(arguments=None):
+    parser = argparse.ArgumentParser(description='Benchmark the Tiger compiler phases')
+    parser.add_argument('--repeat', type=int, default=3, metavar='N',
+                        help='Compile every program N times and keep the fastest run (default: 3)')
+    parser.add_argument('--axis', action='append', choices=AXES, default=None,
+                        help='Only run the scaling series of this axis (repeatable)')
+    parser.add_argument('--no-corpus', action='store_true',
+                        help='Skip the examples/ corpus')
+    parser.add_argument('--quick', action='store_true',
+                        help='Only the two smallest points of every scaling series')
+    parser.add_argument('--output', default=None, metavar='FILE',
+                        help='Write the results as a JSON baseline to FILE')
+    parser.add_argument('--compare', default=None, metavar='BASELINE',
+                        help='Compare the results with a JSON baseline')
+    args = parser.parse_args(arguments)
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+    return args
+
+
+def main(arguments=None):
+    args = setup_arguments(arguments)
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("version") != BASELINE_VERSION:
+            sys.exit(f"{args.compare}: unsupported baseline version {baseline.get('version')}")
+
+    scaling_values = QUICK_SCALING_VALUES if args.quick else SCALING_VALUES
+    if args.axis is not None:
+        scaling_values = {axis: scaling_values[axis] for axis in args.axis}
+    results = run_benchmarks(args.repeat, scaling_values, corpus=not args.no_corpus)
+
+    print(text_report(results))
+    if baseline is not None:
+        print(compare_report(baseline, results))
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+            output_file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Synthetic Tiger programs that grow along one axis at a time.
+
+A ProgramShape fixes how many top-level functions a program declares, how
+deeply functions are nested inside each other, how deep the arithmetic
+expression returned by every function is, how many local variables, for
+loops and string literals each function body has. generate_program turns a
+shape into a valid, deterministic Tiger program; the benchmark harness keeps
+every axis but one at its default to get one scaling curve per axis.
+
+Nested functions read the first local variable of the function around them,
+which therefore escapes into its frame and is reached through static links.
+"""
+
+from dataclasses import dataclass, replace
+from typing import List
+
+OPERATORS = ("+", "-", "*")
+
+
+@dataclass(frozen=True)
+class ProgramShape:
+    functions: int = 4
+    nesting: int = 1
+    expression_depth: int = 3
+    locals: int = 4
+    loops: int = 1
+    strings: int = 1
+
+    def scaled(self, axis: str, value: int) -> "ProgramShape":
+        return replace(self, **{axis: value})
+
+
+AXES = tuple(ProgramShape.__dataclass_fields__)
+
+
+def generate_program(shape: ProgramShape) -> str:
+    """Returns the Tiger source of a program with the given shape."""
+    if shape.functions < 1:
+        raise ValueError("a program needs at least one function")
+    lines = ["let"]
+    for index in range(shape.functions):
+        lines.extend(_function(shape, f"f{index}", shape.nesting, None, 1))
+    lines.append("in")
+    calls = [f"    print_num(f{index}({index}, {index + 1}))" for index in range(shape.functions)]
+    lines.append(";\n".join(calls))
+    lines.append("end")
+    return "\n".join(lines) + "\n"
+
+
+def _function(
+        shape: ProgramShape, name: str, nesting: int, outer: str, indent: int
+) -> List[str]:
+    pad = "    " * indent
+    local_names = [f"{name}_v{index}" for index in range(max(shape.locals, 1))]
+    operands = ["a", "b"] + local_names + ([outer] if outer else [])
+
+    lines = [f"{pad}function {name}(a: int, b: int): int =", f"{pad}  let"]
+    for index, local in enumerate(local_names):
+        lines.append(f"{pad}    var {local} := {operands[index % 2]} + {index}")
+    if nesting > 0:
+        lines.extend(_function(shape, f"{name}_n", nesting - 1, local_names[0], indent + 1))
+    lines.append(f"{pad}  in")
+
+    body = []
+    for index in range(shape.loops):
+        local = local_names[index % len(local_names)]
+        body.append(f"for i := 0 to {index + 1} do {local} := {local} + i")
+    for index in range(shape.strings):
+        body.append(f'print_string("{name} {index}\\n")')
+    if nesting > 0:
+        body.append(f"{local_names[0]} := {local_names[0]} + {name}_n(a, b)")
+    body.append(_expression(operands, shape.expression_depth, [0]))
+    lines.append(";\n".join(f"{pad}    {expression}" for expression in body))
+    lines.append(f"{pad}  end")
+    return lines
+
+
+def _expression(operands: List[str], depth: int, counter: List[int]) -> str:
+    """A full binary tree of the given depth over the operands, used round robin."""
+    if depth == 0:
+        operand = operands[counter[0] % len(operands)]
+        counter[0] += 1
+        return operand
+    operator = OPERATORS[depth % len(OPERATORS)]
+    left = _expression(operands, depth - 1, counter)
+    right = _expression(operands, depth - 1, counter)
+    return f"({left} {operator} {right})"
@@ -1,5 +1,6 @@
 from typing import List
 
+from activation_records.context import profile_phase
 from canonical.basic_block import basic_block
 from canonical.linearize import linearize
 from canonical.trace import trace_schedule
@@ -7,4 +8,9 @@ from intermediate_representation.tree import Statement
 
 
 def canonize(statement: Statement) -> List[Statement]:
-    return trace_schedule(basic_block(linearize(statement)))
+    with profile_phase("linearize"):
+        statements = linearize(statement)
+    with profile_phase("basic_block"):
+        block = basic_block(statements)
+    with profile_phase("trace_schedule"):
+        return trace_schedule(block)
@@ -86,6 +86,15 @@ def do_statement(statement: Statement) -> Statement:
         return Sequence(substatement_list)
 
     if isinstance(statement, Jump):
+        if isinstance(statement.expression, Call):
+            # Tail jump: the call stays under the jump
+            new_statement, new_expressions = reorder(
+                [statement.expression.function] + statement.expression.arguments
+            )
+            return simplified_sequence(
+                new_statement,
+                Jump(Call(new_expressions[0], new_expressions[1:]), statement.labels),
+            )
         new_statement, new_expressions = reorder([statement.expression])
         return simplified_sequence(
             new_statement, Jump(new_expressions[0], statement.labels)
@@ -172,6 +181,13 @@ def reorder(expression_list: List[Expression]) -> Tuple[Statement, List[Expressi
         return reorder(expression_list)
 
     head_statement, head_expression = do_expression(expression_list[0])
+    if isinstance(head_expression, Call):
+        # An EvaluateSequence ending in a call, as inlining leaves them
+        temporary = TempManager.new_temp()
+        head_statement = simplified_sequence(
+            head_statement, Move(Temporary(temporary), head_expression)
+        )
+        head_expression = Temporary(temporary)
     tail_statement, tail_expressions = reorder(expression_list[1:])
     if commute(tail_statement, head_expression):
         return (
@@ -39,7 +39,7 @@ def reorder_blocks(statement_lists: List[List[Statement]]) -> List[List[Statemen
             result.append(current_block)
             last_statement = current_block[-1]
 
-            if isinstance(last_statement, Jump):
+            if isinstance(last_statement, Jump) and last_statement.labels:
                 target_label = last_statement.labels[0]
                 if target_label in unmarked_blocks:
                     current_block = unmarked_blocks[target_label]
@@ -57,7 +57,7 @@ def fix_jumps(statement_lists: List[List[Statement]]):
     """"""
     for index, statements in enumerate(statement_lists[:-1]):
         last_statement = statements[-1]
-        if isinstance(last_statement, Jump):
+        if isinstance(last_statement, Jump) and last_statement.labels:
             jump_label = last_statement.labels[0]
             next_block_label = block_label(statement_lists[index + 1])
             if next_block_label == jump_label:
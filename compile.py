@@ -1,20 +1,31 @@
 """
 Tiger Compiler with Options for Dumping the Ouput of Each Step.
+
+--time-phases reports the wall time, CPU time and object count of every
+phase, per function where the phase runs per function, along with register
+allocation statistics. --profile adds the peak memory of every phase, which
+makes the compilation several times slower. The report is printed as text or,
+with --profile-format json, as JSON that can be kept to track regressions.
 """
-from activation_records.frame import TempMap, sink, assembly_procedure
-from activation_records.instruction_removal import is_redundant_move
-from canonical.canonize import canonize
+from activation_records.context import current_context, profile_phase
+from activation_records.frame import TempMap
 from intermediate_representation.fragment import FragmentManager, ProcessFragment, StringFragment
-from register_allocation.allocation import RegisterAllocator
+from intermediate_representation.inline import InliningReport
 from semantic_analysis.analyzers import SemanticError, translate_program
-from instruction_selection.codegen import Codegen
-from putting_it_all_together.file_handler import FileHandler
-from lexer import lex as le
+from putting_it_all_together.backend import compile_fragments, compile_procedures
+from putting_it_all_together.compilation_cache import open_cache
+from putting_it_all_together.compiler import new_lexer, new_parser, parse_program, TokenReplay
+from putting_it_all_together.file_handler import FileHandler, write_assembly_file
+from putting_it_all_together.phase_profiler import PhaseProfiler
 from parser import parser as p
+import io
 import sys
 import logging
 import argparse
-from ply import lex
+from contextlib import contextmanager, redirect_stdout
+
+# Order in which the phase dumps are printed.
+DUMP_NAMES = ("lex", "parse", "sem", "inlining", "ir", "canon_ir", "assembly", "regalloc")
 
 
 def setup_logger():
@@ -30,13 +41,65 @@ def setup_arguments():
     parser.add_argument('-dump-lex', action='store_true', help='Dump lexer output')
     parser.add_argument('-dump-parse', action='store_true', help='Dump parser output')
     parser.add_argument('-dump-sem', action='store_true', help='Dump semantic analysis output')
+    parser.add_argument('-dump-inlining', action='store_true',
+                        help='Dump the inlining decision of every call site')
     parser.add_argument('-dump-ir', action='store_true', help='Dump intermediate representation')
     parser.add_argument('-dump-canon-ir', action='store_true', help='Dump canonized IR')
     parser.add_argument('-dump-assembly', action='store_true', help='Dump output of instruction selection')
     parser.add_argument('-dump-regalloc', action='store_true', help='Dump output of register allocation')
 
     parser.add_argument('-dump-all', action='store_true', help='Dump output of each phase')
-    return parser.parse_args()
+    parser.add_argument('--jobs', type=int, default=None, metavar='N',
+                        help='Compile functions in parallel on N processes')
+    parser.add_argument('--cache-dir', default=None, metavar='DIR',
+                        help='Reuse compilations cached in DIR (default: $TIGER_CACHE_DIR)')
+    parser.add_argument('--time-phases', action='store_true',
+                        help='Report wall time, CPU time and object counts of each phase')
+    parser.add_argument('--profile', action='store_true',
+                        help='Like --time-phases, also reporting peak memory (slower)')
+    parser.add_argument('--profile-format', choices=('text', 'json'), default='text',
+                        help='Format of the phase report (default: text)')
+    parser.add_argument('--profile-output', default=None, metavar='FILE',
+                        help='Write the phase report to FILE instead of stdout')
+    args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.jobs is not None and (args.dump_all or args.dump_canon_ir
+                                  or args.dump_assembly or args.dump_regalloc):
+        parser.error('--jobs cannot be combined with backend dumps')
+    if args.jobs is not None and (args.time_phases or args.profile):
+        parser.error('--jobs cannot be combined with --time-phases or --profile')
+    return args
+
+
+@contextmanager
+def captured_dump(artifacts, name):
+    """Prints a phase dump and keeps its text so it can be cached."""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        yield
+    artifacts[name] = output.getvalue()
+    sys.stdout.write(artifacts[name])
+
+
+def setup_profiler(args):
+    """Attaches a PhaseProfiler to the compilation if a phase report was requested."""
+    if not (args.time_phases or args.profile):
+        return None
+    profiler = PhaseProfiler(trace_memory=args.profile)
+    current_context().profiler = profiler
+    profiler.start()
+    return profiler
+
+
+def write_profile(profiler, args):
+    profiler.stop()
+    report = profiler.json_report() + "\n" if args.profile_format == 'json' else profiler.text_report()
+    if args.profile_output is None:
+        sys.stdout.write(report)
+    else:
+        with open(args.profile_output, "w") as output_file:
+            output_file.write(report)
 
 
 def main():
@@ -50,6 +113,7 @@ def main():
         args.dump_lex = True
         args.dump_parse = True
         args.dump_sem = True
+        args.dump_inlining = True
         args.dump_ir = True
         args.dump_canon_ir = True
         args.dump_assembly = True
@@ -62,52 +126,95 @@ def main():
         logging.error("Input file not found")
         sys.exit(1)
 
+    # The dumps do not change the generated code, so only --jobs is part of the key.
+    artifacts = {}
+    requested_dumps = [name for name in DUMP_NAMES if getattr(args, "dump_" + name)]
+    cache = open_cache(args.cache_dir)
+    cache_key = None
+    profiler = setup_profiler(args)
+    if cache is not None:
+        cache_key = cache.key(data, ["jobs"] if args.jobs is not None else [])
+        # A profiled compilation has to run, so it only refreshes the cache
+        cache_entry = cache.load(cache_key) if profiler is None else None
+        if cache_entry is not None and all(
+                name in cache_entry.artifacts for name in requested_dumps
+        ):
+            logging.info("Using cached compilation")
+            for name in requested_dumps:
+                sys.stdout.write(cache_entry.artifacts[name])
+            with open("output.s", "w") as output_file:
+                output_file.write(cache_entry.assembly)
+            logging.info("Compilation completed successfully")
+            return
+        if cache_entry is not None:
+            artifacts.update(cache_entry.artifacts)
+
     # Lexical Analysis
     logging.info("Starting lexical analysis")
-    lex.input(data)
 
     if args.dump_lex:
-        # TODO: will the following code affect other subsequent phases?
-        print("\n" + "="*50)
-        print("Lexical Analysis Output")
-        print("="*50)
-        while True:
-            tok = lex.token()
-            if not tok:
-                break  # No more input
-            print(tok)
-        print("="*50 + "\n")
+        with captured_dump(artifacts, "lex"):
+            # A lexer of its own, so the parser still starts from the first token
+            lexer = new_lexer()
+            lexer.input(data)
+            print("\n" + "="*50)
+            print("Lexical Analysis Output")
+            print("="*50)
+            while True:
+                tok = lexer.token()
+                if not tok:
+                    break  # No more input
+                print(tok)
+            print("="*50 + "\n")
 
     # Parsing
     try:
-        parsed_program = p.parser.parse(data, le.lexer)
+        if profiler is None:
+            parsed_program = parse_program(data)
+        else:
+            # Lex up front, so that lexing and parsing are timed separately
+            with profile_phase("lex"):
+                tokens = TokenReplay(data)
+            with profile_phase("parse"):
+                parsed_program = new_parser().parse(data, tokens)
     except p.SyntacticError as err:
         logging.error(f"Syntax error: {err}")
         sys.exit(1)
 
     if args.dump_parse:
-        print("\n" + "="*50)
-        print("Parser Output")
-        print("="*50)
-        print(parsed_program)
-        print("="*50 + "\n")
+        with captured_dump(artifacts, "parse"):
+            print("\n" + "="*50)
+            print("Parser Output")
+            print("="*50)
+            print(parsed_program)
+            print("="*50 + "\n")
 
     # Semantic Analysis and IR Translation
     logging.info("Starting semantic analysis")
     TempMap.initialize()
     try:
-        # translate_program(parsed_program)
-        typed_exp = translate_program(parsed_program)
+        with profile_phase("translate_program"):
+            typed_exp = translate_program(parsed_program)
     except SemanticError as err:
         logging.error(f"Semantic error: {err}")
         sys.exit(1)
 
     if args.dump_sem:
-        print("\n" + "="*50)
-        print("Semantic Analysis Output")
-        print("="*50)
-        print(typed_exp)
-        print("="*50 + "\n")
+        with captured_dump(artifacts, "sem"):
+            print("\n" + "="*50)
+            print("Semantic Analysis Output")
+            print("="*50)
+            print(typed_exp)
+            print("="*50 + "\n")
+
+    if args.dump_inlining:
+        with captured_dump(artifacts, "inlining"):
+            print("\n" + "="*50)
+            print("Inlining Decisions")
+            print("="*50)
+            for decision in InliningReport.get_decisions():
+                print(decision)
+            print("="*50 + "\n")
 
     # IR Processing
     process_fragments = []
@@ -120,74 +227,95 @@ def main():
             string_fragments.append(fragment)
 
     if args.dump_ir:
-        # TODO: pretty print (and dump as a dot file?)
-        #  Make the basic block more ``explicit'' in the dumped IR?
-        print("\n" + "="*50)
-        print("Tree IR")
-        print("="*50)
-        from persistence.ir_dump import print_ir_list
-        print_ir_list([fragment.body for fragment in process_fragments])
-        print("="*50)
-        for fragment in process_fragments:
-            print(fragment.body)
-        print("="*50 + "\n")
-
-    # Canonization
-    logging.info("Starting IR canonization")
-    canonized_bodies = [canonize(fragment.body) for fragment in process_fragments]
+        with captured_dump(artifacts, "ir"):
+            # TODO: pretty print (and dump as a dot file?)
+            #  Make the basic block more ``explicit'' in the dumped IR?
+            print("\n" + "="*50)
+            print("Tree IR")
+            print("="*50)
+            from persistence.ir_dump import print_ir_list
+            print_ir_list([fragment.body for fragment in process_fragments])
+            print("="*50)
+            for fragment in process_fragments:
+                print(fragment.body)
+            print("="*50 + "\n")
+
+    if args.jobs is not None:
+        # Canonization, instruction selection and register allocation per function
+        logging.info(f"Starting per-function backend on {args.jobs} process(es)")
+        write_assembly_file("output.s", string_fragments,
+                            compile_fragments(process_fragments, args.jobs))
+        store_in_cache(cache, cache_key, artifacts)
+        logging.info("Compilation completed successfully")
+        return
+
+    # Simplification, canonization, optimization, instruction selection and
+    # register allocation, one function at a time; each function is written
+    # out before the next starts. The backend dumps are printed once all
+    # functions are done.
+    logging.info("Starting per-function backend")
+    canonized_bodies = []
+    assembly_dumps = []
+
+    def keep_canonized_body(fragment, canonized_body):
+        canonized_bodies.append(canonized_body)
+
+    def keep_assembly_dump(fragment, assembly_body):
+        # Register allocation rewrites the instructions in place
+        assembly_dumps.append(repr(assembly_body))
+
+    procedures = compile_procedures(
+        process_fragments,
+        on_canonized=keep_canonized_body if args.dump_canon_ir else None,
+        on_selected=keep_assembly_dump if args.dump_assembly else None,
+    )
+    with FileHandler("output.s") as file_handler:
+        with profile_phase("emission"):
+            file_handler.print_data_section(string_fragments)
+
+        for fragment, procedure in zip(process_fragments, procedures):
+            with profile_phase("emission", fragment.frame.name):
+                file_handler.print_assembly_procedure(procedure)
 
     if args.dump_canon_ir:
-        # Dump the canonized IR
-        from persistence.ir_dump import print_canonized_ir
-        print("\n" + "="*50)
-        print("Canonized Tree IR")
-        print("="*50)
-        print_canonized_ir(canonized_bodies)
-        print("="*50)
-        print(canonized_bodies)
-        print("="*50 + "\n")
-
-    # Instruction Selection
-    logging.info("Starting instruction selection")
-    assembly_bodies = [Codegen.codegen(process_body) for process_body in canonized_bodies]
+        with captured_dump(artifacts, "canon_ir"):
+            # Dump the canonized IR
+            from persistence.ir_dump import print_canonized_ir
+            print("\n" + "="*50)
+            print("Canonized Tree IR")
+            print("="*50)
+            print_canonized_ir(canonized_bodies)
+            print("="*50)
+            print(canonized_bodies)
+            print("="*50 + "\n")
 
     if args.dump_assembly:
-        print("\n" + "="*50)
-        print("Instruction Selection Output")
-        print(assembly_bodies)
-        print("="*50 + "\n")
-
-
-    file_handler = FileHandler("output.s")
-    file_handler.print_data_header()
-    for string_fragment in string_fragments:
-        file_handler.print_string_fragment(string_fragment)
-
-    file_handler.print_code_header() # shoud we?
-
-    # Register Allocation
-    logging.info("Starting register allocation")
-    bodies_with_sink = [sink(assembly_body) for assembly_body in assembly_bodies]
-    for body, fragment in zip(bodies_with_sink, process_fragments):
-        allocation_result = RegisterAllocator(fragment.frame).main(body)
-        TempMap.update_temp_to_register(allocation_result.temp_to_register)
-        instruction_list = [
-            instruction
-            for instruction in allocation_result.instructions
-            if not is_redundant_move(instruction)
-        ]
-        procedure = assembly_procedure(fragment.frame, instruction_list)
-        file_handler.print_assembly_procedure(procedure)
+        with captured_dump(artifacts, "assembly"):
+            print("\n" + "="*50)
+            print("Instruction Selection Output")
+            print("[" + ", ".join(assembly_dumps) + "]")
+            print("="*50 + "\n")
 
     if args.dump_regalloc:
-        print("\n" + "="*50)
-        print("Register Allocation Output")
-        print("="*50)
-        print(file_handler)
-        print("="*50 + "\n")
+        with captured_dump(artifacts, "regalloc"):
+            print("\n" + "="*50)
+            print("Register Allocation Output")
+            print("="*50)
+            print(file_handler)
+            print("="*50 + "\n")
 
+    store_in_cache(cache, cache_key, artifacts)
+    if profiler is not None:
+        write_profile(profiler, args)
     logging.info("Compilation completed successfully")
 
 
+def store_in_cache(cache, cache_key, artifacts):
+    if cache is None:
+        return
+    with open("output.s", "r") as output_file:
+        cache.store(cache_key, output_file.read(), artifacts)
+
+
 if __name__ == "__main__":
     main()
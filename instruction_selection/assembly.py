@@ -1,7 +1,11 @@
 from activation_records.temp import Temp, TempLabel
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+import re
+from typing import Callable, List, Optional, TextIO
+
+# Operand placeholders: 's<i> (source), 'd<i> (destination) and 'j<i> (jump target).
+_PLACEHOLDER = re.compile(r"'([sdj])(\d+)")
 
 
 # Assembly language instruction without register assignments.
@@ -11,9 +15,28 @@ class Instruction(ABC):
     def format(self, temp_map: Callable[[Temp], str]) -> str:
         pass
 
-    def replace(self, prefix: str, replacements: List[str]):
-        for index in range(len(replacements)):
-            self.line = self.line.replace(f"{prefix}{index}", replacements[index])
+    def substitute(
+            self,
+            temp_map: Callable[[Temp], str],
+            jump: Optional[List[TempLabel]] = None,
+    ) -> str:
+        """
+        Replaces every placeholder of the line in a single pass; placeholders
+        without an operand are left as they are. The line itself is unchanged.
+        """
+        if "'" not in self.line:
+            return self.line
+        operands = {"s": self.source, "d": self.destination, "j": jump or []}
+
+        def operand(match: re.Match) -> str:
+            kind, index = match.group(1), int(match.group(2))
+            if index >= len(operands[kind]):
+                return match.group(0)
+            if kind == "j":
+                return operands[kind][index]
+            return temp_map(operands[kind][index])
+
+        return _PLACEHOLDER.sub(operand, self.line)
 
 
 @dataclass
@@ -24,12 +47,7 @@ class Operation(Instruction):
     jump: Optional[List[TempLabel]]
 
     def format(self, temp_map: Callable[[Temp], str]) -> str:
-        self.replace("'s", [temp_map(src) for src in self.source])
-        self.replace("'d", [temp_map(dst) for dst in self.destination])
-        if self.jump is not None:
-            self.replace("'j", self.jump)
-
-        return self.line
+        return self.substitute(temp_map, self.jump)
 
 
 @dataclass
@@ -48,10 +66,7 @@ class Move(Instruction):
     destination: List[Temp]
 
     def format(self, temp_map: Callable[[Temp], str]) -> str:
-        self.replace("'s", [temp_map(src) for src in self.source])
-        self.replace("'d", [temp_map(dst) for dst in self.destination])
-
-        return self.line
+        return self.substitute(temp_map)
 
 
 @dataclass
@@ -66,3 +81,10 @@ class Procedure:
                 + "".join([instruction.format(temp_map) for instruction in self.body])
                 + self.epilogue
         )
+
+    # Writes the procedure instruction by instruction, without building its text.
+    def write(self, file: TextIO, temp_map: Callable[[Temp], str]):
+        file.write(self.prologue)
+        for instruction in self.body:
+            file.write(instruction.format(temp_map))
+        file.write(self.epilogue)
@@ -22,12 +22,16 @@ Calling Convention: System V ABI
 Author: Tiger Compiler Project
 """
 
-from typing import List
-from abc import ABC
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from abc import ABC, ABCMeta
 import instruction_selection.assembly as Assembly
 import intermediate_representation.tree as IRT
 import activation_records.temp as Temp
 import activation_records.frame as Frame
+from activation_records.runtime import call_clobbers
+from activation_records.context import ContextAttribute
+from intermediate_representation.simplify import COMMUTATIVE_OPERATORS
 
 
 # x86-64 Assembly Target
@@ -41,6 +45,181 @@ import activation_records.frame as Frame
 # 0xaddr: absolute memory address
 # (%R): memory at address in register R
 # D(%R): memory at address R + displacement D
+# D(%B,%I,S): memory at address B + I * S + D, with S one of 1, 2, 4, 8
+#
+# munch_statement and munch_expression tile the IR trees maximally: a memory
+# access covers the whole address computation below it (see match_address),
+# leaq computes addresses and sums in one instruction, and constants that fit
+# in 32 bits are used as immediate operands instead of being loaded into a
+# temporary first.
+
+# Scale factors of the indexed addressing mode.
+ADDRESS_SCALES = (1, 2, 4, 8)
+
+
+def fits_immediate(value: int) -> bool:
+    """Immediates and displacements are sign-extended 32-bit values."""
+    return -(1 << 31) <= value < (1 << 31)
+
+
+def constant_value(expNode: IRT.Expression) -> Optional[int]:
+    """
+    The value of an expression made only of constants, additions,
+    subtractions and multiplications (such as the field offset
+    index * word_size), or None.
+    """
+    if isinstance(expNode, IRT.Constant):
+        return expNode.value
+    if isinstance(expNode, IRT.BinaryOperation) and expNode.operator in (
+            IRT.BinaryOperator.plus,
+            IRT.BinaryOperator.minus,
+            IRT.BinaryOperator.mul,
+    ):
+        left = constant_value(expNode.left)
+        right = None if left is None else constant_value(expNode.right)
+        if right is None:
+            return None
+        if expNode.operator == IRT.BinaryOperator.plus:
+            value = left + right
+        elif expNode.operator == IRT.BinaryOperator.minus:
+            value = left - right
+        else:
+            value = left * right
+        # Wrap around like the 64-bit instructions would
+        return (value + (1 << 63)) % (1 << 64) - (1 << 63)
+    return None
+
+
+def immediate(expNode: IRT.Expression) -> Optional[int]:
+    """The value of a constant expression usable as an immediate operand, or None."""
+    value = constant_value(expNode)
+    return value if value is not None and fits_immediate(value) else None
+
+
+@dataclass
+class Address:
+    """
+    Operand displacement(base, index, scale) covering an address computation.
+    base and index are the IR subtrees left to compute into registers. With
+    a label, the operand is label+displacement(%rip), which has neither.
+    """
+    displacement: int = 0
+    base: Optional[IRT.Expression] = None
+    index: Optional[IRT.Expression] = None
+    scale: int = 1
+    label: Optional[Temp.TempLabel] = None
+
+
+def scaled_index(expNode: IRT.Expression) -> Optional[Tuple[IRT.Expression, int]]:
+    """
+    (e, s) if expNode is e * s, s * e or e << log2(s) with s a scale of the
+    addressing mode.
+    """
+    if (
+            isinstance(expNode, IRT.BinaryOperation)
+            and expNode.operator == IRT.BinaryOperator.lshift
+            and constant_value(expNode.left) is None
+    ):
+        shift = constant_value(expNode.right)
+        if shift is not None and 0 <= shift < len(ADDRESS_SCALES):
+            return expNode.left, ADDRESS_SCALES[shift]
+    if (
+            isinstance(expNode, IRT.BinaryOperation)
+            and expNode.operator == IRT.BinaryOperator.mul
+    ):
+        for index, scale in ((expNode.left, expNode.right), (expNode.right, expNode.left)):
+            scale_value = constant_value(scale)
+            if scale_value in ADDRESS_SCALES and constant_value(index) is None:
+                return index, scale_value
+    return None
+
+
+def match_address(expNode: IRT.Expression) -> Address:
+    """
+    Covers as much of the address computation expNode as the addressing mode
+    allows:
+    - e + c, c + e and e - c fold the constant c into the displacement;
+    - e1 + e2 * s and e2 * s + e1, with s in ADDRESS_SCALES, index e2;
+    - e1 + e2 uses e2 as an index with scale 1;
+    - e * s alone is an index without a base;
+    - a label, plus a constant, is relative to %rip.
+    Anything else is the base register.
+    """
+    if isinstance(expNode, IRT.BinaryOperation) and expNode.operator in (
+            IRT.BinaryOperator.plus,
+            IRT.BinaryOperator.minus,
+    ):
+        plus = expNode.operator == IRT.BinaryOperator.plus
+        for rest, offset in (
+                ((expNode.left, expNode.right), (expNode.right, expNode.left))
+                if plus
+                else ((expNode.left, expNode.right),)
+        ):
+            offset_value = constant_value(offset)
+            if offset_value is None or constant_value(rest) is not None:
+                continue
+            address = match_address(rest)
+            displacement = address.displacement + (offset_value if plus else -offset_value)
+            if fits_immediate(displacement):
+                address.displacement = displacement
+                return address
+            return Address(base=expNode)
+
+        if plus and constant_value(expNode) is None:
+            for rest, index in ((expNode.left, expNode.right), (expNode.right, expNode.left)):
+                index_scale = scaled_index(index)
+                if index_scale is not None:
+                    address = match_address(rest)
+                    if address.index is not None or address.label is not None:
+                        address = Address(base=rest)
+                    address.index, address.scale = index_scale
+                    # (i + c) * s: c * s goes into the displacement
+                    index_address = match_address(address.index)
+                    displacement = (
+                            address.displacement + index_address.displacement * address.scale
+                    )
+                    if (
+                            index_address.displacement
+                            and index_address.index is None
+                            and fits_immediate(displacement)
+                    ):
+                        address.index = index_address.base
+                        address.displacement = displacement
+                    return address
+            return Address(base=expNode.left, index=expNode.right)
+
+    index_scale = scaled_index(expNode)
+    if index_scale is not None:
+        return Address(index=index_scale[0], scale=index_scale[1])
+    if isinstance(expNode, IRT.Name):
+        return Address(label=expNode.label)
+    return Address(base=expNode)
+
+
+def munch_address(address: Address, first_source: int) -> Tuple[str, List[Temp.Temp]]:
+    """
+    Computes the base and index of address into temporaries. Returns the
+    operand text, whose placeholders start at source number first_source,
+    and the temporaries to append to the instruction's sources.
+    """
+    if address.label is not None:
+        displacement = f"{address.displacement:+d}" if address.displacement else ""
+        return (
+            f"{address.label}{displacement}(%'s{first_source})",
+            [Frame.TempMap.register_to_temp["rip"]],
+        )
+    sources = []
+    base = index = ""
+    if address.base is not None:
+        base = f"%'s{first_source + len(sources)}"
+        sources.append(munch_expression(address.base))
+    if address.index is not None:
+        index = f",%'s{first_source + len(sources)}"
+        if address.scale != 1:
+            index += f",{address.scale}"
+        sources.append(munch_expression(address.index))
+    displacement = str(address.displacement) if address.displacement or not sources else ""
+    return f"{displacement}({base}{index})" if sources else displacement, sources
 
 
 def convert_relational_operator(operator: IRT.RelationalOperator) -> str:
@@ -90,7 +269,7 @@ def convert_binary_operator(operator: IRT.BinaryOperator) -> str:
 
     Note:
         Uses signed versions of multiplication and division (imulq, idivq).
-        Shift operations use arithmetic shifts for signed integers.
+        rshift is the logical and arshift the arithmetic right shift.
     """
     conversion_dictionary = {
         IRT.BinaryOperator.plus: "addq",     # Add quadword (64-bit)
@@ -100,13 +279,50 @@ def convert_binary_operator(operator: IRT.BinaryOperator) -> str:
         IRT.BinaryOperator.andOp: "andq",    # Bitwise AND quadword
         IRT.BinaryOperator.orOp: "orq",      # Bitwise OR quadword
         IRT.BinaryOperator.lshift: "salq",   # Shift left arithmetic quadword
-        IRT.BinaryOperator.rshift: "sarq",   # Shift right arithmetic quadword
-        IRT.BinaryOperator.arshift: "shrq",  # Shift right logical quadword
+        IRT.BinaryOperator.rshift: "shrq",   # Shift right logical quadword
+        IRT.BinaryOperator.arshift: "sarq",  # Shift right arithmetic quadword
         IRT.BinaryOperator.xor: "xorq",      # Bitwise XOR quadword
     }
     return conversion_dictionary[operator]
 
 
+def commute_relational_operator(operator: IRT.RelationalOperator) -> IRT.RelationalOperator:
+    """The operator that gives the same result with both operands swapped (a < b is b > a)."""
+    commuted = {
+        IRT.RelationalOperator.lt: IRT.RelationalOperator.gt,
+        IRT.RelationalOperator.gt: IRT.RelationalOperator.lt,
+        IRT.RelationalOperator.le: IRT.RelationalOperator.ge,
+        IRT.RelationalOperator.ge: IRT.RelationalOperator.le,
+        IRT.RelationalOperator.ult: IRT.RelationalOperator.ugt,
+        IRT.RelationalOperator.ugt: IRT.RelationalOperator.ult,
+        IRT.RelationalOperator.ule: IRT.RelationalOperator.uge,
+        IRT.RelationalOperator.uge: IRT.RelationalOperator.ule,
+    }
+    return commuted.get(operator, operator)
+
+
+# Operators computed in place by a two-address instruction (op src, dst).
+TWO_ADDRESS_OPERATORS = (
+    IRT.BinaryOperator.plus,
+    IRT.BinaryOperator.minus,
+    IRT.BinaryOperator.mul,
+    IRT.BinaryOperator.andOp,
+    IRT.BinaryOperator.orOp,
+    IRT.BinaryOperator.xor,
+    IRT.BinaryOperator.lshift,
+    IRT.BinaryOperator.rshift,
+    IRT.BinaryOperator.arshift,
+)
+
+
+# Shifts by a count in a register take the count in %cl.
+SHIFT_OPERATORS = (
+    IRT.BinaryOperator.lshift,
+    IRT.BinaryOperator.rshift,
+    IRT.BinaryOperator.arshift,
+)
+
+
 def munch_statement(stmNode: IRT.Statement) -> None:
     """
     Generate assembly code for an IR statement using pattern matching.
@@ -132,6 +348,20 @@ def munch_statement(stmNode: IRT.Statement) -> None:
     # Jump (addr, labels): Transfer control to address 'addr'. The destination may
     # be a literal label, or it may be an address calculated by any other kind of expression.
     # The list of labels 'labels' specifies all possible locations that 'addr' may jump to.
+    elif isinstance(stmNode, IRT.Jump) and isinstance(stmNode.expression, IRT.Call):
+        # Tail jump: the arguments go where the callee expects them, then our
+        # frame is popped (see assembly_procedure) and the callee returns
+        # directly to our caller. The jump leaves the function, so it uses
+        # what the sink would.
+        source = munch_arguments(stmNode.expression.arguments) + Frame.exit_live_temps()
+        Codegen.emit(
+            Assembly.Operation(
+                line=f"jmp {stmNode.expression.function.label}\n",
+                source=source,
+                destination=[],
+                jump=[],
+            )
+        )
     elif isinstance(stmNode, IRT.Jump):
         Codegen.emit(
             Assembly.Operation(
@@ -146,21 +376,34 @@ def munch_statement(stmNode: IRT.Statement) -> None:
         # The jump itself checks the flags in the EFL register.
         # These are usually set with TEST or CMP.
         # We swap the order of the expressions to match AT&T syntax's
-        # order of operands.
-        Codegen.emit(
-            Assembly.Operation(
-                line="cmpq %'s0, %'s1\n",
-                source=[
-                    munch_expression(stmNode.right),
-                    munch_expression(stmNode.left),
-                ],
-                destination=[],
-                jump=None,
+        # order of operands. An immediate can only be the first operand of
+        # cmpq, so a constant on the left is moved to the right by
+        # commuting the comparison.
+        operator, left, right = stmNode.operator, stmNode.left, stmNode.right
+        if immediate(left) is not None and immediate(right) is None:
+            operator, left, right = commute_relational_operator(operator), right, left
+        right_value = immediate(right)
+        if right_value is not None:
+            Codegen.emit(
+                Assembly.Operation(
+                    line=f"cmpq ${right_value}, %'s0\n",
+                    source=[munch_expression(left)],
+                    destination=[],
+                    jump=None,
+                )
+            )
+        else:
+            Codegen.emit(
+                Assembly.Operation(
+                    line="cmpq %'s0, %'s1\n",
+                    source=[munch_expression(right), munch_expression(left)],
+                    destination=[],
+                    jump=None,
+                )
             )
-        )
         Codegen.emit(
             Assembly.Operation(
-                line=f"{convert_relational_operator(stmNode.operator)} 'j0\n",
+                line=f"{convert_relational_operator(operator)} 'j0\n",
                 source=[],
                 destination=[],
                 jump=[stmNode.true, stmNode.false],
@@ -175,27 +418,28 @@ def munch_statement(stmNode: IRT.Statement) -> None:
 
         # Move(Temporary t, exp): evaluates 'exp' and moves it to temporary 't'.
         if isinstance(stmNode.temporary, IRT.Temporary):
-            Codegen.emit(
-                Assembly.Move(
-                    line="movq %'s0, %'d0\n",
-                    source=[munch_expression(stmNode.expression)],
-                    destination=[munch_expression(stmNode.temporary)],
-                )
-            )
+            munch_move_to_temporary(stmNode.temporary.temporary, stmNode.expression)
 
         # Move(mem(e1), e2): evaluates 'e1', yielding address 'addr'.
         # Then evaluate 'e2' and store the result into 'WordSize' bytes of memory
-        # starting at 'addr'.
+        # starting at 'addr'. The address computation is covered by the
+        # addressing mode, and a constant 'e2' is stored as an immediate.
         elif isinstance(stmNode.temporary, IRT.Memory):
-            Codegen.emit(
-                Assembly.Move(
-                    line="movq %'s0, (%'s1)\n",
-                    source=[
-                        munch_expression(stmNode.expression),
-                        munch_expression(stmNode.temporary.expression),
-                    ],
-                    destination=[],
+            value = immediate(stmNode.expression)
+            if value is not None:
+                operand, sources = munch_address(
+                    match_address(stmNode.temporary.expression), 0
                 )
+                line = f"movq ${value}, {operand}\n"
+            else:
+                sources = [munch_expression(stmNode.expression)]
+                operand, address_sources = munch_address(
+                    match_address(stmNode.temporary.expression), 1
+                )
+                sources += address_sources
+                line = f"movq %'s0, {operand}\n"
+            Codegen.emit(
+                Assembly.Operation(line=line, source=sources, destination=[], jump=None)
             )
 
         else:
@@ -214,32 +458,122 @@ def munch_statement(stmNode: IRT.Statement) -> None:
         raise Exception("No match for IRT node while munching a statement.")
 
 
-def munch_arguments(arg_list: List[IRT.Expression]) -> List[Temp.Temp]:
-    # Pass arguments through registers.
-    temp_list = []
-    for argument, register in zip(arg_list, Frame.argument_registers):
-        register_temp = Frame.TempMap.register_to_temp[register]
+def munch_move_to_temporary(temporary: Temp.Temp, expNode: IRT.Expression) -> None:
+    """
+    Evaluates expNode into temporary. Constants, loads and addresses are
+    computed straight into it, and t := t op e updates t in place.
+    """
+    value = constant_value(expNode)
+    if value is not None:
+        Codegen.emit(
+            Assembly.Move(
+                line=f"movq ${value}, %'d0\n", source=[], destination=[temporary]
+            )
+        )
+    elif isinstance(expNode, IRT.Memory):
+        operand, sources = munch_address(match_address(expNode.expression), 0)
+        Codegen.emit(
+            Assembly.Operation(
+                line=f"movq {operand}, %'d0\n",
+                source=sources,
+                destination=[temporary],
+                jump=None,
+            )
+        )
+    elif (
+            isinstance(expNode, IRT.BinaryOperation)
+            and expNode.operator in TWO_ADDRESS_OPERATORS
+            and isinstance(expNode.left, IRT.Temporary)
+            and expNode.left.temporary == temporary
+    ):
+        munch_two_address_operation(expNode.operator, temporary, expNode.right)
+    else:
         Codegen.emit(
             Assembly.Move(
                 line="movq %'s0, %'d0\n",
-                source=[munch_expression(argument)],
-                destination=[register_temp],
+                source=[munch_expression(expNode)],
+                destination=[temporary],
             )
         )
+
+
+def munch_two_address_operation(
+        operator: IRT.BinaryOperator, temporary: Temp.Temp, right: IRT.Expression
+) -> None:
+    """temporary := temporary operator right, with an immediate right operand if possible."""
+    mnemonic = convert_binary_operator(operator)
+    value = immediate(right)
+    if value is not None and operator in SHIFT_OPERATORS:
+        # The processor only uses the low 6 bits of a 64-bit shift count
+        value &= 63
+    if value is None and operator in SHIFT_OPERATORS:
+        rcx = Frame.TempMap.register_to_temp["rcx"]
+        Codegen.emit(
+            Assembly.Move(
+                line="movq %'s0, %'d0\n",
+                source=[munch_expression(right)],
+                destination=[rcx],
+            )
+        )
+        Codegen.emit(
+            Assembly.Operation(
+                line=f"{mnemonic} %cl, %'d0\n",
+                source=[temporary, rcx],
+                destination=[temporary],
+                jump=None,
+            )
+        )
+    elif value is not None:
+        Codegen.emit(
+            Assembly.Operation(
+                line=f"{mnemonic} ${value}, %'d0\n",
+                source=[temporary],
+                destination=[temporary],
+                jump=None,
+            )
+        )
+    else:
+        Codegen.emit(
+            Assembly.Operation(
+                line=f"{mnemonic} %'s1, %'d0\n",
+                source=[temporary, munch_expression(right)],
+                destination=[temporary],
+                jump=None,
+            )
+        )
+
+
+def munch_arguments(arg_list: List[IRT.Expression]) -> List[Temp.Temp]:
+    # Pass arguments through registers.
+    temp_list = []
+    for argument, register in zip(arg_list, Frame.argument_registers):
+        register_temp = Frame.TempMap.register_to_temp[register]
+        munch_move_to_temporary(register_temp, argument)
         temp_list.append(register_temp)
 
     # Put the remaining arguments in the stack (if any).
     rsp = Frame.TempMap.register_to_temp["rsp"]
     for index in range(len(Frame.argument_registers), len(arg_list)):
         offset = Frame.word_size * (index - len(Frame.argument_registers))
-        Codegen.emit(
-            Assembly.Operation(
-                line=f"movq %'s0, {offset}(%'s1)\n",
-                source=[munch_expression(arg_list[index]), rsp],
-                destination=[],
-                jump=None,
+        value = immediate(arg_list[index])
+        if value is not None:
+            Codegen.emit(
+                Assembly.Operation(
+                    line=f"movq ${value}, {offset}(%'s0)\n",
+                    source=[rsp],
+                    destination=[],
+                    jump=None,
+                )
+            )
+        else:
+            Codegen.emit(
+                Assembly.Operation(
+                    line=f"movq %'s0, {offset}(%'s1)\n",
+                    source=[munch_expression(arg_list[index]), rsp],
+                    destination=[],
+                    jump=None,
+                )
             )
-        )
 
     return temp_list
 
@@ -249,41 +583,64 @@ def munch_expression(expNode: IRT.Expression) -> Temp.Temp:
     # 'operator' to operands 'exp_left' and 'exp_right'. 'exp_left' is evaluated
     # before 'exp_right'.
     if isinstance(expNode, IRT.BinaryOperation):
-        if expNode.operator in (
-                IRT.BinaryOperator.plus,
-                IRT.BinaryOperator.minus,
-                IRT.BinaryOperator.andOp,
-                IRT.BinaryOperator.orOp,
-                IRT.BinaryOperator.xor,
-        ):
-            # add/sub/and/or/xor src, dst
+        value = constant_value(expNode)
+        if value is not None:
+            return munch_expression(IRT.Constant(value))
+
+        if expNode.operator in (IRT.BinaryOperator.plus, IRT.BinaryOperator.minus):
+            # Sums of registers and constants are address arithmetic:
+            # leaq disp(base, index, scale), dst
+            address = match_address(expNode)
+            if address.base is not expNode and (
+                    expNode.operator == IRT.BinaryOperator.plus or address.index is None
+            ):
+                temp = Temp.TempManager.new_temp()
+                operand, sources = munch_address(address, 0)
+                Codegen.emit(
+                    Assembly.Operation(
+                        line=f"leaq {operand}, %'d0\n",
+                        source=sources,
+                        destination=[temp],
+                        jump=None,
+                    )
+                )
+                return temp
+
+        if expNode.operator in TWO_ADDRESS_OPERATORS:
+            left, right = expNode.left, expNode.right
+            if (
+                    expNode.operator in COMMUTATIVE_OPERATORS
+                    and immediate(left) is not None
+            ):
+                # Commutative: keep the constant as the immediate operand
+                left, right = right, left
+
+            if expNode.operator == IRT.BinaryOperator.mul and immediate(right) is not None:
+                # imulq $imm, src, dst
+                temp = Temp.TempManager.new_temp()
+                Codegen.emit(
+                    Assembly.Operation(
+                        line=f"imulq ${immediate(right)}, %'s0, %'d0\n",
+                        source=[munch_expression(left)],
+                        destination=[temp],
+                        jump=None,
+                    )
+                )
+                return temp
+
+            # add/sub/imul/and/or/xor/sal/shr/sar src, dst
             temp = Temp.TempManager.new_temp()
             Codegen.emit(
                 Assembly.Move(
                     line="movq %'s0, %'d0\n",
-                    source=[munch_expression(expNode.left)],
+                    source=[munch_expression(left)],
                     destination=[temp],
                 )
             )
-            Codegen.emit(
-                Assembly.Operation(
-                    line=f"{convert_binary_operator(expNode.operator)} %'s1, %'d0\n",
-                    source=[temp, munch_expression(expNode.right)],
-                    destination=[temp],
-                    jump=None,
-                )
-            )
+            munch_two_address_operation(expNode.operator, temp, right)
             return temp
 
-        elif expNode.operator in (IRT.BinaryOperator.mul, IRT.BinaryOperator.div):
-            # imul S :  RDX:RAX <--- S * RAX
-            # In this implementation, we switch left and right operands, since
-            # multiplication is commutative.
-            # In this implementation, S has the right operand.
-            # In this implementation, RAX has the left operand.
-            # RDX:RAX has the result.
-            # RDX is discarded in this implementation.
-
+        elif expNode.operator == IRT.BinaryOperator.div:
             # idiv S :  RDX <--- RDX:RAX mod S
             #           RAX <--- RDX:RAX / S
             # S has the divisor.
@@ -296,25 +653,27 @@ def munch_expression(expNode: IRT.Expression) -> Temp.Temp:
             rax = Frame.TempMap.register_to_temp["rax"]
             rdx = Frame.TempMap.register_to_temp["rdx"]
 
+            # Both operands are computed before RAX is loaded: the divisor may
+            # itself contain a division, which would overwrite RAX and RDX.
+            dividend = munch_expression(expNode.left)
+            divisor = munch_expression(expNode.right)
             Codegen.emit(
                 Assembly.Move(
                     line="movq %'s0, %'d0\n",
-                    source=[munch_expression(expNode.left)],
+                    source=[dividend],
                     destination=[rax],
                 )
             )
-            # R[%rdx]:R[%rax] <- SignExtend(R[%rax])
-            # This is necessary only for the division, since it uses RDX:RAX as the dividend.
-            if expNode.operator == IRT.BinaryOperator.div:
-                Codegen.emit(
-                    Assembly.Operation(
-                        line="cqto\n", source=[rax], destination=[rdx], jump=None
-                    )
+            # R[%rdx]:R[%rax] <- SignExtend(R[%rax]), since RDX:RAX is the dividend.
+            Codegen.emit(
+                Assembly.Operation(
+                    line="cqto\n", source=[rax], destination=[rdx], jump=None
                 )
+            )
             Codegen.emit(
                 Assembly.Operation(
                     line=f"{convert_binary_operator(expNode.operator)} %'s2\n",
-                    source=[rax, rdx, munch_expression(expNode.right)],
+                    source=[rax, rdx, divisor],
                     destination=[rax, rdx],
                     jump=None,
                 )
@@ -326,40 +685,22 @@ def munch_expression(expNode: IRT.Expression) -> Temp.Temp:
             )
             return temp
 
-        elif isinstance(
-                expNode.operator,
-                (
-                        IRT.BinaryOperator.lshift,
-                        IRT.BinaryOperator.rshift,
-                        IRT.BinaryOperator.arshift,
-                ),
-        ):
-            # sal/sar/shr count, dst : dst <<=/>>= count
-            dst_temp = munch_expression(expNode.left)
-            Codegen.emit(
-                Assembly.Operation(
-                    line=f"{convert_binary_operator(expNode.operator)} %'s0, %'d0\n",
-                    source=[munch_expression(expNode.right), dst_temp],
-                    destination=[dst_temp],
-                    jump=None,
-                )
-            )
-            return dst_temp
-
         else:
             raise Exception(
                 "Munching a node IRT.BinaryOperator with an invalid operator"
             )
 
     # Memory(addr): The contents of 'Frame.word_size' bytes of memory, starting at address addr.
+    # The address computation is covered by the addressing mode.
     elif isinstance(expNode, IRT.Memory):
         temp = Temp.TempManager.new_temp()
+        operand, sources = munch_address(match_address(expNode.expression), 0)
         Codegen.emit(
             # This is an Operation and not a Move, since it should not be deleted if src and
             # dst are the same (they're not really the same, the source is a memory location).
             Assembly.Operation(
-                line="movq (%'s0), %'d0\n",
-                source=[munch_expression(expNode.expression)],
+                line=f"movq {operand}, %'d0\n",
+                source=sources,
                 destination=[temp],
                 jump=None,
             )
@@ -400,18 +741,17 @@ def munch_expression(expNode: IRT.Expression) -> Temp.Temp:
     # to argument list 'args'. The subexpression 'function' is evaluated before the
     # arguments, which are evaluated left to right.
     elif isinstance(expNode, IRT.Call):
-        # A CALL is expected to “trash” certain registers – the caller-save registers,
-        # and the return-value register. This list of calldefs should be listed as
-        # “destinations” of the CALL, so that the later phases of the compiler know
-        # that something happens to them here.
-        calldefs = [
-            Frame.TempMap.register_to_temp[register]
-            for register in Frame.caller_saved_registers
-                            + Frame.argument_registers
-                            + ["rax"]
-        ]
-
         if isinstance(expNode.function, IRT.Name):
+            # A CALL is expected to “trash” certain registers – for a Tiger function
+            # the caller-save registers, the argument registers and the return-value
+            # register, for a runtime function only what it returns. This list of
+            # calldefs should be listed as “destinations” of the CALL, so that the
+            # later phases of the compiler know that something happens to them here.
+            calldefs = [
+                Frame.TempMap.register_to_temp[register]
+                for register in call_clobbers(expNode.function.label)
+            ]
+
             # Reserve space in the stack for extra arguments.
             rsp = Frame.TempMap.register_to_temp["rsp"]
             stack_arguments_size = Frame.word_size * (
@@ -461,8 +801,12 @@ def munch_expression(expNode: IRT.Expression) -> Temp.Temp:
         raise Exception("No match for IRT node while munching an expression.")
 
 
-class Codegen(ABC):
-    instruction_list = []
+class _CodegenState(ABCMeta):
+    # Instructions emitted for the statement list being munched
+    instruction_list = ContextAttribute()
+
+
+class Codegen(ABC, metaclass=_CodegenState):
 
     @classmethod
     def emit(cls, instruction: Assembly.Instruction) -> None:
@@ -1,11 +1,12 @@
-from abc import ABC
-from typing import List
+from abc import ABC, ABCMeta
+from typing import List, Optional
 
 from dataclasses import dataclass
 
-from activation_records.frame import Frame
-from activation_records.temp import TempLabel
-from intermediate_representation.tree import Statement
+from activation_records.context import ContextAttribute
+from activation_records.frame import Frame, string_characters
+from activation_records.temp import TempLabel, TempManager
+from intermediate_representation.tree import Expression, Statement
 
 
 class Fragment(ABC):
@@ -22,15 +23,36 @@ class StringFragment(Fragment):
 class ProcessFragment(Fragment):
     body: Statement
     frame: Frame
+    # The body as translated, before the view shift, which the inliner copies
+    result: Optional[Expression] = None
 
 
-class FragmentManager(ABC):
-    fragment_list = []
+class _FragmentManagerState(ABCMeta):
+    fragment_list = ContextAttribute()
+    # The label of the literal holding each sequence of characters
+    string_labels = ContextAttribute()
+
+
+class FragmentManager(ABC, metaclass=_FragmentManagerState):
 
     @classmethod
     def add_fragment(cls, fragment: Fragment):
         cls.fragment_list.append(fragment)
 
+    @classmethod
+    def string_label(cls, string: str) -> TempLabel:
+        """
+        The label of the literal string, which is shared with every earlier
+        literal of the same characters, however they are written.
+        """
+        characters = string_characters(string)
+        label = cls.string_labels.get(characters)
+        if label is None:
+            label = TempManager.new_label()
+            cls.string_labels[characters] = label
+            cls.add_fragment(StringFragment(label, string))
+        return label
+
     @classmethod
     def get_fragments(cls) -> List[Fragment]:
         return cls.fragment_list
@@ -38,3 +60,4 @@ class FragmentManager(ABC):
     @classmethod
     def reset(cls):
         cls.fragment_list = []
+        cls.string_labels = {}
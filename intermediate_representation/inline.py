@@ -0,0 +1,380 @@
+"""
+Inline expansion of small Tiger functions.
+
+inline_calls runs once translation has produced every fragment, on the
+results of the functions (their bodies before the view shift). A call to a
+small Tiger function is replaced by a copy of the function body, run in the
+frame of the caller:
+- the arguments are moved into fresh temporaries, or into new slots of the
+  caller's frame for the formals that escape;
+- the local variables that live in the frame get new slots in the caller's
+  frame, and every other temporary and label of the body is renamed, so one
+  function can be inlined several times in the same caller;
+- the static link goes into a temporary, so the body still reaches the
+  variables of the functions enclosing it, whatever the nesting level of
+  the caller.
+
+A function is not inlined if its body hands its frame pointer to another
+function (to call a function nested in it), or if its body is larger than
+INLINING_BUDGET nodes, with a bonus for every constant argument, which the
+optimizer can then propagate. The calls inside an inlined body are inlined
+in turn, up to MAXIMUM_INLINING_DEPTH levels, but a function is never
+inlined into a copy of itself, so recursive functions are expanded once.
+
+Every decision is kept in InliningReport, one per call site. The inlined
+results then go through tail call elimination (see tail_calls), which builds
+the final bodies of the fragments.
+"""
+
+from abc import ABC, ABCMeta
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from activation_records.context import ContextAttribute, record_statistics
+from activation_records.frame import (
+    Frame,
+    InFrame,
+    TempMap,
+    frame_pointer,
+    static_link_offset,
+)
+from activation_records.temp import Temp, TempLabel, TempManager
+from intermediate_representation.fragment import Fragment, ProcessFragment
+from intermediate_representation.simplify import tree_size
+from intermediate_representation.tree import (
+    BinaryOperation,
+    BinaryOperator,
+    Call,
+    ConditionalJump,
+    Constant,
+    EvaluateSequence,
+    Expression,
+    Jump,
+    Label,
+    Memory,
+    Move,
+    Name,
+    Sequence,
+    Statement,
+    StatementExpression,
+    Temporary,
+)
+
+# Largest body inlined, in IR nodes
+INLINING_BUDGET = 40
+# Extra nodes allowed for every constant argument
+CONSTANT_ARGUMENT_BONUS = 10
+# Calls inlined inside inlined bodies, inside inlined bodies...
+MAXIMUM_INLINING_DEPTH = 3
+
+
+@dataclass
+class InliningDecision:
+    """
+    What was done with one call to a Tiger function.
+
+    Attributes:
+        function: The function whose code contains the call
+        caller: The function the call was written in, which differs from
+            function when the call comes from an inlined body
+        callee: The function called
+        size: The size of the callee's body, in IR nodes
+        inlined: Whether the call was replaced by the body
+        reason: Why
+    """
+    function: TempLabel
+    caller: TempLabel
+    callee: TempLabel
+    size: int
+    inlined: bool
+    reason: str
+
+    def __str__(self):
+        where = self.caller if self.caller == self.function else f"{self.caller} in {self.function}"
+        verdict = "inlined" if self.inlined else "not inlined"
+        return f"{where} -> {self.callee} ({self.size} nodes): {verdict}, {self.reason}"
+
+
+class _InliningReportState(ABCMeta):
+    inlining_decisions = ContextAttribute()
+
+
+class InliningReport(ABC, metaclass=_InliningReportState):
+
+    @classmethod
+    def add_decision(cls, decision: InliningDecision):
+        cls.inlining_decisions.append(decision)
+
+    @classmethod
+    def get_decisions(cls) -> List[InliningDecision]:
+        return cls.inlining_decisions
+
+    @classmethod
+    def reset(cls):
+        cls.inlining_decisions = []
+
+
+def frame_offset(address: Expression) -> Optional[int]:
+    """The offset of address from the frame pointer, None if it is not one."""
+    if (
+            isinstance(address, BinaryOperation)
+            and address.operator == BinaryOperator.plus
+            and address.left == Temporary(frame_pointer())
+            and isinstance(address.right, Constant)
+    ):
+        return address.right.value
+    return None
+
+
+def inlining_obstacle(function: ProcessFragment) -> Optional[str]:
+    """Why the body of function cannot be copied into another frame, None if it can."""
+    machine_temps = set(TempMap.register_to_temp.values())
+
+    def obstacle(node) -> Optional[str]:
+        if isinstance(node, Memory) and frame_offset(node.expression) is not None:
+            return None
+        if isinstance(node, Temporary) and node.temporary in machine_temps:
+            if node.temporary == frame_pointer():
+                return "passes its frame pointer on"
+            return "uses machine registers"
+        for child in children(node):
+            reason = obstacle(child)
+            if reason is not None:
+                return reason
+        return None
+
+    return obstacle(function.result)
+
+
+def children(node) -> list:
+    if isinstance(node, Sequence):
+        return node.sequence
+    if isinstance(node, (Jump, Memory, StatementExpression)):
+        return [node.expression]
+    if isinstance(node, Move):
+        return [node.temporary, node.expression]
+    if isinstance(node, (BinaryOperation, ConditionalJump)):
+        return [node.left, node.right]
+    if isinstance(node, EvaluateSequence):
+        return [node.statement, node.expression]
+    if isinstance(node, Call):
+        return [node.function] + node.arguments
+    return []
+
+
+class Expansion:
+    """The body of a function copied for one call, to run in another frame."""
+
+    def __init__(self, function: ProcessFragment, frame: Frame):
+        self.function = function
+        self.frame = frame
+        self.static_link = TempManager.new_temp()
+        self.temps: Dict[Temp, Temp] = {}
+        self.slots: Dict[int, int] = {}
+        self.labels: Dict[TempLabel, TempLabel] = {}
+        self._rename_labels(function.result)
+
+    def _rename_labels(self, node):
+        if isinstance(node, Label):
+            self.labels[node.label] = TempManager.new_label()
+        for child in children(node):
+            self._rename_labels(child)
+
+    def call(self, arguments: List[Expression]) -> Expression:
+        """The body, evaluated after moving arguments into the formals."""
+        moves = [
+            Move(
+                self.frame_slot(access.offset) if isinstance(access, InFrame)
+                else Temporary(self.temp(access.register)),
+                argument,
+            )
+            for access, argument in zip(self.function.frame.formal_parameters, arguments)
+        ]
+        return EvaluateSequence(Sequence(moves), self.expression(self.function.result))
+
+    def temp(self, temp: Temp) -> Temp:
+        if temp not in self.temps:
+            self.temps[temp] = TempManager.new_temp()
+        return self.temps[temp]
+
+    def label(self, label: TempLabel) -> TempLabel:
+        return self.labels.get(label, label)
+
+    def frame_slot(self, offset: int) -> Expression:
+        """The copy of the frame slot at offset in the function's frame."""
+        if offset == static_link_offset:
+            return Temporary(self.static_link)
+        if offset not in self.slots:
+            self.slots[offset] = self.frame.alloc_local(True).offset
+        return Memory(
+            BinaryOperation(
+                BinaryOperator.plus, Temporary(frame_pointer()), Constant(self.slots[offset])
+            )
+        )
+
+    def statement(self, statement: Statement) -> Statement:
+        if isinstance(statement, Sequence):
+            return Sequence([self.statement(inner) for inner in statement.sequence])
+        if isinstance(statement, Label):
+            return Label(self.label(statement.label))
+        if isinstance(statement, Jump):
+            return Jump(
+                self.expression(statement.expression),
+                [self.label(label) for label in statement.labels],
+            )
+        if isinstance(statement, ConditionalJump):
+            return ConditionalJump(
+                statement.operator,
+                self.expression(statement.left),
+                self.expression(statement.right),
+                self.label(statement.true),
+                self.label(statement.false),
+            )
+        if isinstance(statement, Move):
+            return Move(self.expression(statement.temporary), self.expression(statement.expression))
+        if isinstance(statement, StatementExpression):
+            return StatementExpression(self.expression(statement.expression))
+        return statement
+
+    def expression(self, expression: Expression) -> Expression:
+        if isinstance(expression, Memory):
+            offset = frame_offset(expression.expression)
+            if offset is not None:
+                return self.frame_slot(offset)
+            return Memory(self.expression(expression.expression))
+        if isinstance(expression, Temporary):
+            return Temporary(self.temp(expression.temporary))
+        if isinstance(expression, BinaryOperation):
+            return BinaryOperation(
+                expression.operator,
+                self.expression(expression.left),
+                self.expression(expression.right),
+            )
+        if isinstance(expression, EvaluateSequence):
+            return EvaluateSequence(
+                self.statement(expression.statement), self.expression(expression.expression)
+            )
+        if isinstance(expression, Call):
+            return Call(
+                self.expression(expression.function),
+                [self.expression(argument) for argument in expression.arguments],
+            )
+        if isinstance(expression, Name):
+            return Name(self.label(expression.label))
+        return expression
+
+
+class Inliner:
+    def __init__(self, functions: List[ProcessFragment]):
+        self.functions = {function.frame.name: function for function in functions}
+        self.obstacles = {
+            name: inlining_obstacle(function) for name, function in self.functions.items()
+        }
+        self.sizes = {
+            name: tree_size(function.result) for name, function in self.functions.items()
+        }
+        # The function being rewritten, and the functions inlined into it that
+        # the code being rewritten comes from, outermost first
+        self.fragment: Optional[ProcessFragment] = None
+        self.stack: List[TempLabel] = []
+        self.inlined_calls = 0
+
+    def inline(self, fragment: ProcessFragment) -> Expression:
+        """The result of fragment, with the calls in it inlined."""
+        self.fragment = fragment
+        self.stack = [fragment.frame.name]
+        self.inlined_calls = 0
+        return self.expression(fragment.result)
+
+    def obstacle(self, callee: TempLabel, budget: int) -> Optional[str]:
+        """Why the call to callee is not inlined, None if it is."""
+        if self.obstacles[callee] is not None:
+            return self.obstacles[callee]
+        if callee in self.stack:
+            return "recursive call"
+        if len(self.stack) > MAXIMUM_INLINING_DEPTH:
+            return "too deeply nested"
+        if self.sizes[callee] > budget:
+            return f"larger than {budget} nodes"
+        return None
+
+    def call(self, call: Call) -> Expression:
+        arguments = [self.expression(argument) for argument in call.arguments]
+        callee = call.function.label if isinstance(call.function, Name) else None
+        if callee not in self.functions:
+            return Call(call.function, arguments)
+
+        constants = sum(isinstance(argument, Constant) for argument in arguments)
+        budget = INLINING_BUDGET + constants * CONSTANT_ARGUMENT_BONUS
+        reason = self.obstacle(callee, budget)
+        InliningReport.add_decision(
+            InliningDecision(
+                self.fragment.frame.name,
+                self.stack[-1],
+                callee,
+                self.sizes[callee],
+                reason is None,
+                reason or f"at most {budget} nodes",
+            )
+        )
+        if reason is not None:
+            return Call(call.function, arguments)
+
+        self.inlined_calls += 1
+        expansion = Expansion(self.functions[callee], self.fragment.frame).call(arguments)
+        self.stack.append(callee)
+        # The arguments are already inlined; they are moved first, untouched
+        inlined = EvaluateSequence(expansion.statement, self.expression(expansion.expression))
+        self.stack.pop()
+        return inlined
+
+    def statement(self, statement: Statement) -> Statement:
+        if isinstance(statement, Sequence):
+            return Sequence([self.statement(inner) for inner in statement.sequence])
+        if isinstance(statement, Jump):
+            return Jump(self.expression(statement.expression), statement.labels)
+        if isinstance(statement, ConditionalJump):
+            return ConditionalJump(
+                statement.operator,
+                self.expression(statement.left),
+                self.expression(statement.right),
+                statement.true,
+                statement.false,
+            )
+        if isinstance(statement, Move):
+            return Move(self.expression(statement.temporary), self.expression(statement.expression))
+        if isinstance(statement, StatementExpression):
+            return StatementExpression(self.expression(statement.expression))
+        return statement
+
+    def expression(self, expression: Expression) -> Expression:
+        if isinstance(expression, Call):
+            return self.call(expression)
+        if isinstance(expression, Memory):
+            return Memory(self.expression(expression.expression))
+        if isinstance(expression, BinaryOperation):
+            return BinaryOperation(
+                expression.operator,
+                self.expression(expression.left),
+                self.expression(expression.right),
+            )
+        if isinstance(expression, EvaluateSequence):
+            return EvaluateSequence(
+                self.statement(expression.statement), self.expression(expression.expression)
+            )
+        return expression
+
+
+def inline_calls(fragments: List[Fragment]) -> Dict[TempLabel, Expression]:
+    """The results of the process fragments, with the calls to small functions inlined."""
+    functions = [
+        fragment
+        for fragment in fragments
+        if isinstance(fragment, ProcessFragment) and fragment.result is not None
+    ]
+    inliner = Inliner(functions)
+    results = {}
+    for function in functions:
+        results[function.frame.name] = inliner.inline(function)
+        record_statistics(function.frame.name, inlined_calls=inliner.inlined_calls)
+    return results
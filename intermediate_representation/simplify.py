@@ -0,0 +1,362 @@
+"""
+Constant folding and algebraic simplification of IR trees.
+
+simplify rewrites the body of a function between translation and
+canonization:
+- operations on constants are computed at compile time, with the 64-bit
+  wraparound of the generated code;
+- algebraic identities drop operations that do not change their operand
+  (e + 0, e * 1, e / 1...), and e * 0 becomes 0 when e has no side effects;
+- constants added to sums are gathered into one ((e + 1) + 2 is e + 3);
+- multiplications by powers of two become left shifts, and divisions by
+  powers of two become arithmetic right shifts, rounded towards zero like
+  idivq;
+- conditional jumps that compare two constants become unconditional jumps.
+
+Expressions that may trap or have side effects are never dropped: calls,
+memory reads and divisions stay, and divisions that trap at run time (by
+zero, or the smallest integer by -1) are not folded.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from activation_records.context import profile_phase, record_statistics
+from activation_records.temp import TempManager
+from intermediate_representation.fragment import ProcessFragment
+from intermediate_representation.tree import (
+    BinaryOperation,
+    BinaryOperator,
+    Call,
+    ConditionalJump,
+    Constant,
+    EvaluateSequence,
+    Expression,
+    Jump,
+    Memory,
+    Move,
+    Name,
+    RelationalOperator,
+    Sequence,
+    Statement,
+    StatementExpression,
+    Temporary,
+)
+
+WORD_BITS = 64
+
+# Operators whose operands can be swapped.
+COMMUTATIVE_OPERATORS = (
+    BinaryOperator.plus,
+    BinaryOperator.mul,
+    BinaryOperator.andOp,
+    BinaryOperator.orOp,
+    BinaryOperator.xor,
+)
+
+
+def wrap(value: int) -> int:
+    """value reduced to a signed 64-bit integer."""
+    return (value + (1 << (WORD_BITS - 1))) % (1 << WORD_BITS) - (1 << (WORD_BITS - 1))
+
+
+def unsigned(value: int) -> int:
+    return value % (1 << WORD_BITS)
+
+
+def power_of_two(value: int) -> Optional[int]:
+    """k if value is 2 ** k with k > 0, otherwise None."""
+    if value > 1 and value & (value - 1) == 0:
+        return value.bit_length() - 1
+    return None
+
+
+def fold_binary_operation(operator: BinaryOperator, left: int, right: int) -> Optional[int]:
+    """The value of left operator right, or None if it traps at run time."""
+    if operator == BinaryOperator.plus:
+        return wrap(left + right)
+    if operator == BinaryOperator.minus:
+        return wrap(left - right)
+    if operator == BinaryOperator.mul:
+        return wrap(left * right)
+    if operator == BinaryOperator.div:
+        if right == 0 or (left == -(1 << (WORD_BITS - 1)) and right == -1):
+            return None
+        # idivq rounds towards zero
+        quotient = abs(left) // abs(right)
+        return quotient if (left < 0) == (right < 0) else -quotient
+    if operator == BinaryOperator.andOp:
+        return wrap(left & right)
+    if operator == BinaryOperator.orOp:
+        return wrap(left | right)
+    if operator == BinaryOperator.xor:
+        return wrap(left ^ right)
+    # Shift counts are taken modulo the word size, as the processor does
+    shift = right % WORD_BITS
+    if operator == BinaryOperator.lshift:
+        return wrap(left << shift)
+    if operator == BinaryOperator.rshift:
+        return wrap(unsigned(left) >> shift)
+    return left >> shift
+
+
+def fold_relational_operator(operator: RelationalOperator, left: int, right: int) -> bool:
+    if operator in (
+            RelationalOperator.ult,
+            RelationalOperator.ule,
+            RelationalOperator.ugt,
+            RelationalOperator.uge,
+    ):
+        left, right = unsigned(left), unsigned(right)
+    return {
+        RelationalOperator.eq: left == right,
+        RelationalOperator.ne: left != right,
+        RelationalOperator.lt: left < right,
+        RelationalOperator.gt: left > right,
+        RelationalOperator.le: left <= right,
+        RelationalOperator.ge: left >= right,
+        RelationalOperator.ult: left < right,
+        RelationalOperator.ule: left <= right,
+        RelationalOperator.ugt: left > right,
+        RelationalOperator.uge: left >= right,
+    }[operator]
+
+
+def is_pure(expression: Expression) -> bool:
+    """
+    Whether evaluating expression can be skipped: it has no side effects
+    and cannot trap (no calls, statements, memory reads or divisions).
+    """
+    if isinstance(expression, (Constant, Temporary, Name)):
+        return True
+    if isinstance(expression, BinaryOperation):
+        return (
+                expression.operator != BinaryOperator.div
+                and is_pure(expression.left)
+                and is_pure(expression.right)
+        )
+    return False
+
+
+def tree_size(node) -> int:
+    """Number of IR nodes in a statement or expression."""
+    if isinstance(node, Sequence):
+        return 1 + sum(tree_size(statement) for statement in node.sequence)
+    if isinstance(node, (Jump, Memory, StatementExpression)):
+        return 1 + tree_size(node.expression)
+    if isinstance(node, (Move, BinaryOperation, ConditionalJump)):
+        children = (
+            (node.temporary, node.expression) if isinstance(node, Move)
+            else (node.left, node.right)
+        )
+        return 1 + sum(tree_size(child) for child in children)
+    if isinstance(node, EvaluateSequence):
+        return 1 + tree_size(node.statement) + tree_size(node.expression)
+    if isinstance(node, Call):
+        return 1 + tree_size(node.function) + sum(
+            tree_size(argument) for argument in node.arguments
+        )
+    return 1
+
+
+@dataclass
+class SimplificationStatistics:
+    """What simplify did to one function body."""
+    folded_constants: int = 0
+    algebraic_simplifications: int = 0
+    strength_reductions: int = 0
+    folded_jumps: int = 0
+    removed_nodes: int = 0
+
+
+class Simplifier:
+    def __init__(self):
+        self.statistics = SimplificationStatistics()
+
+    def statement(self, statement: Statement) -> Statement:
+        if isinstance(statement, Sequence):
+            return Sequence([self.statement(inner) for inner in statement.sequence])
+
+        if isinstance(statement, Move):
+            destination = statement.temporary
+            if isinstance(destination, Memory):
+                destination = Memory(self.expression(destination.expression))
+            return Move(destination, self.expression(statement.expression))
+
+        if isinstance(statement, StatementExpression):
+            expression = self.expression(statement.expression)
+            if is_pure(expression) and not isinstance(expression, Constant):
+                # Evaluated only to be thrown away
+                self.statistics.algebraic_simplifications += 1
+                expression = Constant(0)
+            return StatementExpression(expression)
+
+        if isinstance(statement, Jump):
+            return Jump(self.expression(statement.expression), statement.labels)
+
+        if isinstance(statement, ConditionalJump):
+            left = self.expression(statement.left)
+            right = self.expression(statement.right)
+            if isinstance(left, Constant) and isinstance(right, Constant):
+                self.statistics.folded_jumps += 1
+                taken = fold_relational_operator(statement.operator, left.value, right.value)
+                label = statement.true if taken else statement.false
+                return Jump(Name(label), [label])
+            return ConditionalJump(
+                statement.operator, left, right, statement.true, statement.false
+            )
+
+        return statement
+
+    def expression(self, expression: Expression) -> Expression:
+        if isinstance(expression, BinaryOperation):
+            return self.binary_operation(
+                expression.operator,
+                self.expression(expression.left),
+                self.expression(expression.right),
+            )
+
+        if isinstance(expression, Memory):
+            return Memory(self.expression(expression.expression))
+
+        if isinstance(expression, EvaluateSequence):
+            statement = self.statement(expression.statement)
+            result = self.expression(expression.expression)
+            if isinstance(statement, StatementExpression) and isinstance(
+                    statement.expression, Constant
+            ):
+                return result
+            return EvaluateSequence(statement, result)
+
+        if isinstance(expression, Call):
+            return Call(
+                self.expression(expression.function),
+                [self.expression(argument) for argument in expression.arguments],
+            )
+
+        return expression
+
+    def binary_operation(
+            self, operator: BinaryOperator, left: Expression, right: Expression
+    ) -> Expression:
+        """operator applied to the already simplified left and right."""
+        if isinstance(left, Constant) and isinstance(right, Constant):
+            value = fold_binary_operation(operator, left.value, right.value)
+            if value is not None:
+                self.statistics.folded_constants += 1
+                return Constant(value)
+
+        if operator in (BinaryOperator.plus, BinaryOperator.minus):
+            return self.sum(operator, left, right)
+
+        if operator in COMMUTATIVE_OPERATORS and isinstance(left, Constant):
+            # Constants go on the right
+            left, right = right, left
+
+        right_value = right.value if isinstance(right, Constant) else None
+
+        if right_value is not None:
+            if (
+                    right_value == 1 and operator in (BinaryOperator.mul, BinaryOperator.div)
+                    or right_value == 0 and operator in (
+                        BinaryOperator.orOp,
+                        BinaryOperator.xor,
+                        BinaryOperator.lshift,
+                        BinaryOperator.rshift,
+                        BinaryOperator.arshift,
+                    )
+                    or right_value == -1 and operator == BinaryOperator.andOp
+            ):
+                self.statistics.algebraic_simplifications += 1
+                return left
+            if (
+                    right_value == 0
+                    and operator in (BinaryOperator.mul, BinaryOperator.andOp)
+                    and is_pure(left)
+            ):
+                self.statistics.algebraic_simplifications += 1
+                return Constant(0)
+
+            shift = power_of_two(right_value)
+            if shift is not None and operator == BinaryOperator.mul:
+                self.statistics.strength_reductions += 1
+                return BinaryOperation(BinaryOperator.lshift, left, Constant(shift))
+            if shift is not None and operator == BinaryOperator.div:
+                self.statistics.strength_reductions += 1
+                return self.divide_by_power_of_two(left, shift)
+
+        return BinaryOperation(operator, left, right)
+
+    def sum(self, operator: BinaryOperator, left: Expression, right: Expression) -> Expression:
+        """left + right or left - right, with the constant terms gathered on the right."""
+        if operator == BinaryOperator.plus and isinstance(left, Constant):
+            left, right = right, left
+        if not isinstance(right, Constant):
+            return BinaryOperation(operator, left, right)
+
+        offset = right.value if operator == BinaryOperator.plus else wrap(-right.value)
+        if (
+                isinstance(left, BinaryOperation)
+                and left.operator in (BinaryOperator.plus, BinaryOperator.minus)
+                and isinstance(left.right, Constant)
+        ):
+            # (e + c1) + c2 is e + (c1 + c2)
+            inner = left.right.value
+            offset = wrap(offset + (inner if left.operator == BinaryOperator.plus else -inner))
+            left = left.left
+            self.statistics.folded_constants += 1
+
+        if offset == 0:
+            self.statistics.algebraic_simplifications += 1
+            return left
+        if offset < 0 and offset != -(1 << (WORD_BITS - 1)):
+            return BinaryOperation(BinaryOperator.minus, left, Constant(-offset))
+        return BinaryOperation(BinaryOperator.plus, left, Constant(offset))
+
+    @staticmethod
+    def divide_by_power_of_two(dividend: Expression, shift: int) -> Expression:
+        """
+        dividend / 2 ** shift. An arithmetic shift rounds towards minus
+        infinity, so negative dividends are first biased by 2 ** shift - 1:
+        (d + ((d >>a 63) >>l (64 - shift))) >>a shift.
+        """
+        if isinstance(dividend, Temporary):
+            value, setup = dividend, None
+        else:
+            value = Temporary(TempManager.new_temp())
+            setup = Move(value, dividend)
+        bias = BinaryOperation(
+            BinaryOperator.rshift,
+            BinaryOperation(BinaryOperator.arshift, value, Constant(WORD_BITS - 1)),
+            Constant(WORD_BITS - shift),
+        )
+        quotient = BinaryOperation(
+            BinaryOperator.arshift,
+            BinaryOperation(BinaryOperator.plus, value, bias),
+            Constant(shift),
+        )
+        return quotient if setup is None else EvaluateSequence(setup, quotient)
+
+
+def simplify(statement: Statement) -> Tuple[Statement, SimplificationStatistics]:
+    """The simplified statement and what was simplified."""
+    simplifier = Simplifier()
+    simplified = simplifier.statement(statement)
+    simplifier.statistics.removed_nodes = tree_size(statement) - tree_size(simplified)
+    return simplified, simplifier.statistics
+
+
+def simplified_body(fragment: ProcessFragment) -> Statement:
+    """The simplified body of a function, reporting the statistics to the profiler."""
+    name = fragment.frame.name
+    with profile_phase("simplify", name):
+        body, statistics = simplify(fragment.body)
+    record_statistics(
+        name,
+        folded_constants=statistics.folded_constants,
+        algebraic_simplifications=statistics.algebraic_simplifications,
+        strength_reductions=statistics.strength_reductions,
+        folded_jumps=statistics.folded_jumps,
+        removed_nodes=statistics.removed_nodes,
+    )
+    return body
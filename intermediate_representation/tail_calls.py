@@ -0,0 +1,174 @@
+"""
+Tail call elimination.
+
+eliminate_tail_calls runs after inlining, on the results of the functions,
+and builds the final bodies of the fragments from them. A call is in tail
+position when its value is the result of the function: the result itself,
+the last expression of a let or a sequence, or a branch of an if.
+
+- A call of the function to itself becomes a loop: the arguments are moved
+  into the formals, all of them evaluated before the first one changes,
+  and control jumps back to the start of the body, after the view shift.
+  The frame is reused, so deep recursion does not grow the stack.
+- A call to another Tiger function becomes a tail jump (see Jump): our
+  frame is popped, and the callee returns directly to our caller. This is
+  only done when every argument fits in a register, and when the callee
+  does not need our frame, that is when no argument is our frame pointer
+  (which a function nested in ours receives as its static link).
+
+Calls to the runtime are left alone.
+"""
+
+from typing import Dict, List, Optional
+
+from activation_records.context import record_statistics
+from activation_records.frame import (
+    Frame,
+    access_to_exp,
+    argument_registers,
+    frame_pointer,
+    return_value,
+    shift_view,
+)
+from activation_records.temp import TempLabel, TempManager
+from intermediate_representation.fragment import Fragment, ProcessFragment
+from intermediate_representation.inline import children, frame_offset
+from intermediate_representation.tree import (
+    Call,
+    Constant,
+    EvaluateSequence,
+    Expression,
+    Jump,
+    Label,
+    Memory,
+    Move,
+    Name,
+    Sequence,
+    Statement,
+    Temporary,
+)
+
+
+def passes_frame_pointer(expression: Expression) -> bool:
+    """Whether the value of expression may be our frame pointer, not just read through it."""
+    if isinstance(expression, Memory) and frame_offset(expression.expression) is not None:
+        return False
+    if expression == Temporary(frame_pointer()):
+        return True
+    return any(passes_frame_pointer(child) for child in children(expression))
+
+
+class TailCallEliminator:
+    def __init__(self, functions: List[ProcessFragment]):
+        self.functions = {function.frame.name: function for function in functions}
+        # The function being rewritten
+        self.function: Optional[ProcessFragment] = None
+        self.loop: Optional[TempLabel] = None
+        self.tail_recursions = 0
+        self.tail_jumps = 0
+
+    def eliminate(self, function: ProcessFragment, result: Expression) -> Statement:
+        """The body of function, built from its result with the tail calls eliminated."""
+        self.function = function
+        self.loop = None
+        self.tail_recursions = 0
+        self.tail_jumps = 0
+
+        result = self.tail(result)
+        body = [Move(Temporary(return_value()), result)]
+        if self.loop is not None:
+            body.insert(0, Label(self.loop))
+        return shift_view(function.frame, Sequence(body))
+
+    def tail(self, expression: Expression) -> Expression:
+        """expression, which is in tail position, with its tail calls eliminated."""
+        if isinstance(expression, Call):
+            return self.call(expression)
+        if isinstance(expression, EvaluateSequence):
+            statement = expression.statement
+            if isinstance(expression.expression, Temporary) and isinstance(statement, Sequence):
+                statement = self.branches(statement, expression.expression)
+            return EvaluateSequence(statement, self.tail(expression.expression))
+        return expression
+
+    def branches(self, sequence: Sequence, result: Temporary) -> Sequence:
+        """
+        The sequence of an if whose value is result, with the values of its
+        branches in tail position. A branch is a move to result followed by
+        the label that ends the if, or by a jump to it.
+        """
+        statements = sequence.sequence
+        if not statements or not isinstance(statements[-1], Label):
+            return sequence
+        join = statements[-1].label
+        rewritten = list(statements)
+        for index, statement in enumerate(statements[:-1]):
+            following = statements[index + 1]
+            if (
+                    isinstance(statement, Move)
+                    and statement.temporary == result
+                    and (following == statements[-1] or following == Jump(Name(join), [join]))
+            ):
+                rewritten[index] = Move(result, self.tail(statement.expression))
+        return Sequence(rewritten)
+
+    def call(self, call: Call) -> Expression:
+        callee = call.function.label if isinstance(call.function, Name) else None
+        if callee == self.function.frame.name:
+            return self.recursion(call.arguments)
+        if (
+                callee in self.functions
+                and len(call.arguments) <= len(argument_registers)
+                and not any(passes_frame_pointer(argument) for argument in call.arguments)
+        ):
+            return self.jump(callee, call.arguments)
+        return call
+
+    def recursion(self, arguments: List[Expression]) -> Expression:
+        """Moves the arguments into the formals, and jumps back to the start of the body."""
+        frame: Frame = self.function.frame
+        if self.loop is None:
+            self.loop = TempManager.new_label()
+        self.tail_recursions += 1
+
+        formals = [
+            (formal, argument)
+            for formal, argument in (
+                (access_to_exp(access, Temporary(frame_pointer())), argument)
+                for access, argument in zip(frame.formal_parameters, arguments)
+            )
+            # The static link is passed on unchanged
+            if formal != argument
+        ]
+        values = [Temporary(TempManager.new_temp()) for _ in formals]
+        moves = [Move(value, argument) for value, (_, argument) in zip(values, formals)]
+        moves += [Move(formal, value) for value, (formal, _) in zip(values, formals)]
+        return EvaluateSequence(
+            Sequence(moves + [Jump(Name(self.loop), [self.loop])]), Constant(0)
+        )
+
+    def jump(self, callee: TempLabel, arguments: List[Expression]) -> Expression:
+        """Evaluates the arguments and jumps to callee."""
+        self.tail_jumps += 1
+        values = [Temporary(TempManager.new_temp()) for _ in arguments]
+        moves = [Move(value, argument) for value, argument in zip(values, arguments)]
+        return EvaluateSequence(
+            Sequence(moves + [Jump(Call(Name(callee), values), [])]), Constant(0)
+        )
+
+
+def eliminate_tail_calls(fragments: List[Fragment], results: Dict[TempLabel, Expression]):
+    """Builds the bodies of the process fragments from their results, without their tail calls."""
+    functions = [
+        fragment
+        for fragment in fragments
+        if isinstance(fragment, ProcessFragment) and fragment.frame.name in results
+    ]
+    eliminator = TailCallEliminator(functions)
+    for function in functions:
+        function.body = eliminator.eliminate(function, results[function.frame.name])
+        record_statistics(
+            function.frame.name,
+            tail_recursions=eliminator.tail_recursions,
+            tail_jumps=eliminator.tail_jumps,
+        )
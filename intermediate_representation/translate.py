@@ -3,11 +3,7 @@ from typing import Optional, List
 import parser.ast_nodes as ast
 import activation_records.frame as frame
 from activation_records.temp import TempManager, TempLabel
-from intermediate_representation.fragment import (
-    StringFragment,
-    FragmentManager,
-    ProcessFragment,
-)
+from intermediate_representation.fragment import FragmentManager, ProcessFragment
 from intermediate_representation.level import Access, Level, RealLevel
 from intermediate_representation.translated_expression import (
     TranslatedExpression,
@@ -114,9 +110,7 @@ def integer_expression(integer: int) -> TranslatedExpression:
 
 
 def string_expression(string: str) -> TranslatedExpression:
-    string_label = TempManager.new_label()
-    FragmentManager.add_fragment(StringFragment(string_label, string))
-    return Expression(Name(string_label))
+    return Expression(Name(FragmentManager.string_label(string)))
 
 
 def call_expression(
@@ -171,27 +165,28 @@ def conditional_operation_expression(
 def string_conditional_operation_expression(
         operator: ast.Oper, left: TranslatedExpression, right: TranslatedExpression
 ) -> TranslatedExpression:
-    jump_expression = ConditionalJump(
-        convert_conditional_operator(operator),
-        frame.external_call(
-            "string_compare",
-            [convert_to_expression(left), convert_to_expression(right)],
-        ),
-        Constant(0),
-    )
+    arguments = [convert_to_expression(left), convert_to_expression(right)]
+    if operator in (ast.Oper.eq, ast.Oper.neq):
+        # string_equal gives up as soon as the lengths or the hashes differ
+        jump_expression = ConditionalJump(
+            RelationalOperator.ne if operator == ast.Oper.eq else RelationalOperator.eq,
+            frame.external_call("string_equal", arguments),
+            Constant(0),
+        )
+    else:
+        jump_expression = ConditionalJump(
+            convert_conditional_operator(operator),
+            frame.external_call("string_compare", arguments),
+            Constant(0),
+        )
     return Conditional(Condition(jump_expression, [jump_expression], [jump_expression]))
 
 
-def record_expression(field_list: List[TranslatedExpression]) -> TranslatedExpression:
+def record_expression(
+        field_list: List[TranslatedExpression], pointer_fields: List[bool]
+) -> TranslatedExpression:
     result = TempManager.new_temp()
-    creation_sequence = [
-        Move(
-            Temporary(result),
-            frame.external_call(
-                "init_record", [Constant(len(field_list) * frame.word_size)]
-            ),
-        )
-    ]
+    creation_sequence = [Move(Temporary(result), frame.record_allocation(pointer_fields))]
 
     for index, field_expression in enumerate(field_list):
         field_allocation = Move(
@@ -344,12 +339,16 @@ def let_expression(
 
 
 def array_expression(
-        size: TranslatedExpression, initial_value: TranslatedExpression
+        size: TranslatedExpression, initial_value: TranslatedExpression, pointer_elements: bool
 ) -> TranslatedExpression:
     return Expression(
         frame.external_call(
             "init_array",
-            [convert_to_expression(size), convert_to_expression(initial_value)],
+            [
+                convert_to_expression(size),
+                convert_to_expression(initial_value),
+                Constant(int(pointer_elements)),
+            ],
         )
     )
 
@@ -359,11 +358,12 @@ def empty_expression() -> TranslatedExpression:
 
 
 def proc_entry_exit(function_level: RealLevel, body: TranslatedExpression):
-    body_statement = Move(Temporary(frame.return_value()), convert_to_expression(body))
-    proc_statement = frame.preserve_callee_registers(
-        function_level.frame, frame.shift_view(function_level.frame, body_statement)
+    body_expression = convert_to_expression(body)
+    body_statement = Move(Temporary(frame.return_value()), body_expression)
+    proc_statement = frame.shift_view(function_level.frame, body_statement)
+    FragmentManager.add_fragment(
+        ProcessFragment(proc_statement, function_level.frame, body_expression)
     )
-    FragmentManager.add_fragment(ProcessFragment(proc_statement, function_level.frame))
 
 
 def convert_arithmetic_operator(operator: ast.Oper) -> BinaryOperator:
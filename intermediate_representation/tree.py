@@ -133,6 +133,9 @@ class Jump(Statement):
     Transfers control to a target address, which can be a label
     or a computed address expression.
 
+    A tail jump, Jump(Call(Name(f), arguments), []), leaves the function
+    and enters f with the arguments, f returning directly to our caller.
+
     Attributes:
         expression (Expression): Target address (usually a Name expression)
         labels (List[TempLabel]): Possible target labels for the jump
@@ -0,0 +1,197 @@
+"""
+Bit-vector liveness solver.
+
+Temporaries are numbered densely and every live set is stored as a Python
+integer used as a bit-vector, so unions and differences are word-parallel.
+Instructions are grouped into basic blocks, each block is summarized by a
+single use/def pair, and the block equations are solved with a worklist
+seeded in postorder (reverse postorder of the reversed CFG), which is the
+natural order for a backward problem. The per-instruction sets are then
+recovered with one backward sweep per block.
+
+The solution is the same least fixed point computed by the round-robin
+iteration, so the results can be used interchangeably.
+"""
+
+from collections import deque
+from typing import List, Dict, Set
+
+from activation_records.temp import Temp
+from liveness_analysis.graph import Graph
+
+
+class TempNumbering:
+    """Dense numbering of the temporaries that appear in a flow graph."""
+
+    def __init__(self):
+        self.temps: List[Temp] = []
+        self.indexes: Dict[Temp, int] = {}
+
+    def index(self, temp: Temp) -> int:
+        if temp not in self.indexes:
+            self.indexes[temp] = len(self.temps)
+            self.temps.append(temp)
+        return self.indexes[temp]
+
+    def to_bits(self, temps: Set[Temp]) -> int:
+        bits = 0
+        for temp in temps:
+            bits |= 1 << self.index(temp)
+        return bits
+
+    def to_set(self, bits: int) -> Set[Temp]:
+        result = set()
+        while bits:
+            lowest = bits & -bits
+            result.add(self.temps[lowest.bit_length() - 1])
+            bits ^= lowest
+        return result
+
+
+class BitVectorLiveness:
+    """
+    Liveness analysis over a flow graph of AssemblerInformation nodes.
+
+    After solve(), live_in/live_out hold one bit-vector per flow node, and
+    the block-level solution is kept in block_live_in/block_live_out.
+    """
+
+    def __init__(self, flow_graph: Graph):
+        self.flow_graph = flow_graph
+        self.numbering = TempNumbering()
+        nodes = flow_graph.get_nodes()
+
+        self.uses: List[int] = []
+        self.definitions: List[int] = []
+        for node in nodes:
+            self.uses.append(self.numbering.to_bits(node.information.uses))
+            self.definitions.append(
+                self.numbering.to_bits(node.information.definitions)
+            )
+
+        self.live_in: List[int] = [0] * len(nodes)
+        self.live_out: List[int] = [0] * len(nodes)
+
+        self._build_blocks()
+
+    def _build_blocks(self):
+        """Splits the flow nodes into maximal straight-line blocks."""
+        graph = self.flow_graph
+        node_count = len(graph.get_nodes())
+
+        # block_nodes[b] lists the node ids of block b in program order.
+        self.block_nodes: List[List[int]] = []
+        self.node_block: List[int] = [0] * node_count
+        for node_id in range(node_count):
+            if self._starts_block(node_id):
+                self.block_nodes.append([])
+            self.block_nodes[-1].append(node_id)
+            self.node_block[node_id] = len(self.block_nodes) - 1
+
+        self.block_successors: List[Set[int]] = []
+        self.block_predecessors: List[Set[int]] = [set() for _ in self.block_nodes]
+        for block, node_ids in enumerate(self.block_nodes):
+            successors = {
+                self.node_block[successor] for successor in graph.out_edges[node_ids[-1]]
+            }
+            self.block_successors.append(successors)
+            for successor in successors:
+                self.block_predecessors[successor].add(block)
+
+        # Summaries: live_in(B) = use(B) | (live_out(B) & ~def(B)).
+        self.block_uses: List[int] = []
+        self.block_definitions: List[int] = []
+        for node_ids in self.block_nodes:
+            block_use = 0
+            block_definition = 0
+            for node_id in reversed(node_ids):
+                block_use = self.uses[node_id] | (
+                        block_use & ~self.definitions[node_id]
+                )
+                block_definition |= self.definitions[node_id]
+            self.block_uses.append(block_use)
+            self.block_definitions.append(block_definition)
+
+        self.block_live_in: List[int] = [0] * len(self.block_nodes)
+        self.block_live_out: List[int] = [0] * len(self.block_nodes)
+
+    def _starts_block(self, node_id: int) -> bool:
+        if node_id == 0:
+            return True
+        previous = node_id - 1
+        graph = self.flow_graph
+        return (
+                graph.in_edges[node_id] != {previous}
+                or graph.out_edges[previous] != {node_id}
+        )
+
+    def _postorder(self) -> List[int]:
+        """Blocks in DFS postorder from the entry, followed by unreachable ones."""
+        block_count = len(self.block_nodes)
+        visited = [False] * block_count
+        order = []
+        for root in range(block_count):
+            if visited[root]:
+                continue
+            visited[root] = True
+            stack = [(root, iter(sorted(self.block_successors[root])))]
+            while stack:
+                block, successors = stack[-1]
+                for successor in successors:
+                    if not visited[successor]:
+                        visited[successor] = True
+                        stack.append(
+                            (successor, iter(sorted(self.block_successors[successor])))
+                        )
+                        break
+                else:
+                    stack.pop()
+                    order.append(block)
+        return order
+
+    def solve(self) -> "BitVectorLiveness":
+        if not self.block_nodes:
+            return self
+
+        worklist = deque(self._postorder())
+        in_worklist = [True] * len(self.block_nodes)
+        while worklist:
+            block = worklist.popleft()
+            in_worklist[block] = False
+
+            live_out = 0
+            for successor in self.block_successors[block]:
+                live_out |= self.block_live_in[successor]
+            self.block_live_out[block] = live_out
+
+            live_in = self.block_uses[block] | (
+                    live_out & ~self.block_definitions[block]
+            )
+            if live_in != self.block_live_in[block]:
+                self.block_live_in[block] = live_in
+                for predecessor in self.block_predecessors[block]:
+                    if not in_worklist[predecessor]:
+                        in_worklist[predecessor] = True
+                        worklist.append(predecessor)
+
+        for block, node_ids in enumerate(self.block_nodes):
+            live = self.block_live_out[block]
+            for node_id in reversed(node_ids):
+                self.live_out[node_id] = live
+                live = self.uses[node_id] | (live & ~self.definitions[node_id])
+                self.live_in[node_id] = live
+        return self
+
+    def store_sets(self):
+        """Copies the solution into the live_in/live_out sets of the flow nodes."""
+        to_set = self.numbering.to_set
+        for node in self.flow_graph.get_nodes():
+            node.information.live_in = to_set(self.live_in[node.id])
+            node.information.live_out = to_set(self.live_out[node.id])
+
+
+def bit_vector_liveness(flow_graph: Graph) -> BitVectorLiveness:
+    """Solves liveness for flow_graph and stores the sets in its nodes."""
+    solver = BitVectorLiveness(flow_graph).solve()
+    solver.store_sets()
+    return solver
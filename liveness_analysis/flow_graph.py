@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from activation_records.temp import Temp
 from instruction_selection.assembly import Instruction, Operation, Move, Label
+from liveness_analysis.bit_vector import bit_vector_liveness
 from liveness_analysis.graph import Graph
 
 
@@ -88,28 +89,7 @@ def assembler_flow_graph(instructions: List[Instruction]) -> FlowGraphResult:
         for jump_label in last_node.information.instruction.jump:
             graph.add_edge(last_node, label_nodes[jump_label])
 
-    # Liveness iteration
-    continue_iteration = True
-    while continue_iteration:
-        continue_iteration = False
-        for node in node_list:
-            # Backup live_in and live_out
-            backup_live_in = node.information.live_in
-            backup_live_out = node.information.live_out
-
-            # Compute live_in and live_out
-            node.information.set_live_in()
-            node.information.set_live_out(
-                [
-                    successor.information.live_in
-                    for successor in graph.node_successors(node)
-                ]
-            )
-
-            if (
-                    node.information.live_in != backup_live_in
-                    or node.information.live_out != backup_live_out
-            ):
-                continue_iteration = True
+    bit_vector_liveness(graph)
 
     return FlowGraphResult(graph, temp_uses, temp_definitions)
+
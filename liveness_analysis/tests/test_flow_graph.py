@@ -0,0 +1,126 @@
+import copy
+import unittest
+from typing import List
+
+from activation_records.frame import sink
+from canonical.canonize import canonize
+from instruction_selection.assembly import Instruction, Operation, Move, Label
+from instruction_selection.codegen import Codegen
+from intermediate_representation.fragment import FragmentManager, ProcessFragment
+from liveness_analysis.bit_vector import BitVectorLiveness
+from liveness_analysis.flow_graph import AssemblerInformation, assembler_flow_graph
+from liveness_analysis.graph import Graph
+from tests.utils.compilation_steps import semantic_analysis
+
+
+def _round_robin_liveness(graph: Graph[AssemblerInformation]):
+    """Reference liveness iteration: sweeps every node until nothing changes."""
+    node_list = graph.get_nodes()
+    continue_iteration = True
+    while continue_iteration:
+        continue_iteration = False
+        for node in node_list:
+            # Backup live_in and live_out
+            backup_live_in = node.information.live_in
+            backup_live_out = node.information.live_out
+
+            # Compute live_in and live_out
+            node.information.set_live_in()
+            node.information.set_live_out(
+                [
+                    successor.information.live_in
+                    for successor in graph.node_successors(node)
+                ]
+            )
+
+            if (
+                    node.information.live_in != backup_live_in
+                    or node.information.live_out != backup_live_out
+            ):
+                continue_iteration = True
+
+
+def _reference_sets(instructions: List[Instruction]):
+    flow_graph = assembler_flow_graph(copy.deepcopy(instructions)).flow_graph
+    for node in flow_graph.get_nodes():
+        node.information.live_in = set()
+        node.information.live_out = set()
+    _round_robin_liveness(flow_graph)
+    return [
+        (node.information.live_in, node.information.live_out)
+        for node in flow_graph.get_nodes()
+    ]
+
+
+def _bit_vector_sets(instructions: List[Instruction]):
+    flow_graph = assembler_flow_graph(instructions).flow_graph
+    return [
+        (node.information.live_in, node.information.live_out)
+        for node in flow_graph.get_nodes()
+    ]
+
+
+class TestBitVectorLiveness(unittest.TestCase):
+    def setUp(self):
+        FragmentManager.fragment_list = []
+
+    def test_straight_line_code(self):
+        instructions = [
+            Move("movq $1, %'d0\n", [], [1]),
+            Move("movq $2, %'d0\n", [], [2]),
+            Operation("addq %'s1, %'d0\n", [1, 2], [1], None),
+            Operation("", [1], [], None),
+        ]
+        live_sets = _bit_vector_sets(instructions)
+
+        self.assertEqual(live_sets[0], (set(), {1}))
+        self.assertEqual(live_sets[1], ({1}, {1, 2}))
+        self.assertEqual(live_sets[2], ({1, 2}, {1}))
+        self.assertEqual(live_sets[3], ({1}, set()))
+
+    def test_loop_keeps_values_live_around_back_edge(self):
+        instructions = [
+            Move("movq $0, %'d0\n", [], [1]),
+            Move("movq $10, %'d0\n", [], [2]),
+            Label("loop:\n", "loop"),
+            Operation("cmpq %'s0, %'s1\n", [2, 1], [], None),
+            Operation("jge 'j0\n", [], [], ["done", "body"]),
+            Label("body:\n", "body"),
+            Operation("addq $1, %'d0\n", [1], [1], None),
+            Operation("jmp 'j0\n", [], [], ["loop"]),
+            Label("done:\n", "done"),
+            Operation("", [1], [], None),
+        ]
+        live_sets = _bit_vector_sets(instructions)
+
+        self.assertEqual(live_sets[2], ({1, 2}, {1, 2}))
+        self.assertEqual(live_sets[6], ({1, 2}, {1, 2}))
+        self.assertEqual(live_sets[8], ({1}, {1}))
+        self.assertEqual(live_sets, _reference_sets(instructions))
+
+    def test_blocks_summarize_straight_line_runs(self):
+        instructions = [
+            Move("movq $0, %'d0\n", [], [1]),
+            Label("loop:\n", "loop"),
+            Operation("addq $1, %'d0\n", [1], [1], None),
+            Operation("jmp 'j0\n", [], [], ["loop"]),
+        ]
+        flow_graph = assembler_flow_graph(instructions).flow_graph
+        solver = BitVectorLiveness(flow_graph).solve()
+
+        self.assertEqual(solver.block_nodes, [[0], [1, 2, 3]])
+        self.assertEqual(solver.block_successors, [{1}, {1}])
+
+    def test_examples_match_round_robin_iteration(self):
+        for file_name in ("test6.tig", "test8.tig", "test27.tig", "queens.tig", "merge.tig"):
+            with self.subTest(file_name=file_name):
+                FragmentManager.fragment_list = []
+                semantic_analysis(file_name)
+                for fragment in FragmentManager.get_fragments():
+                    if not isinstance(fragment, ProcessFragment):
+                        continue
+                    instructions = sink(Codegen.codegen(canonize(fragment.body)))
+                    self.assertEqual(
+                        _bit_vector_sets(copy.deepcopy(instructions)),
+                        _reference_sets(instructions),
+                    )
@@ -15,6 +15,9 @@ It coordinates all compilation phases from source code to executable assembly:
 The compilation process follows the standard compiler architecture:
 Source Code → Tokens → AST → Typed IR → Assembly → Executable
 
+The phases themselves are driven by putting_it_all_together.compiler.Compiler,
+which runs every compilation in its own CompilationContext.
+
 Error Handling:
 - Lexical errors: Invalid characters in source
 - Syntax errors: Malformed Tiger programs
@@ -22,7 +25,11 @@ Error Handling:
 - Code generation errors: Register allocation failures
 
 Usage:
-    python main.py <source_file.tig>
+    python main.py <source_file.tig> [--jobs N]
+
+    --jobs N compiles the functions on a pool of N processes. Each function
+    then gets its own block of temporary and label numbers, so the output is
+    the same for every N.
 
 Output:
     - output.s: x86-64 assembly code
@@ -31,26 +38,34 @@ Output:
 Author: Tiger Compiler Project
 """
 
-from activation_records.frame import (
-    TempMap,
-    sink,
-    assembly_procedure,
-)
-from activation_records.instruction_removal import is_redundant_move
-from canonical.canonize import canonize
-from intermediate_representation.fragment import (
-    FragmentManager,
-    ProcessFragment,
-    StringFragment,
-)
-from register_allocation.allocation import RegisterAllocator
-from semantic_analysis.analyzers import SemanticError, translate_program
-from instruction_selection.codegen import Codegen
-from putting_it_all_together.file_handler import FileHandler
-from lexer import lex as le
+from semantic_analysis.analyzers import SemanticError
+from putting_it_all_together.compilation_cache import open_cache, CACHE_DIRECTORY_VARIABLE
+from putting_it_all_together.compiler import Compiler
 from parser import parser as p
 import sys
-from ply import lex
+import argparse
+
+
+def setup_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Tiger compiler")
+    parser.add_argument("input_file", nargs="?", help="Input source file")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Compile functions in parallel on N processes",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        metavar="DIR",
+        help=f"Reuse compilations cached in DIR (default: ${CACHE_DIRECTORY_VARIABLE})",
+    )
+    arguments = parser.parse_args()
+    if arguments.jobs is not None and arguments.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return arguments
 
 
 def main():
@@ -77,108 +92,48 @@ def main():
     # PHASE 1: INPUT VALIDATION AND SOURCE READING
     # =====================================================================
 
-    if len(sys.argv) == 1:
+    arguments = setup_arguments()
+    if arguments.input_file is None:
         print("Fatal error. No input file detected.")
         sys.exit(1)
 
     # Read source file
     try:
-        with open(sys.argv[1], "r") as f:
+        with open(arguments.input_file, "r") as f:
             data = f.read()
     except IOError as e:
         print(f"Fatal error reading input file: {e}")
         sys.exit(1)
 
-    # =====================================================================
-    # PHASE 2: LEXICAL ANALYSIS (TOKENIZATION)
-    # =====================================================================
-
-    # Initialize lexer with source code
-    lex.input(data)
-
-    try:
-        # Parse tokens into Abstract Syntax Tree
-        parsed_program = p.parser.parse(data, le.lexer)
-    except p.SyntacticError as err:
-        print(err)
-        sys.exit(1)
+    # A cached compilation of the same source skips the whole pipeline
+    cache = open_cache(arguments.cache_dir)
+    if cache is not None:
+        cache_key = cache.key(data, ["jobs"] if arguments.jobs is not None else [])
+        cache_entry = cache.load(cache_key)
+        if cache_entry is not None:
+            with open("output.s", "w") as output_file:
+                output_file.write(cache_entry.assembly)
+            return
 
     # =====================================================================
-    # PHASE 3: SEMANTIC ANALYSIS (TYPE CHECKING & IR GENERATION)
+    # PHASES 2-8: LEXING, PARSING, SEMANTIC ANALYSIS, BACKEND AND OUTPUT
     # =====================================================================
 
-    # Initialize register mapping system
-    TempMap.initialize()
+    # Every compilation runs in its own context, with fresh temporaries,
+    # labels and fragments
+    compiler = Compiler(arguments.jobs)
 
+    # The functions are written to output.s as they are compiled; the file
+    # only replaces an earlier output.s once the whole program compiled
     try:
-        # Perform type checking and generate intermediate representation
-        translate_program(parsed_program)
-    except SemanticError as err:
+        compiler.compile_to(data, "output.s")
+    except (p.SyntacticError, SemanticError) as err:
         print(err)
         sys.exit(1)
 
-    # =====================================================================
-    # PHASE 4: CANONICALIZATION (BASIC BLOCK FORMATION)
-    # =====================================================================
-
-    # Separate different types of fragments (functions vs string literals)
-    process_fragments = []
-    string_fragments = []
-
-    for fragment in FragmentManager.get_fragments():
-        if isinstance(fragment, ProcessFragment):
-            process_fragments.append(fragment)  # Function definitions
-        elif isinstance(fragment, StringFragment):
-            string_fragments.append(fragment)   # String literals
-
-    # Transform IR trees into canonical basic block form
-    canonized_bodies = [canonize(fragment.body) for fragment in process_fragments]
-
-    # =====================================================================
-    # PHASE 5: INSTRUCTION SELECTION (ASSEMBLY GENERATION)
-    # =====================================================================
-
-    # Generate assembly instructions from canonical IR
-    assembly_bodies = [
-        Codegen.codegen(process_body) for process_body in canonized_bodies
-    ]
-
-    # =====================================================================
-    # PHASE 6: ASSEMBLY OUTPUT AND REGISTER ALLOCATION
-    # =====================================================================
-
-    # Initialize output file handler
-    file_handler = FileHandler("output.s")
-
-    # Write data section (string literals and static data)
-    file_handler.print_data_header()
-    for string_fragment in string_fragments:
-        file_handler.print_string_fragment(string_fragment)
-
-    # Write code section header
-    file_handler.print_code_header()
-
-    # Register Allocation Phase
-    # Add sink instructions and perform register allocation for each function
-    bodies_with_sink = [sink(assembly_body) for assembly_body in assembly_bodies]
-
-    for body, fragment in zip(bodies_with_sink, process_fragments):
-        # Allocate registers for this function
-        allocation_result = RegisterAllocator(fragment.frame).main(body)
-
-        # Update global register mapping
-        TempMap.update_temp_to_register(allocation_result.temp_to_register)
-
-        # Filter out redundant move instructions
-        instruction_list = [
-            instruction
-            for instruction in allocation_result.instructions
-            if not is_redundant_move(instruction)
-        ]
-
-        # Generate final procedure assembly
-        procedure = assembly_procedure(fragment.frame, instruction_list)
-        file_handler.print_assembly_procedure(procedure)
+    if cache is not None:
+        with open("output.s", "r") as output_file:
+            cache.store(cache_key, output_file.read())
 
 
 if __name__ == "__main__":
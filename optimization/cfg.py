@@ -0,0 +1,257 @@
+"""
+Control flow graph of a canonized function body.
+
+ControlFlowGraph.from_statements splits the statement list produced by
+canonize into basic blocks. Every block starts at a label and ends with a
+Jump or ConditionalJump, the fall-through edges being made explicit. The
+last block is the exit: it holds the label that trace_schedule puts at the
+end of the function, and nothing else. to_statements goes back to a
+canonical list through trace_schedule, so every ConditionalJump is followed
+by its false label again.
+
+Blocks also hold the phi functions of SSA form (see optimization.ssa), and
+the graph computes the dominator tree and dominance frontiers used to build
+it. Labels are strings, so the graph keeps them in lists and dicts rather
+than sets: iterating a set of strings would make the numbering of the new
+temporaries, and therefore the output, change from one run to the next.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional
+
+from activation_records.temp import Temp, TempLabel, TempManager
+from canonical.basic_block import BasicBlock
+from canonical.trace import trace_schedule
+from intermediate_representation.tree import (
+    ConditionalJump,
+    Expression,
+    Jump,
+    Label,
+    Name,
+    Statement,
+)
+
+
+def jump_to(label: TempLabel) -> Jump:
+    return Jump(Name(label), [label])
+
+
+@dataclass
+class Phi:
+    """
+    temporary := phi(arguments), with one argument per predecessor block.
+    An argument is None when original is not defined on that edge.
+    """
+    temporary: Temp
+    original: Temp
+    arguments: Dict[TempLabel, Optional[Expression]] = field(default_factory=dict)
+
+
+@dataclass
+class Block:
+    label: TempLabel
+    statements: List[Statement] = field(default_factory=list)
+    # Jump or ConditionalJump ending the block, None for the exit block
+    jump: Optional[Statement] = None
+    phis: List[Phi] = field(default_factory=list)
+    predecessors: List[TempLabel] = field(default_factory=list)
+
+    def successors(self) -> List[TempLabel]:
+        if isinstance(self.jump, Jump):
+            return list(dict.fromkeys(self.jump.labels))
+        if isinstance(self.jump, ConditionalJump):
+            return list(dict.fromkeys((self.jump.true, self.jump.false)))
+        return []
+
+    def retarget(self, old: TempLabel, new: TempLabel):
+        """Makes the edge to old go to new instead."""
+        if isinstance(self.jump, Jump):
+            self.jump = jump_to(new) if self.jump.labels == [old] else Jump(
+                self.jump.expression,
+                [new if label == old else label for label in self.jump.labels],
+            )
+        elif isinstance(self.jump, ConditionalJump):
+            self.jump = replace(
+                self.jump,
+                true=new if self.jump.true == old else self.jump.true,
+                false=new if self.jump.false == old else self.jump.false,
+            )
+
+
+class ControlFlowGraph:
+    def __init__(self, blocks: List[Block]):
+        self.blocks: Dict[TempLabel, Block] = {block.label: block for block in blocks}
+        self.entry = blocks[0].label
+        self.exit = blocks[-1].label
+        self.compute_predecessors()
+
+    @classmethod
+    def from_statements(cls, statements: List[Statement]) -> "ControlFlowGraph":
+        blocks: List[Block] = []
+        block: Optional[Block] = None
+        for statement in statements:
+            if isinstance(statement, Label):
+                if block is not None and block.jump is None:
+                    block.jump = jump_to(statement.label)
+                block = Block(statement.label)
+                blocks.append(block)
+                continue
+
+            if block is None or block.jump is not None:
+                # Statements between a jump and the next label
+                block = Block(TempManager.new_label())
+                blocks.append(block)
+            if isinstance(statement, ConditionalJump) and statement.true == statement.false:
+                block.jump = jump_to(statement.true)
+            elif isinstance(statement, (Jump, ConditionalJump)):
+                block.jump = statement
+            else:
+                block.statements.append(statement)
+
+        if not blocks or blocks[-1].jump is not None or blocks[-1].statements:
+            exit_block = Block(TempManager.new_label())
+            if blocks and blocks[-1].jump is None:
+                blocks[-1].jump = jump_to(exit_block.label)
+            blocks.append(exit_block)
+
+        if any(blocks[0].label in block.successors() for block in blocks):
+            # Phi functions need an entry block that nothing jumps back to
+            blocks.insert(0, Block(TempManager.new_label(), jump=jump_to(blocks[0].label)))
+        return cls(blocks)
+
+    def to_statements(self) -> List[Statement]:
+        """The canonical statement list of the graph, which must be out of SSA form."""
+        statement_lists = [
+            [Label(block.label)] + block.statements + [replace(block.jump)]
+            for block in self.blocks.values()
+            if block.label != self.exit
+        ]
+        return trace_schedule(BasicBlock(self.exit, statement_lists))
+
+    def compute_predecessors(self):
+        for block in self.blocks.values():
+            block.predecessors = []
+        for block in self.blocks.values():
+            for successor in block.successors():
+                self.blocks[successor].predecessors.append(block.label)
+
+    def reverse_postorder(self) -> List[TempLabel]:
+        """The blocks reachable from the entry, in reverse postorder."""
+        postorder = []
+        visited = {self.entry}
+        stack = [(self.entry, iter(self.blocks[self.entry].successors()))]
+        while stack:
+            label, successors = stack[-1]
+            for successor in successors:
+                if successor not in visited:
+                    visited.add(successor)
+                    stack.append((successor, iter(self.blocks[successor].successors())))
+                    break
+            else:
+                stack.pop()
+                postorder.append(label)
+        postorder.reverse()
+        return postorder
+
+    def remove_unreachable(self) -> int:
+        """
+        Removes the blocks that cannot be reached from the entry, along with
+        the phi arguments of the edges that no longer exist. Returns the
+        number of blocks removed.
+        """
+        reachable = set(self.reverse_postorder())
+        removed = [
+            label for label in self.blocks if label not in reachable and label != self.exit
+        ]
+        for label in removed:
+            del self.blocks[label]
+        self.compute_predecessors()
+        for block in self.blocks.values():
+            for phi in block.phis:
+                phi.arguments = {
+                    predecessor: argument
+                    for predecessor, argument in phi.arguments.items()
+                    if predecessor in block.predecessors
+                }
+        return len(removed)
+
+    def split_critical_edges(self):
+        """
+        Puts an empty block on every edge that leaves a block with several
+        successors for a block with phi functions and several predecessors,
+        so that the copies of the phi functions have somewhere to go.
+        """
+        for block in list(self.blocks.values()):
+            if not block.phis or len(block.predecessors) < 2:
+                continue
+            for predecessor in block.predecessors:
+                source = self.blocks[predecessor]
+                if len(source.successors()) < 2:
+                    continue
+                middle = Block(TempManager.new_label(), jump=jump_to(block.label))
+                self.blocks[middle.label] = middle
+                source.retarget(block.label, middle.label)
+                for phi in block.phis:
+                    if predecessor in phi.arguments:
+                        phi.arguments[middle.label] = phi.arguments.pop(predecessor)
+        self.compute_predecessors()
+
+    def immediate_dominators(self) -> Dict[TempLabel, TempLabel]:
+        """
+        The immediate dominator of every reachable block (the entry being its
+        own), with the iterative algorithm of Cooper, Harvey and Kennedy.
+        """
+        order = self.reverse_postorder()
+        position = {label: index for index, label in enumerate(order)}
+        dominators = {self.entry: self.entry}
+
+        def intersect(first: TempLabel, second: TempLabel) -> TempLabel:
+            while first != second:
+                while position[first] > position[second]:
+                    first = dominators[first]
+                while position[second] > position[first]:
+                    second = dominators[second]
+            return first
+
+        changed = True
+        while changed:
+            changed = False
+            for label in order[1:]:
+                dominator = None
+                for predecessor in self.blocks[label].predecessors:
+                    if predecessor in dominators:
+                        dominator = (
+                            predecessor if dominator is None
+                            else intersect(predecessor, dominator)
+                        )
+                if dominators.get(label) != dominator:
+                    dominators[label] = dominator
+                    changed = True
+        return dominators
+
+    def dominator_tree(self, dominators: Dict[TempLabel, TempLabel]) -> Dict[TempLabel, List[TempLabel]]:
+        """The children of every block in the dominator tree, in reverse postorder."""
+        children = {label: [] for label in dominators}
+        for label in self.reverse_postorder()[1:]:
+            children[dominators[label]].append(label)
+        return children
+
+    def dominance_frontiers(
+            self, dominators: Dict[TempLabel, TempLabel]
+    ) -> Dict[TempLabel, List[TempLabel]]:
+        frontiers = {label: [] for label in dominators}
+        for label in dominators:
+            predecessors = [
+                predecessor
+                for predecessor in self.blocks[label].predecessors
+                if predecessor in dominators
+            ]
+            if len(predecessors) < 2:
+                continue
+            for predecessor in predecessors:
+                runner = predecessor
+                while runner != dominators[label]:
+                    if label not in frontiers[runner]:
+                        frontiers[runner].append(label)
+                    runner = dominators[runner]
+        return frontiers
@@ -0,0 +1,269 @@
+"""
+Loop-invariant code motion.
+
+Every access to a variable of an enclosing function walks the static links
+from the frame pointer, one load per level, and does so again on every
+iteration of a loop. This pass moves such loads, and the arithmetic on
+values that do not change in the loop, to the preheader of the loop, inner
+loops first so that code can leave several loops.
+
+Only loads of frame slots are moved: the address is the frame pointer, or a
+chain of static links from it, plus a constant, so the load cannot trap. A
+load stays in the loop if the loop stores to the same slot, or if the loop
+calls a Tiger function that could assign the variable (calls to the runtime
+cannot). Static links themselves are never assigned after the prologue.
+Loads from the heap (record fields, array elements) stay where they are, as
+moving them could make a loop that does not run trap.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from activation_records.frame import TempMap, static_link_offset
+from activation_records.runtime import runtime_signatures
+from activation_records.temp import Temp, TempLabel, TempManager
+from intermediate_representation.simplify import is_pure
+from intermediate_representation.tree import (
+    BinaryOperation,
+    BinaryOperator,
+    Call,
+    ConditionalJump,
+    Constant,
+    Expression,
+    Memory,
+    Move,
+    Name,
+    Statement,
+    StatementExpression,
+    Temporary,
+)
+from optimization.cfg import ControlFlowGraph
+from optimization.loops import Loop, insert_preheader, natural_loops
+from optimization.ssa import defined_temp, expression_uses, machine_temps
+
+# Functions of runtime.c, which only write memory they allocate themselves.
+RUNTIME_FUNCTIONS = frozenset(runtime_signatures)
+
+# A frame slot: the number of static links followed from the frame pointer
+# (0 for the current frame) and the offset in that frame.
+Slot = Tuple[int, int]
+
+
+def split_offset(address: Expression) -> Tuple[Expression, int]:
+    """(base, offset) such that address is base + offset."""
+    if isinstance(address, BinaryOperation) and isinstance(address.right, Constant):
+        if address.operator == BinaryOperator.plus:
+            return address.left, address.right.value
+        if address.operator == BinaryOperator.minus:
+            return address.left, -address.right.value
+    if (
+            isinstance(address, BinaryOperation)
+            and address.operator == BinaryOperator.plus
+            and isinstance(address.left, Constant)
+    ):
+        return address.right, address.left.value
+    return address, 0
+
+
+def calls_in(expression: Expression) -> List[Call]:
+    if isinstance(expression, Call):
+        return [expression]
+    if isinstance(expression, BinaryOperation):
+        return calls_in(expression.left) + calls_in(expression.right)
+    if isinstance(expression, Memory):
+        return calls_in(expression.expression)
+    return []
+
+
+def rewrite_statement(statement: Statement, rewrite: Callable[[Expression], Expression]) -> Statement:
+    """statement with rewrite applied to the expressions it reads."""
+    if isinstance(statement, Move):
+        destination = statement.temporary
+        if isinstance(destination, Memory):
+            destination = Memory(rewrite(destination.expression))
+        return Move(destination, rewrite(statement.expression))
+    if isinstance(statement, ConditionalJump):
+        return ConditionalJump(
+            statement.operator,
+            rewrite(statement.left),
+            rewrite(statement.right),
+            statement.true,
+            statement.false,
+        )
+    if isinstance(statement, StatementExpression):
+        return StatementExpression(rewrite(statement.expression))
+    return statement
+
+
+@dataclass
+class LoopEffects:
+    """Frame slots a loop stores to, and whether it may change any variable."""
+    stored_slots: Set[Slot]
+    clobbers_variables: bool
+
+
+class LoopInvariantCodeMotion:
+    def __init__(self, graph: ControlFlowGraph):
+        self.graph = graph
+        self.machine = machine_temps()
+        self.frame_pointer = TempMap.register_to_temp.get("rbp")
+        self.definitions: Dict[Temp, Expression] = {}
+        self.definition_blocks: Dict[Temp, TempLabel] = {}
+        for label, block in graph.blocks.items():
+            for phi in block.phis:
+                self.definition_blocks[phi.temporary] = label
+            for statement in block.statements:
+                temp = defined_temp(statement)
+                if temp is not None and temp not in self.machine:
+                    self.definitions[temp] = statement.expression
+                    self.definition_blocks[temp] = label
+        self.hoisted_loads = 0
+        self.hoisted_expressions = 0
+
+    def expand(self, expression: Expression) -> Expression:
+        """expression with the SSA temporaries it uses replaced by their definitions."""
+        if isinstance(expression, Temporary) and expression.temporary in self.definitions:
+            return self.expand(self.definitions[expression.temporary])
+        if isinstance(expression, BinaryOperation):
+            return BinaryOperation(
+                expression.operator, self.expand(expression.left), self.expand(expression.right)
+            )
+        if isinstance(expression, Memory):
+            return Memory(self.expand(expression.expression))
+        return expression
+
+    def slot(self, address: Expression) -> Optional[Slot]:
+        """The frame slot at address, None if it is not one."""
+        base, offset = split_offset(self.expand(address))
+        if isinstance(base, Temporary) and base.temporary == self.frame_pointer:
+            return 0, offset
+        if isinstance(base, Memory):
+            link = self.slot(base.expression)
+            if link is not None and link[1] == static_link_offset:
+                return link[0] + 1, offset
+        return None
+
+    def effects(self, loop: Loop) -> LoopEffects:
+        effects = LoopEffects(set(), False)
+        for label in loop.blocks:
+            for statement in self.graph.blocks[label].statements:
+                if isinstance(statement, Move) and isinstance(statement.temporary, Memory):
+                    address = statement.temporary.expression
+                    slot = self.slot(address)
+                    if slot is not None:
+                        effects.stored_slots.add(slot)
+                    elif self.frame_pointer in expression_uses(self.expand(address)):
+                        # Somewhere in a frame
+                        effects.clobbers_variables = True
+                expression = statement.expression if isinstance(
+                    statement, (Move, StatementExpression)
+                ) else None
+                for call in calls_in(expression) if expression is not None else []:
+                    if not (
+                            isinstance(call.function, Name)
+                            and call.function.label in RUNTIME_FUNCTIONS
+                    ):
+                        effects.clobbers_variables = True
+        return effects
+
+    def invariant(self, expression: Expression, loop: Loop) -> bool:
+        for temp in expression_uses(expression):
+            if temp in self.machine:
+                if temp != self.frame_pointer:
+                    return False
+            elif self.definition_blocks.get(temp) in loop:
+                return False
+        return True
+
+    def movable_load(self, load: Memory, loop: Loop, effects: LoopEffects) -> bool:
+        if not self.invariant(load, loop):
+            return False
+        slot = self.slot(load.expression)
+        if slot is None or slot in effects.stored_slots:
+            return False
+        return slot[1] == static_link_offset or not effects.clobbers_variables
+
+    def movable(self, expression: Expression, loop: Loop, effects: LoopEffects) -> bool:
+        """Whether a definition computing expression can go to the preheader."""
+        if isinstance(expression, Memory):
+            return self.movable_load(expression, loop, effects)
+        # Constants and labels are cheaper to recompute than to keep in a register
+        return (
+                isinstance(expression, (BinaryOperation, Temporary))
+                and is_pure(expression)
+                and self.invariant(expression, loop)
+        )
+
+    def run(self) -> Tuple[int, int, int]:
+        loops = natural_loops(self.graph)
+        for loop in loops:
+            self.hoist(loop, loops)
+        return len(loops), self.hoisted_loads, self.hoisted_expressions
+
+    def hoist(self, loop: Loop, loops: List[Loop]):
+        effects = self.effects(loop)
+        preheader: Optional[TempLabel] = None
+        # The loads already moved out of this loop, by their text
+        hoisted: Dict[str, Temporary] = {}
+
+        def move_out(statement: Move):
+            nonlocal preheader
+            if preheader is None:
+                preheader = insert_preheader(self.graph, loop, loops)
+            self.graph.blocks[preheader].statements.append(statement)
+            self.definition_blocks[statement.temporary.temporary] = preheader
+
+        def hoist_loads(expression: Expression) -> Expression:
+            if isinstance(expression, Memory):
+                if not self.movable_load(expression, loop, effects):
+                    return Memory(hoist_loads(expression.expression))
+                key = repr(expression)
+                if key not in hoisted:
+                    temp = TempManager.new_temp()
+                    hoisted[key] = Temporary(temp)
+                    self.definitions[temp] = expression
+                    move_out(Move(Temporary(temp), expression))
+                    self.hoisted_loads += 1
+                return hoisted[key]
+            if isinstance(expression, BinaryOperation):
+                return BinaryOperation(
+                    expression.operator,
+                    hoist_loads(expression.left),
+                    hoist_loads(expression.right),
+                )
+            if isinstance(expression, Call):
+                return Call(
+                    expression.function,
+                    [hoist_loads(argument) for argument in expression.arguments],
+                )
+            return expression
+
+        for label in list(loop.blocks):
+            block = self.graph.blocks[label]
+            statements = []
+            for statement in block.statements:
+                temp = defined_temp(statement)
+                if temp is not None and temp not in self.machine:
+                    if not self.movable(statement.expression, loop, effects):
+                        statement = Move(statement.temporary, hoist_loads(statement.expression))
+                    if self.movable(statement.expression, loop, effects):
+                        move_out(statement)
+                        if isinstance(statement.expression, Memory):
+                            self.hoisted_loads += 1
+                        else:
+                            self.hoisted_expressions += 1
+                        continue
+                else:
+                    statement = rewrite_statement(statement, hoist_loads)
+                statements.append(statement)
+            block.statements = statements
+            block.jump = rewrite_statement(block.jump, hoist_loads)
+
+
+def move_loop_invariants(graph: ControlFlowGraph) -> Tuple[int, int, int]:
+    """
+    Moves the invariant code of the loops of graph, in SSA form, to their
+    preheaders. Returns the number of loops, moved loads and moved
+    expressions.
+    """
+    return LoopInvariantCodeMotion(graph).run()
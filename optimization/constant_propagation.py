@@ -0,0 +1,203 @@
+"""
+Sparse conditional constant propagation (Wegman and Zadeck).
+
+Every SSA temporary starts undefined and only moves down the lattice
+undefined > constant > varying, while blocks only become executable when an
+executable edge reaches them. Propagating along both the SSA uses and the
+executable edges finds the constants that hold on every path actually
+taken, and the branches that can only go one way.
+
+The temporaries found constant are replaced by their value, branches that
+only go one way become jumps and the blocks that are never executed are
+removed. Definitions left without uses are removed by dead code elimination.
+"""
+
+from collections import deque
+from enum import Enum, auto
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
+
+from activation_records.temp import Temp, TempLabel
+from intermediate_representation.simplify import (
+    fold_binary_operation,
+    fold_relational_operator,
+)
+from intermediate_representation.tree import (
+    BinaryOperation,
+    ConditionalJump,
+    Constant,
+    Expression,
+    Statement,
+    Temporary,
+)
+from optimization.cfg import ControlFlowGraph, Phi, jump_to
+from optimization.ssa import (
+    defined_temp,
+    expression_uses,
+    machine_temps,
+    replace_uses,
+    statement_uses,
+)
+
+
+class Lattice(Enum):
+    """Values of a temporary besides the constants themselves."""
+    undefined = auto()
+    varying = auto()
+
+
+Value = Union[int, Lattice]
+
+
+def meet(first: Value, second: Value) -> Value:
+    if first == Lattice.undefined:
+        return second
+    if second == Lattice.undefined or first == second:
+        return first
+    return Lattice.varying
+
+
+class ConstantPropagation:
+    def __init__(self, graph: ControlFlowGraph):
+        self.graph = graph
+        self.machine = machine_temps()
+        self.values: Dict[Temp, Value] = {}
+        # Phi functions and statements using each temporary, with their block
+        self.users: Dict[Temp, List[Tuple[TempLabel, Union[Phi, Statement]]]] = {}
+        self.executable_blocks: Set[TempLabel] = set()
+        self.executable_edges: Set[Tuple[Optional[TempLabel], TempLabel]] = set()
+        self.edge_worklist: Deque[Tuple[Optional[TempLabel], TempLabel]] = deque()
+        self.temp_worklist: Deque[Temp] = deque()
+
+        for label, block in graph.blocks.items():
+            for phi in block.phis:
+                self.values[phi.temporary] = Lattice.undefined
+                for argument in phi.arguments.values():
+                    if argument is not None:
+                        self._add_users(label, phi, expression_uses(argument))
+            for statement in block.statements + [block.jump]:
+                temp = defined_temp(statement)
+                if temp is not None and temp not in self.machine:
+                    self.values[temp] = Lattice.undefined
+                self._add_users(label, statement, statement_uses(statement))
+
+    def _add_users(self, label: TempLabel, user: Union[Phi, Statement], temps):
+        for temp in temps:
+            self.users.setdefault(temp, []).append((label, user))
+
+    def run(self):
+        self.edge_worklist.append((None, self.graph.entry))
+        while self.edge_worklist or self.temp_worklist:
+            while self.edge_worklist:
+                edge = self.edge_worklist.popleft()
+                if edge in self.executable_edges:
+                    continue
+                self.executable_edges.add(edge)
+                label = edge[1]
+                block = self.graph.blocks[label]
+                for phi in block.phis:
+                    self.visit_phi(label, phi)
+                if label not in self.executable_blocks:
+                    self.executable_blocks.add(label)
+                    for statement in block.statements:
+                        self.visit_statement(statement)
+                    self.visit_jump(label, block.jump)
+
+            while self.temp_worklist:
+                for label, user in self.users.get(self.temp_worklist.popleft(), ()):
+                    if label not in self.executable_blocks:
+                        continue
+                    if isinstance(user, Phi):
+                        self.visit_phi(label, user)
+                    elif user is self.graph.blocks[label].jump:
+                        self.visit_jump(label, user)
+                    else:
+                        self.visit_statement(user)
+
+    def evaluate(self, expression: Expression) -> Value:
+        if isinstance(expression, Constant):
+            return expression.value
+        if isinstance(expression, Temporary):
+            return self.values.get(expression.temporary, Lattice.varying)
+        if isinstance(expression, BinaryOperation):
+            left = self.evaluate(expression.left)
+            right = self.evaluate(expression.right)
+            if Lattice.varying in (left, right):
+                return Lattice.varying
+            if Lattice.undefined in (left, right):
+                return Lattice.undefined
+            value = fold_binary_operation(expression.operator, left, right)
+            return Lattice.varying if value is None else value
+        # Loads, calls and addresses of labels
+        return Lattice.varying
+
+    def set_value(self, temp: Temp, value: Value):
+        if self.values[temp] != value:
+            self.values[temp] = value
+            self.temp_worklist.append(temp)
+
+    def visit_phi(self, label: TempLabel, phi: Phi):
+        value = Lattice.undefined
+        for predecessor, argument in phi.arguments.items():
+            if (predecessor, label) in self.executable_edges:
+                # An argument undefined on its edge may hold anything
+                value = meet(
+                    value, Lattice.varying if argument is None else self.evaluate(argument)
+                )
+        self.set_value(phi.temporary, value)
+
+    def visit_statement(self, statement: Statement):
+        temp = defined_temp(statement)
+        if temp is not None and temp not in self.machine:
+            self.set_value(temp, self.evaluate(statement.expression))
+
+    def visit_jump(self, label: TempLabel, jump: Optional[Statement]):
+        successors = self.graph.blocks[label].successors()
+        if isinstance(jump, ConditionalJump):
+            successors = self.taken_successors(jump)
+        for successor in successors:
+            self.edge_worklist.append((label, successor))
+
+    def taken_successors(self, jump: ConditionalJump) -> List[TempLabel]:
+        left = self.evaluate(jump.left)
+        right = self.evaluate(jump.right)
+        if Lattice.varying in (left, right):
+            return [jump.true, jump.false]
+        if Lattice.undefined in (left, right):
+            return []
+        return [jump.true if fold_relational_operator(jump.operator, left, right) else jump.false]
+
+    def rewrite(self) -> Tuple[int, int, int]:
+        """
+        Applies the solution to the graph. Returns the number of constant
+        temporaries, folded branches and removed blocks.
+        """
+        constants = {
+            temp: Constant(value) for temp, value in self.values.items() if isinstance(value, int)
+        }
+        folded_branches = 0
+        for label, block in self.graph.blocks.items():
+            if label not in self.executable_blocks or not isinstance(block.jump, ConditionalJump):
+                continue
+            taken = [
+                successor
+                for successor in block.successors()
+                if (label, successor) in self.executable_edges
+            ]
+            if len(taken) == 1:
+                block.jump = jump_to(taken[0])
+                folded_branches += 1
+
+        removed_blocks = self.graph.remove_unreachable()
+        replace_uses(self.graph, constants.get)
+        return len(constants), folded_branches, removed_blocks
+
+
+def propagate_constants(graph: ControlFlowGraph) -> Tuple[int, int, int]:
+    """
+    Runs sparse conditional constant propagation on graph, in SSA form.
+    Returns the number of constant temporaries, folded branches and removed
+    blocks.
+    """
+    propagation = ConstantPropagation(graph)
+    propagation.run()
+    return propagation.rewrite()
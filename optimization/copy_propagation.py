@@ -0,0 +1,76 @@
+"""
+Copy propagation on SSA form.
+
+A temporary defined by a copy of another temporary, or by a phi function
+whose arguments are all the same value (leaving aside the phi function
+itself), is replaced by that value everywhere and its definition removed.
+Copies of machine registers stay: the register may change before the use.
+"""
+
+from typing import Dict, Optional
+
+from activation_records.temp import Temp
+from intermediate_representation.tree import Expression, Temporary
+from optimization.cfg import ControlFlowGraph
+from optimization.ssa import defined_temp, machine_temps, replace_uses
+
+
+def propagate_copies(graph: ControlFlowGraph) -> int:
+    """Propagates the copies of graph, in SSA form. Returns the number of copies removed."""
+    machine = machine_temps()
+    copies: Dict[Temp, Expression] = {}
+
+    def resolve(temp: Temp) -> Expression:
+        value = Temporary(temp)
+        while isinstance(value, Temporary) and value.temporary in copies:
+            value = copies[value.temporary]
+        return value
+
+    for block in graph.blocks.values():
+        for statement in block.statements:
+            temp = defined_temp(statement)
+            if (
+                    temp is not None
+                    and temp not in machine
+                    and isinstance(statement.expression, Temporary)
+                    and statement.expression.temporary not in machine
+                    and statement.expression.temporary != temp
+            ):
+                copies[temp] = statement.expression
+
+    # Removing a phi function can make another one redundant
+    changed = True
+    while changed:
+        changed = False
+        for block in graph.blocks.values():
+            for phi in block.phis:
+                if phi.temporary in copies:
+                    continue
+                value = single_argument(phi.temporary, phi.arguments.values(), resolve)
+                if value is not None:
+                    copies[phi.temporary] = value
+                    changed = True
+
+    for block in graph.blocks.values():
+        block.phis = [phi for phi in block.phis if phi.temporary not in copies]
+        block.statements = [
+            statement for statement in block.statements if defined_temp(statement) not in copies
+        ]
+    replace_uses(graph, lambda temp: resolve(temp) if temp in copies else None)
+    return len(copies)
+
+
+def single_argument(temp: Temp, arguments, resolve) -> Optional[Expression]:
+    """The only value among the arguments of the phi function of temp, if there is one."""
+    value = None
+    for argument in arguments:
+        if argument is None:
+            return None
+        if isinstance(argument, Temporary):
+            argument = resolve(argument.temporary)
+        if argument == Temporary(temp):
+            continue
+        if value is not None and argument != value:
+            return None
+        value = argument
+    return value
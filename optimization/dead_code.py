@@ -0,0 +1,149 @@
+"""
+Dead code elimination on SSA form.
+
+Stores, calls, jumps and moves into machine registers are always kept, along
+with every definition whose evaluation may trap or have side effects (loads,
+calls and divisions, see simplify.is_pure). Starting from their operands,
+the definitions that are used are marked live; the phi functions and
+definitions of SSA temporaries left unmarked are removed, along with the
+pure expressions evaluated only to be thrown away.
+
+Stores to a slot of the function's own frame are removed too when nothing
+loads the slot, as long as the frame pointer only serves to address the
+slots: no function nested in this one gets it as its static link. This is
+what drops the static link of a function that does not use it, and lets a
+frame without any slot left be omitted (see frame.assembly_procedure).
+"""
+
+from typing import Dict, Iterator, List, Optional, Set, Union
+
+from activation_records.frame import TempMap
+from activation_records.temp import Temp
+from intermediate_representation.simplify import is_pure
+from intermediate_representation.tree import (
+    BinaryOperation,
+    Call,
+    ConditionalJump,
+    Expression,
+    Jump,
+    Memory,
+    Move,
+    Statement,
+    StatementExpression,
+    Temporary,
+)
+from optimization.cfg import ControlFlowGraph, Phi
+from optimization.code_motion import split_offset
+from optimization.ssa import defined_temp, expression_uses, machine_temps, statement_uses
+
+
+def frame_slot(address: Expression) -> Optional[int]:
+    """The offset of the slot of the current frame at address, None if it is not one."""
+    base, offset = split_offset(address)
+    if isinstance(base, Temporary) and base.temporary == TempMap.register_to_temp.get("rbp"):
+        return offset
+    return None
+
+
+def frame_loads(expression: Expression) -> Iterator[Optional[int]]:
+    """The slots of the current frame that expression loads, None for any other use of the frame pointer."""
+    if isinstance(expression, Memory) and frame_slot(expression.expression) is not None:
+        yield frame_slot(expression.expression)
+    elif isinstance(expression, Temporary):
+        if expression.temporary == TempMap.register_to_temp.get("rbp"):
+            yield None
+    elif isinstance(expression, BinaryOperation):
+        yield from frame_loads(expression.left)
+        yield from frame_loads(expression.right)
+    elif isinstance(expression, Memory):
+        yield from frame_loads(expression.expression)
+    elif isinstance(expression, Call):
+        for argument in expression.arguments:
+            yield from frame_loads(argument)
+
+
+def loaded_frame_slots(graph: ControlFlowGraph) -> Optional[Set[int]]:
+    """The slots of the current frame that graph loads, None if the frame pointer escapes."""
+    expressions: List[Expression] = []
+    for block in graph.blocks.values():
+        for phi in block.phis:
+            expressions += [argument for argument in phi.arguments.values() if argument is not None]
+        for statement in block.statements + [block.jump]:
+            if isinstance(statement, Move):
+                if not (
+                        isinstance(statement.temporary, Memory)
+                        and frame_slot(statement.temporary.expression) is not None
+                ):
+                    expressions.append(statement.temporary)
+                expressions.append(statement.expression)
+            elif isinstance(statement, (Jump, StatementExpression)):
+                expressions.append(statement.expression)
+            elif isinstance(statement, ConditionalJump):
+                expressions += [statement.left, statement.right]
+    loaded = set()
+    for expression in expressions:
+        for slot in frame_loads(expression):
+            if slot is None:
+                return None
+            loaded.add(slot)
+    return loaded
+
+
+def eliminate_dead_code(graph: ControlFlowGraph) -> int:
+    """Removes the unused definitions of graph, in SSA form. Returns how many were removed."""
+    machine = machine_temps()
+    loaded_slots = loaded_frame_slots(graph)
+    definitions: Dict[Temp, Union[Phi, Statement]] = {}
+    live: Set[Temp] = set()
+    worklist: List[Temp] = []
+
+    def mark(temps):
+        for temp in temps:
+            if temp not in live:
+                live.add(temp)
+                worklist.append(temp)
+
+    def removable(statement: Statement) -> bool:
+        if isinstance(statement, StatementExpression):
+            return is_pure(statement.expression)
+        if (
+                loaded_slots is not None
+                and isinstance(statement, Move)
+                and isinstance(statement.temporary, Memory)
+        ):
+            slot = frame_slot(statement.temporary.expression)
+            return slot is not None and slot not in loaded_slots and is_pure(statement.expression)
+        temp = defined_temp(statement)
+        return temp is not None and temp not in machine and is_pure(statement.expression)
+
+    for block in graph.blocks.values():
+        for phi in block.phis:
+            definitions[phi.temporary] = phi
+        for statement in block.statements:
+            if not removable(statement):
+                mark(statement_uses(statement))
+            elif defined_temp(statement) is not None:
+                definitions[defined_temp(statement)] = statement
+        mark(statement_uses(block.jump))
+
+    while worklist:
+        definition = definitions.get(worklist.pop())
+        if isinstance(definition, Phi):
+            for argument in definition.arguments.values():
+                if argument is not None:
+                    mark(expression_uses(argument))
+        elif definition is not None:
+            mark(statement_uses(definition))
+
+    removed = 0
+    for block in graph.blocks.values():
+        phis = [phi for phi in block.phis if phi.temporary in live]
+        statements = [
+            statement
+            for statement in block.statements
+            if not removable(statement) or defined_temp(statement) in live
+        ]
+        removed += len(block.phis) - len(phis) + len(block.statements) - len(statements)
+        block.phis = phis
+        block.statements = statements
+    return removed
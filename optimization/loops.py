@@ -0,0 +1,97 @@
+"""
+Natural loops of a ControlFlowGraph.
+
+An edge from a block to one of its dominators is a back edge, and its loop is
+the dominator (the header) together with every block that reaches the back
+edge without going through the header. Loops with the same header are
+merged, so two loops are either nested or disjoint.
+
+insert_preheader gives a loop a block that runs once before entering it,
+where invariant code can go.
+"""
+
+from typing import Dict, List, Set
+
+from activation_records.temp import TempLabel, TempManager
+from intermediate_representation.tree import Temporary
+from optimization.cfg import Block, ControlFlowGraph, Phi, jump_to
+
+
+class Loop:
+    def __init__(self, header: TempLabel, blocks: List[TempLabel]):
+        self.header = header
+        # In reverse postorder, so every block comes after its dominators
+        self.blocks = blocks
+        self._members = set(blocks)
+
+    def __contains__(self, label: TempLabel) -> bool:
+        return label in self._members
+
+    def add_before(self, label: TempLabel, following: TempLabel):
+        self.blocks.insert(self.blocks.index(following), label)
+        self._members.add(label)
+
+
+def dominates(dominators: Dict[TempLabel, TempLabel], first: TempLabel, second: TempLabel) -> bool:
+    while second != first:
+        if dominators[second] == second:
+            return False
+        second = dominators[second]
+    return True
+
+
+def natural_loops(graph: ControlFlowGraph) -> List[Loop]:
+    """The loops of graph, inner loops before the loops containing them."""
+    dominators = graph.immediate_dominators()
+    order = graph.reverse_postorder()
+    bodies: Dict[TempLabel, Set[TempLabel]] = {}
+    for label in order:
+        for successor in graph.blocks[label].successors():
+            if not dominates(dominators, successor, label):
+                continue
+            body = bodies.setdefault(successor, {successor})
+            worklist = [label]
+            while worklist:
+                node = worklist.pop()
+                if node not in body:
+                    body.add(node)
+                    worklist.extend(graph.blocks[node].predecessors)
+
+    position = {label: index for index, label in enumerate(order)}
+    loops = [
+        Loop(header, [label for label in order if label in body])
+        for header, body in bodies.items()
+    ]
+    loops.sort(key=lambda loop: (len(loop.blocks), position[loop.header]))
+    return loops
+
+
+def insert_preheader(graph: ControlFlowGraph, loop: Loop, loops: List[Loop]) -> TempLabel:
+    """
+    The block that jumps to the header of loop from outside, created if
+    there is none. A new preheader gets the phi functions merging the values
+    that enter the loop, and joins the loops that contain loop.
+    """
+    header = graph.blocks[loop.header]
+    outside = [predecessor for predecessor in header.predecessors if predecessor not in loop]
+    if len(outside) == 1 and graph.blocks[outside[0]].successors() == [loop.header]:
+        return outside[0]
+
+    preheader = Block(TempManager.new_label(), jump=jump_to(loop.header))
+    graph.blocks[preheader.label] = preheader
+    for predecessor in outside:
+        graph.blocks[predecessor].retarget(loop.header, preheader.label)
+    for phi in header.phis:
+        arguments = [phi.arguments.pop(predecessor, None) for predecessor in outside]
+        if all(argument == arguments[0] for argument in arguments):
+            phi.arguments[preheader.label] = arguments[0]
+        else:
+            temp = TempManager.new_temp()
+            preheader.phis.append(Phi(temp, phi.original, dict(zip(outside, arguments))))
+            phi.arguments[preheader.label] = Temporary(temp)
+    graph.compute_predecessors()
+
+    for other in loops:
+        if other is not loop and loop.header in other:
+            other.add_before(preheader.label, loop.header)
+    return preheader.label
@@ -0,0 +1,83 @@
+"""
+Scalar optimizer for canonized function bodies.
+
+optimize runs between canonize and instruction selection. It builds the
+control flow graph and SSA form of the statement list, then runs
+- sparse conditional constant propagation, which also turns the branches
+  that only go one way into jumps and removes the blocks never executed;
+- copy propagation;
+- global value numbering;
+- loop-invariant code motion of frame and static link loads;
+- dead code elimination;
+and comes out of SSA form into a canonical statement list again.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import List, Tuple
+
+from activation_records.context import profile_phase, record_statistics
+from activation_records.temp import TempLabel
+from intermediate_representation.tree import Statement
+from optimization.cfg import ControlFlowGraph
+from optimization.code_motion import move_loop_invariants
+from optimization.constant_propagation import propagate_constants
+from optimization.copy_propagation import propagate_copies
+from optimization.dead_code import eliminate_dead_code
+from optimization.ssa import from_ssa, to_ssa
+from optimization.value_numbering import number_values
+
+
+@dataclass
+class OptimizationStatistics:
+    """What optimize did to one function body."""
+    phi_functions: int = 0
+    constant_temporaries: int = 0
+    folded_branches: int = 0
+    unreachable_blocks: int = 0
+    propagated_copies: int = 0
+    redundant_expressions: int = 0
+    loops: int = 0
+    hoisted_loads: int = 0
+    hoisted_expressions: int = 0
+    dead_statements: int = 0
+    phi_copies: int = 0
+
+
+def optimize(statements: List[Statement]) -> Tuple[List[Statement], OptimizationStatistics]:
+    """The optimized canonical statement list and what was optimized."""
+    statistics = OptimizationStatistics()
+    with profile_phase("ssa"):
+        graph = ControlFlowGraph.from_statements(statements)
+        statistics.unreachable_blocks = graph.remove_unreachable()
+        statistics.phi_functions = to_ssa(graph)
+    with profile_phase("constant_propagation"):
+        (
+            statistics.constant_temporaries,
+            statistics.folded_branches,
+            removed_blocks,
+        ) = propagate_constants(graph)
+        statistics.unreachable_blocks += removed_blocks
+    with profile_phase("copy_propagation"):
+        statistics.propagated_copies = propagate_copies(graph)
+    with profile_phase("value_numbering"):
+        statistics.redundant_expressions = number_values(graph)
+    with profile_phase("code_motion"):
+        (
+            statistics.loops,
+            statistics.hoisted_loads,
+            statistics.hoisted_expressions,
+        ) = move_loop_invariants(graph)
+    with profile_phase("dead_code"):
+        statistics.dead_statements = eliminate_dead_code(graph)
+    with profile_phase("out_of_ssa"):
+        statistics.phi_copies = from_ssa(graph)
+        optimized = graph.to_statements()
+    return optimized, statistics
+
+
+def optimized_body(name: TempLabel, statements: List[Statement]) -> List[Statement]:
+    """The optimized canonized body of function name, reporting the statistics to the profiler."""
+    with profile_phase("optimize", name):
+        body, statistics = optimize(statements)
+    record_statistics(name, **asdict(statistics))
+    return body
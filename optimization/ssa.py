@@ -0,0 +1,274 @@
+"""
+Static single assignment form over a ControlFlowGraph.
+
+to_ssa gives every definition of a temporary a temporary of its own and
+places phi functions at the iterated dominance frontiers of the definitions,
+only for the temporaries that are live across blocks (semi-pruned form).
+Uses are renamed along the dominator tree.
+
+The temporaries of machine registers (frame pointer, argument registers,
+return value...) keep their names and are never SSA values: calls and the
+prologue change them without any Move in the IR.
+
+from_ssa replaces the phi functions by copies at the end of the
+predecessors. Critical edges into blocks with phi functions are split first,
+and the copies of each edge are ordered so that none of them overwrites a
+temporary that a later one still reads.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from activation_records.frame import TempMap
+from activation_records.temp import Temp, TempLabel, TempManager
+from intermediate_representation.simplify import fold_binary_operation
+from intermediate_representation.tree import (
+    BinaryOperation,
+    Call,
+    ConditionalJump,
+    Constant,
+    Expression,
+    Jump,
+    Memory,
+    Move,
+    Statement,
+    StatementExpression,
+    Temporary,
+)
+from optimization.cfg import ControlFlowGraph, Phi
+
+# Gives the expression replacing a temporary, or None to keep it.
+Replacement = Callable[[Temp], Optional[Expression]]
+
+
+def machine_temps() -> Set[Temp]:
+    return set(TempMap.register_to_temp.values())
+
+
+def expression_uses(expression: Expression) -> Iterator[Temp]:
+    if isinstance(expression, Temporary):
+        yield expression.temporary
+    elif isinstance(expression, BinaryOperation):
+        yield from expression_uses(expression.left)
+        yield from expression_uses(expression.right)
+    elif isinstance(expression, Memory):
+        yield from expression_uses(expression.expression)
+    elif isinstance(expression, Call):
+        yield from expression_uses(expression.function)
+        for argument in expression.arguments:
+            yield from expression_uses(argument)
+
+
+def statement_uses(statement: Statement) -> Iterator[Temp]:
+    if isinstance(statement, Move):
+        if isinstance(statement.temporary, Memory):
+            yield from expression_uses(statement.temporary.expression)
+        yield from expression_uses(statement.expression)
+    elif isinstance(statement, ConditionalJump):
+        yield from expression_uses(statement.left)
+        yield from expression_uses(statement.right)
+    elif isinstance(statement, (Jump, StatementExpression)):
+        yield from expression_uses(statement.expression)
+
+
+def defined_temp(statement: Statement) -> Optional[Temp]:
+    if isinstance(statement, Move) and isinstance(statement.temporary, Temporary):
+        return statement.temporary.temporary
+    return None
+
+
+def replace_expression_uses(expression: Expression, replacement: Replacement) -> Expression:
+    """expression with its temporaries replaced, folding the operations left on two constants."""
+    if isinstance(expression, Temporary):
+        replaced = replacement(expression.temporary)
+        return expression if replaced is None else replaced
+    if isinstance(expression, BinaryOperation):
+        left = replace_expression_uses(expression.left, replacement)
+        right = replace_expression_uses(expression.right, replacement)
+        if isinstance(left, Constant) and isinstance(right, Constant):
+            value = fold_binary_operation(expression.operator, left.value, right.value)
+            if value is not None:
+                return Constant(value)
+        return BinaryOperation(expression.operator, left, right)
+    if isinstance(expression, Memory):
+        return Memory(replace_expression_uses(expression.expression, replacement))
+    if isinstance(expression, Call):
+        return Call(
+            replace_expression_uses(expression.function, replacement),
+            [replace_expression_uses(argument, replacement) for argument in expression.arguments],
+        )
+    return expression
+
+
+def replace_statement_uses(statement: Statement, replacement: Replacement) -> Statement:
+    if isinstance(statement, Move):
+        destination = statement.temporary
+        if isinstance(destination, Memory):
+            destination = replace_expression_uses(destination, replacement)
+        return Move(destination, replace_expression_uses(statement.expression, replacement))
+    if isinstance(statement, ConditionalJump):
+        return ConditionalJump(
+            statement.operator,
+            replace_expression_uses(statement.left, replacement),
+            replace_expression_uses(statement.right, replacement),
+            statement.true,
+            statement.false,
+        )
+    if isinstance(statement, StatementExpression):
+        return StatementExpression(replace_expression_uses(statement.expression, replacement))
+    if isinstance(statement, Jump) and isinstance(statement.expression, Call):
+        return Jump(replace_expression_uses(statement.expression, replacement), statement.labels)
+    return statement
+
+
+def replace_uses(graph: ControlFlowGraph, replacement: Replacement):
+    """Replaces the temporaries used anywhere in graph, phi arguments included."""
+    for block in graph.blocks.values():
+        for phi in block.phis:
+            phi.arguments = {
+                predecessor: argument if argument is None
+                else replace_expression_uses(argument, replacement)
+                for predecessor, argument in phi.arguments.items()
+            }
+        block.statements = [
+            replace_statement_uses(statement, replacement) for statement in block.statements
+        ]
+        block.jump = replace_statement_uses(block.jump, replacement)
+
+
+def to_ssa(graph: ControlFlowGraph) -> int:
+    """
+    Puts graph, whose blocks must all be reachable, in SSA form. Returns the
+    number of phi functions placed.
+    """
+    machine = machine_temps()
+    dominators = graph.immediate_dominators()
+
+    # Blocks defining each temporary, and the temporaries used before being
+    # defined in some block, the only ones that may need phi functions
+    definition_blocks: Dict[Temp, List[TempLabel]] = {}
+    global_temps: Set[Temp] = set()
+    for label in dominators:
+        block = graph.blocks[label]
+        defined: Set[Temp] = set()
+        for statement in block.statements + [block.jump]:
+            global_temps.update(
+                temp for temp in statement_uses(statement) if temp not in defined
+            )
+            temp = defined_temp(statement)
+            if temp is not None and temp not in machine and temp not in defined:
+                defined.add(temp)
+                definition_blocks.setdefault(temp, []).append(label)
+
+    frontiers = graph.dominance_frontiers(dominators)
+    phi_count = 0
+    for temp, labels in definition_blocks.items():
+        if temp not in global_temps:
+            continue
+        with_phi = set()
+        queued = set(labels)
+        worklist = list(labels)
+        while worklist:
+            for frontier in frontiers[worklist.pop()]:
+                if frontier in with_phi:
+                    continue
+                with_phi.add(frontier)
+                graph.blocks[frontier].phis.append(Phi(temp, temp))
+                phi_count += 1
+                if frontier not in queued:
+                    queued.add(frontier)
+                    worklist.append(frontier)
+
+    # Renaming, walking the dominator tree with an explicit stack
+    names: Dict[Temp, List[Temp]] = {}
+
+    def current_name(temp: Temp) -> Optional[Expression]:
+        stack = names.get(temp)
+        return Temporary(stack[-1]) if stack else None
+
+    def new_name(temp: Temp) -> Temp:
+        name = TempManager.new_temp()
+        names.setdefault(temp, []).append(name)
+        return name
+
+    children = graph.dominator_tree(dominators)
+    defined_in: Dict[TempLabel, List[Temp]] = {}
+    work = [(graph.entry, False)]
+    while work:
+        label, leaving = work.pop()
+        if leaving:
+            for temp in defined_in.pop(label):
+                names[temp].pop()
+            continue
+
+        block = graph.blocks[label]
+        defined_in[label] = []
+        for phi in block.phis:
+            phi.temporary = new_name(phi.original)
+            defined_in[label].append(phi.original)
+
+        statements = []
+        for statement in block.statements:
+            statement = replace_statement_uses(statement, current_name)
+            temp = defined_temp(statement)
+            if temp is not None and temp not in machine:
+                statement = Move(Temporary(new_name(temp)), statement.expression)
+                defined_in[label].append(temp)
+            statements.append(statement)
+        block.statements = statements
+        block.jump = replace_statement_uses(block.jump, current_name)
+
+        for successor in block.successors():
+            for phi in graph.blocks[successor].phis:
+                phi.arguments[label] = current_name(phi.original)
+
+        work.append((label, True))
+        work.extend((child, False) for child in reversed(children[label]))
+    return phi_count
+
+
+def sequential_copies(copies: Dict[Temp, Expression]) -> List[Move]:
+    """
+    Moves doing the parallel copies destination := source. A cycle of copies
+    goes through a new temporary.
+    """
+    moves = []
+    pending = dict(copies)
+    while pending:
+        read = {
+            source.temporary for source in pending.values() if isinstance(source, Temporary)
+        }
+        ready = [destination for destination in pending if destination not in read]
+        if ready:
+            for destination in ready:
+                moves.append(Move(Temporary(destination), pending.pop(destination)))
+            continue
+
+        # Every destination is still read by another copy
+        destination = next(iter(pending))
+        saved = Temporary(TempManager.new_temp())
+        moves.append(Move(saved, Temporary(destination)))
+        pending = {
+            other: saved if source == Temporary(destination) else source
+            for other, source in pending.items()
+        }
+    return moves
+
+
+def from_ssa(graph: ControlFlowGraph) -> int:
+    """Replaces the phi functions of graph by copies. Returns the number of copies."""
+    graph.split_critical_edges()
+    copy_count = 0
+    for block in list(graph.blocks.values()):
+        if not block.phis:
+            continue
+        for predecessor in block.predecessors:
+            copies = {}
+            for phi in block.phis:
+                argument = phi.arguments.get(predecessor)
+                if argument is not None and argument != Temporary(phi.temporary):
+                    copies[phi.temporary] = argument
+            moves = sequential_copies(copies)
+            graph.blocks[predecessor].statements.extend(moves)
+            copy_count += len(moves)
+        block.phis = []
+    return copy_count
@@ -0,0 +1,113 @@
+"""
+Global value numbering over the dominator tree.
+
+Walking the dominator tree, the operations computed into SSA temporaries are
+hashed by operator and operands; an operation already computed in a
+dominating block is not computed again, and the temporary holding it is
+used instead. Phi functions of one block with the same arguments are merged
+the same way.
+
+Only operations of constants, labels and SSA temporaries are numbered.
+Loads and calls are not: a store or a call between two of them may change
+their value. A division may be numbered, as the dominating one would have
+trapped first.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from activation_records.temp import Temp, TempLabel
+from intermediate_representation.simplify import COMMUTATIVE_OPERATORS
+from intermediate_representation.tree import (
+    BinaryOperation,
+    Constant,
+    Expression,
+    Name,
+    Temporary,
+)
+from optimization.cfg import ControlFlowGraph
+from optimization.ssa import defined_temp, machine_temps, replace_uses
+
+
+def number_values(graph: ControlFlowGraph) -> int:
+    """
+    Removes the redundant operations of graph, in SSA form. Returns the
+    number of definitions removed.
+    """
+    machine = machine_temps()
+    replacements: Dict[Temp, Expression] = {}
+
+    def key(expression: Expression) -> Optional[Tuple]:
+        if isinstance(expression, Constant):
+            return "constant", expression.value
+        if isinstance(expression, Name):
+            return "name", expression.label
+        if isinstance(expression, Temporary):
+            temp = expression.temporary
+            if temp in replacements:
+                return key(replacements[temp])
+            return None if temp in machine else ("temporary", temp)
+        if isinstance(expression, BinaryOperation):
+            operands = [key(expression.left), key(expression.right)]
+            if None in operands:
+                return None
+            if expression.operator in COMMUTATIVE_OPERATORS:
+                operands.sort()
+            return (expression.operator.name, *operands)
+        return None
+
+    dominators = graph.immediate_dominators()
+    children = graph.dominator_tree(dominators)
+    available: Dict[Tuple, Temp] = {}
+    numbered_in: Dict[TempLabel, List[Tuple]] = {}
+    work = [(graph.entry, False)]
+    while work:
+        label, leaving = work.pop()
+        if leaving:
+            for value in numbered_in.pop(label):
+                del available[value]
+            continue
+
+        block = graph.blocks[label]
+        numbered_in[label] = []
+
+        phis = []
+        for phi in block.phis:
+            arguments = [
+                None if phi.arguments.get(predecessor) is None
+                else key(phi.arguments[predecessor])
+                for predecessor in block.predecessors
+            ]
+            value = None if None in arguments else ("phi", label, *arguments)
+            if value in available:
+                replacements[phi.temporary] = Temporary(available[value])
+                continue
+            if value is not None:
+                available[value] = phi.temporary
+                numbered_in[label].append(value)
+            phis.append(phi)
+        block.phis = phis
+
+        statements = []
+        for statement in block.statements:
+            temp = defined_temp(statement)
+            value = None
+            if (
+                    temp is not None
+                    and temp not in machine
+                    and isinstance(statement.expression, BinaryOperation)
+            ):
+                value = key(statement.expression)
+            if value in available:
+                replacements[temp] = Temporary(available[value])
+                continue
+            if value is not None:
+                available[value] = temp
+                numbered_in[label].append(value)
+            statements.append(statement)
+        block.statements = statements
+
+        work.append((label, True))
+        work.extend((child, False) for child in reversed(children[label]))
+
+    replace_uses(graph, replacements.get)
+    return len(replacements)
@@ -623,5 +623,10 @@ def p_error(p):
     raise SyntacticError(p.value, p.lexer.lineno)
 
 
-# Build the parser
-parser = yacc.yacc()
+# Build the parser. The LALR tables are loaded from parser/parsetab.py, which
+# is only regenerated (in memory) when its grammar signature no longer matches
+# the rules above. Run `python -m parser.parser` after changing the grammar to
+# rewrite it.
+PARSE_TABLE_MODULE = "parser.parsetab"
+
+parser = yacc.yacc(tabmodule=PARSE_TABLE_MODULE, write_tables=__name__ == "__main__")
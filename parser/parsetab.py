@@ -0,0 +1,279 @@
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# flake8: noqa
+
+_tabversion = '4.0-tables.1'
+
+_lr_signature = 'expressionnonassocASSIGNleftORleftANDnonassocEQNEQGTLTGELEleftPLUSMINUSleftTIMESDIVIDErightUMINUSAND ARRAY ASSIGN BREAK COLON COMMA DIVIDE DO DOT ELSE END EQ FOR FUNCTION GE GT ID IF IN INT LBRACE LBRACK LE LET LPAREN LT MINUS NEQ NIL OF OR PLUS RBRACE RBRACK RPAREN SEMICOLON STRING THEN TIMES TO TYPE VAR WHILEp_emptyempty :p_empty_listempty_list : emptyp_declaration_block\n    declaration_block : empty_declaration_block\n                      | ne_declaration_block\n    p_empty_declaration_blockempty_declaration_block : empty_listp_ne_declaration_blockne_declaration_block : declaration_listp_declaration\n    declaration : type_dec_block\n                | variable_dec\n                | function_dec_block\n    p_declaration_list\n    declaration_list : declaration_list_iter\n                     | declaration_list_end\n    p_declaration_list_iterdeclaration_list_iter : declaration_list declarationp_declaration_list_enddeclaration_list_end : declarationp_type_dec_block\n    type_dec_block : type_dec_list\n    p_type_dectype_dec : TYPE ID EQ typep_type_dec_list\n    type_dec_list : type_dec_list_iter\n                  | type_dec_list_end\n    p_type_dec_list_itertype_dec_list_iter : type_dec_list type_decp_type_dec_list_endtype_dec_list_end : type_decp_type\n    type : name_ty\n         | record_ty\n         | array_ty\n    p_name_tyname_ty : IDp_record_ty\n    record_ty : LBRACE field_list RBRACE\n    p_array_tyarray_ty : ARRAY OF IDp_fieldfield : ID COLON IDp_field_list\n    field_list : empty_list\n               | ne_field_list\n    p_ne_field_list\n    ne_field_list : ne_field_list_end\n               | ne_field_list_iter\n    p_ne_field_list_iterne_field_list_iter : ne_field_list COMMA fieldp_ne_field_list_endne_field_list_end : fieldp_variable_dec\n    variable_dec : variable_dec_no_type\n                 | variable_dec_with_type\n    p_variable_dec_no_typevariable_dec_no_type : VAR ID ASSIGN expressionp_variable_dec_with_typevariable_dec_with_type : VAR ID COLON ID ASSIGN expressionp_function_dec_block\n    function_dec_block : function_dec_list\n    p_function_dec\n    function_dec : function_dec_no_type\n                 | function_dec_with_type\n    p_function_dec_no_typefunction_dec_no_type : FUNCTION ID LPAREN field_list RPAREN EQ expressionp_function_dec_with_typefunction_dec_with_type : FUNCTION ID LPAREN field_list RPAREN COLON ID EQ expressionp_function_dec_list\n    function_dec_list : function_dec_list_iter\n                      | function_dec_list_end\n    p_function_dec_list_iterfunction_dec_list_iter : function_dec_list function_decp_function_dec_list_endfunction_dec_list_end : function_decp_expression\n    expression : paren_exp\n               | var_exp\n               | nil_exp\n               | int_exp\n               | string_exp\n               | call_exp\n               | op_exp\n               | record_exp\n               | seq_exp\n               | assign_exp\n               | if_then_exp\n               | if_then_else_exp\n               | while_exp\n               | break_exp\n               | for_exp\n               | let_exp\n               | array_exp\n               | empty_exp\n    p_paren_expparen_exp : LPAREN expression RPARENp_var_expvar_exp : variablep_nil_expnil_exp : NILp_int_expint_exp : INTp_string_expstring_exp : STRINGp_call_expcall_exp : ID LPAREN arg_list RPARENp_arg_list\n    arg_list : empty_list\n             | exp_list\n    p_exp_list\n    exp_list : exp_list_iter\n             | exp_list_end\n    p_exp_list_iterexp_list_iter : exp_list COMMA expressionp_exp_list_endexp_list_end : expressionp_op_exp\n    op_exp : unary_minus_exp\n           | binary_plus_exp\n           | binary_minus_exp\n           | binary_times_exp\n           | binary_divide_exp\n           | binary_eq_exp\n           | binary_neq_exp\n           | binary_lt_exp\n           | binary_le_exp\n           | binary_gt_exp\n           | binary_ge_exp\n           | binary_and_exp\n           | binary_or_exp\n    p_unary_minus_expunary_minus_exp : MINUS expression %prec UMINUSp_binary_plus_expbinary_plus_exp : expression PLUS expressionp_binary_minus_expbinary_minus_exp : expression MINUS expressionp_binary_times_expbinary_times_exp : expression TIMES expressionp_binary_divide_expbinary_divide_exp : expression DIVIDE expressionp_binary_eq_expbinary_eq_exp : expression EQ expressionp_binary_neq_expbinary_neq_exp : expression NEQ expressionp_binary_lt_expbinary_lt_exp : expression LT expressionp_binary_le_expbinary_le_exp : expression LE expressionp_binary_gt_expbinary_gt_exp : expression GT expressionp_binary_ge_expbinary_ge_exp : expression GE expressionp_binary_and_expbinary_and_exp : expression AND expressionp_binary_or_expbinary_or_exp : expression OR expressionp_record_exprecord_exp : ID LBRACE exp_field_list RBRACEp_exp_fieldexp_field : ID EQ expressionp_exp_field_list\n    exp_field_list : empty_list\n                   | ne_exp_field_list\n    p_ne_exp_field_list\n    ne_exp_field_list : ne_exp_field_list_iter\n                      | ne_exp_field_list_end\n    p_ne_exp_field_list_iterne_exp_field_list_iter : ne_exp_field_list COMMA exp_fieldp_ne_exp_field_list_endne_exp_field_list_end : exp_fieldp_seq_expseq_exp : LPAREN ne_exp_seq SEMICOLON expression RPARENp_ne_exp_seq\n    ne_exp_seq : ne_exp_seq_iter\n               | ne_exp_seq_end\n    p_ne_exp_seq_iterne_exp_seq_iter : ne_exp_seq SEMICOLON expressionp_ne_exp_seq_endne_exp_seq_end : expressionp_assign_expassign_exp : variable ASSIGN expressionp_if_then_expif_then_exp : IF expression THEN expressionp_if_then_else_expif_then_else_exp : IF expression THEN expression ELSE expressionp_while_expwhile_exp : WHILE expression DO expressionp_break_expbreak_exp : BREAKp_for_expfor_exp : FOR ID ASSIGN expression TO expression DO expressionp_let_exp\n    let_exp : empty_let_exp\n            | ne_let_exp\n    p_empty_let_expempty_let_exp : LET declaration_block IN empty_list ENDp_ne_let_expne_let_exp : LET declaration_block IN ne_exp_seq ENDp_array_exparray_exp : ID LBRACK expression RBRACK OF expressionp_empty_expempty_exp : emptyp_variable\n    variable : simple_var\n             | field_var\n             | subscript_var\n             | subscript_var_aux\n    p_simple_varsimple_var : IDp_field_varfield_var : variable DOT IDp_subscript_varsubscript_var : variable LBRACK expression RBRACKp_subscript_var_auxsubscript_var_aux : ID LBRACK expression RBRACK'
+
+_lr_action_items = {
+    'LPAREN': ([0, 20, 25, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 146, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [20, 20, 71, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 164, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20]),
+    'NIL': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22]),
+    'INT': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23]),
+    'STRING': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24]),
+    'ID': ([0, 20, 39, 40, 42, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 69, 70, 71, 72, 73, 96, 101, 104, 118, 137, 138, 139, 140, 150, 151, 153, 161, 162, 163, 164, 169, 170, 171, 174, 182, 195, 197, 198, 200, 201, 206, 207, 212], [25, 25, 25, 25, 76, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 120, 25, 25, 129, 25, 144, 145, 146, 25, 25, 25, 25, 25, 25, 25, 129, 25, 176, 177, 184, 25, 25, 25, 25, 184, 25, 204, 205, 184, 25, 25, 211, 25]),
+    'IF': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39]),
+    'WHILE': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40]),
+    'BREAK': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41]),
+    'FOR': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42]),
+    'MINUS': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [50, 53, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, 50, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, 50, 50, -119, -121, -122, -126, -127, -128, -129, -130, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 53, 50, 50, 50, 50, 53, 53, -89, -90, -91, -92, -93, 53, 53, 53, 53, 53, 53, 53, 53, -64, 50, 53, -132, 53, -126, 53, 53, 50, 50, 50, 50, 53, -133, -69, 50, 50, -102, -134, 53, 53, 53, 53, 50, -110, 53, 53, 50, 50, 50, -123, -124, 50, 53, 53, 53, 53, 53, 50, 50, 53, 50, 53, 53, 50, 53]),
+    'LET': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51]),
+    'PLUS': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 52, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 52, -1, -1, -1, -1, 52, 52, -89, -90, -91, -92, -93, 52, 52, 52, 52, 52, 52, 52, 52, -64, -1, 52, -132, 52, -126, 52, 52, -1, -1, -1, -1, 52, -133, -69, -1, -1, -102, -134, 52, 52, 52, 52, -1, -110, 52, 52, -1, -1, -1, -123, -124, -1, 52, 52, 52, 52, 52, -1, -1, 52, -1, 52, 52, -1, 52]),
+    'TIMES': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 54, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 54, -1, -1, -1, -1, 54, 54, -89, 54, 54, -92, -93, 54, 54, 54, 54, 54, 54, 54, 54, -64, -1, 54, -132, 54, -126, 54, 54, -1, -1, -1, -1, 54, -133, -69, -1, -1, -102, -134, 54, 54, 54, 54, -1, -110, 54, 54, -1, -1, -1, -123, -124, -1, 54, 54, 54, 54, 54, -1, -1, 54, -1, 54, 54, -1, 54]),
+    'DIVIDE': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 55, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 55, -1, -1, -1, -1, 55, 55, -89, 55, 55, -92, -93, 55, 55, 55, 55, 55, 55, 55, 55, -64, -1, 55, -132, 55, -126, 55, 55, -1, -1, -1, -1, 55, -133, -69, -1, -1, -102, -134, 55, 55, 55, 55, -1, -110, 55, 55, -1, -1, -1, -123, -124, -1, 55, 55, 55, 55, 55, -1, -1, 55, -1, 55, 55, -1, 55]),
+    'EQ': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 129, 136, 137, 138, 139, 140, 145, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 199, 201, 202, 206, 209, 210, 211, 212, 213], [-1, 56, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 56, -1, -1, -1, -1, 56, 56, -89, -90, -91, -92, -93, None, None, None, None, None, None, 56, 56, -64, -1, 56, -132, 56, -126, 56, 151, 56, -1, -1, -1, -1, 163, 56, -133, -69, -1, -1, -102, -134, 56, 56, 56, 56, -1, -110, 56, 56, -1, -1, -1, -123, -124, -1, 56, 56, 56, 56, 56, -1, 206, -1, 56, -1, 56, 56, 212, -1, 56]),
+    'NEQ': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 57, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 57, -1, -1, -1, -1, 57, 57, -89, -90, -91, -92, -93, None, None, None, None, None, None, 57, 57, -64, -1, 57, -132, 57, -126, 57, 57, -1, -1, -1, -1, 57, -133, -69, -1, -1, -102, -134, 57, 57, 57, 57, -1, -110, 57, 57, -1, -1, -1, -123, -124, -1, 57, 57, 57, 57, 57, -1, -1, 57, -1, 57, 57, -1, 57]),
+    'LT': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 58, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 58, -1, -1, -1, -1, 58, 58, -89, -90, -91, -92, -93, None, None, None, None, None, None, 58, 58, -64, -1, 58, -132, 58, -126, 58, 58, -1, -1, -1, -1, 58, -133, -69, -1, -1, -102, -134, 58, 58, 58, 58, -1, -110, 58, 58, -1, -1, -1, -123, -124, -1, 58, 58, 58, 58, 58, -1, -1, 58, -1, 58, 58, -1, 58]),
+    'LE': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 59, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 59, -1, -1, -1, -1, 59, 59, -89, -90, -91, -92, -93, None, None, None, None, None, None, 59, 59, -64, -1, 59, -132, 59, -126, 59, 59, -1, -1, -1, -1, 59, -133, -69, -1, -1, -102, -134, 59, 59, 59, 59, -1, -110, 59, 59, -1, -1, -1, -123, -124, -1, 59, 59, 59, 59, 59, -1, -1, 59, -1, 59, 59, -1, 59]),
+    'GT': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 60, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 60, -1, -1, -1, -1, 60, 60, -89, -90, -91, -92, -93, None, None, None, None, None, None, 60, 60, -64, -1, 60, -132, 60, -126, 60, 60, -1, -1, -1, -1, 60, -133, -69, -1, -1, -102, -134, 60, 60, 60, 60, -1, -110, 60, 60, -1, -1, -1, -123, -124, -1, 60, 60, 60, 60, 60, -1, -1, 60, -1, 60, 60, -1, 60]),
+    'GE': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 61, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 61, -1, -1, -1, -1, 61, 61, -89, -90, -91, -92, -93, None, None, None, None, None, None, 61, 61, -64, -1, 61, -132, 61, -126, 61, 61, -1, -1, -1, -1, 61, -133, -69, -1, -1, -102, -134, 61, 61, 61, 61, -1, -110, 61, 61, -1, -1, -1, -123, -124, -1, 61, 61, 61, 61, 61, -1, -1, 61, -1, 61, 61, -1, 61]),
+    'AND': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 62, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 62, -1, -1, -1, -1, 62, 62, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, 62, -64, -1, 62, -132, 62, -126, 62, 62, -1, -1, -1, -1, 62, -133, -69, -1, -1, -102, -134, 62, 62, 62, 62, -1, -110, 62, 62, -1, -1, -1, -123, -124, -1, 62, 62, 62, 62, 62, -1, -1, 62, -1, 62, 62, -1, 62]),
+    'OR': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 70, 71, 73, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 125, 128, 136, 137, 138, 139, 140, 147, 148, 149, 150, 151, 152, 154, 155, 156, 157, 160, 161, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 191, 192, 193, 194, 195, 201, 202, 206, 209, 210, 212, 213], [-1, 63, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 63, -1, -1, -1, -1, 63, 63, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -1, 63, -132, 63, -126, 63, 63, -1, -1, -1, -1, 63, -133, -69, -1, -1, -102, -134, 63, 63, 63, 63, -1, -110, 63, 63, -1, -1, -1, -123, -124, -1, 63, 63, 63, 63, 63, -1, -1, 63, -1, 63, 63, -1, 63]),
+    '$end': ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 137, 138, 148, 149, 152, 154, 155, 156, 165, 169, 170, 172, 173, 191, 192, 201, 209], [-1, 0, -46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -1, -1, -133, -69, -102, -134, -116, -118, -110, -1, -1, -123, -124, -125, -117, -1, -120]),
+    'RPAREN': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 68, 71, 77, 83, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 122, 123, 124, 125, 126, 127, 128, 137, 138, 147, 148, 149, 150, 152, 154, 155, 156, 164, 165, 166, 169, 170, 172, 173, 185, 186, 187, 188, 189, 190, 191, 192, 201, 205, 208, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 117, -1, -1, -89, -2, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -1, -115, -132, 149, -70, -71, -2, -72, -73, -75, -1, -1, 165, -133, -69, -1, -102, -134, -116, -118, -1, -110, -74, -1, -1, -123, -124, 199, -27, -28, -29, -30, -32, -125, -117, -1, -26, -31, -120]),
+    'SEMICOLON': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 125, 137, 138, 140, 147, 148, 149, 152, 154, 155, 156, 159, 160, 165, 169, 170, 172, 173, 174, 191, 192, 194, 201, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -1, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -114, 118, -111, -112, -1, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -1, -115, -132, -126, -1, -1, -1, -113, -133, -69, -102, -134, -116, -118, 174, -114, -110, -1, -1, -123, -124, -1, -125, -117, -113, -1, -120]),
+    'THEN': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 74, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 137, 138, 148, 149, 152, 154, 155, 156, 165, 169, 170, 172, 173, 191, 192, 201, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 137, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -1, -1, -133, -69, -102, -134, -116, -118, -110, -1, -1, -123, -124, -125, -117, -1, -120]),
+    'DO': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 40, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 137, 138, 148, 149, 152, 154, 155, 156, 165, 169, 170, 171, 172, 173, 191, 192, 193, 201, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -1, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 138, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -1, -1, -133, -69, -102, -134, -116, -118, -110, -1, -1, -1, -123, -124, -125, -117, 201, -1, -120]),
+    'RBRACK': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 73, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 121, 136, 137, 138, 148, 149, 152, 154, 155, 156, 165, 169, 170, 172, 173, 191, 192, 201, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, 148, 154, -1, -1, -133, -69, -102, -134, -116, -118, -110, -1, -1, -123, -124, -125, -117, -1, -120]),
+    'COMMA': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 71, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 124, 125, 126, 127, 128, 132, 133, 134, 135, 137, 138, 148, 149, 150, 151, 152, 154, 155, 156, 165, 166, 167, 168, 169, 170, 172, 173, 187, 188, 189, 190, 191, 192, 201, 205, 208, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, 150, -126, -72, -73, -75, 153, -106, -107, -109, -1, -1, -133, -69, -1, -1, -102, -134, -116, -118, -110, -74, -103, -108, -1, -1, -123, -124, 200, -29, -30, -32, -125, -117, -1, -26, -31, -120]),
+    'ELSE': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 137, 138, 148, 149, 152, 154, 155, 156, 165, 169, 170, 172, 173, 191, 192, 201, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -1, -1, -133, -69, -102, -134, 170, -118, -110, -1, -1, -123, -124, -125, -117, -1, -120]),
+    'TO': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 137, 138, 139, 148, 149, 152, 154, 155, 156, 157, 165, 169, 170, 172, 173, 191, 192, 201, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -1, -1, -1, -133, -69, -102, -134, -116, -118, 171, -110, -1, -1, -123, -124, -125, -117, -1, -120]),
+    'END': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 66, 67, 68, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 125, 137, 138, 140, 148, 149, 152, 154, 155, 156, 158, 159, 160, 165, 169, 170, 172, 173, 174, 191, 192, 194, 201, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -111, -112, -1, -89, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -2, -1, -1, -1, -133, -69, -102, -134, -116, -118, 172, 173, -114, -110, -1, -1, -123, -124, -1, -125, -117, -113, -1, -120]),
+    'RBRACE': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 72, 77, 83, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 130, 131, 132, 133, 134, 135, 137, 138, 148, 149, 151, 152, 154, 155, 156, 165, 167, 168, 169, 170, 172, 173, 182, 186, 187, 188, 189, 190, 191, 192, 196, 201, 205, 208, 209], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, -2, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, 152, -104, -105, -106, -107, -109, -1, -1, -133, -69, -1, -102, -134, -116, -118, -110, -103, -108, -1, -1, -123, -124, -1, -27, -28, -29, -30, -32, -125, -117, 203, -1, -26, -31, -120]),
+    'VAR': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 77, 82, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 102, 103, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 137, 138, 141, 142, 143, 148, 149, 152, 154, 155, 156, 161, 165, 169, 170, 172, 173, 175, 177, 178, 179, 180, 181, 191, 192, 195, 201, 202, 203, 204, 206, 209, 210, 212, 213], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, 96, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, 96, -10, -11, -13, -7, -8, -9, -14, -33, -34, -37, -16, -17, -42, -43, -19, -45, -38, -39, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -1, -1, -12, -18, -44, -133, -69, -102, -134, -116, -118, -1, -110, -1, -1, -123, -124, -35, -23, -15, -20, -21, -22, -125, -117, -1, -1, -36, -24, -25, -1, -120, -40, -1, -41]),
+    'TYPE': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 77, 82, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 102, 103, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 137, 138, 141, 142, 143, 148, 149, 152, 154, 155, 156, 161, 165, 169, 170, 172, 173, 175, 177, 178, 179, 180, 181, 191, 192, 195, 201, 202, 203, 204, 206, 209, 210, 212, 213], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, 101, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, 101, -10, -11, -13, -7, -8, -9, 101, -33, -34, -37, -16, -17, -42, -43, -19, -45, -38, -39, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -1, -1, -12, -18, -44, -133, -69, -102, -134, -116, -118, -1, -110, -1, -1, -123, -124, -35, -23, -15, -20, -21, -22, -125, -117, -1, -1, -36, -24, -25, -1, -120, -40, -1, -41]),
+    'FUNCTION': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 77, 82, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 102, 103, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 137, 138, 141, 142, 143, 148, 149, 152, 154, 155, 156, 161, 165, 169, 170, 172, 173, 175, 177, 178, 179, 180, 181, 191, 192, 195, 201, 202, 203, 204, 206, 209, 210, 212, 213], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, 104, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, 104, -10, -11, -13, -7, -8, -9, -14, -33, -34, 104, -16, -17, -42, -43, -19, -45, -38, -39, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -1, -1, -12, -18, -44, -133, -69, -102, -134, -116, -118, -1, -110, -1, -1, -123, -124, -35, -23, -15, -20, -21, -22, -125, -117, -1, -1, -36, -24, -25, -1, -120, -40, -1, -41]),
+    'IN': ([2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 41, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 102, 103, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 119, 120, 137, 138, 141, 142, 143, 148, 149, 152, 154, 155, 156, 161, 165, 169, 170, 172, 173, 175, 177, 178, 179, 180, 181, 191, 192, 195, 201, 202, 203, 204, 206, 209, 210, 212, 213], [-46, -47, -48, -49, -50, -51, -52, -53, -54, -55, -56, -57, -58, -59, -60, -61, -62, -63, -65, -66, -67, -68, -131, -76, -77, -78, -79, -80, -81, -82, -83, -84, -85, -86, -87, -88, -119, -121, -122, -126, -127, -128, -129, -130, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -89, 140, -5, -3, -4, -6, -2, -10, -11, -13, -7, -8, -9, -14, -33, -34, -37, -16, -17, -42, -43, -19, -45, -38, -39, -90, -91, -92, -93, -94, -95, -96, -97, -98, -99, -100, -101, -64, -115, -132, -1, -1, -12, -18, -44, -133, -69, -102, -134, -116, -118, -1, -110, -1, -1, -123, -124, -35, -23, -15, -20, -21, -22, -125, -117, -1, -1, -36, -24, -25, -1, -120, -40, -1, -41]),
+    'ASSIGN': ([21, 25, 46, 47, 48, 49, 76, 120, 144, 148, 154, 176], [68, -131, -127, -128, -129, -130, 139, -132, 161, -133, -134, 195]),
+    'DOT': ([21, 25, 46, 47, 48, 49, 120, 148, 154], [69, -131, -127, -128, -129, -130, -132, -133, -134]),
+    'LBRACK': ([21, 25, 46, 47, 48, 49, 120, 148, 154], [70, 73, -127, -128, -129, -130, -132, -133, -134]),
+    'LBRACE': ([25, 163], [72, 182]),
+    'COLON': ([144, 184, 199], [162, 198, 207]),
+    'OF': ([154, 183], [169, 197]),
+    'ARRAY': ([163], [183]),
+}
+
+_lr_goto_items = {
+    'expression': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [1, 64, 74, 75, 77, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 119, 121, 128, 136, 147, 155, 156, 157, 160, 166, 167, 175, 191, 192, 193, 194, 202, 209, 210, 213]),
+    'paren_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+    'var_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3]),
+    'nil_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4]),
+    'int_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5]),
+    'string_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6]),
+    'call_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7]),
+    'op_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8]),
+    'record_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9]),
+    'seq_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10]),
+    'assign_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11]),
+    'if_then_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12]),
+    'if_then_else_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13]),
+    'while_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14]),
+    'break_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15]),
+    'for_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16]),
+    'let_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17]),
+    'array_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18]),
+    'empty_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19]),
+    'variable': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21]),
+    'unary_minus_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26]),
+    'binary_plus_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27]),
+    'binary_minus_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28]),
+    'binary_times_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29]),
+    'binary_divide_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30]),
+    'binary_eq_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31]),
+    'binary_neq_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32]),
+    'binary_lt_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33]),
+    'binary_le_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34]),
+    'binary_gt_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35]),
+    'binary_ge_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36]),
+    'binary_and_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37]),
+    'binary_or_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38]),
+    'empty_let_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43]),
+    'ne_let_exp': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44]),
+    'empty': ([0, 20, 39, 40, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 72, 73, 118, 137, 138, 139, 140, 150, 151, 161, 164, 169, 170, 171, 174, 182, 195, 201, 206, 212], [45, 45, 45, 45, 45, 83, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 125, 83, 45, 45, 45, 45, 45, 125, 45, 45, 45, 83, 45, 45, 45, 45, 83, 45, 45, 45, 45]),
+    'simple_var': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46]),
+    'field_var': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47]),
+    'subscript_var': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48]),
+    'subscript_var_aux': ([0, 20, 39, 40, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 68, 70, 71, 73, 118, 137, 138, 139, 140, 150, 151, 161, 169, 170, 171, 174, 195, 201, 206, 212], [49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49]),
+    'ne_exp_seq': ([20, 140], [65, 159]),
+    'ne_exp_seq_iter': ([20, 140], [66, 66]),
+    'ne_exp_seq_end': ([20, 140], [67, 67]),
+    'declaration_block': ([51], [78]),
+    'empty_list': ([51, 71, 72, 140, 164, 182], [79, 123, 131, 158, 186, 186]),
+    'empty_declaration_block': ([51], [80]),
+    'ne_declaration_block': ([51], [81]),
+    'declaration_list': ([51], [82]),
+    'declaration_list_iter': ([51], [84]),
+    'declaration_list_end': ([51], [85]),
+    'declaration': ([51, 82], [86, 141]),
+    'type_dec_block': ([51, 82], [87, 87]),
+    'variable_dec': ([51, 82], [88, 88]),
+    'function_dec_block': ([51, 82], [89, 89]),
+    'type_dec_list': ([51, 82], [90, 90]),
+    'variable_dec_no_type': ([51, 82], [91, 91]),
+    'variable_dec_with_type': ([51, 82], [92, 92]),
+    'function_dec_list': ([51, 82], [93, 93]),
+    'type_dec_list_iter': ([51, 82], [94, 94]),
+    'type_dec_list_end': ([51, 82], [95, 95]),
+    'function_dec_list_iter': ([51, 82], [97, 97]),
+    'function_dec_list_end': ([51, 82], [98, 98]),
+    'type_dec': ([51, 82, 90], [99, 99, 142]),
+    'function_dec': ([51, 82, 93], [100, 100, 143]),
+    'function_dec_no_type': ([51, 82, 93], [102, 102, 102]),
+    'function_dec_with_type': ([51, 82, 93], [103, 103, 103]),
+    'arg_list': ([71], [122]),
+    'exp_list': ([71], [124]),
+    'exp_list_iter': ([71], [126]),
+    'exp_list_end': ([71], [127]),
+    'exp_field_list': ([72], [130]),
+    'ne_exp_field_list': ([72], [132]),
+    'ne_exp_field_list_iter': ([72], [133]),
+    'ne_exp_field_list_end': ([72], [134]),
+    'exp_field': ([72, 153], [135, 168]),
+    'type': ([163], [178]),
+    'name_ty': ([163], [179]),
+    'record_ty': ([163], [180]),
+    'array_ty': ([163], [181]),
+    'field_list': ([164, 182], [185, 196]),
+    'ne_field_list': ([164, 182], [187, 187]),
+    'ne_field_list_end': ([164, 182], [188, 188]),
+    'ne_field_list_iter': ([164, 182], [189, 189]),
+    'field': ([164, 182, 200], [190, 190, 208]),
+}
+
+_lr_productions = [
+    ("S' -> expression", "S'", 1, None, '', 0),
+    ('empty -> <empty>', 'empty', 0, 'p_empty', 'parser.py', 26),
+    ('empty_list -> empty', 'empty_list', 1, 'p_empty_list', 'parser.py', 31),
+    ('declaration_block -> empty_declaration_block', 'declaration_block', 1, 'p_declaration_block', 'parser.py', 40),
+    ('declaration_block -> ne_declaration_block', 'declaration_block', 1, 'p_declaration_block', 'parser.py', 41),
+    ('empty_declaration_block -> empty_list', 'empty_declaration_block', 1, 'p_empty_declaration_block', 'parser.py', 47),
+    ('ne_declaration_block -> declaration_list', 'ne_declaration_block', 1, 'p_ne_declaration_block', 'parser.py', 52),
+    ('declaration -> type_dec_block', 'declaration', 1, 'p_declaration', 'parser.py', 60),
+    ('declaration -> variable_dec', 'declaration', 1, 'p_declaration', 'parser.py', 61),
+    ('declaration -> function_dec_block', 'declaration', 1, 'p_declaration', 'parser.py', 62),
+    ('declaration_list -> declaration_list_iter', 'declaration_list', 1, 'p_declaration_list', 'parser.py', 70),
+    ('declaration_list -> declaration_list_end', 'declaration_list', 1, 'p_declaration_list', 'parser.py', 71),
+    ('declaration_list_iter -> declaration_list declaration', 'declaration_list_iter', 2, 'p_declaration_list_iter', 'parser.py', 77),
+    ('declaration_list_end -> declaration', 'declaration_list_end', 1, 'p_declaration_list_end', 'parser.py', 83),
+    ('type_dec_block -> type_dec_list', 'type_dec_block', 1, 'p_type_dec_block', 'parser.py', 89),
+    ('type_dec -> TYPE ID EQ type', 'type_dec', 4, 'p_type_dec', 'parser.py', 95),
+    ('type_dec_list -> type_dec_list_iter', 'type_dec_list', 1, 'p_type_dec_list', 'parser.py', 102),
+    ('type_dec_list -> type_dec_list_end', 'type_dec_list', 1, 'p_type_dec_list', 'parser.py', 103),
+    ('type_dec_list_iter -> type_dec_list type_dec', 'type_dec_list_iter', 2, 'p_type_dec_list_iter', 'parser.py', 109),
+    ('type_dec_list_end -> type_dec', 'type_dec_list_end', 1, 'p_type_dec_list_end', 'parser.py', 115),
+    ('type -> name_ty', 'type', 1, 'p_type', 'parser.py', 121),
+    ('type -> record_ty', 'type', 1, 'p_type', 'parser.py', 122),
+    ('type -> array_ty', 'type', 1, 'p_type', 'parser.py', 123),
+    ('name_ty -> ID', 'name_ty', 1, 'p_name_ty', 'parser.py', 129),
+    ('record_ty -> LBRACE field_list RBRACE', 'record_ty', 3, 'p_record_ty', 'parser.py', 135),
+    ('array_ty -> ARRAY OF ID', 'array_ty', 3, 'p_array_ty', 'parser.py', 141),
+    ('field -> ID COLON ID', 'field', 3, 'p_field', 'parser.py', 146),
+    ('field_list -> empty_list', 'field_list', 1, 'p_field_list', 'parser.py', 152),
+    ('field_list -> ne_field_list', 'field_list', 1, 'p_field_list', 'parser.py', 153),
+    ('ne_field_list -> ne_field_list_end', 'ne_field_list', 1, 'p_ne_field_list', 'parser.py', 161),
+    ('ne_field_list -> ne_field_list_iter', 'ne_field_list', 1, 'p_ne_field_list', 'parser.py', 162),
+    ('ne_field_list_iter -> ne_field_list COMMA field', 'ne_field_list_iter', 3, 'p_ne_field_list_iter', 'parser.py', 168),
+    ('ne_field_list_end -> field', 'ne_field_list_end', 1, 'p_ne_field_list_end', 'parser.py', 174),
+    ('variable_dec -> variable_dec_no_type', 'variable_dec', 1, 'p_variable_dec', 'parser.py', 180),
+    ('variable_dec -> variable_dec_with_type', 'variable_dec', 1, 'p_variable_dec', 'parser.py', 181),
+    ('variable_dec_no_type -> VAR ID ASSIGN expression', 'variable_dec_no_type', 4, 'p_variable_dec_no_type', 'parser.py', 187),
+    ('variable_dec_with_type -> VAR ID COLON ID ASSIGN expression', 'variable_dec_with_type', 6, 'p_variable_dec_with_type', 'parser.py', 192),
+    ('function_dec_block -> function_dec_list', 'function_dec_block', 1, 'p_function_dec_block', 'parser.py', 198),
+    ('function_dec -> function_dec_no_type', 'function_dec', 1, 'p_function_dec', 'parser.py', 207),
+    ('function_dec -> function_dec_with_type', 'function_dec', 1, 'p_function_dec', 'parser.py', 208),
+    ('function_dec_no_type -> FUNCTION ID LPAREN field_list RPAREN EQ expression', 'function_dec_no_type', 7, 'p_function_dec_no_type', 'parser.py', 214),
+    ('function_dec_with_type -> FUNCTION ID LPAREN field_list RPAREN COLON ID EQ expression', 'function_dec_with_type', 9, 'p_function_dec_with_type', 'parser.py', 227),
+    ('function_dec_list -> function_dec_list_iter', 'function_dec_list', 1, 'p_function_dec_list', 'parser.py', 242),
+    ('function_dec_list -> function_dec_list_end', 'function_dec_list', 1, 'p_function_dec_list', 'parser.py', 243),
+    ('function_dec_list_iter -> function_dec_list function_dec', 'function_dec_list_iter', 2, 'p_function_dec_list_iter', 'parser.py', 249),
+    ('function_dec_list_end -> function_dec', 'function_dec_list_end', 1, 'p_function_dec_list_end', 'parser.py', 255),
+    ('expression -> paren_exp', 'expression', 1, 'p_expression', 'parser.py', 264),
+    ('expression -> var_exp', 'expression', 1, 'p_expression', 'parser.py', 265),
+    ('expression -> nil_exp', 'expression', 1, 'p_expression', 'parser.py', 266),
+    ('expression -> int_exp', 'expression', 1, 'p_expression', 'parser.py', 267),
+    ('expression -> string_exp', 'expression', 1, 'p_expression', 'parser.py', 268),
+    ('expression -> call_exp', 'expression', 1, 'p_expression', 'parser.py', 269),
+    ('expression -> op_exp', 'expression', 1, 'p_expression', 'parser.py', 270),
+    ('expression -> record_exp', 'expression', 1, 'p_expression', 'parser.py', 271),
+    ('expression -> seq_exp', 'expression', 1, 'p_expression', 'parser.py', 272),
+    ('expression -> assign_exp', 'expression', 1, 'p_expression', 'parser.py', 273),
+    ('expression -> if_then_exp', 'expression', 1, 'p_expression', 'parser.py', 274),
+    ('expression -> if_then_else_exp', 'expression', 1, 'p_expression', 'parser.py', 275),
+    ('expression -> while_exp', 'expression', 1, 'p_expression', 'parser.py', 276),
+    ('expression -> break_exp', 'expression', 1, 'p_expression', 'parser.py', 277),
+    ('expression -> for_exp', 'expression', 1, 'p_expression', 'parser.py', 278),
+    ('expression -> let_exp', 'expression', 1, 'p_expression', 'parser.py', 279),
+    ('expression -> array_exp', 'expression', 1, 'p_expression', 'parser.py', 280),
+    ('expression -> empty_exp', 'expression', 1, 'p_expression', 'parser.py', 281),
+    ('paren_exp -> LPAREN expression RPAREN', 'paren_exp', 3, 'p_paren_exp', 'parser.py', 287),
+    ('var_exp -> variable', 'var_exp', 1, 'p_var_exp', 'parser.py', 292),
+    ('nil_exp -> NIL', 'nil_exp', 1, 'p_nil_exp', 'parser.py', 297),
+    ('int_exp -> INT', 'int_exp', 1, 'p_int_exp', 'parser.py', 302),
+    ('string_exp -> STRING', 'string_exp', 1, 'p_string_exp', 'parser.py', 307),
+    ('call_exp -> ID LPAREN arg_list RPAREN', 'call_exp', 4, 'p_call_exp', 'parser.py', 312),
+    ('arg_list -> empty_list', 'arg_list', 1, 'p_arg_list', 'parser.py', 318),
+    ('arg_list -> exp_list', 'arg_list', 1, 'p_arg_list', 'parser.py', 319),
+    ('exp_list -> exp_list_iter', 'exp_list', 1, 'p_exp_list', 'parser.py', 327),
+    ('exp_list -> exp_list_end', 'exp_list', 1, 'p_exp_list', 'parser.py', 328),
+    ('exp_list_iter -> exp_list COMMA expression', 'exp_list_iter', 3, 'p_exp_list_iter', 'parser.py', 334),
+    ('exp_list_end -> expression', 'exp_list_end', 1, 'p_exp_list_end', 'parser.py', 340),
+    ('op_exp -> unary_minus_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 346),
+    ('op_exp -> binary_plus_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 347),
+    ('op_exp -> binary_minus_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 348),
+    ('op_exp -> binary_times_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 349),
+    ('op_exp -> binary_divide_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 350),
+    ('op_exp -> binary_eq_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 351),
+    ('op_exp -> binary_neq_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 352),
+    ('op_exp -> binary_lt_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 353),
+    ('op_exp -> binary_le_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 354),
+    ('op_exp -> binary_gt_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 355),
+    ('op_exp -> binary_ge_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 356),
+    ('op_exp -> binary_and_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 357),
+    ('op_exp -> binary_or_exp', 'op_exp', 1, 'p_op_exp', 'parser.py', 358),
+    ('unary_minus_exp -> MINUS expression', 'unary_minus_exp', 2, 'p_unary_minus_exp', 'parser.py', 364),
+    ('binary_plus_exp -> expression PLUS expression', 'binary_plus_exp', 3, 'p_binary_plus_exp', 'parser.py', 374),
+    ('binary_minus_exp -> expression MINUS expression', 'binary_minus_exp', 3, 'p_binary_minus_exp', 'parser.py', 379),
+    ('binary_times_exp -> expression TIMES expression', 'binary_times_exp', 3, 'p_binary_times_exp', 'parser.py', 384),
+    ('binary_divide_exp -> expression DIVIDE expression', 'binary_divide_exp', 3, 'p_binary_divide_exp', 'parser.py', 389),
+    ('binary_eq_exp -> expression EQ expression', 'binary_eq_exp', 3, 'p_binary_eq_exp', 'parser.py', 396),
+    ('binary_neq_exp -> expression NEQ expression', 'binary_neq_exp', 3, 'p_binary_neq_exp', 'parser.py', 401),
+    ('binary_lt_exp -> expression LT expression', 'binary_lt_exp', 3, 'p_binary_lt_exp', 'parser.py', 406),
+    ('binary_le_exp -> expression LE expression', 'binary_le_exp', 3, 'p_binary_le_exp', 'parser.py', 411),
+    ('binary_gt_exp -> expression GT expression', 'binary_gt_exp', 3, 'p_binary_gt_exp', 'parser.py', 416),
+    ('binary_ge_exp -> expression GE expression', 'binary_ge_exp', 3, 'p_binary_ge_exp', 'parser.py', 421),
+    ('binary_and_exp -> expression AND expression', 'binary_and_exp', 3, 'p_binary_and_exp', 'parser.py', 426),
+    ('binary_or_exp -> expression OR expression', 'binary_or_exp', 3, 'p_binary_or_exp', 'parser.py', 436),
+    ('record_exp -> ID LBRACE exp_field_list RBRACE', 'record_exp', 4, 'p_record_exp', 'parser.py', 446),
+    ('exp_field -> ID EQ expression', 'exp_field', 3, 'p_exp_field', 'parser.py', 451),
+    ('exp_field_list -> empty_list', 'exp_field_list', 1, 'p_exp_field_list', 'parser.py', 457),
+    ('exp_field_list -> ne_exp_field_list', 'exp_field_list', 1, 'p_exp_field_list', 'parser.py', 458),
+    ('ne_exp_field_list -> ne_exp_field_list_iter', 'ne_exp_field_list', 1, 'p_ne_exp_field_list', 'parser.py', 466),
+    ('ne_exp_field_list -> ne_exp_field_list_end', 'ne_exp_field_list', 1, 'p_ne_exp_field_list', 'parser.py', 467),
+    ('ne_exp_field_list_iter -> ne_exp_field_list COMMA exp_field', 'ne_exp_field_list_iter', 3, 'p_ne_exp_field_list_iter', 'parser.py', 473),
+    ('ne_exp_field_list_end -> exp_field', 'ne_exp_field_list_end', 1, 'p_ne_exp_field_list_end', 'parser.py', 479),
+    ('seq_exp -> LPAREN ne_exp_seq SEMICOLON expression RPAREN', 'seq_exp', 5, 'p_seq_exp', 'parser.py', 484),
+    ('ne_exp_seq -> ne_exp_seq_iter', 'ne_exp_seq', 1, 'p_ne_exp_seq', 'parser.py', 492),
+    ('ne_exp_seq -> ne_exp_seq_end', 'ne_exp_seq', 1, 'p_ne_exp_seq', 'parser.py', 493),
+    ('ne_exp_seq_iter -> ne_exp_seq SEMICOLON expression', 'ne_exp_seq_iter', 3, 'p_ne_exp_seq_iter', 'parser.py', 499),
+    ('ne_exp_seq_end -> expression', 'ne_exp_seq_end', 1, 'p_ne_exp_seq_end', 'parser.py', 505),
+    ('assign_exp -> variable ASSIGN expression', 'assign_exp', 3, 'p_assign_exp', 'parser.py', 510),
+    ('if_then_exp -> IF expression THEN expression', 'if_then_exp', 4, 'p_if_then_exp', 'parser.py', 515),
+    ('if_then_else_exp -> IF expression THEN expression ELSE expression', 'if_then_else_exp', 6, 'p_if_then_else_exp', 'parser.py', 520),
+    ('while_exp -> WHILE expression DO expression', 'while_exp', 4, 'p_while_exp', 'parser.py', 525),
+    ('break_exp -> BREAK', 'break_exp', 1, 'p_break_exp', 'parser.py', 530),
+    ('for_exp -> FOR ID ASSIGN expression TO expression DO expression', 'for_exp', 8, 'p_for_exp', 'parser.py', 535),
+    ('let_exp -> empty_let_exp', 'let_exp', 1, 'p_let_exp', 'parser.py', 541),
+    ('let_exp -> ne_let_exp', 'let_exp', 1, 'p_let_exp', 'parser.py', 542),
+    ('empty_let_exp -> LET declaration_block IN empty_list END', 'empty_let_exp', 5, 'p_empty_let_exp', 'parser.py', 548),
+    ('ne_let_exp -> LET declaration_block IN ne_exp_seq END', 'ne_let_exp', 5, 'p_ne_let_exp', 'parser.py', 557),
+    ('array_exp -> ID LBRACK expression RBRACK OF expression', 'array_exp', 6, 'p_array_exp', 'parser.py', 566),
+    ('empty_exp -> empty', 'empty_exp', 1, 'p_empty_exp', 'parser.py', 571),
+    ('variable -> simple_var', 'variable', 1, 'p_variable', 'parser.py', 580),
+    ('variable -> field_var', 'variable', 1, 'p_variable', 'parser.py', 581),
+    ('variable -> subscript_var', 'variable', 1, 'p_variable', 'parser.py', 582),
+    ('variable -> subscript_var_aux', 'variable', 1, 'p_variable', 'parser.py', 583),
+    ('simple_var -> ID', 'simple_var', 1, 'p_simple_var', 'parser.py', 589),
+    ('field_var -> variable DOT ID', 'field_var', 3, 'p_field_var', 'parser.py', 594),
+    ('subscript_var -> variable LBRACK expression RBRACK', 'subscript_var', 4, 'p_subscript_var', 'parser.py', 599),
+    ('subscript_var_aux -> ID LBRACK expression RBRACK', 'subscript_var_aux', 4, 'p_subscript_var_aux', 'parser.py', 604),
+]
@@ -64,7 +64,9 @@
 import re
 import types
 import sys
+import os
 import inspect
+import importlib
 
 # -----------------------------------------------------------------------------
 #                     === User configurable parameters ===
@@ -81,6 +83,10 @@ resultlimit = 40  # Size limit of results when running in debug mode.
 
 MAXINT = sys.maxsize
 
+# Version of the table modules written by write_table().  Table modules with
+# a different version are ignored and the tables are regenerated.
+__tabversion__ = "4.0-tables.1"
+
 
 # This object is a stand-in for a logging object created by the
 # logging module.   PLY will use this by default to create things
@@ -744,6 +750,37 @@ class Production(object):
             self.callable = pdict[self.func]
 
 
+# -----------------------------------------------------------------------------
+# class MiniProduction:
+#
+# This class is a simplified representation of a production, used by the
+# tables read back from a table module.  It only carries what the parsing
+# engine needs.
+# -----------------------------------------------------------------------------
+
+
+class MiniProduction(object):
+    def __init__(self, str, name, len, func, file, line):
+        self.name = name
+        self.len = len
+        self.func = func
+        self.callable = None
+        self.file = file
+        self.line = line
+        self.str = str
+
+    def __str__(self):
+        return self.str
+
+    def __repr__(self):
+        return "MiniProduction(%s)" % self.str
+
+    # Bind the production function name to a callable
+    def bind(self, pdict):
+        if self.func:
+            self.callable = pdict[self.func]
+
+
 # -----------------------------------------------------------------------------
 # class LRItem
 #
@@ -2048,6 +2085,125 @@ class LRTable:
             st += 1
 
 
+# -----------------------------------------------------------------------------
+#                            === TABLE MODULES ===
+#
+# The tables computed by LRTable can be written to a Python module and read
+# back by later runs, which then skip table construction altogether.  A table
+# module records the table format version and the signature of the grammar it
+# was built from; yacc() only uses it when both match.
+# -----------------------------------------------------------------------------
+
+
+class LRTableModule(object):
+    def __init__(self, parsetab):
+        if getattr(parsetab, "_tabversion", None) != __tabversion__:
+            raise YaccError("yacc table file version is out of date")
+
+        self.lr_signature = parsetab._lr_signature
+
+        self.lr_action = {}
+        for name, (states, actions) in parsetab._lr_action_items.items():
+            for state, action in zip(states, actions):
+                self.lr_action.setdefault(state, {})[name] = action
+
+        self.lr_goto = {state: {} for state in self.lr_action}
+        for name, (states, gotos) in parsetab._lr_goto_items.items():
+            for state, goto in zip(states, gotos):
+                self.lr_goto.setdefault(state, {})[name] = goto
+
+        self.lr_productions = [MiniProduction(*p) for p in parsetab._lr_productions]
+
+    # Bind all production function names to callable objects in pdict
+    def bind_callables(self, pdict):
+        for p in self.lr_productions:
+            p.bind(pdict)
+
+
+# -----------------------------------------------------------------------------
+# read_table()
+#
+# Returns the tables in tabmodule (a module or the name of one), or None if the
+# module does not exist or was written by a different version of this file.
+# -----------------------------------------------------------------------------
+
+
+def read_table(tabmodule):
+    if isinstance(tabmodule, types.ModuleType):
+        parsetab = tabmodule
+    else:
+        try:
+            parsetab = importlib.import_module(tabmodule)
+        except ImportError:
+            return None
+    try:
+        return LRTableModule(parsetab)
+    except YaccError:
+        return None
+
+
+# -----------------------------------------------------------------------------
+# write_table()
+#
+# Writes the tables of an LRTable to the module tabmodule in outputdir.  The
+# action and goto tables are stored per symbol, as the list of states having
+# an entry for it and the list of those entries.
+# -----------------------------------------------------------------------------
+
+
+def write_table(lr, tabmodule, outputdir="", signature=""):
+    basemodulename = tabmodule.split(".")[-1]
+    filename = os.path.join(outputdir, basemodulename) + ".py"
+
+    action_items = {}
+    for state, actions in lr.lr_action.items():
+        for name, action in actions.items():
+            states, entries = action_items.setdefault(name, ([], []))
+            states.append(state)
+            entries.append(action)
+
+    goto_items = {}
+    for state, gotos in lr.lr_goto.items():
+        for name, goto in gotos.items():
+            states, entries = goto_items.setdefault(name, ([], []))
+            states.append(state)
+            entries.append(goto)
+
+    lines = [
+        "# %s.py" % basemodulename,
+        "# This file is automatically generated. Do not edit.",
+        "# flake8: noqa",
+        "",
+        "_tabversion = %r" % __tabversion__,
+        "",
+        "_lr_signature = %r" % signature,
+        "",
+        "_lr_action_items = {",
+    ]
+    for name, items in action_items.items():
+        lines.append("    %r: %r," % (name, items))
+    lines.append("}")
+    lines.append("")
+    lines.append("_lr_goto_items = {")
+    for name, items in goto_items.items():
+        lines.append("    %r: %r," % (name, items))
+    lines.append("}")
+    lines.append("")
+    lines.append("_lr_productions = [")
+    for p in lr.lr_productions:
+        lines.append(
+            "    (%r, %r, %d, %r, %r, %d),"
+            % (str(p), p.name, p.len, p.func, os.path.basename(p.file), p.line)
+        )
+    lines.append("]")
+
+    # Write to a temporary file first so a failed write leaves the old tables intact
+    temporary_filename = filename + ".tmp"
+    with open(temporary_filename, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(temporary_filename, filename)
+
+
 # -----------------------------------------------------------------------------
 #                            === INTROSPECTION ===
 #
@@ -2168,6 +2324,7 @@ class ParserReflect(object):
                 parts.append(" ".join(self.tokens))
             for f in self.pfuncs:
                 if f[3]:
+                    parts.append(f[2])
                     parts.append(f[3])
         except (TypeError, ValueError):
             pass
@@ -2438,7 +2595,10 @@ def yacc(
         optimize=False,
         debugfile=debug_file,
         debuglog=None,
-        errorlog=None
+        errorlog=None,
+        tabmodule=None,
+        write_tables=False,
+        outputdir=None
 ):
     # Reference to the parsing method of the last built parser
     global parse
@@ -2471,6 +2631,16 @@ def yacc(
     if pinfo.error:
         raise YaccError("Unable to build parser")
 
+    # Use the tables in tabmodule when they were built for this grammar
+    signature = pinfo.signature()
+    if tabmodule and not debug:
+        lr = read_table(tabmodule)
+        if lr is not None and lr.lr_signature == signature:
+            lr.bind_callables(pinfo.pdict)
+            parser = LRParser(lr, pinfo.error_func)
+            parse = parser.parse
+            return parser
+
     if debuglog is None:
         if debug:
             try:
@@ -2668,6 +2838,15 @@ def yacc(
                 errorlog.warning("Rule (%s) is never reduced", rejected)
                 warned_never.append(rejected)
 
+    # Write the tables for later runs
+    if write_tables and tabmodule:
+        if outputdir is None:
+            outputdir = os.path.dirname(pinfo.pdict.get("__file__", ""))
+        try:
+            write_table(lr, tabmodule, outputdir, signature)
+        except IOError as e:
+            errorlog.warning("Couldn't create %r. %s" % (tabmodule, e))
+
     # Build the parser
     lr.bind_callables(pinfo.pdict)
     parser = LRParser(lr, pinfo.error_func)
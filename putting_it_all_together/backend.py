@@ -0,0 +1,175 @@
+"""
+Per-function backend pipeline.
+
+Every ProcessFragment goes through IR simplification, canonicalization, the
+SSA optimizer, instruction selection, register allocation and final
+formatting on its own, so the fragments can be compiled in any order or in
+separate processes. compile_fragments returns the assembly text of every
+function in fragment order.
+
+compile_procedures streams the functions instead: it runs the whole backend
+for one function, hands its Procedure to the caller to write out, and only
+then starts on the next one, numbering temporaries and labels consecutively.
+It is the one copy of the pipeline; compile.py, the web UI and the Compiler
+all go through it, and look at the intermediate results through its hooks.
+
+Temporaries and labels come from the counters in TempManager, which belong to
+the current CompilationContext. Before fragment i is compiled, the counters
+are moved to a block of numbers reserved for position i. Numbering, and
+therefore the output, depends only on the fragment's position, never on the
+number of workers or on which worker picked the fragment up. Labels stay
+unique across the whole output file.
+"""
+
+import multiprocessing
+import threading
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from activation_records.context import CompilationContext, current_context, profile_phase
+from activation_records.frame import TempMap, sink, assembly_procedure, temp_to_str
+from activation_records.instruction_removal import is_redundant_move
+from activation_records.temp import TempManager
+from canonical.canonize import canonize
+from instruction_selection.assembly import Instruction, Procedure
+from instruction_selection.codegen import Codegen
+from intermediate_representation.fragment import ProcessFragment
+from intermediate_representation.simplify import simplified_body
+from intermediate_representation.tree import Statement
+from optimization.optimizer import optimized_body
+from register_allocation.allocation import RegisterAllocator
+
+# Temporaries and labels available to each fragment.
+NUMBERING_STRIDE = 1_000_000
+
+# Set by compile_fragments while a pool is running and inherited by the forked
+# workers, so the IR trees never have to be pickled. The lock keeps threads
+# that compile in parallel from overwriting each other's pool state.
+_pool_lock = threading.Lock()
+_pool_fragments: List[ProcessFragment] = []
+_pool_context = CompilationContext()
+_pool_temp_base = 0
+_pool_label_base = 0
+
+
+def compile_fragment(fragment: ProcessFragment) -> str:
+    """Runs the whole backend for one function and returns its assembly."""
+    # Exhausting the generator also forgets the function's registers
+    for procedure in compile_procedures([fragment]):
+        assembly = procedure.format(temp_to_str)
+    return assembly
+
+
+def _compile_fragment_at(
+        fragments: List[ProcessFragment], index: int, temp_base: int, label_base: int
+) -> str:
+    temp_base += index * NUMBERING_STRIDE
+    label_base += index * NUMBERING_STRIDE
+    TempManager.temp_count = temp_base
+    TempManager.label_count = label_base
+
+    assembly = compile_fragment(fragments[index])
+
+    if (
+            TempManager.temp_count >= temp_base + NUMBERING_STRIDE
+            or TempManager.label_count >= label_base + NUMBERING_STRIDE
+    ):
+        raise RuntimeError(
+            f"Function {fragments[index].frame.name} needs more than "
+            f"{NUMBERING_STRIDE} temporaries or labels"
+        )
+    return assembly
+
+
+def _compile_pooled_fragment(index: int) -> str:
+    with _pool_context.activate():
+        return _compile_fragment_at(
+            _pool_fragments, index, _pool_temp_base, _pool_label_base
+        )
+
+
+def _compile_on_pool(
+        fragments: List[ProcessFragment], jobs: int, temp_base: int, label_base: int
+) -> List[str]:
+    global _pool_fragments, _pool_context, _pool_temp_base, _pool_label_base
+    with _pool_lock:
+        _pool_fragments = fragments
+        _pool_context = current_context()
+        _pool_temp_base = temp_base
+        _pool_label_base = label_base
+        try:
+            context = multiprocessing.get_context("fork")
+            with context.Pool(min(jobs, len(fragments))) as pool:
+                return pool.map(_compile_pooled_fragment, range(len(fragments)), chunksize=1)
+        finally:
+            _pool_fragments = []
+            _pool_context = CompilationContext()
+
+
+def compile_fragments(fragments: List[ProcessFragment], jobs: int = 1) -> List[str]:
+    """
+    Compiles every fragment, using a pool of jobs processes when jobs > 1.
+
+    The result only depends on the fragments, so any number of jobs gives the
+    same assembly. Process pools are started with fork; where fork is not
+    available the fragments are compiled in this process.
+    """
+    fragments = list(fragments)
+    temp_base = TempManager.temp_count
+    label_base = TempManager.label_count
+
+    try:
+        if (
+                jobs > 1
+                and len(fragments) > 1
+                and "fork" in multiprocessing.get_all_start_methods()
+        ):
+            return _compile_on_pool(fragments, jobs, temp_base, label_base)
+        return [
+            _compile_fragment_at(fragments, index, temp_base, label_base)
+            for index in range(len(fragments))
+        ]
+    finally:
+        # Later numbering starts after every block handed out above.
+        TempManager.temp_count = temp_base + len(fragments) * NUMBERING_STRIDE
+        TempManager.label_count = label_base + len(fragments) * NUMBERING_STRIDE
+
+
+def compile_procedures(
+        fragments: Iterable[ProcessFragment],
+        on_canonized: Optional[Callable[[ProcessFragment, List[Statement]], None]] = None,
+        on_selected: Optional[Callable[[ProcessFragment, List[Instruction]], None]] = None,
+) -> Iterator[Procedure]:
+    """
+    Compiles the fragments one at a time, in order, and yields the Procedure
+    of each as soon as its registers are allocated.
+
+    Only one function is in the backend at any time, so memory does not grow
+    with the number of functions. The Procedure must be formatted (or written)
+    before asking for the next one: its registers are forgotten afterwards.
+
+    on_canonized is called with the canonized body of each function, before
+    it is optimized, and on_selected with its instructions, before register
+    allocation rewrites them in place.
+    """
+    for fragment in fragments:
+        name = fragment.frame.name
+        body = simplified_body(fragment)
+        with profile_phase("canonize", name):
+            canonized_body = canonize(body)
+        if on_canonized is not None:
+            on_canonized(fragment, canonized_body)
+        optimized = optimized_body(name, canonized_body)
+        with profile_phase("codegen", name):
+            assembly_body = Codegen.codegen(optimized)
+        if on_selected is not None:
+            on_selected(fragment, assembly_body)
+        with profile_phase("register_allocation", name):
+            allocation_result = RegisterAllocator(fragment.frame).main(sink(assembly_body))
+            TempMap.update_temp_to_register(allocation_result.temp_to_register)
+            instruction_list = [
+                instruction
+                for instruction in allocation_result.instructions
+                if not is_redundant_move(instruction)
+            ]
+        yield assembly_procedure(fragment.frame, instruction_list)
+        TempMap.forget_temp_to_register(allocation_result.temp_to_register)
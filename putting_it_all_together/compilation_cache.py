@@ -0,0 +1,152 @@
+"""
+On-disk cache of compiled Tiger programs.
+
+An entry is keyed by a hash of the source text, the compiler version and the
+flags that change the generated code, and stores the final assembly plus,
+optionally, textual phase artifacts (AST, IR, canonical trees, instructions
+before allocation) for the tools that display them.
+
+Every entry is one JSON file. Entries are written to a temporary file and
+renamed into place, so readers in other processes see either a complete
+entry or none. Reading an entry bumps its modification time, and after each
+store the least recently used entries are deleted, under an exclusive lock,
+until the cache fits in max_bytes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; eviction is then unlocked.
+    fcntl = None
+
+# Directory of the cache used by main.py and compile.py when no --cache-dir is given.
+CACHE_DIRECTORY_VARIABLE = "TIGER_CACHE_DIR"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Packages whose code determines the generated assembly.
+_COMPILER_PACKAGES = (
+    "activation_records",
+    "canonical",
+    "instruction_selection",
+    "intermediate_representation",
+    "lexer",
+    "liveness_analysis",
+    "optimization",
+    "parser",
+    "ply",
+    "register_allocation",
+    "semantic_analysis",
+    "putting_it_all_together",
+)
+_ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@lru_cache(maxsize=None)
+def compiler_version() -> str:
+    """Fingerprint of the compiler sources, so any code change invalidates the cache."""
+    digest = hashlib.sha256()
+    for package in _COMPILER_PACKAGES:
+        package_directory = os.path.join(_ROOT_DIRECTORY, package)
+        for directory, subdirectories, files in os.walk(package_directory):
+            subdirectories[:] = sorted(
+                name for name in subdirectories if name not in ("tests", "__pycache__")
+            )
+            for file_name in sorted(files):
+                if not file_name.endswith(".py"):
+                    continue
+                path = os.path.join(directory, file_name)
+                digest.update(os.path.relpath(path, _ROOT_DIRECTORY).encode())
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    assembly: str
+    artifacts: Dict[str, Any] = field(default_factory=dict)
+
+
+class CompilationCache:
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, source: str, flags: Iterable[str] = ()) -> str:
+        digest = hashlib.sha256()
+        for part in (compiler_version(), *sorted(flags), source):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".json")
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, "r") as file:
+                content = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            # Missing, concurrently evicted or unreadable entries are misses.
+            return None
+        return CacheEntry(content["assembly"], content.get("artifacts", {}))
+
+    def store(self, key: str, assembly: str, artifacts: Optional[Dict[str, Any]] = None):
+        content = {"assembly": assembly, "artifacts": artifacts or {}}
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory, prefix=".tmp-", suffix=".json"
+        )
+        try:
+            with os.fdopen(descriptor, "w") as file:
+                json.dump(content, file)
+            os.chmod(temporary_path, 0o644)
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.unlink(temporary_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits in max_bytes."""
+        with open(os.path.join(self.directory, ".lock"), "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            entries = []
+            total_size = 0
+            for entry in os.scandir(self.directory):
+                if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                    continue
+                try:
+                    status = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((status.st_mtime, entry.path, status.st_size))
+                total_size += status.st_size
+
+            for _, path, size in sorted(entries):
+                if total_size <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+
+
+def open_cache(directory: Optional[str]) -> Optional[CompilationCache]:
+    """The cache in directory, or in $TIGER_CACHE_DIR; None when neither is set."""
+    directory = directory or os.environ.get(CACHE_DIRECTORY_VARIABLE)
+    if not directory:
+        return None
+    return CompilationCache(directory)
@@ -0,0 +1,160 @@
+"""
+Reentrant compiler driver.
+
+A Compiler turns Tiger source text into the text of an x86-64 assembly file.
+Every call to compile() runs in a CompilationContext of its own, with its own
+lexer and parser, so a single Compiler (or several) can compile programs
+concurrently in different threads, for instance in a long-lived server. The
+output is the same as compiling the programs one at a time. compile_to
+writes the assembly straight to a file, one function at a time.
+"""
+
+import copy
+import io
+from typing import List, Optional, TextIO, Tuple, Union
+
+import parser.ast_nodes as ast
+from activation_records.context import CompilationContext, profile_phase
+from activation_records.frame import TempMap
+from intermediate_representation.fragment import (
+    Fragment,
+    FragmentManager,
+    ProcessFragment,
+    StringFragment,
+)
+from lexer import lex as le
+from parser import parser as p
+from ply import lex, yacc
+from putting_it_all_together.backend import compile_fragments, compile_procedures
+from putting_it_all_together.file_handler import FileHandler
+from putting_it_all_together.phase_profiler import PhaseProfiler
+from semantic_analysis.analyzers import translate_program
+
+
+def new_lexer() -> lex.Lexer:
+    """A lexer with its own input and position, built from the Tiger lexer rules."""
+    lexer = le.lexer.clone()
+    lexer.begin("INITIAL")
+    lexer.lexstatestack = []
+    lexer.lineno = 1
+    return lexer
+
+
+def new_parser() -> yacc.LRParser:
+    """A parser with its own parsing stacks, sharing the tables of the Tiger parser."""
+    return copy.copy(p.parser)
+
+
+def parse_program(source: str) -> ast.Expression:
+    """Parses source; raises SyntacticError on malformed programs."""
+    return new_parser().parse(source, new_lexer())
+
+
+class TokenReplay:
+    """
+    Lexer stand-in that hands the parser tokens lexed beforehand, so lexing
+    and parsing can be timed apart. Grammar actions read lexer.lineno, which
+    is kept at the line the real lexer would be on at that point.
+    """
+
+    def __init__(self, source: str):
+        lexer = new_lexer()
+        lexer.input(source)
+        self.tokens: List[lex.LexToken] = list(iter(lexer.token, None))
+        self.final_lineno = lexer.lineno
+        self.lineno = 1
+        self._position = 0
+
+    def input(self, source: str):
+        # The tokens were read from source in the constructor
+        pass
+
+    def token(self) -> Optional[lex.LexToken]:
+        if self._position == len(self.tokens):
+            self.lineno = self.final_lineno
+            return None
+        token = self.tokens[self._position]
+        self._position += 1
+        self.lineno = token.lineno
+        return token
+
+
+def split_fragments(
+        fragments: List[Fragment],
+) -> Tuple[List[ProcessFragment], List[StringFragment]]:
+    """Separates function definitions from string literals, keeping their order."""
+    process_fragments = []
+    string_fragments = []
+    for fragment in fragments:
+        if isinstance(fragment, ProcessFragment):
+            process_fragments.append(fragment)
+        elif isinstance(fragment, StringFragment):
+            string_fragments.append(fragment)
+    return process_fragments, string_fragments
+
+
+class Compiler:
+    def __init__(self, jobs: Optional[int] = None):
+        """
+        With jobs=None the backend streams the functions through
+        compile_procedures, one at a time. With a number of jobs every
+        function is compiled on its own by compile_fragments, on that many
+        processes.
+        """
+        self.jobs = jobs
+
+    def compile(self, source: str, profiler: Optional[PhaseProfiler] = None) -> str:
+        """
+        Compiles a Tiger program and returns the assembly file text.
+
+        If a profiler is given, every phase is reported to it (the caller
+        starts and stops it). Raises SyntacticError or SemanticError for
+        invalid programs.
+        """
+        output = io.StringIO()
+        self.compile_to(source, output, profiler)
+        return output.getvalue()
+
+    def compile_to(
+            self,
+            source: str,
+            file: Union[str, TextIO],
+            profiler: Optional[PhaseProfiler] = None,
+    ):
+        """
+        Compiles a Tiger program into a file (given by name) or a text stream.
+
+        Without jobs the functions are compiled and written one at a time. A
+        file is only created once the whole program compiled; on errors an
+        existing file of that name is left untouched.
+        """
+        with CompilationContext(profiler=profiler).activate():
+            if profiler is None:
+                program = parse_program(source)
+            else:
+                # Lex up front, so that lexing and parsing are timed separately
+                with profile_phase("lex"):
+                    tokens = TokenReplay(source)
+                with profile_phase("parse"):
+                    program = new_parser().parse(source, tokens)
+
+            TempMap.initialize()
+            with profile_phase("translate_program"):
+                translate_program(program)
+
+            process_fragments, string_fragments = split_fragments(
+                FragmentManager.get_fragments()
+            )
+            with FileHandler(file) as file_handler:
+                with profile_phase("emission"):
+                    file_handler.print_data_section(string_fragments)
+                if self.jobs is None:
+                    procedures = compile_procedures(process_fragments)
+                    for fragment, procedure in zip(process_fragments, procedures):
+                        with profile_phase("emission", fragment.frame.name):
+                            file_handler.print_assembly_procedure(procedure)
+                else:
+                    procedures = compile_fragments(process_fragments, self.jobs)
+                    with profile_phase("emission"):
+                        for procedure in procedures:
+                            file_handler.print_assembly_text(procedure)
@@ -1,14 +1,78 @@
+"""
+Writing the assembly file.
+
+A FileHandler writes the data section and then the procedures, one at a
+time, to a file or to an already open text stream. A file is written through
+a large buffer to a temporary file in the same directory, which replaces the
+target only when the handler is closed. If the compilation fails before that,
+the handler is discarded: the temporary file is closed and deleted, and any
+existing file of the same name is left as it was. Used as a context manager,
+the handler closes or discards itself.
+"""
+
+import os
+import tempfile
+from typing import List, Optional, TextIO, Union
+
 from intermediate_representation.fragment import StringFragment
-from activation_records.frame import string_literal, temp_to_str
+from activation_records.frame import string_literal, string_table, temp_to_str
 from instruction_selection.assembly import Procedure
 
+# Write buffer size of assembly files.
+BUFFER_SIZE = 1 << 16
+
 
 class FileHandler:
-    def __init__(self, file_name: str):
-        self.file = open(file_name, "w")
+    def __init__(self, file: Union[str, TextIO]):
+        # Either the name of the file to create or an already open text stream
+        self.file_name: Optional[str] = None
+        self._temporary_path: Optional[str] = None
+        if isinstance(file, str):
+            self.file_name = file
+            descriptor, self._temporary_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(file)),
+                prefix=f".{os.path.basename(file)}-",
+                suffix=".tmp",
+            )
+            self.file = os.fdopen(descriptor, "w", buffering=BUFFER_SIZE)
+        else:
+            self.file = file
+
+    def __enter__(self) -> "FileHandler":
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        if exception_type is None:
+            self.close()
+        else:
+            self.discard()
 
     def close(self):
+        """Flushes the output; a file the handler created replaces file_name."""
+        if self._temporary_path is None:
+            self.file.flush()
+            return
         self.file.close()
+        os.chmod(self._temporary_path, 0o644)
+        os.replace(self._temporary_path, self.file_name)
+        self._temporary_path = None
+
+    def discard(self):
+        """Drops a partially written file; a stream is only flushed."""
+        if self._temporary_path is None:
+            self.file.flush()
+            return
+        self.file.close()
+        os.unlink(self._temporary_path)
+        self._temporary_path = None
+
+    def print_data_section(self, string_fragments: List[StringFragment]):
+        """Everything before the procedures: the string literals, their table and the code header."""
+        self.print_data_header()
+        for string_fragment in string_fragments:
+            self.print_string_fragment(string_fragment)
+        self.print_string_table(string_fragments)
+        self.print_code_header()
 
     def print_data_header(self):
         self.file.write(".section .rodata\n")
@@ -21,8 +85,26 @@ class FileHandler:
     def print_string_fragment(self, string_fragment: StringFragment):
         self.file.write(string_literal(string_fragment.label, string_fragment.string))
 
+    def print_string_table(self, string_fragments: List[StringFragment]):
+        # Addresses, which need relocating, do not go in .rodata
+        self.file.write("\n.section .data.rel.ro\n")
+        self.file.write(string_table([string_fragment.label for string_fragment in string_fragments]))
+
     def print_assembly_procedure(self, assembly_procedure: Procedure):
-        self.file.write(assembly_procedure.format(temp_to_str))
+        assembly_procedure.write(self.file, temp_to_str)
+
+    def print_assembly_text(self, assembly: str):
+        self.file.write(assembly)
 
     def get_file_content(self):
         return self.file
+
+
+def write_assembly_file(
+        file_name: str, string_fragments: List[StringFragment], procedures: List[str]
+):
+    """Writes the data section and the already formatted procedures to file_name."""
+    with FileHandler(file_name) as file_handler:
+        file_handler.print_data_section(string_fragments)
+        for procedure in procedures:
+            file_handler.print_assembly_text(procedure)
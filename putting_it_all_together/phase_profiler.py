@@ -0,0 +1,240 @@
+"""
+Per-phase profile of one compilation.
+
+A PhaseProfiler attached to the CompilationContext (context.profiler) is told
+about every phase through activation_records.context.profile_phase. Phases
+nest: canonize contains linearize, basic_block and trace_schedule, and the
+register allocation of a function contains its liveness analysis, allocation
+rounds and spill rewrites. Nested phases inherit the function of the phase
+around them.
+
+Every phase records:
+- wall time (time.perf_counter) and CPU time (time.process_time);
+- objects: the net number of memory blocks it left allocated
+  (sys.getallocatedblocks), which follows the number of live objects;
+- peak memory: the highest memory use traced during the phase, above what
+  was in use when it started. This is only recorded with trace_memory=True,
+  which runs tracemalloc and slows the compilation down severalfold.
+
+The report aggregates the phases by their position in the phase tree and
+lists the per-function phase times together with the statistics handed over
+through record_statistics (temporaries, interference edges, spill rounds...).
+It is available as text and as JSON.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+# Version of the JSON report layout.
+REPORT_VERSION = 1
+
+
+@dataclass
+class PhaseRecord:
+    name: str
+    path: Tuple[str, ...]  # Names of the enclosing phases, then this one
+    function: Optional[str]
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    objects: int = 0
+    peak_memory: Optional[int] = None
+
+
+class PhaseProfiler:
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.records: List[PhaseRecord] = []
+        self.statistics: Dict[str, Dict[str, int]] = {}
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.peak_memory: Optional[int] = None
+        self._open_records: List[PhaseRecord] = []
+        # Memory in use when each open phase started, and its peak so far
+        self._memory_starts: List[int] = []
+        self._memory_peaks: List[int] = []
+        self._started_tracing = False
+        self._start_wall_time = 0.0
+        self._start_cpu_time = 0.0
+
+    def start(self):
+        """Starts measuring the whole compilation (and tracing memory, if enabled)."""
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            self._memory_starts.append(current)
+            self._memory_peaks.append(current)
+        self._start_wall_time = time.perf_counter()
+        self._start_cpu_time = time.process_time()
+
+    def stop(self):
+        self.wall_time = time.perf_counter() - self._start_wall_time
+        self.cpu_time = time.process_time() - self._start_cpu_time
+        if self.trace_memory:
+            peak = max(self._memory_peaks.pop(), tracemalloc.get_traced_memory()[1])
+            self.peak_memory = peak - self._memory_starts.pop()
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    @contextmanager
+    def phase(self, name: str, function: Optional[str] = None):
+        parent = self._open_records[-1] if self._open_records else None
+        if function is None and parent is not None:
+            function = parent.function
+        record = PhaseRecord(name, (parent.path if parent else ()) + (name,), function)
+        self.records.append(record)
+        self._open_records.append(record)
+
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._memory_peaks:
+                self._memory_peaks[-1] = max(self._memory_peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self._memory_starts.append(current)
+            self._memory_peaks.append(current)
+        allocated_blocks = sys.getallocatedblocks()
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        try:
+            yield record
+        finally:
+            record.wall_time = time.perf_counter() - start_wall_time
+            record.cpu_time = time.process_time() - start_cpu_time
+            record.objects = sys.getallocatedblocks() - allocated_blocks
+            if self.trace_memory:
+                peak = max(self._memory_peaks.pop(), tracemalloc.get_traced_memory()[1])
+                record.peak_memory = peak - self._memory_starts.pop()
+                if self._memory_peaks:
+                    self._memory_peaks[-1] = max(self._memory_peaks[-1], peak)
+            self._open_records.pop()
+
+    def record_statistics(self, function: str, **statistics: int):
+        self.statistics.setdefault(function, {}).update(statistics)
+
+    def phase_summary(self) -> List[Dict[str, Any]]:
+        """One entry per position in the phase tree, in order of first appearance."""
+        summary: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        for record in self.records:
+            entry = summary.get(record.path)
+            if entry is None:
+                entry = summary[record.path] = {
+                    "name": record.name,
+                    "path": list(record.path),
+                    "depth": len(record.path) - 1,
+                    "calls": 0,
+                    "wall_time": 0.0,
+                    "cpu_time": 0.0,
+                    "objects": 0,
+                    "peak_memory": None,
+                }
+            entry["calls"] += 1
+            entry["wall_time"] += record.wall_time
+            entry["cpu_time"] += record.cpu_time
+            entry["objects"] += record.objects
+            if record.peak_memory is not None:
+                entry["peak_memory"] = max(entry["peak_memory"] or 0, record.peak_memory)
+        return _in_tree_order(list(summary.values()))
+
+    def function_summary(self) -> List[Dict[str, Any]]:
+        """Wall time of every top-level backend phase and the statistics of each function."""
+        functions: Dict[str, Dict[str, Any]] = {}
+        for record in self.records:
+            if record.function is None or len(record.path) != 1:
+                continue
+            entry = functions.setdefault(record.function, {"phases": {}, "statistics": {}})
+            entry["phases"][record.name] = entry["phases"].get(record.name, 0.0) + record.wall_time
+        for function, statistics in self.statistics.items():
+            functions.setdefault(function, {"phases": {}, "statistics": {}})
+            functions[function]["statistics"].update(statistics)
+        return [{"name": name, **entry} for name, entry in functions.items()]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "version": REPORT_VERSION,
+            "total": {
+                "wall_time": self.wall_time,
+                "cpu_time": self.cpu_time,
+                "peak_memory": self.peak_memory,
+            },
+            "phases": self.phase_summary(),
+            "functions": self.function_summary(),
+        }
+
+    def json_report(self) -> str:
+        return json.dumps(self.report(), indent=2)
+
+    def text_report(self) -> str:
+        report = self.report()
+        lines = [
+            f"{'Phase':<32}{'Calls':>7}{'Wall ms':>11}{'CPU ms':>11}"
+            f"{'Peak KiB':>11}{'Objects':>10}"
+        ]
+        for phase in report["phases"]:
+            lines.append(
+                f"{'  ' * phase['depth'] + phase['name']:<32}{phase['calls']:>7}"
+                f"{phase['wall_time'] * 1000:>11.2f}{phase['cpu_time'] * 1000:>11.2f}"
+                f"{_kibibytes(phase['peak_memory']):>11}{phase['objects']:>10}"
+            )
+        total = report["total"]
+        lines.append(
+            f"{'total':<32}{'':>7}{total['wall_time'] * 1000:>11.2f}"
+            f"{total['cpu_time'] * 1000:>11.2f}{_kibibytes(total['peak_memory']):>11}"
+        )
+
+        functions = report["functions"]
+        if functions:
+            phase_names = list(dict.fromkeys(
+                name for function in functions for name in function["phases"]
+            ))
+            statistic_names = list(dict.fromkeys(
+                name for function in functions for name in function["statistics"]
+            ))
+            width = max(len("Function"), *(len(function["name"]) for function in functions)) + 2
+            lines.append("")
+            lines.append(
+                f"{'Function':<{width}}"
+                + "".join(f"{name + ' ms':>{len(name) + 5}}" for name in phase_names)
+                + "".join(f"{name:>{len(name) + 2}}" for name in statistic_names)
+            )
+            for function in functions:
+                lines.append(
+                    f"{function['name']:<{width}}"
+                    + "".join(
+                        f"{function['phases'].get(name, 0.0) * 1000:>{len(name) + 5}.2f}"
+                        for name in phase_names
+                    )
+                    + "".join(
+                        f"{function['statistics'].get(name, ''):>{len(name) + 2}}"
+                        for name in statistic_names
+                    )
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _in_tree_order(phases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Orders the phases depth first, so every phase follows its parent."""
+    children: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for phase in phases:
+        children.setdefault(tuple(phase["path"][:-1]), []).append(phase)
+
+    ordered = []
+
+    def visit(path: Tuple[str, ...]):
+        for phase in children.get(path, []):
+            ordered.append(phase)
+            visit(tuple(phase["path"]))
+
+    visit(())
+    return ordered
+
+
+def _kibibytes(size: Optional[int]) -> str:
+    return "-" if size is None else f"{size / 1024:.1f}"
@@ -1,114 +1,673 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <sys/mman.h>
 
-long long *init_record(long long size){
+/*
+ * The runtime functions preserve every register but the %rax they return, so
+ * the compiler only treats %rax as overwritten by a call to them (see
+ * activation_records/runtime.py). Saving the registers needs the functions to
+ * keep to the general purpose registers.
+ */
+#pragma GCC target("general-regs-only")
+#define RUNTIME __attribute__((no_caller_saved_registers))
+
+/*
+ * The heap is made of pages, carved into records and arrays by moving
+ * tiger_heap_pointer up to tiger_heap_limit, the end of the current page.
+ * The compiler does it inline for records (see heap_allocation in
+ * activation_records/frame.py) and calls refill_heap when the page is full.
+ * Blocks larger than a page get a run of pages of their own. Pages are
+ * zeroed when handed out, so a zero word ends the blocks of a page.
+ *
+ * The collector is mostly-copying (Bartlett): every page belongs to a space,
+ * and a collection moves the live objects of the current space to the next.
+ * The header of every object (see record_layout in
+ * activation_records/frame.py) tells which of its words are pointers, so the
+ * objects are traced precisely, Cheney's way: the objects they point to are
+ * copied, and leave their new address in place of their header. The stack
+ * and the registers are scanned conservatively instead: an object that a
+ * word of them points into is kept where it is, along with its page, so the
+ * compiled code never sees a value it holds move. The other objects of the
+ * kept pages are dead, and become arrays of integers, so that a stale word
+ * that points to them later keeps nothing else alive. Runs of pages are not
+ * copied either, but kept.
+ *
+ * A collection starts when the pages allocated since the last one outnumber
+ * the ones that survived it (and at least MINIMUM_THRESHOLD), so the heap
+ * stays within about twice the live data.
+ */
+#define PAGE_SIZE 4096
+#define MINIMUM_THRESHOLD 256
+#define LAYOUT_FIELDS 32
+#define ARRAY 2
+#define MARKED 4
+#define POINTER_ELEMENTS 8
+
+char *tiger_heap_pointer = 0;
+char *tiger_heap_limit = 0;
+
+/* The address space reserved for the heap, and how much of it can be used */
+static char *heap_start;
+static long long reserved_pages;
+static long long committed_pages;
+/* Pages from this one on have never been handed out, so they are zero */
+static long long touched_pages;
+/* For every page: its space, the first page of its run and whether the collection keeps the run */
+static unsigned *page_space;
+static long long *page_run;
+static char *page_kept;
+/* For the first page of every run: its number of pages */
+static long long *run_length;
+static long long described_pages;
+/* Pages in neither the current space nor the next are free */
+static unsigned current_space = 1;
+static long long free_cursor;
+static long long allocated_pages;
+static long long threshold = MINIMUM_THRESHOLD;
+static long long collections;
+/* The frame of main, above every frame of the compiled code */
+static char *stack_bottom;
+
+struct list {
+  long long *items;
+  long long count;
+  long long capacity;
+};
+
+/* The runs kept in place, and their marked objects that remain to be scanned */
+static struct list kept;
+static struct list marked;
+/* Pages objects are copied to, in order, and Cheney's scan through them */
+static struct list copies;
+static long long scan_page;
+static char *scan_pointer;
+static char *copy_pointer;
+static char *copy_limit;
+static long long live_pages;
+
+static void out_of_memory(long long size){
+  printf("Out of memory! Allocating %lld bytes\n", size);
+  exit(1);
+}
+
+static void *resized(void *memory, long long size){
+  memory = realloc(memory, size);
+  if (memory == NULL) out_of_memory(size);
+  return memory;
+}
+
+static void append(struct list *list, long long item){
+  if (list->count == list->capacity) {
+    list->capacity = list->capacity ? 2 * list->capacity : 64;
+    list->items = resized(list->items, list->capacity * sizeof(long long));
+  }
+  list->items[list->count++] = item;
+}
+
+static char *page_address(long long page){
+  return heap_start + page * PAGE_SIZE;
+}
+
+static void reserve_heap(void){
+  long long size;
+  for (size = 1LL << 38; size >= 1LL << 28; size >>= 1) {
+    void *memory = mmap(NULL, size, PROT_NONE, MAP_PRIVATE | MAP_ANONYMOUS | MAP_NORESERVE, -1, 0);
+    if (memory != MAP_FAILED) {
+      heap_start = memory;
+      reserved_pages = size / PAGE_SIZE;
+      return;
+    }
+  }
+  out_of_memory(size);
+}
+
+/* Makes at least pages more pages usable, at the end of the heap */
+static void commit_pages(long long pages){
+  long long target = committed_pages + (pages > 64 ? pages : 64), page;
+  if (target > reserved_pages) target = reserved_pages;
+  if (target - committed_pages < pages
+      || mprotect(page_address(committed_pages), (target - committed_pages) * PAGE_SIZE,
+                  PROT_READ | PROT_WRITE) != 0)
+    out_of_memory(pages * PAGE_SIZE);
+  if (target > described_pages) {
+    described_pages = 2 * target;
+    page_space = resized(page_space, described_pages * sizeof(unsigned));
+    page_run = resized(page_run, described_pages * sizeof(long long));
+    page_kept = resized(page_kept, described_pages);
+    run_length = resized(run_length, described_pages * sizeof(long long));
+  }
+  for (page = committed_pages; page < target; page++) {
+    page_space[page] = 0;
+    page_run[page] = page;
+    page_kept[page] = 0;
+    run_length[page] = 1;
+  }
+  committed_pages = target;
+}
+
+static int is_free(long long page){
+  return page_space[page] != current_space && page_space[page] != current_space + 1;
+}
+
+/* A zeroed run of free pages, given to space */
+static char *take_pages(long long pages, unsigned space){
+  long long start = free_cursor, page;
+  for (page = free_cursor; page - start < pages; page++) {
+    if (page == committed_pages) commit_pages(start + pages - committed_pages);
+    if (!is_free(page)) start = page + 1;
+  }
+  if (pages == 1 || start == free_cursor) free_cursor = start + pages;
+  for (page = start; page < start + pages; page++) {
+    page_space[page] = space;
+    page_run[page] = start;
+  }
+  run_length[start] = pages;
+  if (start < touched_pages)
+    memset(page_address(start), 0,
+           ((start + pages < touched_pages ? start + pages : touched_pages) - start) * PAGE_SIZE);
+  if (start + pages > touched_pages) touched_pages = start + pages;
+  return page_address(start);
+}
+
+/* The number of words of the object whose header is given */
+static long long object_words(long long header){
+  long long length;
+  if (header & ARRAY) {
+    length = (unsigned long long)header >> 4;
+    return 1 + (length > 0 ? length : 1);
+  }
+  length = (header >> 3) & 0x1fffffff;
+  return 1 + (length > 0 ? length : 1)
+    + (length > LAYOUT_FIELDS ? (length - LAYOUT_FIELDS + 63) / 64 : 0);
+}
+
+/* Keeps the run of pages where it is */
+static void keep(long long first){
+  long long page;
+  for (page = first; page < first + run_length[first]; page++)
+    page_space[page] = current_space + 1;
+  page_kept[first] = 1;
+  live_pages += run_length[first];
+  append(&kept, first);
+}
+
+/* Marks the object whose header is at block live, on a kept run */
+static void mark(long long *block){
+  if (*block & MARKED) return;
+  *block |= MARKED;
+  append(&marked, (long long)block);
+}
+
+/* If address points into an object of the heap, keeps the object where it is */
+static void pin(char *address){
+  long long page, *block, *end;
+  if (address < heap_start || address >= page_address(committed_pages)) return;
+  page = page_run[(address - heap_start) / PAGE_SIZE];
+  if (page_space[page] != current_space && !page_kept[page]) return;
+  block = (long long *)page_address(page);
+  end = (long long *)page_address(page + run_length[page]);
+  for (; block < end && *block != 0; block += object_words(*block))
+    if (address < (char *)(block + object_words(*block))) {
+      if (!page_kept[page]) keep(page);
+      mark(block);
+      return;
+    }
+}
+
+/* The address of the object value points to, after the collection */
+static long long forward(long long value){
+  long long *object = (long long *)value, *copy, header, size, page, i;
+  if (value == 0) return value;
+  page = page_run[((char *)object - heap_start) / PAGE_SIZE];
+  if (page_kept[page]) {
+    mark(object - 1);
+    return value;
+  }
+  /* Copied to already */
+  if (page_space[page] != current_space) return value;
+  if (run_length[page] > 1) {
+    keep(page);
+    mark(object - 1);
+    return value;
+  }
+  header = object[-1];
+  /* Copied already */
+  if (!(header & 1)) return header;
+  size = object_words(header) * sizeof(long long);
+  if (copy_pointer + size > copy_limit) {
+    copy_pointer = take_pages(1, current_space + 1);
+    copy_limit = copy_pointer + PAGE_SIZE;
+    append(&copies, (copy_pointer - heap_start) / PAGE_SIZE);
+    live_pages++;
+  }
+  copy = (long long *)copy_pointer;
+  for (i = 0; i < size / (long long)sizeof(long long); i++) copy[i] = object[i - 1];
+  copy_pointer += size;
+  return object[-1] = (long long)(copy + 1);
+}
+
+/* Forwards the pointers of the object whose header is at block */
+static void scan_object(long long *block){
+  long long header = block[0], *fields = block + 1, length, i;
+  unsigned long long *bits;
+  if (header & ARRAY) {
+    if (header & POINTER_ELEMENTS)
+      for (i = 0, length = (unsigned long long)header >> 4; i < length; i++)
+        fields[i] = forward(fields[i]);
+    return;
+  }
+  length = (header >> 3) & 0x1fffffff;
+  bits = (unsigned long long *)fields + length;
+  for (i = 0; i < length; i++)
+    if (i < LAYOUT_FIELDS
+        ? (unsigned long long)header >> (32 + i) & 1
+        : bits[(i - LAYOUT_FIELDS) / 64] >> ((i - LAYOUT_FIELDS) % 64) & 1)
+      fields[i] = forward(fields[i]);
+}
+
+/* Scans the next copied object, false when there is none */
+static int scan_copy(void){
+  char *page;
+  while (scan_page < copies.count) {
+    page = page_address(copies.items[scan_page]);
+    if (scan_pointer == NULL) scan_pointer = page;
+    if (scan_pointer < page + PAGE_SIZE && *(long long *)scan_pointer != 0) {
+      scan_object((long long *)scan_pointer);
+      scan_pointer += object_words(*(long long *)scan_pointer) * sizeof(long long);
+      return 1;
+    }
+    if (scan_page + 1 == copies.count) return 0;
+    scan_page++;
+    scan_pointer = NULL;
+  }
+  return 0;
+}
+
+/* Pins the objects that the stack and the registers point into */
+static void __attribute__((noinline)) scan_roots(void){
+  char *registers[6], **word;
+  __asm__ volatile(
+    "movq %%rbx, 0(%0)\n\tmovq %%rbp, 8(%0)\n\tmovq %%r12, 16(%0)\n\t"
+    "movq %%r13, 24(%0)\n\tmovq %%r14, 32(%0)\n\tmovq %%r15, 40(%0)"
+    : : "r"(registers) : "memory");
+  /* The caller-save registers were saved on the stack by the runtime function */
+  for (word = registers; word < (char **)stack_bottom; word++)
+    pin(*word);
+}
+
+/* Unmarks the live objects of the kept runs, and makes the others integers */
+static void sweep_kept(void){
+  long long k, *block, *end, words;
+  for (k = 0; k < kept.count; k++) {
+    block = (long long *)page_address(kept.items[k]);
+    end = (long long *)page_address(kept.items[k] + run_length[kept.items[k]]);
+    for (; block < end && *block != 0; block += words) {
+      words = object_words(*block);
+      if (*block & MARKED) *block &= ~MARKED;
+      else *block = (words - 1) << 4 | ARRAY | 1;
+    }
+    page_kept[kept.items[k]] = 0;
+  }
+}
+
+static void collect(void){
+  kept.count = marked.count = copies.count = scan_page = 0;
+  scan_pointer = copy_pointer = copy_limit = NULL;
+  live_pages = 0;
+  free_cursor = 0;
+
+  scan_roots();
+  for (;;) {
+    if (marked.count > 0) scan_object((long long *)marked.items[--marked.count]);
+    else if (!scan_copy()) break;
+  }
+  sweep_kept();
+
+  current_space++;
+  collections++;
+  allocated_pages = 0;
+  threshold = live_pages > MINIMUM_THRESHOLD ? live_pages : MINIMUM_THRESHOLD;
+  free_cursor = 0;
+  tiger_heap_pointer = tiger_heap_limit = 0;
+}
+
+static char *allocate_pages(long long pages){
+  if (heap_start == NULL) reserve_heap();
+  else if (allocated_pages + pages > threshold) collect();
+  allocated_pages += pages;
+  return take_pages(pages, current_space);
+}
+
+RUNTIME char *refill_heap(long long size){
+  char *page;
+  if (size > PAGE_SIZE) return allocate_pages((size + PAGE_SIZE - 1) / PAGE_SIZE);
+  page = allocate_pages(1);
+  tiger_heap_pointer = page + size;
+  tiger_heap_limit = page + PAGE_SIZE;
+  return page;
+}
+
+static char *heap_allocation(long long size){
+  if (size <= tiger_heap_limit - tiger_heap_pointer) {
+    char *block = tiger_heap_pointer;
+    tiger_heap_pointer += size;
+    return block;
+  }
+  return refill_heap(size);
+}
+
+/* With TIGER_HEAP_STATISTICS set, reports the collections and the largest the heap grew */
+static void report_heap(void){
+  fprintf(stderr, "tiger_heap collections %lld peak %lld\n",
+          collections, committed_pages * PAGE_SIZE);
+}
+
+/*
+ * A string is the address of its characters, which end with a zero byte and
+ * follow three words: its depth as a rope, the hash of the characters and
+ * their number. string_literal in activation_records/frame.py lays the
+ * literals out the same way. The length is read in constant time, and
+ * strings of different lengths or hashes are unequal without comparing their
+ * characters. Strings are never changed, so they can be shared.
+ *
+ * string_concat does not copy long strings: it makes a rope, a string whose
+ * depth is positive and whose characters are replaced by a struct rope holding
+ * the two halves. The characters of a rope are only put together (its hash
+ * with them) when something reads them, so building a string of n pieces in
+ * a loop costs O(n) and not O(n^2).
+ */
+struct string_header {
+  long long depth;
+  unsigned long long hash;
+  long long length;
+};
+
+struct rope {
+  char *left;
+  char *right;
+  char *flat;    /* The characters, once they are put together */
+};
+
+/* Concatenations shorter than this are copied */
+#define SHORTEST_ROPE 64
+
+/* The depth of the flat strings in the interning table */
+#define INTERNED (-1)
+
+#define IS_ROPE(string) (STRING_HEADER(string)->depth > 0)
+#define ROPE_DEPTH(string) (IS_ROPE(string) ? STRING_HEADER(string)->depth : 0)
+
+#define STRING_HEADER(string) ((struct string_header *)(string) - 1)
+
+struct short_string {
+  struct string_header header;
+  char characters[8];
+};
+
+static struct short_string empty_string;
+static struct short_string character_strings[256];
+
+/* The interned strings of no and of one character */
+static char *no_characters;
+static char *one_character[256];
+
+/*
+ * The interning table keeps one string for each sequence of characters in
+ * it, so two interned strings are equal only if they are the same string.
+ * It is filled when the program starts: first with the literals, which the
+ * compiler has already pooled and marked INTERNED (see string_literal in
+ * activation_records/frame.py) and lists in tiger_strings, then with the
+ * strings of up to one character the runtime returns, unless a literal has
+ * their characters.
+ */
+struct string_table {
+  long long count;
+  char *strings[];
+};
+
+extern struct string_table tiger_strings;
+
+static char **interned;
+static long long interned_capacity, interned_count;
+
+/* 64-bit FNV-1a */
+static unsigned long long string_hash(const char *characters, long long length){
+  unsigned long long hash = 0xcbf29ce484222325ULL;
   long long i;
-  long long *p, *a;
-  p = a = (long long *)malloc(size);
-  for(i=0;i<size;i+=sizeof(long long)) *p++ = 0;
-  return a;
+  for (i = 0; i < length; i++)
+    hash = (hash ^ (unsigned char)characters[i]) * 0x100000001b3ULL;
+  return hash;
+}
+
+/* A string of length characters, which finish_string completes once they are written */
+static char *new_string(long long length){
+  struct string_header *header = malloc(sizeof(struct string_header) + length + 1);
+  if (header == NULL) out_of_memory(sizeof(struct string_header) + length + 1);
+  header->depth = 0;
+  header->length = length;
+  ((char *)(header + 1))[length] = '\0';
+  return (char *)(header + 1);
+}
+
+static char *finish_string(char *string){
+  STRING_HEADER(string)->hash = string_hash(string, STRING_HEADER(string)->length);
+  return string;
+}
+
+/* The characters of string, which puts those of a rope together the first time */
+static char *characters(char *string){
+  struct string_header *header = STRING_HEADER(string);
+  struct rope *rope = (struct rope *)string;
+  if (!IS_ROPE(string)) return string;
+  if (rope->flat != NULL) return rope->flat;
+
+  /* Copies the pieces from left to right. Each rope on the way down leaves
+     its right half on the stack, so it never holds more than depth + 1. */
+  char *flat = new_string(header->length);
+  char **pending = malloc((header->depth + 1) * sizeof(char *));
+  if (pending == NULL) out_of_memory((header->depth + 1) * sizeof(char *));
+  long long top = 0, position = 0;
+  pending[top++] = string;
+  while (top > 0) {
+    char *piece = pending[--top];
+    struct rope *piece_rope = (struct rope *)piece;
+    if (IS_ROPE(piece) && piece_rope->flat == NULL) {
+      pending[top++] = piece_rope->right;
+      pending[top++] = piece_rope->left;
+      continue;
+    }
+    memcpy(flat + position, characters(piece), STRING_HEADER(piece)->length);
+    position += STRING_HEADER(piece)->length;
+  }
+  free(pending);
+
+  rope->flat = finish_string(flat);
+  header->hash = STRING_HEADER(flat)->hash;
+  return flat;
+}
+
+/* Doubles the capacity of the interning table, which is a power of 2 */
+static void grow_interned(void){
+  char **old = interned;
+  long long old_capacity = interned_capacity, i;
+  interned_capacity = old_capacity ? 2 * old_capacity : 1024;
+  interned = calloc(interned_capacity, sizeof(char *));
+  if (interned == NULL) out_of_memory(interned_capacity * sizeof(char *));
+  for (i = 0; i < old_capacity; i++) {
+    if (old[i] == NULL) continue;
+    unsigned long long slot = STRING_HEADER(old[i])->hash & (interned_capacity - 1);
+    while (interned[slot] != NULL) slot = (slot + 1) & (interned_capacity - 1);
+    interned[slot] = old[i];
+  }
+  free(old);
+}
+
+/* The interned string of the characters of string, which becomes it if there is none */
+static char *intern(char *string){
+  string = characters(string);
+  struct string_header *header = STRING_HEADER(string);
+  if (2 * (interned_count + 1) > interned_capacity) grow_interned();
+  unsigned long long slot = header->hash & (interned_capacity - 1);
+  while (interned[slot] != NULL) {
+    char *candidate = interned[slot];
+    if (STRING_HEADER(candidate)->length == header->length
+        && STRING_HEADER(candidate)->hash == header->hash
+        && memcmp(candidate, string, header->length) == 0)
+      return candidate;
+    slot = (slot + 1) & (interned_capacity - 1);
+  }
+  interned[slot] = string;
+  interned_count++;
+  /* The literals are read-only, and marked already */
+  if (header->depth != INTERNED) header->depth = INTERNED;
+  return string;
 }
 
-long long char_to_num(char* str){
-    if ( strlen(str) ) return (long long)str[0];
+static void initialize_strings(void){
+  long long i;
+  for (i = 0; i < tiger_strings.count; i++)
+    intern(tiger_strings.strings[i]);
+
+  empty_string.header.hash = string_hash("", 0);
+  no_characters = intern(empty_string.characters);
+  for (i = 0; i < 256; i++) {
+    character_strings[i].characters[0] = (char)i;
+    character_strings[i].header.length = 1;
+    character_strings[i].header.hash = string_hash(character_strings[i].characters, 1);
+    one_character[i] = intern(character_strings[i].characters);
+  }
+}
+
+RUNTIME long long char_to_num(char* str){
+    if ( STRING_HEADER(str)->length ) return (unsigned char)characters(str)[0];
     return -1;
 }
 
-void exit_program(long long status){
+RUNTIME void exit_program(long long status){
   exit(status);
 }
 
-void flush(){
+RUNTIME void flush(){
  fflush(stdout);
 }
 
-long long *init_array(long long size, long long init){
+RUNTIME long long *init_array(long long size, long long init, long long pointers){
+  if (size < 0) {
+    printf("Negative array size! Arguments: %lld %lld\n", size, init);
+    exit(1);
+  }
   long long i;
-  long long *a = (long long *)malloc(size*sizeof(long long));
-  for(i=0;i<size;i++) a[i]=init;
+  long long *a = (long long *)heap_allocation((1 + (size > 0 ? size : 1)) * sizeof(long long));
+  a[0] = size << 4 | (pointers ? POINTER_ELEMENTS : 0) | ARRAY | 1;
+  a++;
+  /* The heap is zeroed already */
+  if (init != 0)
+    for(i=0;i<size;i++) a[i]=init;
   return a;
 }
 
-long long not(long long n){
+RUNTIME long long not(long long n){
   return n==0;
 }
 
-char* num_to_char(long long n){
+RUNTIME char* num_to_char(long long n){
   if ( n < 0 || n >= 256 ) {
     printf("Out of range char! Arguments: %lld\n", n);
     exit(1);
   }
 
-  char *result = (char*) malloc(sizeof(char) * 2);
-  result[0] = (char)n;
-  result[1] = '\0';
-  return result;
+  return one_character[n];
 }
 
 
-void print_num(long long n){
+RUNTIME void print_num(long long n){
   printf("%lld\n", n);
 }
 
-void print_string(char *str){
-  printf("%s", str);
+RUNTIME void print_string(char *str){
+  fwrite(characters(str), 1, STRING_HEADER(str)->length, stdout);
 }
 
-char* read_char(){
-  char *c = (char*) malloc(sizeof(char) * 2);
+RUNTIME char* read_char(){
   long long result = getchar();
   // Check EOF.
   if(result < 0)
-    result = 0;
-  c[0] = result;
-  c[1] = '\0';
-  return c;
+    return no_characters;
+  return one_character[result];
 }
 
-long long read_num(){
+RUNTIME long long read_num(){
   long long n;
   scanf("%lld", &n);
   return n;
 }
 
-long long string_compare(char *str1, char *str2){
-  return strcmp(str1, str2);
+RUNTIME long long string_compare(char *str1, char *str2){
+  long long length1 = STRING_HEADER(str1)->length, length2 = STRING_HEADER(str2)->length;
+  int order = memcmp(characters(str1), characters(str2), length1 < length2 ? length1 : length2);
+  if (order != 0) return order;
+  return (length1 > length2) - (length1 < length2);
 }
 
-char* string_concat(char *first, char *second){
-  // Reserve space for both strings + '\0'.
-  long long combined_length = strlen(first) + strlen(second) + 1;
-  char *result = (char*) malloc(combined_length * sizeof(char));
-  result[0] = '\0';
-  strcat(result, first);
-  strcat(result, second);
-  return result;
+RUNTIME char* string_concat(char *first, char *second){
+  long long first_length = STRING_HEADER(first)->length;
+  long long second_length = STRING_HEADER(second)->length;
+  if (first_length == 0) return second;
+  if (second_length == 0) return first;
+  if (first_length + second_length < SHORTEST_ROPE) {
+    char *result = new_string(first_length + second_length);
+    memcpy(result, characters(first), first_length);
+    memcpy(result + first_length, characters(second), second_length);
+    return finish_string(result);
+  }
+
+  long long first_depth = ROPE_DEPTH(first), second_depth = ROPE_DEPTH(second);
+  struct string_header *header = malloc(sizeof(struct string_header) + sizeof(struct rope));
+  if (header == NULL) out_of_memory(sizeof(struct string_header) + sizeof(struct rope));
+  header->depth = 1 + (first_depth > second_depth ? first_depth : second_depth);
+  header->length = first_length + second_length;
+  struct rope *rope = (struct rope *)(header + 1);
+  rope->left = first;
+  rope->right = second;
+  rope->flat = NULL;
+  return (char *)rope;
 }
 
-long long string_equal(char *str1, char *str2){
-  return strcmp(str1, str2) == 0;
+RUNTIME long long string_equal(char *str1, char *str2){
+  struct string_header *header1 = STRING_HEADER(str1), *header2 = STRING_HEADER(str2);
+  if (str1 == str2) return 1;
+  if (header1->depth == INTERNED && header2->depth == INTERNED) return 0;
+  if (header1->length != header2->length) return 0;
+  /* The hash of a rope is known once its characters are */
+  char *characters1 = characters(str1), *characters2 = characters(str2);
+  return header1->hash == header2->hash && memcmp(characters1, characters2, header1->length) == 0;
 }
 
-long long string_length(char *str){
-  return strlen(str);
+RUNTIME long long string_length(char *str){
+  return STRING_HEADER(str)->length;
 }
 
-char* string_substring(char *source, long long start, long long length){
-  if(start < 0  || start + length > strlen(source)){
-    printf("Out of range substring! Arguments: \"%s\" %lld %lld \n", source, start, length);
+RUNTIME char* string_substring(char *source, long long start, long long length){
+  long long source_length = STRING_HEADER(source)->length;
+  if(start < 0 || length < 0 || start + length > source_length){
+    printf("Out of range substring! Arguments: \"%s\" %lld %lld \n", characters(source), start, length);
     exit(1);
   }
 
-  // Reserve space for the substring + '\0'.
-  char* result = (char*) malloc(sizeof(char) * (length + 1));
-  strncpy(result, source + start, length);
-  result[length] = '\0';
-  return result;
+  if (length == source_length) return source;
+  if (length == 0) return no_characters;
+  if (length == 1) return one_character[(unsigned char)characters(source)[start]];
+  char* result = new_string(length);
+  memcpy(result, characters(source) + start, length);
+  return finish_string(result);
 }
 
 long long tigermain(long long);
 long long main(){
+  stack_bottom = __builtin_frame_address(0);
+  if (getenv("TIGER_HEAP_STATISTICS") != NULL) atexit(report_heap);
+  initialize_strings();
   printf("\n");
   return tigermain(0 /*static link*/);
 }
\ No newline at end of file
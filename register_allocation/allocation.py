@@ -19,25 +19,33 @@ Algorithm Overview:
 
 Key Data Structures:
 - Interference Graph: Nodes represent temporaries, edges represent conflicts
-- Worklists: Separate queues for different types of temporaries
+- Worklists: Insertion-ordered indexed sets, one per kind of temporary, with
+  a state tag per node and per move so membership tests are O(1)
+- Adjacency: A bit matrix for edge queries plus ordered neighbor lists and
+  an explicit degree table
 - Coloring: Mapping from temporaries to physical registers
 - Spilling: When not enough registers, some temporaries go to memory
 
 Author: Tiger Compiler Project
 """
 
-from typing import List, Set, Dict, Tuple, TypeVar
+from typing import List, Set, Dict
 from dataclasses import dataclass
 
-from activation_records.frame import Frame, TempMap, frame_pointer
-from activation_records.temp import Temp, TempManager
-from instruction_selection.assembly import Instruction, Move, Operation
+from activation_records.context import profile_phase, record_statistics
+from activation_records.frame import Frame, TempMap, callee_saved_registers, omit_frame_pointer
+from activation_records.temp import Temp
+from instruction_selection.assembly import Instruction, Label, Move
 
-from liveness_analysis.flow_graph import assembler_flow_graph
-from liveness_analysis.graph import Graph
-from liveness_analysis.liveness import liveness
+from register_allocation.interference import SpillProgram, InterferenceGraph, is_rematerializable
+from register_allocation.structures import IndexedSet, BitMatrix, NodeState, MoveState
 
-T = TypeVar("T")
+# Nodes in these states are no longer part of the graph being simplified.
+_REMOVED_NODE_STATES = (NodeState.select, NodeState.coalesced)
+
+# How many times more often an instruction is expected to run than the same
+# instruction outside the innermost loop around it.
+LOOP_WEIGHT = 10
 
 
 @dataclass
@@ -90,7 +98,8 @@ class RegisterAllocator:
         1. Initialize data structures (interference graph, worklists)
         2. Iteratively apply simplify/coalesce/freeze/spill until no work remains
         3. Assign colors (register mappings) to all temporaries
-        4. If spills occurred, rewrite program and restart allocation
+        4. If spills occurred, rewrite program and restart allocation, updating
+           liveness and interference only around the rewritten instructions
 
         Args:
             instructions (List[Instruction]): Assembly instructions to allocate
@@ -98,88 +107,138 @@ class RegisterAllocator:
         Returns:
             AllocationResult: Final instructions with registers assigned and temp->register mapping
         """
-        # Initialize all data structures from liveness analysis
-        self._initialize_data_structures(instructions)
-
-        # Main allocation loop: continue until all worklists are empty
-        while (
-                self.simplify_worklist
-                or self.worklist_moves
-                or self.freeze_worklist
-                or self.spill_worklist
-        ):
-            if self.simplify_worklist:
-                self._simplify()      # Remove non-constrained temporaries
-            elif self.worklist_moves:
-                self._coalesce()     # Merge compatible moves
-            elif self.freeze_worklist:
-                self._freeze()       # Freeze low-degree move-related nodes
-            elif self.spill_worklist:
-                self._select_spill() # Select spill candidates
-
-        # Assign final register mappings (colors) to all temporaries
-        self._assign_colors()
-
-        # If any temporaries were spilled to memory, rewrite program and retry
-        if self.spilled_nodes:
-            new_instructions = self._rewrite_program(instructions)
-            return self.main(new_instructions)  # Recursive retry after spilling
-
-        # Success: return final allocation result
-        return AllocationResult(instructions, self.color)
-
-    def _initialize_data_structures(self, instructions: List[Instruction]):
+        # Frames that do not need %rbp are addressed from %rsp, freeing it
+        omit_frame_pointer(self.frame, instructions)
+        # Build liveness and the interference graph once; spill rounds patch them
+        with profile_phase("liveness"):
+            program = SpillProgram(instructions)
+        record_statistics(
+            self.frame.name,
+            temporaries=len(program.interference.neighbors),
+            interference_edges=program.interference.edge_count(),
+        )
+        spill_rounds = 0
+        spilled_temporaries = 0
+
+        while True:
+            with profile_phase("allocation_round"):
+                # Initialize the per-round worklists from the interference graph
+                self._initialize_data_structures(program)
+
+                # Main allocation loop: continue until all worklists are empty
+                while (
+                        self.simplify_worklist
+                        or self.worklist_moves
+                        or self.freeze_worklist
+                        or self.spill_worklist
+                ):
+                    if self.simplify_worklist:
+                        self._simplify()      # Remove non-constrained temporaries
+                    elif self.worklist_moves:
+                        self._coalesce()     # Merge compatible moves
+                    elif self.freeze_worklist:
+                        self._freeze()       # Freeze low-degree move-related nodes
+                    elif self.spill_worklist:
+                        self._select_spill() # Select spill candidates
+
+                # Assign final register mappings (colors) to all temporaries
+                self._assign_colors()
+
+            # Success: return final allocation result
+            if not self.spilled_nodes:
+                self._record_saved_registers(program)
+                record_statistics(
+                    self.frame.name,
+                    spill_rounds=spill_rounds,
+                    spilled_temporaries=spilled_temporaries,
+                    rematerialized_temporaries=len(program.rematerialized),
+                    instructions=len(program.instructions),
+                )
+                return AllocationResult(program.instructions, self.color)
+
+            # Some temporaries were spilled to memory: rewrite the program,
+            # update liveness for the new temporaries only, and retry
+            spill_rounds += 1
+            spilled_temporaries += len(self.spilled_nodes)
+            with profile_phase("spill_rewrite"):
+                program.rewrite(self.spilled_nodes, self.frame)
+
+    def _record_saved_registers(self, program: SpillProgram):
+        """Gives the frame the callee-save registers that the program writes, to push and pop."""
+        written = {self.color.get(temporary, temporary) for temporary in program.temp_definitions}
+        self.frame.saved_registers = [
+            register
+            for register in callee_saved_registers
+            if (register != "rbp" or self.frame.omits_frame_pointer)
+            and TempMap.register_to_temp[register] in written
+        ]
+
+    def _initialize_data_structures(self, program: SpillProgram):
         """
         Initialize all data structures needed for register allocation.
 
         This method builds the foundation for the allocation algorithm by:
-        1. Constructing control flow graph from assembly instructions
-        2. Computing liveness information and interference graph
-        3. Categorizing temporaries into different worklists
-        4. Setting up adjacency and coloring data structures
+        1. Taking the use/def information and interference graph of program
+        2. Categorizing temporaries into different worklists
+        3. Setting up adjacency and coloring data structures
+
+        Every node and every move carries a state tag naming the one worklist
+        or set it currently belongs to, so membership tests never scan a list.
 
         Args:
-            instructions (List[Instruction]): Assembly instructions to analyze
+            program (SpillProgram): Instructions with liveness and interference
         """
-        # Build control flow graph and extract use/def information
-        flow_graph_results = assembler_flow_graph(instructions)
-        self.temp_uses: Dict[Temp, List[Instruction]] = flow_graph_results.temp_uses
-        self.temp_definitions: Dict[Temp, List[Instruction]] = flow_graph_results.temp_definitions
-
-        # Compute liveness information and build interference graph
-        liveness_results = liveness(flow_graph_results.flow_graph)
-        all_temporaries = [
-            node.information for node in liveness_results.interference_graph.get_nodes()
-        ]
+        all_temporaries = list(program.interference.neighbors)
 
         # Separate precolored (machine register) temporaries from user temporaries
         self.precolored: List[Temp] = list(TempMap.register_to_temp.values())
-        self.color_amount: int = len(self.precolored)  # Number of available registers
+        # %rip and %rsp never hold temporaries. The sink keeps them live
+        # everywhere, except in a function whose end cannot be reached.
+        self.colors: List[Temp] = [
+            temporary
+            for temporary in self.precolored
+            if temporary not in (TempMap.register_to_temp["rip"], TempMap.register_to_temp["rsp"])
+        ]
+        self.color_amount: int = len(self.colors)  # Number of available registers
+        self.node_state: Dict[Temp, NodeState] = {
+            temporary: NodeState.precolored for temporary in self.precolored
+        }
         self.initial: List[Temp] = [
             temporary
             for temporary in all_temporaries
-            if temporary not in self.precolored  # User-defined temporaries only
+            if temporary not in self.node_state  # User-defined temporaries only
         ]
+        for temporary in self.initial:
+            self.node_state[temporary] = NodeState.initial
 
         # Initialize worklists for different types of temporaries
-        self.simplify_worklist: List[Temp] = []  # Low-degree non-move-related temps
-        self.freeze_worklist: List[Temp] = []    # Low-degree move-related temps
-        self.spill_worklist: List[Temp] = []     # High-degree temps (spill candidates)
+        self.simplify_worklist: IndexedSet[Temp] = IndexedSet()  # Low-degree non-move-related temps
+        self.freeze_worklist: IndexedSet[Temp] = IndexedSet()    # Low-degree move-related temps
+        self.spill_worklist: IndexedSet[Temp] = IndexedSet()     # High-degree temps (spill candidates)
         self.spilled_nodes: List[Temp] = []      # Temporaries that were spilled
         self.coalesced_nodes: List[Temp] = []    # Temporaries that were coalesced
-        self.colored_nodes: List[Temp] = []      # Temporaries with assigned colors
         self.select_stack: List[Temp] = []       # Stack for coloring algorithm
+        self.worklists: Dict[NodeState, IndexedSet[Temp]] = {
+            NodeState.simplify: self.simplify_worklist,
+            NodeState.freeze: self.freeze_worklist,
+            NodeState.spill: self.spill_worklist,
+        }
 
-        # Initialize move-related data structures
-        self.coalesced_moves: List[Move] = []    # Successfully coalesced moves
-        self.constrained_moves: List[Move] = []  # Moves that couldn't be coalesced
-        self.frozen_moves: List[Move] = []       # Frozen moves (no longer considered)
-        self.worklist_moves: List[Move] = liveness_results.move_instructions  # Moves to consider
-        self.active_moves: List[Move] = []       # Moves involving colored temps
+        # Initialize move-related data structures. Moves are dataclasses that
+        # compare by value, so they are tracked by identity.
+        self.move_state: Dict[int, MoveState] = {}
+        self.worklist_moves: IndexedSet[Move] = IndexedSet(key=id)  # Moves to consider
+        for move in program.move_instructions:
+            self.worklist_moves.add(move)
+            self.move_state[id(move)] = MoveState.worklist
 
         # Set up graph structures from interference analysis
-        self._initialize_adjacency_structures(liveness_results.interference_graph)
-        self.move_list: Dict[Temp, List[Move]] = liveness_results.temporary_to_moves
+        self._initialize_adjacency_structures(program.interference)
+        self.move_list: Dict[Temp, IndexedSet[Move]] = {}
+        for temporary, moves in program.temporary_to_moves.items():
+            self.move_list[temporary] = IndexedSet(key=id)
+            for move in moves:
+                self.move_list[temporary].add(move)
 
         # Initialize coloring and aliasing mappings
         self.alias: Dict[Temp, Temp] = {}  # Maps coalesced temps to their canonical temp
@@ -187,62 +246,82 @@ class RegisterAllocator:
             temporary: temporary for temporary in self.precolored  # Precolored temps map to themselves
         }
 
+        self.spill_costs: Dict[Temp, float] = self._spill_costs(program)
+
         # Populate initial worklists based on temporary properties
         self._make_worklist()
 
-    def _initialize_adjacency_structures(self, interference_graph: Graph[Temp]):
-        """Initializes the adjacency structures for the graph."""
-        self.adjacencies: Set[Tuple[Temp, Temp]] = set()
-        self.adjacent_nodes: Dict[Temp, List[Temp]] = {
-            temporary: [] for temporary in self.initial
-        }
+    def _initialize_adjacency_structures(self, interference_graph: InterferenceGraph):
+        """Copies the interference graph into the structures coalescing updates."""
+        self.adjacencies: BitMatrix = BitMatrix()
+        self.adjacent_nodes: Dict[Temp, List[Temp]] = {}
         self.node_degree: Dict[Temp, int] = {
-            temporary: 0 if temporary in self.initial else 999999
-            for temporary in self.initial + self.precolored
+            temporary: 999999 for temporary in self.precolored
         }
-
-        for node in interference_graph.get_nodes():
-            for neighbor in interference_graph.node_successors(node):
-                self._add_edge(node.information, neighbor.information)
+        for node, neighbors in interference_graph.neighbors.items():
+            self.adjacencies.set_neighbors(node, neighbors)
+            if self.node_state[node] != NodeState.precolored:
+                self.adjacent_nodes[node] = list(neighbors)
+                self.node_degree[node] = len(neighbors)
 
     def _add_edge(self, node1: Temp, node2: Temp):
         """Adds an edge between two nodes in the interference graph."""
-        if (node1, node2) not in self.adjacencies and node1 != node2:
-            self.adjacencies.add((node1, node2))
-            self.adjacencies.add((node2, node1))
-            if node1 not in self.precolored:
+        if node1 != node2 and self.adjacencies.add(node1, node2):
+            if self.node_state[node1] != NodeState.precolored:
                 self.adjacent_nodes[node1].append(node2)
                 self.node_degree[node1] = self.node_degree[node1] + 1
-            if node2 not in self.precolored:
+            if self.node_state[node2] != NodeState.precolored:
                 self.adjacent_nodes[node2].append(node1)
                 self.node_degree[node2] = self.node_degree[node2] + 1
 
+    def _move_to_worklist(self, node: Temp, state: NodeState):
+        """Moves node out of whichever worklist holds it and into the one for state."""
+        current_state = self.node_state[node]
+        if current_state == state:
+            return
+        if current_state in self.worklists:
+            self.worklists[current_state].remove(node)
+        self.worklists[state].add(node)
+        self.node_state[node] = state
+
+    def _set_move_state(self, move: Move, state: MoveState):
+        current_state = self.move_state[id(move)]
+        if current_state == MoveState.worklist:
+            self.worklist_moves.remove(move)
+        self.move_state[id(move)] = state
+        if state == MoveState.worklist:
+            self.worklist_moves.add(move)
+
     def _make_worklist(self):
         """Initializes the worklists for the algorithm."""
         for node in self.initial:
             if self.node_degree[node] >= self.color_amount:
-                self.spill_worklist.append(node)
+                self._move_to_worklist(node, NodeState.spill)
             elif self._move_related(node):
-                self.freeze_worklist.append(node)
+                self._move_to_worklist(node, NodeState.freeze)
             else:
-                self.simplify_worklist.append(node)
+                self._move_to_worklist(node, NodeState.simplify)
 
     def _node_moves(self, node: Temp) -> List[Move]:
-        """."""
+        """Moves involving node that are still candidates for coalescing."""
         return [
             move
             for move in self.move_list[node]
-            if move in self.active_moves or move in self.worklist_moves
+            if self.move_state[id(move)] in (MoveState.active, MoveState.worklist)
         ]
 
     def _move_related(self, node: Temp) -> bool:
-        return len(self._node_moves(node)) > 0
+        return any(
+            self.move_state[id(move)] in (MoveState.active, MoveState.worklist)
+            for move in self.move_list[node]
+        )
 
     def _simplify(self):
         """Simplifies the graph by removing nodes with degree less than the color amount."""
         while self.simplify_worklist:
-            node = self.simplify_worklist.pop(0)
+            node = self.simplify_worklist.pop_first()
             self.select_stack.append(node)
+            self.node_state[node] = NodeState.select
             for adjacent_node in self._adjacent(node):
                 self._decrement_degree(adjacent_node)
 
@@ -250,73 +329,71 @@ class RegisterAllocator:
         return [
             adjacent_node
             for adjacent_node in self.adjacent_nodes[node]
-            if adjacent_node not in self.select_stack
-               and adjacent_node not in self.coalesced_nodes
+            if self.node_state[adjacent_node] not in _REMOVED_NODE_STATES
         ]
 
     def _decrement_degree(self, node: Temp):
         self.node_degree[node] = self.node_degree[node] - 1
         if self.node_degree[node] == self.color_amount - 1:
             self._enable_moves([node] + self._adjacent(node))
-            self._maybe_remove_from_list(self.spill_worklist, node)
             if self._move_related(node):
-                self.freeze_worklist.append(node)
+                self._move_to_worklist(node, NodeState.freeze)
             else:
-                self.simplify_worklist.append(node)
+                self._move_to_worklist(node, NodeState.simplify)
 
     def _enable_moves(self, nodes: List[Temp]):
         for node in nodes:
             for move in self._node_moves(node):
-                if move in self.active_moves:
-                    self.active_moves.remove(move)
-                    self.worklist_moves.append(move)
+                if self.move_state[id(move)] == MoveState.active:
+                    self._set_move_state(move, MoveState.worklist)
 
     def _coalesce(self):
         """Coalesces nodes in the graph."""
         while self.worklist_moves:
-            move = self.worklist_moves.pop(0)
+            move = self.worklist_moves.pop_first()
+            self.move_state[id(move)] = MoveState.coalesced
             x = self._get_alias(move.source[0])
             y = self._get_alias(move.destination[0])
-            if y in self.precolored:
+            if self.node_state[y] == NodeState.precolored:
                 u, v = y, x
             else:
                 u, v = x, y
 
             if u == v:
-                self.coalesced_moves.append(move)
                 self._add_work_list(u)
-            elif v in self.precolored or (u, v) in self.adjacencies:
-                self.constrained_moves.append(move)
+            elif (
+                    self.node_state[v] == NodeState.precolored
+                    or (u, v) in self.adjacencies
+            ):
+                self.move_state[id(move)] = MoveState.constrained
                 self._add_work_list(u)
                 self._add_work_list(v)
             elif (
-                    u in self.precolored
+                    self.node_state[u] == NodeState.precolored
                     and all(self._precolored_coalesceable(t, u) for t in self._adjacent(v))
-                    or u not in self.precolored
+                    or self.node_state[u] != NodeState.precolored
                     and self._conservative_coalesceable(
                 set(self._adjacent(u) + self._adjacent(v))
             )
             ):
-                self.coalesced_moves.append(move)
                 self._combine(u, v)
                 self._add_work_list(u)
             else:
-                self.active_moves.append(move)
+                self.move_state[id(move)] = MoveState.active
 
     def _add_work_list(self, node: Temp):
         if (
-                node not in self.precolored
+                self.node_state[node] != NodeState.precolored
                 and not self._move_related(node)
                 and self.node_degree[node] < self.color_amount
         ):
-            self.freeze_worklist.remove(node)
-            self.simplify_worklist.append(node)
+            self._move_to_worklist(node, NodeState.simplify)
 
     def _precolored_coalesceable(self, node: Temp, precolored_node: Temp) -> bool:
         """Georage's conservative coalesceable algorithm"""
         return (
                 self.node_degree[node] < self.color_amount
-                or node in self.precolored
+                or self.node_state[node] == NodeState.precolored
                 or (node, precolored_node) in self.adjacencies
         )
 
@@ -329,116 +406,101 @@ class RegisterAllocator:
         return significant_node_count < self.color_amount
 
     def _get_alias(self, node: Temp) -> Temp:
-        if node in self.coalesced_nodes:
-            return self._get_alias(self.alias[node])
+        while self.node_state[node] == NodeState.coalesced:
+            node = self.alias[node]
         return node
 
     def _combine(self, u: Temp, v: Temp):
-        if v in self.freeze_worklist:
-            self.freeze_worklist.remove(v)
-        else:
-            self.spill_worklist.remove(v)
+        self.worklists[self.node_state[v]].remove(v)
+        self.node_state[v] = NodeState.coalesced
         self.coalesced_nodes.append(v)
         self.alias[v] = u
-        self.move_list[u] = self.move_list[u] + self.move_list[v]
+        for move in self.move_list[v]:
+            self.move_list[u].add(move)
         for adjacent_node in self._adjacent(v):
             self._add_edge(adjacent_node, u)
             self._decrement_degree(adjacent_node)
-        if self.node_degree[u] >= self.color_amount and u in self.freeze_worklist:
-            self.freeze_worklist.remove(u)
-            self.spill_worklist.append(u)
+        if (
+                self.node_degree[u] >= self.color_amount
+                and self.node_state[u] == NodeState.freeze
+        ):
+            self._move_to_worklist(u, NodeState.spill)
 
     def _freeze(self):
         while self.freeze_worklist:
-            node = self.freeze_worklist.pop(0)
-            self.simplify_worklist.append(node)
+            node = self.freeze_worklist.pop_first()
+            self.node_state[node] = NodeState.simplify
+            self.simplify_worklist.add(node)
             self._freeze_moves(node)
 
     def _freeze_moves(self, node: Temp):
         for move in self._node_moves(node):
             x = self._get_alias(move.source[0])
             y = self._get_alias(move.destination[0])
-            v = (
-                self._get_alias(x)
-                if self._get_alias(y) == self._get_alias(node)
-                else self._get_alias(y)
-            )
-            self.active_moves.remove(move)
-            self.frozen_moves.append(move)
-            if not self._node_moves(v) and self.node_degree[v] < self.color_amount:
-                self.freeze_worklist.remove(v)
-                self.simplify_worklist.append(v)
+            v = x if y == self._get_alias(node) else y
+            self._set_move_state(move, MoveState.frozen)
+            if (
+                    self.node_state[v] == NodeState.freeze
+                    and not self._move_related(v)
+                    and self.node_degree[v] < self.color_amount
+            ):
+                self._move_to_worklist(v, NodeState.simplify)
 
     def _select_spill(self):
         spillable_nodes = [
-            node for node in self.spill_worklist if node not in self.precolored
+            node
+            for node in self.spill_worklist
+            if self.node_state[node] != NodeState.precolored
         ]
         spilled_node = min(spillable_nodes, key=self._spill_heuristic)
-        self.spill_worklist.remove(spilled_node)
-        self.simplify_worklist.append(spilled_node)
+        self._move_to_worklist(spilled_node, NodeState.simplify)
         self._freeze_moves(spilled_node)
 
+    def _spill_costs(self, program: SpillProgram) -> Dict[Temp, float]:
+        """
+        The instructions that spilling each temporary adds, weighted by
+        LOOP_WEIGHT for every loop around them: a load before every use and a
+        store after every definition. A rematerialized temporary loses its
+        definition instead of gaining a store. The temporaries of earlier
+        spills only live between a fetch or store and its instruction, so
+        spilling them again gains nothing.
+        """
+        costs: Dict[Temp, float] = {}
+        for index, instruction in enumerate(program.instructions):
+            if isinstance(instruction, Label):
+                continue
+            weight = LOOP_WEIGHT ** program.loop_depths[index]
+            for temporary in set(instruction.source) | set(instruction.destination):
+                if (
+                        is_rematerializable(instruction)
+                        and program.rematerialization(temporary) is instruction
+                ):
+                    continue
+                costs[temporary] = costs.get(temporary, 0) + weight
+        for temporary in program.spill_temporaries:
+            costs[temporary] = float("inf")
+        return costs
+
     def _spill_heuristic(self, node: Temp) -> float:
-        return (
-                len(self.temp_uses[node]) + len(self.temp_definitions[node])
-        ) / self.node_degree[node]
+        # A temporary that is defined but never used (a dead local) only costs its stores
+        return self.spill_costs.get(node, 0) / self.node_degree[node]
 
     def _assign_colors(self):
         while self.select_stack:
             node = self.select_stack.pop()
-            possible_colors = self.precolored.copy()
+            used_colors = set()
             for adjacent_node in self.adjacent_nodes[node]:
-                if (
-                        self._get_alias(adjacent_node) in self.colored_nodes
-                        or self._get_alias(adjacent_node) in self.precolored
-                ):
-                    adjacent_node_color = self.color[self._get_alias(adjacent_node)]
-                    self._maybe_remove_from_list(possible_colors, adjacent_node_color)
+                alias = self._get_alias(adjacent_node)
+                if self.node_state[alias] in (NodeState.colored, NodeState.precolored):
+                    used_colors.add(self.color[alias])
+            possible_colors = [
+                color for color in self.colors if color not in used_colors
+            ]
             if not possible_colors:
+                self.node_state[node] = NodeState.spilled
                 self.spilled_nodes.append(node)
             else:
-                self.colored_nodes.append(node)
+                self.node_state[node] = NodeState.colored
                 self.color[node] = possible_colors[0]
         for node in self.coalesced_nodes:
             self.color[node] = self.color[self._get_alias(node)]
-
-    def _rewrite_program(self, instructions: List[Instruction]) -> List[Instruction]:
-        for node in self.spilled_nodes:
-            memory_access = self.frame.alloc_local(True)
-            for use_instruction in self.temp_uses[node]:
-                new_temporary = TempManager.new_temp()
-                use_instruction.source = [
-                    source_temp if source_temp != node else new_temporary
-                    for source_temp in use_instruction.source
-                ]
-                fetch_instruction = Operation(
-                    f"movq {memory_access.offset}(%'s0), %'d0\n",
-                    [frame_pointer()],
-                    [new_temporary],
-                    None,
-                )
-                instructions.insert(
-                    instructions.index(use_instruction), fetch_instruction
-                )
-
-            for definition_instruction in self.temp_definitions[node]:
-                new_temporary = TempManager.new_temp()
-                definition_instruction.destination = [
-                    destination_temp if destination_temp != node else new_temporary
-                    for destination_temp in definition_instruction.destination
-                ]
-                store_instruction = Operation(
-                    f"movq %'s0, {memory_access.offset}(%'s1)\n",
-                    [new_temporary, frame_pointer()],
-                    [],
-                    None,
-                )
-                instructions.insert(
-                    instructions.index(definition_instruction) + 1, store_instruction
-                )
-
-        return instructions
-
-    def _maybe_remove_from_list(self, list: List[T], element: T):
-        if element in list:
-            list.remove(element)
@@ -0,0 +1,408 @@
+"""
+Interference information kept alive across spill rounds.
+
+SpillProgram owns the instruction list of a function together with its
+control flow successors, the live-out set of every instruction and the
+interference graph. The first round builds all of them from scratch. After
+an actual spill, rewrite() emits the new instruction list in one linear
+sweep and patches the liveness and interference information in place: the
+spilled temporaries are removed, the short-lived temporaries introduced by
+the fetch/store instructions get their edges from the live sets around the
+rewritten instruction, and the frame pointer, which the new fetches and
+stores use, is the only other temporary whose live range can grow (with
+%rip, which rematerialized addresses read).
+
+A spilled temporary whose only definition loads a constant or the address of
+a label is rematerialized instead: the definition is dropped, and a copy of
+it computes the value again before every use, without any frame slot.
+
+loop_depths estimates how often every instruction runs, from the loops of
+the control flow, for the spill costs of the allocator.
+"""
+
+from dataclasses import replace
+from typing import List, Dict, Set, Optional
+
+from activation_records.frame import Frame, TempMap, frame_base
+from activation_records.temp import Temp, TempManager
+from instruction_selection.assembly import Instruction, Move, Operation, Label
+from liveness_analysis.flow_graph import assembler_flow_graph
+from liveness_analysis.liveness import liveness
+
+
+class InterferenceGraph:
+    """Undirected graph; every node keeps its neighbors in insertion order."""
+
+    def __init__(self):
+        self.neighbors: Dict[Temp, Dict[Temp, None]] = {}
+
+    def add_node(self, node: Temp):
+        if node not in self.neighbors:
+            self.neighbors[node] = {}
+
+    def add_edge(self, node1: Temp, node2: Temp):
+        if node1 != node2 and node2 not in self.neighbors[node1]:
+            self.neighbors[node1][node2] = None
+            self.neighbors[node2][node1] = None
+
+    def remove_node(self, node: Temp):
+        for neighbor in self.neighbors.pop(node):
+            del self.neighbors[neighbor][node]
+
+    def edges(self) -> Set[frozenset]:
+        return {
+            frozenset((node, neighbor))
+            for node, neighbors in self.neighbors.items()
+            for neighbor in neighbors
+        }
+
+    def edge_count(self) -> int:
+        return sum(len(neighbors) for neighbors in self.neighbors.values()) // 2
+
+
+def _move_source(instruction: Instruction) -> Optional[Temp]:
+    """
+    The temporary a coalescable move copies from, which does not interfere
+    with its target (the same rule liveness() applies).
+    """
+    if (
+            isinstance(instruction, Move)
+            and len(set(instruction.source)) == 1
+            and len(set(instruction.destination)) == 1
+    ):
+        return instruction.source[0]
+    return None
+
+
+def _interferes_at_definition(instruction: Instruction) -> bool:
+    """Moves only add interference edges when they define exactly one temporary."""
+    return not isinstance(instruction, Move) or len(set(instruction.destination)) == 1
+
+
+def is_rematerializable(instruction: Instruction) -> bool:
+    """Whether instruction computes its value from nothing, so it can be repeated anywhere."""
+    if isinstance(instruction, Move):
+        return not instruction.source and instruction.line.startswith("movq $")
+    return (
+            isinstance(instruction, Operation)
+            and instruction.jump is None
+            and instruction.line.startswith("leaq ")
+            and instruction.line.endswith("(%'s0), %'d0\n")
+            and instruction.source == [TempMap.register_to_temp["rip"]]
+    )
+
+
+def loop_depths(successors: List[List[int]]) -> List[int]:
+    """
+    The number of loops around every instruction.
+
+    A depth-first search from the first instruction finds the edges back to
+    an instruction on the search path, the header of a loop. The body of the
+    loop is what reaches the source of such an edge backwards without going
+    through its header; the edges back to one header make a single loop.
+    """
+    predecessors: List[List[int]] = [[] for _ in successors]
+    for index, successors_of_index in enumerate(successors):
+        for successor in successors_of_index:
+            predecessors[successor].append(index)
+
+    back_edges = []
+    visited = [False] * len(successors)
+    on_path = [False] * len(successors)
+    stack = []
+    if successors:
+        visited[0] = on_path[0] = True
+        stack.append((0, iter(successors[0])))
+    while stack:
+        index, remaining = stack[-1]
+        for successor in remaining:
+            if on_path[successor]:
+                back_edges.append((index, successor))
+            elif not visited[successor]:
+                visited[successor] = on_path[successor] = True
+                stack.append((successor, iter(successors[successor])))
+                break
+        else:
+            on_path[index] = False
+            stack.pop()
+
+    bodies: Dict[int, Set[int]] = {}
+    for source, header in back_edges:
+        body = bodies.setdefault(header, {header})
+        worklist = []
+        if source not in body:
+            body.add(source)
+            worklist.append(source)
+        while worklist:
+            for predecessor in predecessors[worklist.pop()]:
+                if predecessor not in body:
+                    body.add(predecessor)
+                    worklist.append(predecessor)
+
+    depths = [0] * len(successors)
+    for body in bodies.values():
+        for index in body:
+            depths[index] += 1
+    return depths
+
+
+class SpillProgram:
+    """A function body plus the liveness and interference facts about it."""
+
+    def __init__(self, instructions: List[Instruction]):
+        flow_graph_results = assembler_flow_graph(instructions)
+        flow_graph = flow_graph_results.flow_graph
+        liveness_results = liveness(flow_graph)
+
+        self.instructions: List[Instruction] = instructions
+        self.successors: List[List[int]] = [
+            sorted(successors) for successors in flow_graph.out_edges
+        ]
+        self.live_out: List[Set[Temp]] = [
+            node.information.live_out for node in flow_graph.get_nodes()
+        ]
+        self.loop_depths: List[int] = loop_depths(self.successors)
+        # The temporaries the fetches and stores of spills introduce
+        self.spill_temporaries: Set[Temp] = set()
+        # The temporaries spilled by recomputing their value
+        self.rematerialized: Set[Temp] = set()
+        self.temp_uses: Dict[Temp, List[Instruction]] = flow_graph_results.temp_uses
+        self.temp_definitions: Dict[Temp, List[Instruction]] = (
+            flow_graph_results.temp_definitions
+        )
+        self.move_instructions: List[Move] = liveness_results.move_instructions
+        self.temporary_to_moves: Dict[Temp, List[Move]] = (
+            liveness_results.temporary_to_moves
+        )
+
+        # Edges are inserted in the order the allocator has always visited them,
+        # so the neighbor lists (and hence the coloring) of the first round match
+        # the ones built directly from the liveness interference graph.
+        self.interference = InterferenceGraph()
+        interference_graph = liveness_results.interference_graph
+        for node in interference_graph.get_nodes():
+            self.interference.add_node(node.information)
+        for node in interference_graph.get_nodes():
+            for neighbor in interference_graph.node_successors(node):
+                self.interference.add_edge(node.information, neighbor.information)
+
+    def rewrite(self, spilled_nodes: List[Temp], frame: Frame):
+        """
+        Stores every spilled temporary in a new frame slot.
+
+        Each instruction that mentions a spilled temporary gets a fresh
+        temporary instead, loaded before it and/or stored after it. A temporary
+        that is both used and defined by the same instruction (two-address
+        arithmetic) keeps a single replacement, so the loaded value is the one
+        the instruction updates. A rematerializable temporary gets a copy of
+        its definition before every use instead, and its definition goes.
+        """
+        fp = frame_base(frame)
+        definitions: Dict[Temp, Instruction] = {}
+        for node in spilled_nodes:
+            definition = self.rematerialization(node)
+            if definition is not None:
+                definitions[node] = definition
+        accesses = {
+            node: frame.alloc_local(True) for node in spilled_nodes if node not in definitions
+        }
+        # What the copies of the definitions read, besides the frame pointer
+        recomputed_sources = {
+            source for definition in definitions.values() for source in definition.source
+        }
+        for definition in definitions.values():
+            for source in definition.source:
+                self.temp_uses[source] = [
+                    use for use in self.temp_uses[source] if use is not definition
+                ]
+        self.rematerialized.update(definitions)
+        spilled = set(spilled_nodes)
+        for node in spilled_nodes:
+            self.interference.remove_node(node)
+            self.temp_uses.pop(node, None)
+            self.temp_definitions.pop(node, None)
+            self.temporary_to_moves.pop(node, None)
+
+        instructions: List[Instruction] = []
+        live_out: List[Set[Temp]] = []
+        # Index range of the rewritten group of every old instruction.
+        group_start: List[int] = []
+        group_end: List[int] = []
+        for index, instruction in enumerate(self.instructions):
+            group_start.append(len(instructions))
+            if isinstance(instruction, Label):
+                instructions.append(instruction)
+                live_out.append(self.live_out[index])
+                group_end.append(len(instructions) - 1)
+                continue
+
+            sources = instruction.source
+            destinations = instruction.destination
+            if any(instruction is definition for definition in definitions.values()):
+                # Computed again where it is used; the group stays empty
+                group_end.append(len(instructions) - 1)
+                continue
+            used = [
+                temp for temp in dict.fromkeys(sources) if temp in accesses or temp in definitions
+            ]
+            defined = [temp for temp in dict.fromkeys(destinations) if temp in accesses]
+            old_live_out = self.live_out[index]
+            if not used and not defined:
+                instructions.append(instruction)
+                live_out.append(old_live_out)
+                group_end.append(len(instructions) - 1)
+                continue
+
+            base_out = {temp for temp in old_live_out if temp not in spilled}
+            base_in = set(sources).union(old_live_out - set(destinations))
+            base_in = {temp for temp in base_in if temp not in spilled}
+
+            replacements: Dict[Temp, Temp] = {}
+            fetched: List[Temp] = []
+            for node in used:
+                new_temporary = TempManager.new_temp()
+                replacements[node] = new_temporary
+                fetched.append(new_temporary)
+                if node in definitions:
+                    fetch_instruction = replace(
+                        definitions[node],
+                        source=list(definitions[node].source),
+                        destination=[new_temporary],
+                    )
+                else:
+                    fetch_instruction = Operation(
+                        f"movq {accesses[node].offset}(%'s0), %'d0\n",
+                        [fp],
+                        [new_temporary],
+                        None,
+                    )
+                fetch_live_out = base_in.union(fetched)
+                self._add_definition(new_temporary, fetch_instruction)
+                for source in fetch_instruction.source:
+                    self._add_use(source, fetch_instruction)
+                self._interfere(fetch_instruction, fetch_live_out)
+                instructions.append(fetch_instruction)
+                live_out.append(fetch_live_out)
+
+            stored: List[Temp] = []
+            for node in defined:
+                if node not in replacements:
+                    replacements[node] = TempManager.new_temp()
+                stored.append(replacements[node])
+            self.spill_temporaries.update(replacements.values())
+
+            instruction.source = [replacements.get(temp, temp) for temp in sources]
+            instruction.destination = [
+                replacements.get(temp, temp) for temp in destinations
+            ]
+            for node in used:
+                self._add_use(replacements[node], instruction)
+            for node in defined:
+                self._add_definition(replacements[node], instruction)
+            if _move_source(instruction) is not None:
+                for node in dict.fromkeys(used + defined):
+                    self.temporary_to_moves[replacements[node]].append(instruction)
+            instruction_live_out = base_out.union(stored)
+            self._interfere(instruction, instruction_live_out)
+            instructions.append(instruction)
+            live_out.append(instruction_live_out)
+
+            for position, new_temporary in enumerate(stored):
+                store_instruction = Operation(
+                    f"movq %'s0, {accesses[defined[position]].offset}(%'s1)\n",
+                    [new_temporary, fp],
+                    [],
+                    None,
+                )
+                self._add_use(new_temporary, store_instruction)
+                self._add_use(fp, store_instruction)
+                instructions.append(store_instruction)
+                live_out.append(base_out.union(stored[position + 1:]))
+            group_end.append(len(instructions) - 1)
+
+        successors: List[List[int]] = [[] for _ in instructions]
+        for index, old_successors in enumerate(self.successors):
+            if group_end[index] < group_start[index]:
+                # A dropped definition, which falls through to the next group
+                continue
+            for position in range(group_start[index], group_end[index]):
+                successors[position].append(position + 1)
+            successors[group_end[index]] = [
+                group_start[successor] for successor in old_successors
+            ]
+
+        self.instructions = instructions
+        self.successors = successors
+        self.live_out = [
+            live if live.isdisjoint(spilled) else live - spilled for live in live_out
+        ]
+        self.loop_depths = loop_depths(self.successors)
+        for temporary in recomputed_sources | {fp}:
+            self._extend_liveness(temporary)
+
+    def rematerialization(self, temporary: Temp) -> Optional[Instruction]:
+        """The definition of temporary if it can be repeated at its uses, None if not."""
+        definitions = self.temp_definitions.get(temporary, [])
+        if (
+                len(definitions) == 1
+                and definitions[0].destination == [temporary]
+                and is_rematerializable(definitions[0])
+        ):
+            return definitions[0]
+        return None
+
+    def _add_use(self, temporary: Temp, instruction: Instruction):
+        self.interference.add_node(temporary)
+        self.temporary_to_moves.setdefault(temporary, [])
+        self.temp_uses.setdefault(temporary, []).append(instruction)
+
+    def _add_definition(self, temporary: Temp, instruction: Instruction):
+        self.interference.add_node(temporary)
+        self.temporary_to_moves.setdefault(temporary, [])
+        self.temp_definitions.setdefault(temporary, []).append(instruction)
+
+    def _interfere(self, instruction: Instruction, live_out: Set[Temp]):
+        """Adds the edges between what instruction defines and what is live after it."""
+        if not _interferes_at_definition(instruction):
+            return
+        move_source = _move_source(instruction)
+        for defined in instruction.destination:
+            for live in live_out:
+                if live != move_source:
+                    self.interference.add_edge(defined, live)
+
+    def _extend_liveness(self, register: Temp):
+        """
+        Propagates the new uses of register backwards: the frame pointer (or
+        %rsp, in a function without one), or %rip for rematerialized addresses.
+
+        These registers are never spilled, so they can only become live at more
+        points than before; this one-bit dataflow visits just those points.
+        """
+        predecessors: List[List[int]] = [[] for _ in self.instructions]
+        for index, successors in enumerate(self.successors):
+            for successor in successors:
+                predecessors[successor].append(index)
+
+        def defines_register(index: int) -> bool:
+            instruction = self.instructions[index]
+            return not isinstance(instruction, Label) and register in instruction.destination
+
+        def live_in(index: int) -> bool:
+            instruction = self.instructions[index]
+            if not isinstance(instruction, Label) and register in instruction.source:
+                return True
+            return register in self.live_out[index] and not defines_register(index)
+
+        worklist = [index for index in range(len(self.instructions)) if live_in(index)]
+        while worklist:
+            index = worklist.pop()
+            for predecessor in predecessors[index]:
+                if register in self.live_out[predecessor]:
+                    continue
+                self.live_out[predecessor] = self.live_out[predecessor] | {register}
+                instruction = self.instructions[predecessor]
+                if not isinstance(instruction, Label):
+                    self._interfere(instruction, {register})
+                if not defines_register(predecessor):
+                    worklist.append(predecessor)
@@ -0,0 +1,112 @@
+"""
+Data structures for the worklist-driven register allocator.
+
+- IndexedSet: an insertion-ordered set backed by a doubly-linked hash table
+  (OrderedDict), with O(1) add, remove, membership and pop from the front.
+- NodeState / MoveState: the tag saying which of Appel's disjoint sets a node
+  or a move currently belongs to, so membership tests are a dictionary lookup.
+- BitMatrix: the interference adjacency matrix, one integer bit-row per node.
+"""
+
+from collections import OrderedDict
+from enum import Enum, auto
+from typing import Generic, TypeVar, Iterator, Dict, Hashable, Callable, Optional
+
+from activation_records.temp import Temp
+
+T = TypeVar("T")
+
+
+class NodeState(Enum):
+    precolored = auto()
+    initial = auto()
+    simplify = auto()
+    freeze = auto()
+    spill = auto()
+    spilled = auto()
+    coalesced = auto()
+    colored = auto()
+    select = auto()
+
+
+class MoveState(Enum):
+    coalesced = auto()
+    constrained = auto()
+    frozen = auto()
+    worklist = auto()
+    active = auto()
+
+
+class IndexedSet(Generic[T]):
+    """
+    Insertion-ordered set.
+
+    Elements are stored under key(element), which defaults to the element
+    itself; unhashable elements (such as Move instructions) are keyed by id.
+    """
+
+    def __init__(self, key: Optional[Callable[[T], Hashable]] = None):
+        self._key = key if key is not None else (lambda element: element)
+        self._elements: "OrderedDict[Hashable, T]" = OrderedDict()
+
+    def add(self, element: T):
+        self._elements.setdefault(self._key(element), element)
+
+    def remove(self, element: T):
+        del self._elements[self._key(element)]
+
+    def discard(self, element: T):
+        self._elements.pop(self._key(element), None)
+
+    def pop_first(self) -> T:
+        return self._elements.popitem(last=False)[1]
+
+    def __contains__(self, element: T) -> bool:
+        return self._key(element) in self._elements
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(list(self._elements.values()))
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __bool__(self) -> bool:
+        return bool(self._elements)
+
+
+class BitMatrix:
+    """Symmetric adjacency matrix over temps, stored as one bit-row per temp."""
+
+    def __init__(self):
+        self._index: Dict[Temp, int] = {}
+        self._rows: Dict[Temp, int] = {}
+
+    def _bit(self, node: Temp) -> int:
+        if node not in self._index:
+            self._index[node] = len(self._index)
+            self._rows[node] = 0
+        return 1 << self._index[node]
+
+    def add(self, node1: Temp, node2: Temp) -> bool:
+        """Adds the edge (node1, node2); returns False if it was already there."""
+        bit1 = self._bit(node1)
+        bit2 = self._bit(node2)
+        if self._rows[node1] & bit2:
+            return False
+        self._rows[node1] |= bit2
+        self._rows[node2] |= bit1
+        return True
+
+    def set_neighbors(self, node: Temp, neighbors):
+        """Sets the row of node; the caller keeps the matrix symmetric."""
+        row = 0
+        for neighbor in neighbors:
+            row |= self._bit(neighbor)
+        self._bit(node)
+        self._rows[node] = row
+
+    def __contains__(self, edge) -> bool:
+        node1, node2 = edge
+        if node1 not in self._index or node2 not in self._index:
+            return False
+        return bool(self._rows[node1] >> self._index[node2] & 1)
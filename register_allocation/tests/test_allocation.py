@@ -0,0 +1,148 @@
+import unittest
+
+from activation_records.frame import assembly_procedure, callee_saved_registers, sink, TempMap
+from canonical.canonize import canonize
+from instruction_selection.assembly import Move
+from instruction_selection.codegen import Codegen
+from intermediate_representation.fragment import FragmentManager, ProcessFragment
+from liveness_analysis.flow_graph import assembler_flow_graph
+from liveness_analysis.liveness import liveness
+from register_allocation.allocation import RegisterAllocator
+from register_allocation.structures import IndexedSet, BitMatrix
+from semantic_analysis.analyzers import translate_program
+from tests.utils.compilation_steps import semantic_analysis
+from lexer import lex as le
+from parser import parser as p
+
+
+class TestIndexedSet(unittest.TestCase):
+    def test_keeps_insertion_order_without_duplicates(self):
+        indexed_set = IndexedSet[int]()
+        for element in (3, 1, 2, 1, 3):
+            indexed_set.add(element)
+
+        self.assertEqual(list(indexed_set), [3, 1, 2])
+        self.assertEqual(len(indexed_set), 3)
+
+    def test_remove_and_pop_first(self):
+        indexed_set = IndexedSet[int]()
+        for element in (3, 1, 2):
+            indexed_set.add(element)
+        indexed_set.remove(1)
+        indexed_set.discard(7)
+
+        self.assertNotIn(1, indexed_set)
+        self.assertEqual(indexed_set.pop_first(), 3)
+        self.assertEqual(indexed_set.pop_first(), 2)
+        self.assertFalse(indexed_set)
+
+    def test_identity_key_tells_equal_moves_apart(self):
+        first = Move("movq %'s0, %'d0\n", [1], [2])
+        second = Move("movq %'s0, %'d0\n", [1], [2])
+        indexed_set = IndexedSet[Move](key=id)
+        indexed_set.add(first)
+
+        self.assertIn(first, indexed_set)
+        self.assertNotIn(second, indexed_set)
+
+
+class TestBitMatrix(unittest.TestCase):
+    def test_edges_are_symmetric(self):
+        matrix = BitMatrix()
+        matrix.add(1, 2)
+        matrix.add(2, 3)
+
+        self.assertIn((1, 2), matrix)
+        self.assertIn((2, 1), matrix)
+        self.assertIn((3, 2), matrix)
+        self.assertNotIn((1, 3), matrix)
+        self.assertNotIn((1, 4), matrix)
+
+
+class TestRegisterAllocator(unittest.TestCase):
+    def setUp(self):
+        FragmentManager.fragment_list = []
+
+    def test_temporaries_defined_but_never_used_can_spill(self):
+        # Ten locals are read and ten are not, too many to keep in registers
+        local_variables = " ".join(f"var v{i} := a + {i}" for i in range(20))
+        used = " + ".join(f"v{i}" for i in range(10))
+        source = f"let function f(a: int): int = let {local_variables} in {used} end in f(1) end"
+        TempMap.initialize()
+        translate_program(p.parser.parse(source, le.lexer.clone()))
+        p.parser.restart()
+        for fragment in FragmentManager.get_fragments():
+            if isinstance(fragment, ProcessFragment):
+                instructions = sink(Codegen.codegen(canonize(fragment.body)))
+                RegisterAllocator(fragment.frame).main(instructions)
+
+    def test_interfering_temporaries_get_different_registers(self):
+        for file_name in ("test6.tig", "queens.tig", "merge.tig", "test65.tig"):
+            with self.subTest(file_name=file_name):
+                FragmentManager.fragment_list = []
+                semantic_analysis(file_name)
+                precolored = set(TempMap.register_to_temp.values())
+                for fragment in FragmentManager.get_fragments():
+                    if not isinstance(fragment, ProcessFragment):
+                        continue
+                    instructions = sink(Codegen.codegen(canonize(fragment.body)))
+                    result = RegisterAllocator(fragment.frame).main(instructions)
+                    color = result.temp_to_register
+
+                    interference_graph = liveness(
+                        assembler_flow_graph(result.instructions).flow_graph
+                    ).interference_graph
+                    for node in interference_graph.get_nodes():
+                        self.assertIn(color[node.information], precolored)
+                        for neighbor in interference_graph.node_successors(node):
+                            if neighbor.information == node.information:
+                                continue
+                            self.assertNotEqual(
+                                color[node.information], color[neighbor.information]
+                            )
+
+    def test_only_the_callee_save_registers_written_are_saved(self):
+        semantic_analysis("queens.tig")
+        saved_registers = []
+        for fragment in FragmentManager.get_fragments():
+            if not isinstance(fragment, ProcessFragment):
+                continue
+            instructions = sink(Codegen.codegen(canonize(fragment.body)))
+            result = RegisterAllocator(fragment.frame).main(instructions)
+            written = {
+                TempMap.temp_to_register[result.temp_to_register[temporary]]
+                for instruction in result.instructions
+                for temporary in getattr(instruction, "destination", [])
+            }
+            self.assertEqual(
+                fragment.frame.saved_registers,
+                [register for register in callee_saved_registers if register in written
+                 and (register != "rbp" or fragment.frame.omits_frame_pointer)],
+            )
+            procedure = assembly_procedure(fragment.frame, result.instructions)
+            for register in fragment.frame.saved_registers:
+                self.assertIn(f"pushq %{register}\n", procedure.prologue)
+                self.assertIn(f"popq %{register}\n", procedure.epilogue)
+            saved_registers.append(fragment.frame.saved_registers)
+        # tigermain keeps its values only across runtime calls, in registers
+        # those leave alone
+        self.assertEqual(saved_registers[-1], [])
+
+    def test_the_frame_pointer_is_kept_only_where_it_is_handed_out(self):
+        semantic_analysis("queens.tig")
+        omitted = []
+        for fragment in FragmentManager.get_fragments():
+            if not isinstance(fragment, ProcessFragment):
+                continue
+            instructions = sink(Codegen.codegen(canonize(fragment.body)))
+            result = RegisterAllocator(fragment.frame).main(instructions)
+            procedure = assembly_procedure(fragment.frame, result.instructions)
+            omits = fragment.frame.omits_frame_pointer
+            self.assertEqual("movq %rsp, %rbp\n" in procedure.prologue, not omits)
+            self.assertEqual(
+                "popq %rbp\n" in procedure.epilogue,
+                not omits or "rbp" in fragment.frame.saved_registers,
+            )
+            omitted.append(omits)
+        # tigermain passes its frame pointer to printboard and try as their static link
+        self.assertEqual(omitted, [True, True, False])
@@ -0,0 +1,97 @@
+import unittest
+
+from activation_records.frame import sink, TempMap, Frame
+from activation_records.temp import TempLabel
+from canonical.canonize import canonize
+from instruction_selection.assembly import Operation, Move
+from instruction_selection.codegen import Codegen
+from intermediate_representation.fragment import FragmentManager, ProcessFragment
+from register_allocation.interference import SpillProgram, loop_depths
+from tests.utils.compilation_steps import semantic_analysis
+
+
+def _facts(program: SpillProgram):
+    return (
+        program.interference.edges(),
+        program.live_out,
+        {temp: {id(use) for use in uses} for temp, uses in program.temp_uses.items()},
+        {
+            temp: {id(definition) for definition in definitions}
+            for temp, definitions in program.temp_definitions.items()
+        },
+        [id(move) for move in program.move_instructions],
+        {
+            temp: {id(move) for move in moves}
+            for temp, moves in program.temporary_to_moves.items()
+        },
+    )
+
+
+class TestSpillProgram(unittest.TestCase):
+    def setUp(self):
+        FragmentManager.fragment_list = []
+        TempMap.initialize()
+
+    def test_two_address_instruction_keeps_one_replacement(self):
+        instructions = [
+            Move("movq $1, %'d0\n", [], [1000]),
+            Operation("addq $2, %'d0\n", [1000], [1000], None),
+            Operation("", [1000], [], None),
+        ]
+        program = SpillProgram(instructions)
+        program.rewrite([1000], Frame(TempLabel(), []))
+
+        fetch, add, store = program.instructions[2:5]
+        self.assertEqual(add.source, fetch.destination)
+        self.assertEqual(add.destination, fetch.destination)
+        self.assertEqual(store.source[0], fetch.destination[0])
+        self.assertNotIn(1000, program.interference.neighbors)
+
+    def test_constants_are_rematerialized_at_their_uses(self):
+        instructions = [
+            Move("movq $5000000000, %'d0\n", [], [1000]),
+            Operation("addq %'s0, %'d0\n", [1000, 1001], [1001], None),
+            Operation("subq %'s0, %'d0\n", [1000, 1001], [1001], None),
+            Operation("", [1001], [], None),
+        ]
+        frame = Frame(TempLabel(), [])
+        program = SpillProgram(instructions)
+        program.rewrite([1000], frame)
+
+        self.assertEqual(frame.offset, Frame(TempLabel(), []).offset)
+        self.assertEqual(program.rematerialized, {1000})
+        first, add, second, subtract = program.instructions[:4]
+        self.assertEqual(first.line, "movq $5000000000, %'d0\n")
+        self.assertEqual(add.source[0], first.destination[0])
+        self.assertEqual(second.line, "movq $5000000000, %'d0\n")
+        self.assertEqual(subtract.source[0], second.destination[0])
+        self.assertEqual(_facts(program), _facts(SpillProgram(program.instructions)))
+
+    def test_loop_depths(self):
+        # 0 -> 1 -> 2 -> 3 -> 4 -> 5, with loops 4 -> 1 and 3 -> 2
+        successors = [[1], [2], [3], [2, 4], [1, 5], []]
+        self.assertEqual(loop_depths(successors), [0, 1, 2, 2, 1, 0])
+
+    def test_incremental_update_matches_full_rebuild(self):
+        for file_name in ("test6.tig", "queens.tig", "merge.tig"):
+            with self.subTest(file_name=file_name):
+                FragmentManager.fragment_list = []
+                semantic_analysis(file_name)
+                precolored = set(TempMap.register_to_temp.values())
+                for fragment in FragmentManager.get_fragments():
+                    if not isinstance(fragment, ProcessFragment):
+                        continue
+                    program = SpillProgram(
+                        sink(Codegen.codegen(canonize(fragment.body)))
+                    )
+                    for _ in range(2):
+                        temporaries = [
+                            temporary
+                            for temporary in program.interference.neighbors
+                            if temporary not in precolored
+                        ]
+                        program.rewrite(temporaries[::3], fragment.frame)
+                        self.assertEqual(
+                            _facts(program),
+                            _facts(SpillProgram(program.instructions)),
+                        )
@@ -28,8 +28,12 @@ from typing import Set, Optional, Union, List
 from dataclasses import dataclass
 
 import parser.ast_nodes as ast
+from activation_records.context import profile_phase
 from activation_records.temp import TempLabel, TempManager
 from intermediate_representation.escape import find_escape, EscapeError
+from intermediate_representation.fragment import FragmentManager
+from intermediate_representation.inline import inline_calls
+from intermediate_representation.tail_calls import eliminate_tail_calls
 from intermediate_representation.level import RealLevel, base_program_level
 import intermediate_representation.translate as IRT
 from intermediate_representation.translated_expression import (
@@ -53,6 +57,7 @@ from semantic_analysis.types import (
     NilType,
     StringType,
     are_types_equal,
+    is_pointer,
     VoidType,
 )
 
@@ -218,6 +223,8 @@ def translate_program(program: ast.Expression) -> TypedExpression:
     1. Escape analysis to determine variable allocation requirements
     2. Type checking and IR translation using base environments
     3. Entry/exit sequence generation for the program
+    4. Inline expansion of the calls to small functions
+    5. Tail call elimination, which builds the final function bodies
 
     Args:
         program (ast.Expression): The parsed AST of the Tiger program
@@ -229,12 +236,14 @@ def translate_program(program: ast.Expression) -> TypedExpression:
         SemanticError: If escape analysis or type checking fails
     """
     try:
-        find_escape(program)  # First pass: determine variable escape information
+        with profile_phase("find_escape"):
+            find_escape(program)  # First pass: determine variable escape information
     except EscapeError as err:
         raise SemanticError(err.message, err.position)
 
     # Set up program-level activation record
     program_level = base_program_level()
+    first_fragment = len(FragmentManager.get_fragments())
 
     # Translate with base environments (built-in types and functions)
     translated_program = translate_expression(
@@ -247,6 +256,12 @@ def translate_program(program: ast.Expression) -> TypedExpression:
 
     # Add entry/exit sequences for program initialization
     IRT.proc_entry_exit(program_level, translated_program.expression)
+
+    fragments = FragmentManager.get_fragments()[first_fragment:]
+    with profile_phase("inline"):
+        results = inline_calls(fragments)
+    with profile_phase("tail_calls"):
+        eliminate_tail_calls(fragments, results)
     return translated_program
 
 
@@ -505,7 +520,11 @@ def translate_expression(
             checked_fields[field.name] for field in trans_typ.fields
         ]
         return TypedExpression(
-            IRT.record_expression(ordered_field_expressions), trans_typ
+            IRT.record_expression(
+                ordered_field_expressions,
+                [is_pointer(field.type) for field in trans_typ.fields],
+            ),
+            trans_typ
         )
 
     if isinstance(expression, ast.SeqExp):
@@ -746,7 +765,9 @@ def translate_expression(
             )
 
         return TypedExpression(
-            IRT.array_expression(trans_size.expression, trans_init.expression),
+            IRT.array_expression(
+                trans_size.expression, trans_init.expression, is_pointer(trans_typ.type)
+            ),
             trans_typ,
         )
 
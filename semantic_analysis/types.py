@@ -45,6 +45,11 @@ class NameType(Type):
     symbol: str
 
 
+def is_pointer(t: Type) -> bool:
+    """Sees if values of the type point to a record or an array on the heap, which the collector moves."""
+    return isinstance(t, (RecordType, ArrayType))
+
+
 def are_types_equal(t1: Type, t2: Type) -> bool:
     """Sees if two types are of the same basic type or if they reference the same complex type."""
 
@@ -0,0 +1,43 @@
+import unittest
+
+from activation_records.frame import (
+    record_layout,
+    string_characters,
+    string_hash,
+    string_literal,
+)
+
+
+class TestRecordLayout(unittest.TestCase):
+    def test_header_holds_the_size_and_the_first_pointers(self):
+        # {head: int, tail: list}
+        self.assertEqual(record_layout([False, True]), [1 << 33 | 2 << 3 | 1])
+        self.assertEqual(record_layout([]), [1])
+
+    def test_header_words_are_signed(self):
+        [header] = record_layout([False] * 31 + [True])
+        self.assertEqual(header, (1 << 63 | 32 << 3 | 1) - (1 << 64))
+
+    def test_pointers_past_the_header_follow_the_fields(self):
+        pointer_fields = [True] + [False] * 37 + [True, False]
+        self.assertEqual(record_layout(pointer_fields), [1 << 32 | 40 << 3 | 1, 1 << 6])
+        self.assertEqual(len(record_layout([False] * 100)), 1 + 2)
+
+
+class TestStringLiteral(unittest.TestCase):
+    def test_escapes_are_resolved(self):
+        self.assertEqual(string_characters(r'"a\tb\n"'), b"a\tb\n")
+        self.assertEqual(string_characters(r'"\"\\\065\^A\^@"'), b'"\\A\x01\x00')
+        self.assertEqual(string_characters('"ab\\  \n  \\cd"'), b"abcd")
+
+    def test_hash_is_fnv1a(self):
+        self.assertEqual(string_hash(b""), 0xCBF29CE484222325 - (1 << 64))
+        self.assertEqual(string_hash(b"a"), 0xAF63DC4C8601EC8C - (1 << 64))
+
+    def test_interned_mark_hash_and_length_precede_the_characters(self):
+        hash_value = string_hash(b'a"\0')
+        self.assertEqual(
+            string_literal("L1", r'"a\"\000"'),
+            f"\t.balign 8\n\t.quad -1, {hash_value}, 3\n"
+            "L1:\n\t.asciz \"a\\042\\000\"\n",
+        )
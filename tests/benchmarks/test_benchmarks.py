@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks.run import (
+    PHASES,
+    benchmark_corpus,
+    compare_report,
+    run_benchmarks,
+)
+from benchmarks.execution import executed_instructions
+from benchmarks.heap import heap_statistics
+from benchmarks.synthetic import AXES, ProgramShape, generate_program
+from putting_it_all_together.compiler import Compiler
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestSyntheticPrograms(unittest.TestCase):
+    def test_every_axis_compiles_and_grows(self):
+        shape = ProgramShape(functions=1, nesting=0, expression_depth=1, locals=1, loops=0, strings=0)
+        for axis in AXES:
+            with self.subTest(axis=axis):
+                small = generate_program(shape.scaled(axis, 1))
+                large = generate_program(shape.scaled(axis, 3))
+                self.assertGreater(len(large), len(small))
+                Compiler().compile(large)
+
+    def test_dead_locals_compile(self):
+        # More locals than the expression reads, and more than there are registers
+        Compiler().compile(generate_program(ProgramShape(functions=1, locals=20)))
+
+    def test_generation_is_deterministic(self):
+        self.assertEqual(generate_program(ProgramShape()), generate_program(ProgramShape()))
+
+
+class TestHarness(unittest.TestCase):
+    def test_corpus_records_errors_and_phases(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for file_name in ("queens.tig", "test10.tig"):
+                shutil.copy(os.path.join(ROOT_DIRECTORY, "examples", file_name), directory)
+            corpus = benchmark_corpus(1, directory)
+
+        self.assertEqual(list(corpus["programs"]), ["queens.tig", "test10.tig"])
+        self.assertEqual(list(corpus["programs"]["queens.tig"]["phases"]), list(PHASES))
+        self.assertIsNone(corpus["programs"]["queens.tig"]["error"])
+        self.assertEqual(corpus["programs"]["test10.tig"]["error"], "SemanticError")
+
+    def test_baseline_compares_with_itself(self):
+        results = run_benchmarks(1, {"functions": (1, 2), "strings": (0,)}, corpus=False)
+        self.assertEqual(
+            [point["value"] for point in results["scaling"]["functions"]], [1, 2]
+        )
+        self.assertEqual(set(results["scaling"]["strings"][0]["phases"]), set(PHASES))
+
+        report = compare_report(results, results)
+        rows = [line for line in report.splitlines() if line.startswith("functions=")]
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(all(set(row.split()[1:]) == {"1.00"} for row in rows))
+
+
+class TestExecutionCounts(unittest.TestCase):
+    def test_counts_grow_with_the_iterations(self):
+        counts = [
+            executed_instructions(f"let var s := 0 in for i := 1 to {n} do s := s + i; s end")
+            for n in (10, 20)
+        ]
+        self.assertGreater(counts[0], 0)
+        self.assertGreater(counts[1], counts[0])
+        self.assertEqual(counts[1], executed_instructions(
+            "let var s := 0 in for i := 1 to 20 do s := s + i; s end"
+        ))
+
+    def test_programs_that_do_not_compile_have_no_count(self):
+        self.assertIsNone(executed_instructions("1 + \"a\""))
+
+
+class TestHeapStatistics(unittest.TestCase):
+    def test_garbage_is_collected(self):
+        # 2000 lists of 1000 nodes, 64 MB in all, one alive at a time
+        statistics = heap_statistics(
+            "let type list = {head: int, tail: list} var l: list := nil in "
+            "for round := 1 to 2000 do (l := nil; for i := 1 to 1000 do l := list{head=i, tail=l}); "
+            "0 end"
+        )
+        self.assertGreater(statistics["collections"], 0)
+        self.assertLess(statistics["peak"], 4 << 20)
+
+    def test_programs_that_do_not_compile_have_no_statistics(self):
+        self.assertIsNone(heap_statistics("1 + \"a\""))
@@ -212,6 +212,24 @@ class TestLinearize(unittest.TestCase):
     def test_example_queens(self):
         self._linearize_trees("queens.tig")
 
+    def test_sequences_ending_in_calls_are_not_arguments(self):
+        # f(a, (b := 1; g(b))), as inlining g into the call to f leaves it
+        a, b, result = irt.Temporary(1001), irt.Temporary(1002), irt.Temporary(1003)
+        call = irt.Call(
+            irt.Name("f"),
+            [
+                a,
+                irt.EvaluateSequence(
+                    irt.Move(b, irt.Constant(1)), irt.Call(irt.Name("g"), [b])
+                ),
+            ],
+        )
+        statements = linearize(irt.Move(result, call))
+        for statement in statements:
+            self._assert_no_sequences_statement(statement)
+        # a is read before g runs
+        self.assertEqual(statements[0], irt.Move(statements[-1].expression.arguments[0], a))
+
     def _linearize_trees(self, file_name: str):
         semantic_analysis(file_name)
         for fragment in FragmentManager.get_fragments():
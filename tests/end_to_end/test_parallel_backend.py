@@ -0,0 +1,32 @@
+import re
+import unittest
+
+from activation_records.context import CompilationContext
+from intermediate_representation.fragment import FragmentManager, ProcessFragment
+from putting_it_all_together.backend import compile_fragments
+from tests.utils.compilation_steps import semantic_analysis
+
+
+def _compile(file_name: str, jobs: int):
+    with CompilationContext().activate():
+        semantic_analysis(file_name)
+        fragments = [
+            fragment
+            for fragment in FragmentManager.get_fragments()
+            if isinstance(fragment, ProcessFragment)
+        ]
+        return compile_fragments(fragments, jobs)
+
+
+class TestParallelBackend(unittest.TestCase):
+    def test_output_does_not_depend_on_jobs(self):
+        for file_name in ("merge.tig", "queens.tig", "test61.tig"):
+            with self.subTest(file_name=file_name):
+                self.assertEqual(_compile(file_name, 1), _compile(file_name, 3))
+
+    def test_labels_are_unique_across_functions(self):
+        procedures = _compile("merge.tig", 2)
+        labels = re.findall(r"^(lab_\d+):", "".join(procedures), re.MULTILINE)
+
+        self.assertTrue(labels)
+        self.assertEqual(len(labels), len(set(labels)))
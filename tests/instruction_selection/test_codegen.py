@@ -0,0 +1,170 @@
+import unittest
+
+import intermediate_representation.tree as irt
+from activation_records.context import CompilationContext
+from activation_records.frame import TempMap
+from activation_records.temp import TempManager
+from instruction_selection.codegen import Codegen
+
+
+class TestTiling(unittest.TestCase):
+    """Checks that instruction selection covers whole address computations and uses immediates."""
+
+    def setUp(self):
+        activation = CompilationContext().activate()
+        activation.__enter__()
+        self.addCleanup(activation.__exit__, None, None, None)
+        TempMap.initialize()
+        self.base = TempManager.new_temp()
+        self.index = TempManager.new_temp()
+        self.result = TempManager.new_temp()
+
+    def test_field_load_is_one_instruction(self):
+        # Memory(base + 2 * word_size), as field_variable builds it
+        field = irt.Memory(
+            irt.BinaryOperation(
+                irt.BinaryOperator.plus,
+                irt.Temporary(self.base),
+                irt.BinaryOperation(irt.BinaryOperator.mul, irt.Constant(2), irt.Constant(8)),
+            )
+        )
+        self.assertEqual(
+            self._lines([irt.Move(irt.Temporary(self.result), field)]),
+            ["movq 16(%'s0), %'d0"],
+        )
+
+    def test_subscript_uses_the_indexed_addressing_mode(self):
+        # Memory(base + (index + 1) * word_size), as subscript_variable builds it
+        element = irt.Memory(
+            irt.BinaryOperation(
+                irt.BinaryOperator.plus,
+                irt.Temporary(self.base),
+                irt.BinaryOperation(
+                    irt.BinaryOperator.mul,
+                    irt.BinaryOperation(
+                        irt.BinaryOperator.plus, irt.Temporary(self.index), irt.Constant(1)
+                    ),
+                    irt.Constant(8),
+                ),
+            )
+        )
+        self.assertEqual(
+            self._lines([irt.Move(irt.Temporary(self.result), element)]),
+            ["movq 8(%'s0,%'s1,8), %'d0"],
+        )
+        self.assertEqual(
+            self._lines([irt.Move(element, irt.Constant(7))]),
+            ["movq $7, 8(%'s0,%'s1,8)"],
+        )
+
+    def test_constants_are_immediates(self):
+        increment = irt.Move(
+            irt.Temporary(self.result),
+            irt.BinaryOperation(
+                irt.BinaryOperator.plus, irt.Temporary(self.result), irt.Constant(1)
+            ),
+        )
+        scaled = irt.Move(
+            irt.Temporary(self.result),
+            irt.BinaryOperation(irt.BinaryOperator.mul, irt.Constant(3), irt.Temporary(self.index)),
+        )
+        compare = irt.ConditionalJump(
+            irt.RelationalOperator.lt, irt.Constant(10), irt.Temporary(self.index), "t", "f"
+        )
+        self.assertEqual(self._lines([increment]), ["addq $1, %'d0"])
+        self.assertEqual(
+            self._lines([scaled]), ["imulq $3, %'s0, %'d0", "movq %'s0, %'d0"]
+        )
+        # 10 < index is index > 10
+        self.assertEqual(self._lines([compare]), ["cmpq $10, %'s0", "jg 'j0"])
+
+    def test_sums_use_leaq(self):
+        difference = irt.BinaryOperation(
+            irt.BinaryOperator.minus, irt.Temporary(self.base), irt.Constant(24)
+        )
+        total = irt.BinaryOperation(
+            irt.BinaryOperator.plus, irt.Temporary(self.base), irt.Temporary(self.index)
+        )
+        self.assertEqual(
+            self._lines([irt.StatementExpression(difference), irt.StatementExpression(total)]),
+            ["leaq -24(%'s0), %'d0", "leaq (%'s0,%'s1), %'d0"],
+        )
+
+    def test_large_constants_are_not_immediates(self):
+        store = irt.Move(
+            irt.Memory(irt.Temporary(self.base)), irt.Constant(1 << 40)
+        )
+        self.assertEqual(
+            self._lines([store]), [f"movq ${1 << 40}, %'d0", "movq %'s0, (%'s1)"]
+        )
+
+    def test_shifts(self):
+        scaled_index = irt.Memory(
+            irt.BinaryOperation(
+                irt.BinaryOperator.plus,
+                irt.Temporary(self.base),
+                irt.BinaryOperation(
+                    irt.BinaryOperator.lshift, irt.Temporary(self.index), irt.Constant(3)
+                ),
+            )
+        )
+        halved = irt.Move(
+            irt.Temporary(self.result),
+            irt.BinaryOperation(
+                irt.BinaryOperator.arshift, irt.Temporary(self.result), irt.Constant(1)
+            ),
+        )
+        shifted = irt.Move(
+            irt.Temporary(self.result),
+            irt.BinaryOperation(
+                irt.BinaryOperator.rshift, irt.Temporary(self.base), irt.Temporary(self.index)
+            ),
+        )
+        self.assertEqual(
+            self._lines([irt.Move(irt.Temporary(self.result), scaled_index)]),
+            ["movq (%'s0,%'s1,8), %'d0"],
+        )
+        self.assertEqual(self._lines([halved]), ["sarq $1, %'d0"])
+        # A count in a register has to be in %cl
+        self.assertEqual(
+            self._lines([shifted]),
+            ["movq %'s0, %'d0", "movq %'s0, %'d0", "shrq %cl, %'d0", "movq %'s0, %'d0"],
+        )
+
+    def test_globals_are_addressed_relative_to_rip(self):
+        # The heap pointer, as heap_allocation reads and bumps it
+        heap_pointer = irt.Memory(irt.Name("tiger_heap_pointer"))
+        second_word = irt.Memory(
+            irt.BinaryOperation(
+                irt.BinaryOperator.plus, irt.Name("tiger_heap_pointer"), irt.Constant(8)
+            )
+        )
+        self.assertEqual(
+            self._lines([irt.Move(irt.Temporary(self.result), heap_pointer)]),
+            ["movq tiger_heap_pointer(%'s0), %'d0"],
+        )
+        self.assertEqual(
+            self._lines([irt.Move(heap_pointer, irt.Temporary(self.base))]),
+            ["movq %'s0, tiger_heap_pointer(%'s1)"],
+        )
+        self.assertEqual(
+            self._lines([irt.Move(irt.Temporary(self.result), second_word)]),
+            ["movq tiger_heap_pointer+8(%'s0), %'d0"],
+        )
+
+    def test_calls_overwrite_what_the_callee_may_trash(self):
+        def clobbered(function):
+            [call] = Codegen.codegen(
+                [irt.StatementExpression(irt.Call(irt.Name(function), [irt.Constant(1)]))]
+            )[-1:]
+            return {TempMap.temp_to_register[temporary] for temporary in call.destination}
+
+        self.assertEqual(clobbered("print_num"), set())
+        self.assertEqual(clobbered("string_length"), {"rax"})
+        self.assertEqual(
+            clobbered("lab_1"),
+            {"rax", "rdi", "rsi", "rdx", "rcx", "r8", "r9", "r10", "r11"},
+        )
+
+    def _lines(self, statements):
+        return [instruction.line.rstrip("\n") for instruction in Codegen.codegen(statements)]
@@ -0,0 +1,120 @@
+import unittest
+
+import intermediate_representation.tree as irt
+from activation_records.context import CompilationContext
+from activation_records.frame import TempMap
+from intermediate_representation.fragment import FragmentManager, ProcessFragment
+from intermediate_representation.inline import InliningReport
+from putting_it_all_together.compiler import parse_program
+from semantic_analysis.analyzers import translate_program
+
+
+def called_labels(node) -> list:
+    """The labels of the functions called in an IR tree, in order."""
+    if isinstance(node, irt.Call):
+        own = [node.function.label] if isinstance(node.function, irt.Name) else []
+        return own + [label for argument in node.arguments for label in called_labels(argument)]
+    if isinstance(node, irt.Sequence):
+        return [label for statement in node.sequence for label in called_labels(statement)]
+    if isinstance(node, (irt.Jump, irt.Memory, irt.StatementExpression)):
+        return called_labels(node.expression)
+    if isinstance(node, irt.Move):
+        return called_labels(node.temporary) + called_labels(node.expression)
+    if isinstance(node, (irt.BinaryOperation, irt.ConditionalJump)):
+        return called_labels(node.left) + called_labels(node.right)
+    if isinstance(node, irt.EvaluateSequence):
+        return called_labels(node.statement) + called_labels(node.expression)
+    return []
+
+
+class TestInline(unittest.TestCase):
+    def setUp(self):
+        activation = CompilationContext().activate()
+        activation.__enter__()
+        self.addCleanup(activation.__exit__, None, None, None)
+        TempMap.initialize()
+
+    def _translate(self, source: str) -> dict:
+        translate_program(parse_program(source))
+        return {
+            fragment.frame.name: fragment
+            for fragment in FragmentManager.get_fragments()
+            if isinstance(fragment, ProcessFragment)
+        }
+
+    def _decisions(self):
+        return [
+            (decision.function, decision.caller, decision.callee, decision.inlined)
+            for decision in InliningReport.get_decisions()
+        ]
+
+    def test_small_functions_are_inlined_with_their_frame_slots(self):
+        functions = self._translate(
+            """
+            let
+              var base := 10
+              function add(x: int): int = x + base
+            in
+              add(1) + add(2)
+            end
+            """
+        )
+        self.assertEqual(called_labels(functions["tigermain"].body), [])
+        self.assertEqual(
+            self._decisions(),
+            [("tigermain", "tigermain", "lab_1", True)] * 2,
+        )
+        # base escapes into add, and stays in the frame of tigermain
+        self.assertEqual(functions["tigermain"].frame.offset, -16)
+
+    def test_recursive_functions_are_expanded_once(self):
+        functions = self._translate(
+            """
+            let
+              function fact(n: int): int = if n < 2 then 1 else n * fact(n - 1)
+            in
+              fact(5)
+            end
+            """
+        )
+        self.assertEqual(called_labels(functions["tigermain"].body), ["lab_1"])
+        self.assertEqual(called_labels(functions["lab_1"].body), ["lab_1"])
+        self.assertEqual(
+            self._decisions(),
+            [
+                ("lab_1", "lab_1", "lab_1", False),
+                ("tigermain", "tigermain", "lab_1", True),
+                ("tigermain", "lab_1", "lab_1", False),
+            ],
+        )
+
+    def test_functions_calling_their_nested_functions_are_not_inlined(self):
+        self._translate(
+            """
+            let
+              function outer(n: int): int =
+                let function inner(): int = n in inner() end
+            in
+              outer(1)
+            end
+            """
+        )
+        [_, decision] = InliningReport.get_decisions()
+        self.assertEqual((decision.callee, decision.inlined), ("lab_1", False))
+        self.assertEqual(decision.reason, "passes its frame pointer on")
+
+    def test_constant_arguments_raise_the_budget(self):
+        body = " + ".join(["n * n"] * 11)
+        self._translate(
+            f"""
+            let
+              var v := 2
+              function big(n: int): int = {body}
+            in
+              big(v) + big(3)
+            end
+            """
+        )
+        self.assertEqual(
+            [decision.inlined for decision in InliningReport.get_decisions()], [False, True]
+        )
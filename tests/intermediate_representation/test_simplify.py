@@ -0,0 +1,98 @@
+import unittest
+
+import intermediate_representation.tree as irt
+from activation_records.context import CompilationContext
+from activation_records.temp import TempManager
+from intermediate_representation.simplify import simplify
+
+
+def binary(operator, left, right):
+    return irt.BinaryOperation(operator, left, right)
+
+
+class TestSimplify(unittest.TestCase):
+    def setUp(self):
+        activation = CompilationContext().activate()
+        activation.__enter__()
+        self.addCleanup(activation.__exit__, None, None, None)
+        self.variable = irt.Temporary(TempManager.new_temp())
+
+    def test_constants_are_folded_with_64_bit_wraparound(self):
+        operator = irt.BinaryOperator
+        self.assertEqual(
+            self._simplified(binary(operator.plus, irt.Constant(2), irt.Constant(3))),
+            irt.Constant(5),
+        )
+        self.assertEqual(
+            self._simplified(binary(operator.mul, irt.Constant(1 << 62), irt.Constant(4))),
+            irt.Constant(0),
+        )
+        # Division rounds towards zero, like idivq
+        self.assertEqual(
+            self._simplified(binary(operator.div, irt.Constant(-7), irt.Constant(2))),
+            irt.Constant(-3),
+        )
+
+    def test_trapping_divisions_are_kept(self):
+        division = binary(irt.BinaryOperator.div, irt.Constant(1), irt.Constant(0))
+        self.assertEqual(self._simplified(division), division)
+
+    def test_algebraic_identities(self):
+        operator = irt.BinaryOperator
+        self.assertEqual(
+            self._simplified(binary(operator.plus, irt.Constant(0), self.variable)), self.variable
+        )
+        self.assertEqual(
+            self._simplified(binary(operator.div, self.variable, irt.Constant(1))), self.variable
+        )
+        self.assertEqual(
+            self._simplified(binary(operator.mul, self.variable, irt.Constant(0))), irt.Constant(0)
+        )
+        # (v + 1) - 3 is v - 2
+        self.assertEqual(
+            self._simplified(
+                binary(
+                    operator.minus,
+                    binary(operator.plus, self.variable, irt.Constant(1)),
+                    irt.Constant(3),
+                )
+            ),
+            binary(operator.minus, self.variable, irt.Constant(2)),
+        )
+
+    def test_side_effects_are_not_dropped(self):
+        call = irt.Call(irt.Name("f"), [])
+        product = binary(irt.BinaryOperator.mul, call, irt.Constant(0))
+        self.assertEqual(self._simplified(product), product)
+
+    def test_powers_of_two_become_shifts(self):
+        operator = irt.BinaryOperator
+        self.assertEqual(
+            self._simplified(binary(operator.mul, irt.Constant(8), self.variable)),
+            binary(operator.lshift, self.variable, irt.Constant(3)),
+        )
+        # Negative dividends are biased by 3 so that the shift rounds towards zero
+        bias = binary(
+            operator.rshift,
+            binary(operator.arshift, self.variable, irt.Constant(63)),
+            irt.Constant(62),
+        )
+        self.assertEqual(
+            self._simplified(binary(operator.div, self.variable, irt.Constant(4))),
+            binary(operator.arshift, binary(operator.plus, self.variable, bias), irt.Constant(2)),
+        )
+
+    def test_constant_conditions_become_jumps(self):
+        condition = irt.ConditionalJump(
+            irt.RelationalOperator.ult, irt.Constant(-1), irt.Constant(1), "true", "false"
+        )
+        body, statistics = simplify(irt.Sequence([condition, irt.Label("true")]))
+        self.assertEqual(
+            body, irt.Sequence([irt.Jump(irt.Name("false"), ["false"]), irt.Label("true")])
+        )
+        self.assertEqual(statistics.folded_jumps, 1)
+        self.assertEqual(statistics.removed_nodes, 1)
+
+    def _simplified(self, expression):
+        body, _ = simplify(irt.Move(self.variable, expression))
+        return body.expression
@@ -0,0 +1,128 @@
+import unittest
+
+import intermediate_representation.tree as irt
+from activation_records.context import CompilationContext
+from activation_records.frame import TempMap
+from intermediate_representation.fragment import FragmentManager, ProcessFragment
+from intermediate_representation.inline import children
+from putting_it_all_together.compiler import parse_program
+from semantic_analysis.analyzers import translate_program
+
+# Keeps a function from being inlined
+LARGE = " + ".join(["n * n"] * 11)
+
+
+def nodes(node) -> list:
+    """The nodes of an IR tree, in order."""
+    return [node] + [inner for child in children(node) for inner in nodes(child)]
+
+
+def calls(body) -> list:
+    """The labels of the functions called in body, tail jumps excluded."""
+    jumps = [
+        node.expression for node in nodes(body)
+        if isinstance(node, irt.Jump) and isinstance(node.expression, irt.Call)
+    ]
+    return [
+        node.function.label for node in nodes(body)
+        if isinstance(node, irt.Call) and not any(node is jump for jump in jumps)
+    ]
+
+
+def tail_jumps(body) -> list:
+    """The labels of the functions that body jumps to."""
+    return [
+        node.expression.function.label for node in nodes(body)
+        if isinstance(node, irt.Jump) and isinstance(node.expression, irt.Call)
+    ]
+
+
+class TestTailCalls(unittest.TestCase):
+    def setUp(self):
+        activation = CompilationContext().activate()
+        activation.__enter__()
+        self.addCleanup(activation.__exit__, None, None, None)
+        TempMap.initialize()
+
+    def _translate(self, source: str) -> dict:
+        translate_program(parse_program(source))
+        return {
+            fragment.frame.name: fragment.body
+            for fragment in FragmentManager.get_fragments()
+            if isinstance(fragment, ProcessFragment)
+        }
+
+    def test_self_tail_calls_become_loops(self):
+        bodies = self._translate(
+            """
+            let
+              function sum(n: int, total: int): int =
+                if n = 0 then total else sum(n - 1, total + n)
+            in
+              sum(10, 0)
+            end
+            """
+        )
+        body = nodes(bodies["lab_1"])
+        self.assertEqual(calls(bodies["lab_1"]), [])
+        # The only jump back
+        [loop] = [
+            node.label for index, node in enumerate(body)
+            if isinstance(node, irt.Label)
+            and irt.Jump(irt.Name(node.label), [node.label]) in body[index:]
+        ]
+        # The loop starts after the view shift of the static link, n and total
+        [shift] = [
+            node for node in body
+            if isinstance(node, irt.Sequence)
+            and isinstance(node.sequence[-1], irt.Sequence)
+            and node.sequence[-1].sequence[0] == irt.Label(loop)
+        ]
+        self.assertEqual(
+            [move.expression for move in shift.sequence[:-1]],
+            [irt.Temporary(TempMap.register_to_temp[register]) for register in ("rdi", "rsi", "rdx")],
+        )
+
+    def test_calls_whose_value_is_used_stay_calls(self):
+        bodies = self._translate(
+            """
+            let
+              function fact(n: int): int = if n < 2 then 1 else n * fact(n - 1)
+              function last(n: int): int = (fact(n); 0)
+            in
+              last(fact(5))
+            end
+            """
+        )
+        self.assertEqual(calls(bodies["lab_1"]), ["lab_1"])
+        self.assertEqual(tail_jumps(bodies["lab_2"]), [])
+
+    def test_tail_calls_to_other_functions_become_jumps(self):
+        bodies = self._translate(
+            f"""
+            let
+              function ping(n: int): int = if n = 0 then {LARGE} else pong(n - 1)
+              function pong(n: int): int = if n = 0 then {LARGE} else ping(n - 1)
+            in
+              ping(10)
+            end
+            """
+        )
+        self.assertEqual(tail_jumps(bodies["lab_1"]), ["lab_2"])
+        self.assertEqual(tail_jumps(bodies["lab_2"]), ["lab_1"])
+        self.assertEqual(calls(bodies["lab_1"]), [])
+
+    def test_calls_to_nested_functions_stay_calls(self):
+        bodies = self._translate(
+            f"""
+            let
+              function outer(n: int): int =
+                let function inner(m: int): int = {LARGE.replace("n", "m")} + n
+                in inner(n) end
+            in
+              outer(10)
+            end
+            """
+        )
+        self.assertEqual(calls(bodies["lab_1"]), ["lab_2"])
+        self.assertEqual(tail_jumps(bodies["lab_1"]), [])
@@ -0,0 +1,105 @@
+import unittest
+
+import intermediate_representation.tree as irt
+from activation_records.context import CompilationContext
+from activation_records.frame import TempMap
+from activation_records.temp import TempManager
+from optimization.optimizer import optimize
+
+
+def binary(operator, left, right):
+    return irt.BinaryOperation(operator, left, right)
+
+
+def frame_slot(base, offset):
+    return irt.Memory(binary(irt.BinaryOperator.minus, base, irt.Constant(offset)))
+
+
+class TestLoopInvariantCodeMotion(unittest.TestCase):
+    def setUp(self):
+        activation = CompilationContext().activate()
+        activation.__enter__()
+        self.addCleanup(activation.__exit__, None, None, None)
+        TempMap.initialize()
+        self.frame_pointer = irt.Temporary(TempMap.register_to_temp["rbp"])
+        self.counter, self.total, self.record = (
+            irt.Temporary(TempManager.new_temp()) for _ in range(3)
+        )
+        # A variable of the enclosing function, through the static link
+        self.outer_variable = frame_slot(frame_slot(self.frame_pointer, 8), 16)
+
+    def _loop(self, *body):
+        """for counter := 0 to 9 do body, then return total."""
+        return [
+            irt.Label("entry"),
+            irt.Move(self.counter, irt.Constant(0)),
+            irt.Move(self.total, irt.Constant(0)),
+            irt.Label("test"),
+            irt.ConditionalJump(
+                irt.RelationalOperator.lt, self.counter, irt.Constant(10), "body", "exit"
+            ),
+            irt.Label("body"),
+            *body,
+            irt.Move(self.counter, binary(irt.BinaryOperator.plus, self.counter, irt.Constant(1))),
+            irt.Jump(irt.Name("test"), ["test"]),
+            irt.Label("exit"),
+            irt.Move(irt.Temporary(TempMap.register_to_temp["rax"]), self.total),
+            irt.Label("done"),
+        ]
+
+    def test_static_link_loads_leave_the_loop_despite_calls(self):
+        body, statistics = optimize(
+            self._loop(
+                irt.StatementExpression(irt.Call(irt.Name("print_num"), [self.outer_variable])),
+                irt.StatementExpression(irt.Call(irt.Name("lab_1"), [self.frame_pointer])),
+            )
+        )
+        self.assertEqual(statistics.loops, 1)
+        # The call to a Tiger function may assign the variable, not the static link
+        self.assertEqual(statistics.hoisted_loads, 1)
+        preheader = body[: body.index(irt.Label("test"))]
+        self.assertEqual(
+            [
+                statement.expression
+                for statement in preheader
+                if isinstance(statement, irt.Move) and isinstance(statement.expression, irt.Memory)
+            ],
+            [frame_slot(self.frame_pointer, 8)],
+        )
+
+    def test_variables_read_in_loops_without_calls_leave_the_loop(self):
+        body, statistics = optimize(
+            self._loop(
+                irt.Move(self.total, binary(irt.BinaryOperator.plus, self.total, self.outer_variable)),
+            )
+        )
+        self.assertEqual(statistics.hoisted_loads, 1)
+        preheader = body[: body.index(irt.Label("test"))]
+        self.assertEqual(
+            [
+                statement.expression
+                for statement in preheader
+                if isinstance(statement, irt.Move) and isinstance(statement.expression, irt.Memory)
+            ],
+            [self.outer_variable],
+        )
+
+    def test_variables_stored_in_the_loop_stay(self):
+        local = frame_slot(self.frame_pointer, 16)
+        body, statistics = optimize(
+            self._loop(
+                irt.Move(local, binary(irt.BinaryOperator.plus, local, irt.Constant(1))),
+            )
+        )
+        self.assertEqual(statistics.hoisted_loads, 0)
+        self.assertIn(
+            irt.Move(local, binary(irt.BinaryOperator.plus, local, irt.Constant(1))), body
+        )
+
+    def test_heap_loads_stay(self):
+        # The loop may not run, and the record may be nil
+        field = irt.Memory(self.record)
+        _, statistics = optimize(
+            self._loop(irt.Move(self.total, binary(irt.BinaryOperator.plus, self.total, field)))
+        )
+        self.assertEqual(statistics.hoisted_loads, 0)
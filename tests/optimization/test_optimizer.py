@@ -0,0 +1,163 @@
+import unittest
+
+import intermediate_representation.tree as irt
+from activation_records.context import CompilationContext
+from activation_records.temp import TempManager
+from optimization.optimizer import optimize
+from optimization.ssa import sequential_copies
+
+
+def binary(operator, left, right):
+    return irt.BinaryOperation(operator, left, right)
+
+
+def call(*arguments):
+    return irt.StatementExpression(irt.Call(irt.Name("f"), list(arguments)))
+
+
+class TestOptimizer(unittest.TestCase):
+    def setUp(self):
+        activation = CompilationContext().activate()
+        activation.__enter__()
+        self.addCleanup(activation.__exit__, None, None, None)
+        self.first, self.second, self.third, self.parameter = (
+            irt.Temporary(TempManager.new_temp()) for _ in range(4)
+        )
+
+    def test_constant_branches_are_folded(self):
+        body, statistics = optimize(
+            [
+                irt.Label("entry"),
+                irt.Move(self.first, irt.Constant(4)),
+                irt.Move(self.second, binary(irt.BinaryOperator.mul, self.first, irt.Constant(2))),
+                irt.ConditionalJump(
+                    irt.RelationalOperator.gt, self.second, irt.Constant(5), "taken", "skipped"
+                ),
+                irt.Label("skipped"),
+                call(irt.Constant(0)),
+                irt.Jump(irt.Name("done"), ["done"]),
+                irt.Label("taken"),
+                call(self.second),
+                irt.Label("done"),
+            ]
+        )
+        self.assertEqual(self._calls(body), [[irt.Constant(8)]])
+        self.assertEqual(statistics.folded_branches, 1)
+        self.assertEqual(statistics.unreachable_blocks, 1)
+        self.assertFalse(any(isinstance(statement, irt.Move) for statement in body))
+
+    def test_copies_and_redundant_expressions_are_removed(self):
+        body, statistics = optimize(
+            [
+                irt.Label("entry"),
+                irt.Move(self.first, self.parameter),
+                irt.Move(self.second, binary(irt.BinaryOperator.plus, self.first, irt.Constant(1))),
+                irt.Move(self.third, binary(irt.BinaryOperator.plus, irt.Constant(1), self.parameter)),
+                call(self.second, self.third),
+                irt.Label("done"),
+            ]
+        )
+        [arguments] = self._calls(body)
+        self.assertEqual(arguments[0], arguments[1])
+        self.assertEqual(statistics.propagated_copies, 1)
+        self.assertEqual(statistics.redundant_expressions, 1)
+        self.assertEqual(
+            [statement.expression for statement in body if isinstance(statement, irt.Move)],
+            [binary(irt.BinaryOperator.plus, self.parameter, irt.Constant(1))],
+        )
+
+    def test_unused_definitions_are_removed_but_loads_are_kept(self):
+        load = irt.Memory(self.parameter)
+        body, statistics = optimize(
+            [
+                irt.Label("entry"),
+                irt.Move(self.first, binary(irt.BinaryOperator.mul, self.parameter, irt.Constant(3))),
+                irt.Move(self.second, load),
+                irt.Label("done"),
+            ]
+        )
+        self.assertEqual(
+            [statement.expression for statement in body if isinstance(statement, irt.Move)],
+            [load],
+        )
+        self.assertEqual(statistics.dead_statements, 1)
+
+    def test_loops_keep_the_values_of_their_variables(self):
+        # first, second := second, first + second while first < 100
+        body, statistics = optimize(
+            [
+                irt.Label("entry"),
+                irt.Move(self.first, irt.Constant(0)),
+                irt.Move(self.second, irt.Constant(1)),
+                irt.Label("test"),
+                irt.ConditionalJump(
+                    irt.RelationalOperator.lt, self.first, irt.Constant(100), "body", "exit"
+                ),
+                irt.Label("exit"),
+                call(self.first),
+                irt.Jump(irt.Name("done"), ["done"]),
+                irt.Label("body"),
+                irt.Move(self.third, binary(irt.BinaryOperator.plus, self.first, self.second)),
+                irt.Move(self.first, self.second),
+                irt.Move(self.second, self.third),
+                irt.Jump(irt.Name("test"), ["test"]),
+                irt.Label("done"),
+            ]
+        )
+        self.assertEqual(statistics.phi_functions, 2)
+        self.assertEqual(statistics.folded_branches, 0)
+        self.assertEqual(self._run(body), [144])
+
+    def test_parallel_copies_are_ordered(self):
+        first, second, third = (TempManager.new_temp() for _ in range(3))
+        # A swap needs a third temporary, a chain only the right order
+        swap = sequential_copies({first: irt.Temporary(second), second: irt.Temporary(first)})
+        self.assertEqual(len(swap), 3)
+        self.assertEqual(swap[0].expression, irt.Temporary(first))
+        chain = sequential_copies({first: irt.Temporary(second), second: irt.Temporary(third)})
+        self.assertEqual(
+            [move.temporary.temporary for move in chain], [first, second]
+        )
+
+    @staticmethod
+    def _calls(body):
+        return [
+            statement.expression.arguments
+            for statement in body
+            if isinstance(statement, irt.StatementExpression)
+        ]
+
+    @staticmethod
+    def _run(body):
+        """Runs an optimized body made of moves, jumps and calls, returning the arguments of f."""
+        labels = {
+            statement.label: index
+            for index, statement in enumerate(body)
+            if isinstance(statement, irt.Label)
+        }
+        temps = {}
+        printed = []
+
+        def value(expression):
+            if isinstance(expression, irt.Constant):
+                return expression.value
+            if isinstance(expression, irt.Temporary):
+                return temps[expression.temporary]
+            assert expression.operator == irt.BinaryOperator.plus
+            return value(expression.left) + value(expression.right)
+
+        index = 0
+        while index < len(body):
+            statement = body[index]
+            index += 1
+            if isinstance(statement, irt.Move):
+                temps[statement.temporary.temporary] = value(statement.expression)
+            elif isinstance(statement, irt.StatementExpression):
+                printed.extend(value(argument) for argument in statement.expression.arguments)
+            elif isinstance(statement, irt.Jump):
+                index = labels[statement.labels[0]]
+            elif isinstance(statement, irt.ConditionalJump):
+                assert statement.operator == irt.RelationalOperator.lt
+                taken = value(statement.left) < value(statement.right)
+                index = labels[statement.true if taken else statement.false]
+        return printed
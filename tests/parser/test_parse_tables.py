@@ -0,0 +1,107 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from typing import Tuple
+
+import parser.parser as tiger_parser
+import ply.yacc as yacc
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Seconds the fastest of IMPORT_RUNS imports of main may take. The budget is
+# loose so that slow machines pass; whether the shipped tables are loaded
+# instead of rebuilt is checked exactly.
+IMPORT_TIME_BUDGET = 1.0
+IMPORT_RUNS = 3
+
+
+def _grammar_signature() -> str:
+    grammar = yacc.ParserReflect(vars(tiger_parser), log=yacc.NullLogger())
+    grammar.get_all()
+    return grammar.signature()
+
+
+# Imports main, and prints how many LALR tables were built, whether the
+# shipped ones were loaded and how long the import took
+IMPORT_SCRIPT = """
+import sys
+import time
+import ply.yacc as yacc
+built = []
+build = yacc.LRTable.__init__
+def counting_build(self, *arguments, **keywords):
+    built.append(self)
+    build(self, *arguments, **keywords)
+yacc.LRTable.__init__ = counting_build
+start = time.perf_counter()
+import main
+import_time = time.perf_counter() - start
+print(len(built), "parser.parsetab" in sys.modules, import_time)
+"""
+
+
+def _import_main(working_directory: str) -> Tuple[str, float]:
+    environment = dict(os.environ, PYTHONPATH=ROOT_DIRECTORY)
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=working_directory,
+        env=environment,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    built, loaded, import_time = result.stdout.split()
+    return f"{built} {loaded}", float(import_time)
+
+
+class TestParseTables(unittest.TestCase):
+    def test_shipped_tables_match_grammar(self):
+        tables = yacc.read_table(tiger_parser.PARSE_TABLE_MODULE)
+
+        self.assertIsNotNone(tables, "run `python -m parser.parser` to rebuild the tables")
+        self.assertEqual(
+            tables.lr_signature,
+            _grammar_signature(),
+            "run `python -m parser.parser` to rebuild the tables",
+        )
+
+    def test_shipped_tables_equal_generated_tables(self):
+        generated = yacc.yacc(module=tiger_parser, errorlog=yacc.NullLogger())
+
+        self.assertEqual(tiger_parser.parser.action, generated.action)
+        self.assertEqual(tiger_parser.parser.goto, generated.goto)
+        self.assertEqual(
+            [(p.name, p.len, p.func) for p in tiger_parser.parser.productions],
+            [(p.name, p.len, p.func) for p in generated.productions],
+        )
+
+    def test_tables_of_another_version_are_ignored(self):
+        with tempfile.TemporaryDirectory() as directory:
+            sys.path.insert(0, directory)
+            try:
+                yacc.yacc(
+                    module=tiger_parser,
+                    tabmodule="stale_parsetab",
+                    write_tables=True,
+                    outputdir=directory,
+                    errorlog=yacc.NullLogger(),
+                )
+                with open(os.path.join(directory, "stale_parsetab.py")) as table_file:
+                    tables = table_file.read()
+                with open(os.path.join(directory, "stale_parsetab.py"), "w") as table_file:
+                    table_file.write(tables.replace(yacc.__tabversion__, "0.0"))
+
+                self.assertIsNone(yacc.read_table("stale_parsetab"))
+            finally:
+                sys.path.remove(directory)
+                sys.modules.pop("stale_parsetab", None)
+
+    def test_import_main_loads_the_shipped_tables_within_budget_without_writing_files(self):
+        with tempfile.TemporaryDirectory() as working_directory:
+            imports = [_import_main(working_directory) for _ in range(IMPORT_RUNS)]
+
+            self.assertEqual({tables for tables, _ in imports}, {"0 True"})
+            self.assertLess(min(import_time for _, import_time in imports), IMPORT_TIME_BUDGET)
+            self.assertEqual(os.listdir(working_directory), [])
@@ -0,0 +1,96 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from putting_it_all_together.compilation_cache import CompilationCache
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _store_and_load(directory: str, worker: int):
+    cache = CompilationCache(directory)
+    for round_number in range(20):
+        key = cache.key(f"source {round_number % 5}")
+        cache.store(key, f"assembly {round_number % 5}\n" * 100)
+        entry = cache.load(key)
+        if entry is not None and entry.assembly != f"assembly {round_number % 5}\n" * 100:
+            raise AssertionError(f"worker {worker} read a torn entry")
+
+
+class TestCompilationCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = CompilationCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_key_depends_on_source_and_flags(self):
+        key = self.cache.key("print_num(1)")
+
+        self.assertEqual(key, self.cache.key("print_num(1)"))
+        self.assertNotEqual(key, self.cache.key("print_num(2)"))
+        self.assertNotEqual(key, self.cache.key("print_num(1)", ["jobs"]))
+
+    def test_store_and_load(self):
+        key = self.cache.key("print_num(1)")
+        self.assertIsNone(self.cache.load(key))
+
+        self.cache.store(key, "tigermain:\n", {"parse": "tree"})
+        entry = self.cache.load(key)
+
+        self.assertEqual(entry.assembly, "tigermain:\n")
+        self.assertEqual(entry.artifacts, {"parse": "tree"})
+
+    def test_evicts_least_recently_used_entries(self):
+        keys = [self.cache.key(str(index)) for index in range(3)]
+        for key in keys:
+            self.cache.store(key, "x" * 1000)
+            time.sleep(0.01)
+        self.cache.load(keys[0])
+        time.sleep(0.01)
+
+        self.cache.max_bytes = 3500
+        self.cache.store(self.cache.key("3"), "x" * 1000)
+
+        self.assertIsNotNone(self.cache.load(keys[0]))
+        self.assertIsNone(self.cache.load(keys[1]))
+        self.assertIsNotNone(self.cache.load(keys[2]))
+
+    def test_concurrent_processes_never_see_partial_entries(self):
+        self.cache.max_bytes = 4000
+        processes = [
+            multiprocessing.Process(target=_store_and_load, args=(self.directory.name, worker))
+            for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertEqual([process.exitcode for process in processes], [0] * 4)
+
+    def test_main_reuses_cached_assembly(self):
+        with tempfile.TemporaryDirectory() as working_directory:
+            command = [
+                sys.executable,
+                os.path.join(ROOT_DIRECTORY, "main.py"),
+                os.path.join(ROOT_DIRECTORY, "examples", "test6.tig"),
+                "--cache-dir",
+                self.directory.name,
+            ]
+            subprocess.run(command, cwd=working_directory, check=True)
+            with open(os.path.join(working_directory, "output.s")) as output_file:
+                compiled = output_file.read()
+            os.unlink(os.path.join(working_directory, "output.s"))
+
+            subprocess.run(command, cwd=working_directory, check=True)
+            with open(os.path.join(working_directory, "output.s")) as output_file:
+                self.assertEqual(output_file.read(), compiled)
+
+        entries = [name for name in os.listdir(self.directory.name) if name.endswith(".json")]
+        self.assertEqual(len(entries), 1)
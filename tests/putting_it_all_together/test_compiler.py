@@ -0,0 +1,72 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from activation_records.temp import TempManager
+from intermediate_representation.fragment import FragmentManager
+from parser.parser import SyntacticError
+from putting_it_all_together.compiler import Compiler
+from semantic_analysis.analyzers import SemanticError
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+EXAMPLES_DIRECTORY = os.path.join(ROOT_DIRECTORY, "examples")
+
+
+def _read_examples():
+    examples = {}
+    for file_name in sorted(os.listdir(EXAMPLES_DIRECTORY)):
+        if file_name.endswith(".tig"):
+            with open(os.path.join(EXAMPLES_DIRECTORY, file_name)) as file:
+                examples[file_name] = file.read()
+    return examples
+
+
+def _compile(compiler: Compiler, source: str) -> str:
+    try:
+        return compiler.compile(source)
+    except (SyntacticError, SemanticError) as err:
+        return f"{type(err).__name__}: {err}"
+
+
+class TestCompiler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.examples = _read_examples()
+
+    def test_compiling_twice_gives_the_same_output(self):
+        compiler = Compiler()
+        source = self.examples["merge.tig"]
+
+        self.assertEqual(compiler.compile(source), compiler.compile(source))
+
+    def test_compilation_leaves_the_default_context_alone(self):
+        temp_count = TempManager.temp_count
+        fragment_count = len(FragmentManager.get_fragments())
+
+        Compiler().compile(self.examples["queens.tig"])
+
+        self.assertEqual(TempManager.temp_count, temp_count)
+        self.assertEqual(len(FragmentManager.get_fragments()), fragment_count)
+
+    def test_concurrent_compilations_are_byte_identical(self):
+        compiler = Compiler()
+        names = list(self.examples) * 3
+        expected = {name: _compile(compiler, self.examples[name]) for name in self.examples}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outputs = list(
+                executor.map(lambda name: _compile(compiler, self.examples[name]), names)
+            )
+
+        for name, output in zip(names, outputs):
+            self.assertEqual(output, expected[name], name)
+
+    def test_equal_literals_share_a_label(self):
+        assembly = Compiler().compile(
+            'let function line() = print_string("\\n")\n'
+            'in line(); print_string("\\n"); print_string("\\010"); print_string("x") end'
+        )
+
+        self.assertEqual(assembly.count('.asciz "\\012"'), 1)
+        self.assertEqual(assembly.count(".asciz"), 2)
+        self.assertIn("tiger_strings:\n\t.quad 2\n", assembly)
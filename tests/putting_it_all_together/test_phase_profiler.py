@@ -0,0 +1,151 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from parser.parser import SyntacticError
+from putting_it_all_together.compiler import TokenReplay, new_parser, parse_program
+from putting_it_all_together.phase_profiler import PhaseProfiler
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    def test_nested_phases_are_aggregated_per_position(self):
+        profiler = PhaseProfiler()
+        profiler.start()
+        for function in ("f", "g"):
+            with profiler.phase("register_allocation", function):
+                with profiler.phase("liveness"):
+                    pass
+                with profiler.phase("allocation_round"):
+                    pass
+        with profiler.phase("liveness"):
+            pass
+        profiler.stop()
+
+        summary = [(phase["path"], phase["calls"]) for phase in profiler.phase_summary()]
+        self.assertEqual(
+            summary,
+            [
+                (["register_allocation"], 2),
+                (["register_allocation", "liveness"], 2),
+                (["register_allocation", "allocation_round"], 2),
+                (["liveness"], 1),
+            ],
+        )
+        self.assertEqual([record.function for record in profiler.records[:3]], ["f"] * 3)
+        self.assertEqual(
+            [function["name"] for function in profiler.function_summary()], ["f", "g"]
+        )
+
+    def test_peak_memory_covers_nested_phases(self):
+        profiler = PhaseProfiler(trace_memory=True)
+        profiler.start()
+        with profiler.phase("outer"):
+            with profiler.phase("inner"):
+                buffer = bytearray(1 << 20)
+                del buffer
+        profiler.stop()
+
+        outer, inner = profiler.records
+        self.assertGreaterEqual(inner.peak_memory, 1 << 20)
+        self.assertGreaterEqual(outer.peak_memory, inner.peak_memory)
+        self.assertGreaterEqual(profiler.peak_memory, outer.peak_memory)
+
+    def test_token_replay_gives_the_same_tree(self):
+        for file_name in ("merge.tig", "test6.tig", "test49.tig"):
+            with self.subTest(file_name=file_name):
+                with open(os.path.join(ROOT_DIRECTORY, "examples", file_name)) as file:
+                    source = file.read()
+                try:
+                    expected = str(parse_program(source))
+                except SyntacticError as err:
+                    expected = str(err)
+                try:
+                    replayed = str(new_parser().parse(source, TokenReplay(source)))
+                except SyntacticError as err:
+                    replayed = str(err)
+
+                self.assertEqual(replayed, expected)
+
+    def test_compile_reports_phases_and_functions_as_json(self):
+        with tempfile.TemporaryDirectory() as working_directory:
+            subprocess.run(
+                [
+                    sys.executable,
+                    os.path.join(ROOT_DIRECTORY, "compile.py"),
+                    os.path.join(ROOT_DIRECTORY, "examples", "merge.tig"),
+                    "--profile",
+                    "--profile-format",
+                    "json",
+                    "--profile-output",
+                    "profile.json",
+                ],
+                cwd=working_directory,
+                check=True,
+                capture_output=True,
+            )
+            with open(os.path.join(working_directory, "profile.json")) as report_file:
+                report = json.load(report_file)
+
+        phases = {tuple(phase["path"]): phase for phase in report["phases"]}
+        for path in (
+                ("lex",),
+                ("parse",),
+                ("translate_program", "find_escape"),
+                ("translate_program", "inline"),
+                ("translate_program", "tail_calls"),
+                ("simplify",),
+                ("canonize", "linearize"),
+                ("canonize", "basic_block"),
+                ("canonize", "trace_schedule"),
+                ("optimize", "ssa"),
+                ("optimize", "constant_propagation"),
+                ("optimize", "copy_propagation"),
+                ("optimize", "value_numbering"),
+                ("optimize", "code_motion"),
+                ("optimize", "dead_code"),
+                ("optimize", "out_of_ssa"),
+                ("codegen",),
+                ("register_allocation", "liveness"),
+                ("register_allocation", "allocation_round"),
+                ("emission",),
+        ):
+            self.assertIn(path, phases)
+            self.assertIsNotNone(phases[path]["peak_memory"])
+
+        functions = {function["name"]: function for function in report["functions"]}
+        self.assertIn("tigermain", functions)
+        self.assertEqual(
+            set(functions["tigermain"]["statistics"]),
+            {
+                "inlined_calls",
+                "tail_recursions",
+                "tail_jumps",
+                "folded_constants",
+                "algebraic_simplifications",
+                "strength_reductions",
+                "folded_jumps",
+                "removed_nodes",
+                "phi_functions",
+                "constant_temporaries",
+                "folded_branches",
+                "unreachable_blocks",
+                "propagated_copies",
+                "redundant_expressions",
+                "loops",
+                "hoisted_loads",
+                "hoisted_expressions",
+                "dead_statements",
+                "phi_copies",
+                "temporaries",
+                "interference_edges",
+                "spill_rounds",
+                "spilled_temporaries",
+                "rematerialized_temporaries",
+                "instructions",
+            },
+        )
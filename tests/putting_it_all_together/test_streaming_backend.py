@@ -0,0 +1,114 @@
+import io
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from activation_records.context import CompilationContext
+from activation_records.frame import TempMap, temp_to_str
+from benchmarks.synthetic import ProgramShape, generate_program
+from instruction_selection.assembly import Operation
+from intermediate_representation.fragment import FragmentManager
+from putting_it_all_together.backend import compile_procedures
+from putting_it_all_together.compiler import Compiler, parse_program, split_fragments
+from putting_it_all_together.file_handler import FileHandler
+from putting_it_all_together.phase_profiler import PhaseProfiler
+from semantic_analysis.analyzers import SemanticError, translate_program
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _translated_fragments(source: str):
+    program = parse_program(source)
+    TempMap.initialize()
+    translate_program(program)
+    return split_fragments(FragmentManager.get_fragments())
+
+
+class TestInstructionFormat(unittest.TestCase):
+    def test_placeholders_are_replaced_in_one_pass(self):
+        registers = {temp: f"r{temp}" for temp in range(12)}
+        instruction = Operation("op %'s1, %'s10, %'d0, 'j0, %'s12\n", list(range(11)), [11], ["done"])
+
+        self.assertEqual(
+            instruction.format(registers.__getitem__), "op %r1, %r10, %r11, done, %'s12\n"
+        )
+        # Formatting does not consume the placeholders
+        self.assertEqual(instruction.line, "op %'s1, %'s10, %'d0, 'j0, %'s12\n")
+
+
+class TestFileHandler(unittest.TestCase):
+    def test_file_only_replaced_when_complete(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "output.s")
+            with open(file_name, "w") as file:
+                file.write("previous\n")
+
+            with self.assertRaises(RuntimeError):
+                with FileHandler(file_name) as file_handler:
+                    file_handler.print_assembly_text("partial\n")
+                    raise RuntimeError("backend failure")
+            with open(file_name) as file:
+                self.assertEqual(file.read(), "previous\n")
+            self.assertEqual(os.listdir(directory), ["output.s"])
+
+            with FileHandler(file_name) as file_handler:
+                file_handler.print_assembly_text("complete\n")
+            with open(file_name) as file:
+                self.assertEqual(file.read(), "complete\n")
+            self.assertEqual(os.listdir(directory), ["output.s"])
+
+    def test_compile_to_a_file_matches_compile(self):
+        with open(os.path.join(ROOT_DIRECTORY, "examples", "queens.tig")) as file:
+            source = file.read()
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "output.s")
+            Compiler().compile_to(source, file_name)
+            with open(file_name) as file:
+                self.assertEqual(file.read(), Compiler().compile(source))
+
+            with self.assertRaises(SemanticError):
+                Compiler().compile_to("let var a := nil in end", file_name)
+            self.assertEqual(os.listdir(directory), ["output.s"])
+
+
+class TestStreamingBackend(unittest.TestCase):
+    def test_functions_are_compiled_one_at_a_time(self):
+        profiler = PhaseProfiler()
+        with CompilationContext(profiler=profiler).activate():
+            process_fragments, _ = _translated_fragments(
+                generate_program(ProgramShape(functions=3, nesting=0))
+            )
+            procedures = compile_procedures(process_fragments)
+            next(procedures).write(io.StringIO(), temp_to_str)
+
+            first_function = process_fragments[0].frame.name
+            backend_records = [record for record in profiler.records if record.function is not None]
+            self.assertEqual({record.function for record in backend_records}, {first_function})
+            self.assertEqual(
+                [record.name for record in backend_records if len(record.path) == 1],
+                ["simplify", "canonize", "optimize", "codegen", "register_allocation"],
+            )
+
+    def test_backend_memory_does_not_grow_with_the_number_of_functions(self):
+        def largest_function_peak(functions: int) -> int:
+            # tigermain calls every function, so only the others have a fixed size
+            with CompilationContext().activate():
+                process_fragments, _ = _translated_fragments(
+                    generate_program(ProgramShape(functions=functions, nesting=0))
+                )
+                output = open(os.devnull, "w")
+                peaks = []
+                tracemalloc.start()
+                try:
+                    start = tracemalloc.get_traced_memory()[0]
+                    for procedure in compile_procedures(process_fragments[:-1]):
+                        procedure.write(output, temp_to_str)
+                        peaks.append(tracemalloc.get_traced_memory()[1] - start)
+                        tracemalloc.reset_peak()
+                finally:
+                    tracemalloc.stop()
+                    output.close()
+                return max(peaks)
+
+        self.assertLess(largest_function_peak(48), 1.5 * largest_function_peak(6))
@@ -1,8 +1,6 @@
 import os
 from activation_records.frame import TempMap
-from lexer import lex as le
-from parser import parser as p
-from ply import lex
+from putting_it_all_together.compiler import parse_program as parse_source
 
 import parser.ast_nodes as ast
 from semantic_analysis.analyzers import TypedExpression, translate_program
@@ -21,13 +19,7 @@ def parse_program(file_name: str) -> ast.Expression:
     with open(upper_of_upper_dir + "/examples/" + file_name, "r") as file:
         data = file.read()
 
-    # Both the lexer cloning and the parser restart are necessary
-    # in order to be able to parse files from successive test cases.
-    lexer_clone = le.lexer.clone()
-    lex.input(data)
-    parse_result = p.parser.parse(data, lexer_clone)
-    p.parser.restart()
-    return parse_result
+    return parse_source(data)
 
 
 def semantic_analysis(file_name: str) -> TypedExpression:
@@ -10,17 +10,15 @@ from contextlib import redirect_stdout
 # Add the parent directory to the path so we can import the Tiger compiler modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from activation_records.frame import TempMap, sink, assembly_procedure
-from activation_records.instruction_removal import is_redundant_move
-from canonical.canonize import canonize
+from activation_records.context import CompilationContext
+from activation_records.frame import TempMap
 from intermediate_representation.fragment import FragmentManager, ProcessFragment, StringFragment
-from register_allocation.allocation import RegisterAllocator
 from semantic_analysis.analyzers import SemanticError, translate_program
-from instruction_selection.codegen import Codegen
+from putting_it_all_together.backend import compile_procedures
 from putting_it_all_together.file_handler import FileHandler
-from lexer import lex as le
+from putting_it_all_together.compilation_cache import CompilationCache, CACHE_DIRECTORY_VARIABLE
+from putting_it_all_together.compiler import new_lexer, parse_program
 from parser import parser as p
-from ply import lex
 
 app = Flask(__name__)
 
@@ -28,6 +26,10 @@ app = Flask(__name__)
 EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+CACHE_FOLDER = os.environ.get(CACHE_DIRECTORY_VARIABLE) or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'cache'
+)
+compilation_cache = CompilationCache(CACHE_FOLDER)
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024  # 16 KB max upload size
@@ -46,12 +48,25 @@ def get_example_content(filename):
         return f.read()
 
 def compile_tiger_program(code):
+    """Compile a Tiger program and return the results of each step, reusing cached ones."""
+    cache_key = compilation_cache.key(code, ['web_ui'])
+    cache_entry = compilation_cache.load(cache_key)
+    if cache_entry is not None and 'results' in cache_entry.artifacts:
+        return cache_entry.artifacts['results']
+
+    # Requests may be served concurrently; each compilation gets its own state
+    with CompilationContext().activate():
+        results = _compile_tiger_program(code)
+    if 'final_assembly' in results and 'error' not in results:
+        compilation_cache.store(
+            cache_key, results['final_assembly']['output'], {'results': results}
+        )
+    return results
+
+def _compile_tiger_program(code):
     """Compile a Tiger program and return the results of each step."""
     results = {}
     
-    # Reset the fragment manager
-    FragmentManager.reset()
-    
     # Capture stdout for each step
     lexer_output = io.StringIO()
     parser_output = io.StringIO()
@@ -64,10 +79,11 @@ def compile_tiger_program(code):
     try:
         # Lexical Analysis
         with redirect_stdout(lexer_output):
-            lex.input(code)
+            lexer = new_lexer()
+            lexer.input(code)
             tokens = []
             while True:
-                tok = lex.token()
+                tok = lexer.token()
                 if not tok:
                     break
                 tokens.append(str(tok))
@@ -76,7 +92,7 @@ def compile_tiger_program(code):
         # Parsing
         try:
             with redirect_stdout(parser_output):
-                parsed_program = p.parser.parse(code, le.lexer)
+                parsed_program = parse_program(code)
                 results['parser'] = {'success': True, 'output': str(parsed_program)}
         except p.SyntacticError as err:
             results['parser'] = {'success': False, 'error': str(err)}
@@ -108,43 +124,41 @@ def compile_tiger_program(code):
             ir_str = "\n".join([str(fragment.body) for fragment in process_fragments])
             results['ir'] = {'success': True, 'output': ir_output.getvalue() + "\n" + ir_str}
         
-        # Canonization
-        canonized_bodies = [canonize(fragment.body) for fragment in process_fragments]
-        
-        with redirect_stdout(canon_ir_output):
-            from persistence.ir_dump import print_canonized_ir
-            print_canonized_ir(canonized_bodies)
-            canon_ir_str = str(canonized_bodies)
-            results['canon_ir'] = {'success': True, 'output': canon_ir_output.getvalue() + "\n" + canon_ir_str}
-        
-        # Instruction Selection
-        assembly_bodies = [Codegen.codegen(process_body) for process_body in canonized_bodies]
-        
-        with redirect_stdout(assembly_output):
-            assembly_str = str(assembly_bodies)
-            results['assembly'] = {'success': True, 'output': assembly_str}
+        # Canonization, optimization, instruction selection and register
+        # allocation, one function at a time
+        canonized_bodies = []
+        assembly_bodies = []
+
+        def keep_canonized_body(fragment, canonized_body):
+            canonized_bodies.append(canonized_body)
+
+        def keep_assembly_body(fragment, assembly_body):
+            # Register allocation rewrites the instructions in place
+            assembly_bodies.append(repr(assembly_body))
+
+        procedures = compile_procedures(
+            process_fragments,
+            on_canonized=keep_canonized_body,
+            on_selected=keep_assembly_body,
+        )
         
         # Create a temporary file for the output assembly
         with tempfile.NamedTemporaryFile(delete=False, suffix='.s') as temp_file:
-            file_handler = FileHandler(temp_file.name)
-            file_handler.print_data_header()
-            for string_fragment in string_fragments:
-                file_handler.print_string_fragment(string_fragment)
+            # The assembly is only complete in the file once the handler is closed
+            with FileHandler(temp_file.name) as file_handler:
+                file_handler.print_data_section(string_fragments)
+                for procedure in procedures:
+                    file_handler.print_assembly_procedure(procedure)
             
-            file_handler.print_code_header()
+            with redirect_stdout(canon_ir_output):
+                from persistence.ir_dump import print_canonized_ir
+                print_canonized_ir(canonized_bodies)
+                canon_ir_str = str(canonized_bodies)
+                results['canon_ir'] = {'success': True, 'output': canon_ir_output.getvalue() + "\n" + canon_ir_str}
             
-            # Register Allocation
-            bodies_with_sink = [sink(assembly_body) for assembly_body in assembly_bodies]
-            for body, fragment in zip(bodies_with_sink, process_fragments):
-                allocation_result = RegisterAllocator(fragment.frame).main(body)
-                TempMap.update_temp_to_register(allocation_result.temp_to_register)
-                instruction_list = [
-                    instruction
-                    for instruction in allocation_result.instructions
-                    if not is_redundant_move(instruction)
-                ]
-                procedure = assembly_procedure(fragment.frame, instruction_list)
-                file_handler.print_assembly_procedure(procedure)
+            with redirect_stdout(assembly_output):
+                assembly_str = "[" + ", ".join(assembly_bodies) + "]"
+                results['assembly'] = {'success': True, 'output': assembly_str}
             
             with redirect_stdout(regalloc_output):
                 regalloc_str = str(file_handler)
@@ -262,7 +276,7 @@ def get_ast():
     
     try:
         # Parse the program
-        parsed_program = p.parser.parse(code, le.lexer)
+        parsed_program = parse_program(code)
         
         # Extract AST data
         ast_data = extract_ast_data(parsed_program)